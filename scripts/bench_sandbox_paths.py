@@ -0,0 +1,126 @@
+#!/bin/bash
+# -*- mode: python -*-
+# vim: set ft=python:
+# Polyglot bash/python script - bash delegates to venv python
+"true" '''\'
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
+exec "$PROJECT_ROOT/local.venv/bin/python" "$0" "$@"
+'''
+
+"""
+Microbenchmark: sandbox path validation, compiled policy vs. linear scan.
+
+Compares sandbox.validate_path (PathPolicy trie + cached project root) with
+the previous implementation, which resolved every path from scratch and
+tried relative_to() against each allowed/blocked directory in turn.
+
+Usage:
+    scripts/bench_sandbox_paths.py [--iterations N] [--project DIR]
+"""
+
+import argparse as _argparse
+import functools as _functools
+import pathlib as _pathlib
+import sys as _sys
+import timeit as _timeit
+import typing as _typing
+
+import brynhild.tools.sandbox as sandbox
+
+
+def legacy_validate_path(
+    path: _pathlib.Path,
+    config: sandbox.SandboxConfig,
+    operation: _typing.Literal["read", "write"],
+) -> _pathlib.Path:
+    """The pre-PathPolicy validate_path, kept here as the baseline."""
+    resolved = path.resolve()
+
+    for allowed in config._allowed_write_paths:
+        try:
+            resolved.relative_to(allowed)
+            return resolved
+        except ValueError:
+            continue
+
+    blocked_paths = (
+        config._blocked_write_paths if operation == "write" else config._blocked_read_paths
+    )
+    for blocked in blocked_paths:
+        try:
+            resolved.relative_to(blocked)
+            raise sandbox.PathValidationError(f"denied: {path}")
+        except ValueError:
+            pass
+
+    if operation == "write":
+        raise sandbox.PathValidationError(f"denied: {path}")
+    return resolved
+
+
+def sample_paths(project: _pathlib.Path) -> list[tuple[_pathlib.Path, str]]:
+    """A mix of project files, system paths and blocked paths."""
+    files = sorted(p for p in project.rglob("*.py") if ".git" not in p.parts)[:200]
+    samples: list[tuple[_pathlib.Path, str]] = []
+    for path in files:
+        samples.append((path, "read"))
+        samples.append((path, "write"))
+    for name in ("/usr/lib/python3/os.py", "/etc/hosts", "/opt/tool/bin/run"):
+        samples.append((_pathlib.Path(name), "read"))
+        samples.append((_pathlib.Path(name), "write"))
+    samples.append((_pathlib.Path.home() / ".ssh" / "id_rsa", "read"))
+    return samples
+
+
+def run(
+    validate: _typing.Callable[..., _pathlib.Path],
+    config: sandbox.SandboxConfig,
+    samples: list[tuple[_pathlib.Path, str]],
+) -> list[str]:
+    """Validate every sample, recording the outcome."""
+    outcomes = []
+    for path, operation in samples:
+        try:
+            outcomes.append(str(validate(path, config, operation)))
+        except sandbox.PathValidationError:
+            outcomes.append("denied")
+    return outcomes
+
+
+def main() -> None:
+    parser = _argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--project", type=_pathlib.Path, default=_pathlib.Path.cwd())
+    args = parser.parse_args()
+
+    config = sandbox.SandboxConfig(project_root=args.project)
+    samples = sample_paths(args.project)
+
+    if run(legacy_validate_path, config, samples) != run(
+        sandbox.validate_path, config, samples
+    ):
+        print("ERROR: implementations disagree", file=_sys.stderr)
+        _sys.exit(1)
+
+    checks = len(samples) * args.iterations
+    print(f"{len(samples)} paths x {args.iterations} iterations ({checks} checks)")
+    results = {}
+    for label, validate in (
+        ("linear scan", legacy_validate_path),
+        ("compiled policy", sandbox.validate_path),
+    ):
+        elapsed = min(
+            _timeit.repeat(
+                _functools.partial(run, validate, config, samples),
+                number=args.iterations,
+                repeat=3,
+            )
+        )
+        results[label] = elapsed
+        print(f"  {label:16} {elapsed / checks * 1e6:8.2f} us/check")
+    print(f"  speedup          {results['linear scan'] / results['compiled policy']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
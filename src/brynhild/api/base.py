@@ -341,6 +341,17 @@ class LLMProvider(_abc.ABC):
         """
         ...
 
+    def fork(self) -> LLMProvider:
+        """
+        A provider for requests outside the conversation (e.g. hook checks).
+
+        It shares this provider's settings and connection pool but not its
+        per-conversation state, so its requests don't disturb caches built
+        for the conversation's history. Providers without such state return
+        themselves.
+        """
+        return self
+
     async def test_connection(self) -> dict[str, _typing.Any]:
         """
         Test the connection to the provider.
@@ -0,0 +1,190 @@
+"""
+Incrementally maintained OpenAI-format message list.
+
+The OpenAI-compatible providers (OpenRouter, Ollama) resend the whole
+conversation on every request, and a tool loop grows it by only a few
+messages per round. FormattedMessageCache keeps the formatted form (and its
+JSON encoding) of the conversation prefix seen on the previous request, so
+only new messages are formatted and serialized.
+
+Entries are invalidated when:
+- the history is rewritten: a cached message is no longer the same object
+  (or its content/reasoning/tool_calls were replaced) at the same position;
+  everything from that position on is reformatted
+- the reasoning rule flips (entering or leaving a tool loop, or a different
+  reasoning format): assistant messages carrying reasoning are reformatted
+"""
+
+from __future__ import annotations
+
+import dataclasses as _dataclasses
+import json as _json
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    import brynhild.api.base as base
+    import brynhild.api.types as types
+
+MessageFormatter = _typing.Callable[
+    [dict[str, _typing.Any], "base.ReasoningFormat | None"],
+    "dict[str, _typing.Any] | None",
+]
+"""Formats one internal message (None: reasoning not sent); None drops the message."""
+
+_WATCHED_KEYS = ("content", "reasoning", "tool_calls")
+"""Message fields whose replacement invalidates the cached formatted message."""
+
+
+def _dumps(value: _typing.Any) -> str:
+    """Serialize like httpx does for ``json=`` request bodies."""
+    return _json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+@_dataclasses.dataclass
+class _Entry:
+    """Formatted form of one internal message."""
+
+    source: dict[str, _typing.Any]
+    """The internal message (kept alive so identity checks stay valid)."""
+
+    fields: tuple[_typing.Any, ...]
+    """The watched field values when the message was formatted."""
+
+    formatted: dict[str, _typing.Any] | None
+    """The provider-format message, or None if the message was dropped."""
+
+    encoded: str | None = None
+    """JSON encoding of formatted (computed on first serialization)."""
+
+    def matches(self, message: dict[str, _typing.Any]) -> bool:
+        """Whether message is still the one this entry was formatted from."""
+        if self.source is not message:
+            return False
+        return all(
+            message.get(key) is value for key, value in zip(_WATCHED_KEYS, self.fields, strict=True)
+        )
+
+
+class FormattedMessageCache:
+    """
+    Formatted-prefix cache for one conversation's message history.
+
+    A provider keeps one instance and calls format() for every request; the
+    returned dicts are shared with the cache and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[_Entry] = []
+        self._reasoning_format: base.ReasoningFormat | None = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Messages reused from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Messages that had to be formatted."""
+        return self._misses
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def format(
+        self,
+        messages: list[dict[str, _typing.Any]],
+        reasoning_format: base.ReasoningFormat | None,
+        format_message: MessageFormatter,
+    ) -> list[dict[str, _typing.Any]]:
+        """
+        Format a message history, reusing the cached prefix.
+
+        Args:
+            messages: History in the internal format
+            reasoning_format: How to send assistant reasoning, or None to
+                strip it (outside a tool loop)
+            format_message: Provider formatter for a single message
+
+        Returns:
+            The formatted messages (system prompt not included)
+        """
+        entries = self._entries
+        keep = 0
+        limit = min(len(entries), len(messages))
+        while keep < limit and entries[keep].matches(messages[keep]):
+            keep += 1
+
+        if reasoning_format != self._reasoning_format:
+            # Only assistant messages that carry reasoning format differently
+            for i in range(keep):
+                source = entries[i].source
+                if source.get("role") == "assistant" and source.get("reasoning"):
+                    keep = i
+                    break
+            self._reasoning_format = reasoning_format
+
+        del entries[keep:]
+        self._hits += keep
+        for message in messages[keep:]:
+            entries.append(
+                _Entry(
+                    source=message,
+                    fields=tuple(message.get(key) for key in _WATCHED_KEYS),
+                    formatted=format_message(message, reasoning_format),
+                )
+            )
+            self._misses += 1
+
+        return [e.formatted for e in entries if e.formatted is not None]
+
+    def encode_payload(
+        self,
+        payload: dict[str, _typing.Any],
+        tools: list[types.Tool] | None = None,
+    ) -> bytes:
+        """
+        Serialize a request payload, reusing cached JSON for its messages.
+
+        The result is equivalent to what httpx sends for ``json=payload``;
+        messages not produced by format() (such as the system prompt) are
+        encoded normally. If payload["tools"] holds the OpenAI formats of
+        tools, their cached JSON (types.Tool.to_json) is reused as well.
+
+        Args:
+            payload: Request payload whose "messages" came from format()
+            tools: The tools payload["tools"] was built from
+
+        Returns:
+            UTF-8 request body
+        """
+        by_id = {id(e.formatted): e for e in self._entries if e.formatted is not None}
+        parts: list[str] = []
+        for message in payload.get("messages", []):
+            entry = by_id.get(id(message))
+            if entry is None or entry.formatted is not message:
+                parts.append(_dumps(message))
+                continue
+            if entry.encoded is None:
+                entry.encoded = _dumps(message)
+            parts.append(entry.encoded)
+        spliced = {"messages": f"[{','.join(parts)}]"}
+
+        sent_tools = payload.get("tools")
+        if (
+            tools
+            and isinstance(sent_tools, list)
+            and len(sent_tools) == len(tools)
+            and all(
+                sent is tool.to_openai_format()
+                for sent, tool in zip(sent_tools, tools, strict=True)
+            )
+        ):
+            spliced["tools"] = f"[{','.join(tool.to_json('openai') for tool in tools)}]"
+
+        rest = _dumps({k: v for k, v in payload.items() if k not in spliced})
+        fields = [rest[1:-1]] if rest != "{}" else []
+        fields += [f"{_dumps(key)}:{value}" for key, value in spliced.items()]
+        return f"{{{','.join(fields)}}}".encode()
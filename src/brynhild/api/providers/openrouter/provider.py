@@ -10,6 +10,7 @@ Near-term follow-up will refactor to accept ProviderInstanceConfig for full conf
 
 from __future__ import annotations
 
+import copy as _copy
 import json as _json
 import os as _os
 import typing as _typing
@@ -18,6 +19,7 @@ import httpx as _httpx
 
 import brynhild.api.base as base
 import brynhild.api.credentials as _credentials
+import brynhild.api.message_cache as message_cache
 import brynhild.api.types as types
 import brynhild.constants as _constants
 
@@ -204,6 +206,7 @@ class OpenRouterProvider(base.LLMProvider):
         self._site_name = site_name
         self._require_data_policy = require_data_policy
 
+        self._message_cache = message_cache.FormattedMessageCache()
         self._client = _httpx.AsyncClient(
             base_url=self.BASE_URL,
             headers={
@@ -349,6 +352,12 @@ class OpenRouterProvider(base.LLMProvider):
 
         return self.default_reasoning_format
 
+    def fork(self) -> OpenRouterProvider:
+        """A provider sharing this one's HTTP client, with its own message cache."""
+        forked = _copy.copy(self)
+        forked._message_cache = message_cache.FormattedMessageCache()
+        return forked
+
     async def complete(
         self,
         messages: list[dict[str, _typing.Any]],
@@ -381,7 +390,8 @@ class OpenRouterProvider(base.LLMProvider):
         start_time = _time.perf_counter()
 
         try:
-            response = await self._client.post("/chat/completions", json=payload)
+            body = self._message_cache.encode_payload(payload, tools)
+            response = await self._client.post("/chat/completions", content=body)
             response.raise_for_status()
             data = response.json()
         except _httpx.HTTPStatusError as e:
@@ -439,7 +449,8 @@ class OpenRouterProvider(base.LLMProvider):
         tool_calls: dict[int, dict[str, _typing.Any]] = {}
 
         try:
-            async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+            body = self._message_cache.encode_payload(payload, tools)
+            async with self._client.stream("POST", "/chat/completions", content=body) as response:
                 response.raise_for_status()
 
                 yield types.StreamEvent(type="message_start")
@@ -618,7 +629,12 @@ class OpenRouterProvider(base.LLMProvider):
         messages: list[dict[str, _typing.Any]],
         system: str | None,
     ) -> list[dict[str, _typing.Any]]:
-        """Format messages for OpenAI-compatible API."""
+        """
+        Format messages for OpenAI-compatible API.
+
+        Messages already formatted for an earlier request in this conversation
+        are reused from the provider's message cache.
+        """
         formatted: list[dict[str, _typing.Any]] = []
 
         # Add system message if provided
@@ -632,57 +648,65 @@ class OpenRouterProvider(base.LLMProvider):
         #
         # Heuristic: if the last message is a tool_result, we're in a tool loop
         # and should keep reasoning. Otherwise, strip it.
-        in_tool_loop = messages and messages[-1].get("role") == "tool_result"
+        in_tool_loop = bool(messages) and messages[-1].get("role") == "tool_result"
+        reasoning_format = self._get_reasoning_format() if in_tool_loop else None
 
-        for msg in messages:
-            role = msg["role"]
-            content = msg.get("content", "")
-
-            if role == "user":
-                formatted.append({"role": "user", "content": str(content)})
-
-            elif role == "assistant":
-                assistant_msg: dict[str, _typing.Any] = {"role": "assistant"}
+        formatted.extend(
+            self._message_cache.format(messages, reasoning_format, self._format_message)
+        )
+        return formatted
 
-                # Check for tool calls in the assistant message
-                if "tool_calls" in msg:
-                    assistant_msg["tool_calls"] = msg["tool_calls"]
-                    if content:
-                        assistant_msg["content"] = str(content)
-                else:
+    def _format_message(
+        self,
+        msg: dict[str, _typing.Any],
+        reasoning_format: base.ReasoningFormat | None,
+    ) -> dict[str, _typing.Any] | None:
+        """Format one message; reasoning is sent only if reasoning_format is set."""
+        role = msg["role"]
+        content = msg.get("content", "")
+
+        if role == "user":
+            return {"role": "user", "content": str(content)}
+
+        elif role == "assistant":
+            assistant_msg: dict[str, _typing.Any] = {"role": "assistant"}
+
+            # Check for tool calls in the assistant message
+            if "tool_calls" in msg:
+                assistant_msg["tool_calls"] = msg["tool_calls"]
+                if content:
                     assistant_msg["content"] = str(content)
-
-                # Handle reasoning based on configured format AND whether we're
-                # in a tool loop. We preserve reasoning for logging and potential
-                # tool access, but only SEND it to the API during tool loops.
-                if in_tool_loop and "reasoning" in msg and msg["reasoning"]:
-                    reasoning_format = self._get_reasoning_format()
-                    if reasoning_format == "reasoning_field":
-                        # OpenRouter convention - separate field
-                        assistant_msg["reasoning"] = msg["reasoning"]
-                    elif reasoning_format == "thinking_tags":
-                        # Wrap in tags in content
-                        existing_content = assistant_msg.get("content", "")
-                        thinking_wrapped = f"<thinking>{msg['reasoning']}</thinking>"
-                        if existing_content:
-                            assistant_msg["content"] = f"{thinking_wrapped}\n\n{existing_content}"
-                        else:
-                            assistant_msg["content"] = thinking_wrapped
-                    # else: "none" - don't include reasoning
-
-                formatted.append(assistant_msg)
-
-            elif role == "tool_result":
-                # OpenAI format for tool results
-                formatted.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": msg.get("tool_use_id", ""),
-                        "content": str(content),
-                    }
-                )
-
-        return formatted
+            else:
+                assistant_msg["content"] = str(content)
+
+            # Handle reasoning based on configured format. reasoning_format is
+            # None outside tool loops: we preserve reasoning for logging and
+            # potential tool access, but only SEND it to the API during tool loops.
+            if reasoning_format is not None and msg.get("reasoning"):
+                if reasoning_format == "reasoning_field":
+                    # OpenRouter convention - separate field
+                    assistant_msg["reasoning"] = msg["reasoning"]
+                elif reasoning_format == "thinking_tags":
+                    # Wrap in tags in content
+                    existing_content = assistant_msg.get("content", "")
+                    thinking_wrapped = f"<thinking>{msg['reasoning']}</thinking>"
+                    if existing_content:
+                        assistant_msg["content"] = f"{thinking_wrapped}\n\n{existing_content}"
+                    else:
+                        assistant_msg["content"] = thinking_wrapped
+                # else: "none" - don't include reasoning
+
+            return assistant_msg
+
+        elif role == "tool_result":
+            # OpenAI format for tool results
+            return {
+                "role": "tool",
+                "tool_call_id": msg.get("tool_use_id", ""),
+                "content": str(content),
+            }
+
+        return None
 
     def _parse_response(self, data: dict[str, _typing.Any]) -> types.CompletionResponse:
         """Parse a non-streaming response."""
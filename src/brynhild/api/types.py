@@ -204,30 +204,63 @@ class ContentBlock:
 
 @_dataclasses.dataclass
 class Tool:
-    """Tool definition for the API."""
+    """
+    Tool definition for the API.
+
+    The provider formats and their JSON are built on first use and reused, so
+    a Tool sent on every request is only converted once. Treat a Tool and the
+    dicts it returns as read-only.
+    """
 
     name: str
     description: str
     input_schema: dict[str, _typing.Any]
 
+    _formats: dict[str, dict[str, _typing.Any]] = _dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _json: dict[str, str] = _dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def to_anthropic_format(self) -> dict[str, _typing.Any]:
         """Convert to Anthropic API format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.input_schema,
-        }
+        if "anthropic" not in self._formats:
+            self._formats["anthropic"] = {
+                "name": self.name,
+                "description": self.description,
+                "input_schema": self.input_schema,
+            }
+        return self._formats["anthropic"]
 
     def to_openai_format(self) -> dict[str, _typing.Any]:
         """Convert to OpenAI/OpenRouter format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.input_schema,
-            },
-        }
+        if "openai" not in self._formats:
+            self._formats["openai"] = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.input_schema,
+                },
+            }
+        return self._formats["openai"]
+
+    def to_json(self, api_format: _typing.Literal["anthropic", "openai"]) -> str:
+        """
+        Serialized form of to_anthropic_format()/to_openai_format().
+
+        Encoded the way httpx encodes ``json=`` request bodies, so it can be
+        spliced into a request body verbatim.
+        """
+        if api_format not in self._json:
+            value = (
+                self.to_openai_format() if api_format == "openai" else self.to_anthropic_format()
+            )
+            self._json[api_format] = _json.dumps(
+                value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            )
+        return self._json[api_format]
 
 
 @_dataclasses.dataclass
@@ -15,6 +15,7 @@ import brynhild.api.types as api_types
 import brynhild.core.conversation as core_conversation
 import brynhild.core.tool_recovery as tool_recovery
 import brynhild.tools.base as tools_base
+import brynhild.tools.code_search as code_search
 import brynhild.tools.registry as tools_registry
 import brynhild.ui.adapters as ui_adapters
 import brynhild.ui.base as ui_base
@@ -26,38 +27,6 @@ import brynhild.ui.rich_renderer as rich_renderer
 # =============================================================================
 
 
-class MockSemanticSearch(tools_base.Tool):
-    """Mock semantic search tool for demos."""
-
-    @property
-    def name(self) -> str:
-        return "semantic_search"
-
-    @property
-    def description(self) -> str:
-        return "Search for information in the knowledge base"
-
-    @property
-    def input_schema(self) -> dict[str, _typing.Any]:
-        return {
-            "type": "object",
-            "properties": {"query": {"type": "string"}},
-            "required": ["query"],
-        }
-
-    async def execute(self, input: dict[str, _typing.Any]) -> tools_base.ToolResult:
-        query = input.get("query", "")
-        return tools_base.ToolResult(
-            success=True,
-            output=(
-                f"Search results for '{query}':\n"
-                "1. AsyncIO Best Practices Guide\n"
-                "2. Python Concurrency Patterns\n"
-                "3. Await vs Threading comparison"
-            ),
-        )
-
-
 class MockFileRead(tools_base.Tool):
     """Mock file read tool for demos."""
 
@@ -128,8 +97,8 @@ class RecoveryDemoProvider(api_base.LLMProvider):
                 content="",
                 thinking=(
                     "I need to search for information about Python async patterns.\n\n"
-                    "Let me use the semantic_search tool to find relevant documentation.\n\n"
-                    '{"name": "semantic_search", "input": {"query": "Python async patterns"}}'
+                    "Let me use the CodeSearch tool to find relevant documentation.\n\n"
+                    '{"name": "CodeSearch", "input": {"query": "Python async patterns"}}'
                 ),
                 tool_uses=[],  # No proper tool call - it's in thinking!
                 usage=api_types.Usage(input_tokens=100, output_tokens=50),
@@ -251,9 +220,9 @@ def demo_recovery(tui: bool, json_output: bool) -> None:
     """
     import rich.console as _rich_console
 
-    # Create tool registry with mock tools
+    # Create tool registry (real code search over cwd, mock file read)
     registry = tools_registry.ToolRegistry()
-    registry.register(MockSemanticSearch())
+    registry.register(code_search.CodeSearchTool())
     registry.register(MockFileRead())
 
     # Create mock provider
@@ -351,37 +320,37 @@ def demo_recovery_scenarios() -> None:
 
     console = _rich_console.Console()
 
-    # Create registry with mock tool
+    # Create registry with the code search tool
     registry = tools_registry.ToolRegistry()
-    registry.register(MockSemanticSearch())
+    registry.register(code_search.CodeSearchTool())
 
     scenarios = [
         (
             "Trailing JSON (most common)",
             """I should search for this information.
 
-{"name": "semantic_search", "input": {"query": "test"}}""",
+{"name": "CodeSearch", "input": {"query": "test"}}""",
         ),
         (
             "JSON with trailing punctuation",
             """Let me search for that.
 
-{"name": "semantic_search", "input": {"query": "test"}}.""",
+{"name": "CodeSearch", "input": {"query": "test"}}.""",
         ),
         (
             "JSON with trailing XML tag",
             """I'll perform a search.
 
-{"name": "semantic_search", "input": {"query": "test"}}</think>""",
+{"name": "CodeSearch", "input": {"query": "test"}}</think>""",
         ),
         (
             "JSON in middle of text",
-            """First I'll search {"name": "semantic_search", "input": {"query": "test"}} and then analyze.""",
+            """First I'll search {"name": "CodeSearch", "input": {"query": "test"}} and then analyze.""",
         ),
         (
             "Multiple JSON objects (last one wins)",
-            """First search: {"name": "semantic_search", "input": {"query": "first"}}
-Now another: {"name": "semantic_search", "input": {"query": "second"}}""",
+            """First search: {"name": "CodeSearch", "input": {"query": "first"}}
+Now another: {"name": "CodeSearch", "input": {"query": "second"}}""",
         ),
     ]
 
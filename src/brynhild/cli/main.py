@@ -19,7 +19,9 @@ import brynhild.api as api
 import brynhild.cli.dev as cli_dev
 import brynhild.config as config
 import brynhild.core.conversation as core_conversation
+import brynhild.core.history_pruning as history_pruning
 import brynhild.logging as logging
+import brynhild.logging.files as logging_files
 import brynhild.session as session
 import brynhild.tools as tools
 import brynhild.ui as ui
@@ -41,7 +43,9 @@ def _validate_sandbox_availability(settings: config.Settings) -> None:
 
     On Linux, bubblewrap is required for sandbox protection. This function
     checks that it's available and functional, failing fast with helpful
-    error messages if not.
+    error messages if not. When the functionality probe has no persisted
+    result yet, it runs in the background instead of blocking startup, and a
+    failure is reported by the first sandboxed command.
 
     On macOS, sandbox-exec is built-in, so no validation is needed.
     """
@@ -65,7 +69,9 @@ def _validate_sandbox_availability(settings: config.Settings) -> None:
     import brynhild.tools.sandbox_linux as sandbox_linux
 
     try:
-        sandbox_linux.require_bwrap()
+        # Fail fast if the answer is already known; otherwise probe in the background
+        if sandbox_linux.start_bwrap_probe(settings.cache_dir) is not None:
+            sandbox_linux.require_bwrap()
     except (sandbox_linux.BubblewrapNotFoundError, sandbox_linux.BubblewrapNotFunctionalError) as e:
         _click.echo(str(e), err=True)
         raise SystemExit(1) from None
@@ -270,10 +276,40 @@ def _create_renderer(
         return ui.RichConsoleRenderer(show_thinking=show_thinking, show_cost=show_cost)
 
 
+def _log_writer_config(settings: config.Settings) -> logging.WriterConfig:
+    """Background log writer settings from the logging config section."""
+    return logging.WriterConfig(
+        flush=settings.logging.flush,
+        flush_interval_ms=settings.logging.flush_interval_ms,
+        fsync=settings.logging.fsync,
+        queue_size=settings.logging.queue_size,
+        on_full=settings.logging.on_full,
+    )
+
+
+def _log_retention(settings: config.Settings) -> logging_files.RetentionPolicy:
+    """Log retention limits from the logging config section."""
+    max_total_mb = settings.logging.max_total_mb
+    return logging_files.RetentionPolicy(
+        max_total_bytes=max_total_mb * 1024 * 1024 if max_total_mb is not None else None,
+        max_age_days=settings.logging.max_age_days,
+        max_files=settings.logging.max_files,
+    )
+
+
+def _read_log_events(log_path: _pathlib.Path) -> list[dict[str, _typing.Any]]:
+    """Read a conversation log's events, exiting with an error if it can't be read."""
+    try:
+        return logging.LogReader(log_path).get_events()
+    except logging_files.CompressionUnavailableError as e:
+        _click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1) from None
+
+
 def _resolve_log_path(
     log_file: str | None,
     log_dir: _pathlib.Path,
-    pattern: str = "brynhild_*.jsonl",
+    pattern: str = "brynhild_*.jsonl*",
     exclude_prefix: str | None = "brynhild_raw_",
     error_message: str = "No logs found",
 ) -> _pathlib.Path:
@@ -352,6 +388,7 @@ async def _run_conversation(
 ) -> None:
     """Run a conversation using the ConversationRunner."""
     import brynhild.core as core
+    import brynhild.hooks.manager as hooks_manager
 
     # Create renderer
     renderer = _create_renderer(
@@ -397,6 +434,9 @@ async def _run_conversation(
             provider=effective_provider,
             model=actual_model,
             enabled=True,
+            writer_config=_log_writer_config(settings),
+            compress=settings.logging.compress,
+            retention=_log_retention(settings),
         )
         if conv_logger.file_path and verbose:
             renderer.show_info(f"Logging to: {conv_logger.file_path}")
@@ -411,6 +451,9 @@ async def _run_conversation(
             provider=effective_provider,
             model=actual_model,
             enabled=True,
+            writer_config=_log_writer_config(settings),
+            compress=settings.logging.compress,
+            retention=_log_retention(settings),
         )
         if raw_logger.file_path and verbose:
             renderer.show_info(f"Raw logging to: {raw_logger.file_path}")
@@ -465,10 +508,17 @@ async def _run_conversation(
         if context.profile:
             renderer.show_info(f"Using profile: {context.profile.name}")
 
-    # Create recovery config from profile if available
+    # Create recovery and history pruning config from profile if available
     recovery_config: core_conversation.RecoveryConfig | None = None
+    pruning_config: history_pruning.PruningConfig | None = None
     if context.profile:
         recovery_config = core_conversation.RecoveryConfig.from_profile(context.profile)
+        pruning_config = history_pruning.PruningConfig.from_profile(context.profile)
+
+    # Session-owned hooks; their metrics are logged when the runner is closed
+    hook_manager = hooks_manager.HookManager.from_config(
+        settings.project_root, provider=provider_instance
+    )
 
     # Create conversation runner with enhanced system prompt
     runner = ui.ConversationRunner(
@@ -484,8 +534,11 @@ async def _run_conversation(
         markdown_logger=markdown_logger,
         system_prompt=context.system_prompt,  # Use enhanced prompt
         recovery_config=recovery_config,
+        pruning_config=pruning_config,
         show_thinking=show_thinking,
         require_finish=require_finish,
+        hook_manager=hook_manager,
+        session_id=session_id,
     )
 
     # Log user message to markdown logger
@@ -513,6 +566,8 @@ async def _run_conversation(
         raise SystemExit(1) from None
 
     finally:
+        # Finish hooks first: their metrics go to the conversation log
+        await runner.aclose()
         # Close loggers
         if conv_logger:
             conv_logger.close()
@@ -520,6 +575,8 @@ async def _run_conversation(
             raw_logger.close()
         if markdown_logger:
             markdown_logger.close()
+        if tool_registry is not None:
+            tool_registry.close()
 
 
 async def _send_message(
@@ -567,6 +624,7 @@ def _handle_interactive_mode(
 ) -> None:
     """Handle interactive TUI mode."""
     import brynhild.core as core
+    import brynhild.hooks.manager as hooks_manager
 
     # Handle session resume
     session_manager = session.SessionManager(settings.sessions_dir)
@@ -631,6 +689,9 @@ def _handle_interactive_mode(
             provider=effective_provider,
             model=actual_model,
             enabled=True,
+            writer_config=_log_writer_config(settings),
+            compress=settings.logging.compress,
+            retention=_log_retention(settings),
         )
 
     # Build conversation context with rules, skills, and profile
@@ -649,10 +710,12 @@ def _handle_interactive_mode(
         provider=effective_provider,
     )
 
-    # Create recovery config from profile if available
+    # Create recovery and history pruning config from profile if available
     recovery_config: core_conversation.RecoveryConfig | None = None
+    pruning_config: history_pruning.PruningConfig | None = None
     if context.profile:
         recovery_config = core_conversation.RecoveryConfig.from_profile(context.profile)
+        pruning_config = history_pruning.PruningConfig.from_profile(context.profile)
 
     try:
         # Create and run the TUI app with enhanced system prompt
@@ -665,9 +728,15 @@ def _handle_interactive_mode(
             conv_logger=conv_logger,
             system_prompt=context.system_prompt,  # Use enhanced prompt
             initial_messages=initial_messages,  # Resume support
+            initial_tool_metrics=resumed_session.tool_metrics if resumed_session else None,
             session_id=session_name,  # Session tracking
             sessions_dir=settings.sessions_dir,  # For auto-save
             recovery_config=recovery_config,
+            pruning_config=pruning_config,
+            # Closed (and its metrics logged) when the app unmounts
+            hook_manager=hooks_manager.HookManager.from_config(
+                settings.project_root, provider=provider_instance
+            ),
         )
 
         app.run()
@@ -675,6 +744,7 @@ def _handle_interactive_mode(
         # Close the logger
         if conv_logger:
             conv_logger.close()
+        tool_registry.close()
 
 
 @cli.command()
@@ -1666,119 +1736,146 @@ def tools_exec(
 
 @tools_cmd.command(name="stats")
 @_click.option("--json", "json_output", is_flag=True, help="JSON output")
-@_click.option("--log", "log_file", type=_click.Path(exists=True), help="Read stats from specific log file")
-@_click.option("--session", "session_id", help="Read stats from specific session")
+@_click.option(
+    "--log",
+    "log_files",
+    type=_click.Path(exists=True),
+    multiple=True,
+    help="Read stats from a log file (repeatable)",
+)
+@_click.option("--session", "session_ids", multiple=True, help="Read stats from a session (repeatable)")
+@_click.option("--all-sessions", is_flag=True, help="Aggregate stats from every saved session")
+@_click.option(
+    "--prometheus",
+    "prometheus_file",
+    type=_click.Path(dir_okay=False),
+    help="Also write a Prometheus textfile (e.g. /var/lib/node_exporter/brynhild.prom)",
+)
 def tools_stats(
     json_output: bool,
-    log_file: str | None,
-    session_id: str | None,
+    log_files: tuple[str, ...],
+    session_ids: tuple[str, ...],
+    all_sessions: bool,
+    prometheus_file: str | None,
 ) -> None:
-    """Show tool usage statistics from logs or sessions."""
+    """Show tool usage statistics from logs or sessions.
+
+    Sources are combined, so latency percentiles cover every session and log
+    given.
+    """
+    import pathlib as _pathlib
+
     import brynhild.tools.base as tools_base
+    import brynhild.tools.prometheus as prometheus
 
-    metrics: dict[str, dict[str, _typing.Any]] = {}
+    if not (log_files or session_ids or all_sessions):
+        # No source specified - show message
+        _click.echo("Specify --log, --session or --all-sessions to read tool statistics.", err=True)
+        _click.echo()
+        _click.echo("Examples:")
+        _click.echo("  brynhild tools stats --log ~/.brynhild/logs/brynhild_20251202_143022.jsonl")
+        _click.echo("  brynhild tools stats --session abc12345 --session def67890")
+        _click.echo("  brynhild tools stats --all-sessions --prometheus /var/lib/node_exporter/brynhild.prom")
+        raise SystemExit(1)
+
+    collector = tools_base.MetricsCollector()
 
-    if session_id:
-        # Load from session
+    if session_ids or all_sessions:
+        # Load from sessions
         settings = config.Settings()
         import brynhild.session as session_mod
 
         manager = session_mod.SessionManager(settings.sessions_dir)
-        sess = manager.load(session_id)
-        if not sess:
-            _click.echo(f"Session not found: {session_id}", err=True)
-            raise SystemExit(1)
-        if sess.tool_metrics:
-            metrics = sess.tool_metrics
-        else:
+        sessions = {s.id: s for s in manager.list_sessions()} if all_sessions else {}
+        for session_id in session_ids:
+            sess = manager.load(session_id)
+            if not sess:
+                _click.echo(f"Session not found: {session_id}", err=True)
+                raise SystemExit(1)
+            sessions[sess.id] = sess
+        for sess in sessions.values():
+            if sess.tool_metrics:
+                collector.merge(tools_base.MetricsCollector.from_dict(sess.tool_metrics))
+        if session_ids and not all_sessions and not collector.all():
             _click.echo("No tool metrics in session", err=True)
             raise SystemExit(1)
 
-    elif log_file:
+    for log_file in log_files:
         # Parse log file for tool_result events
-        import pathlib as _pathlib
-
-        log_path = _pathlib.Path(log_file)
-        collector = tools_base.MetricsCollector()
-
-        with log_path.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = _json.loads(line)
-                    if event.get("event_type") == "tool_result":
-                        tool_name = event.get("tool_name", "unknown")
-                        success = event.get("success", False)
-                        duration_ms = event.get("duration_ms", 0.0)
-                        collector.record(tool_name, success, duration_ms)
-                except _json.JSONDecodeError:
-                    continue
-
-        metrics = collector.to_dict()
-
-    else:
-        # No source specified - show message
-        _click.echo("Specify --log or --session to read tool statistics.", err=True)
-        _click.echo()
-        _click.echo("Examples:")
-        _click.echo("  brynhild tools stats --log ~/.brynhild/logs/brynhild_20251202_143022.jsonl")
-        _click.echo("  brynhild tools stats --session abc12345")
-        raise SystemExit(1)
+        try:
+            lines = [
+                line
+                for line in logging_files.read_lines(_pathlib.Path(log_file))
+                if '"tool_result"' in line
+            ]
+        except OSError as e:
+            _click.echo(f"Warning: skipping {log_file}: {e}", err=True)
+            continue
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = _json.loads(line)
+                if event.get("event_type") == "tool_result":
+                    tool_name = event.get("tool_name", "unknown")
+                    success = event.get("success", False)
+                    duration_ms = event.get("duration_ms", 0.0)
+                    collector.record(tool_name, success, duration_ms)
+            except _json.JSONDecodeError:
+                continue
 
-    if not metrics:
+    if not collector.all():
         _click.echo("No tool usage found", err=True)
         raise SystemExit(1)
 
+    if prometheus_file:
+        prometheus.write_textfile(collector, _pathlib.Path(prometheus_file))
+
+    summary = collector.summary()
     if json_output:
         # Include summary in JSON output
-        total_calls = sum(m.get("call_count", 0) for m in metrics.values())
-        total_success = sum(m.get("success_count", 0) for m in metrics.values())
-        total_duration = sum(m.get("total_duration_ms", 0) for m in metrics.values())
         output = {
-            "tools": metrics,
+            "tools": collector.to_dict(),
             "summary": {
-                "total_calls": total_calls,
-                "total_success": total_success,
-                "total_failures": total_calls - total_success,
-                "success_rate": (total_success / total_calls * 100.0) if total_calls else 0.0,
-                "total_duration_ms": round(total_duration, 2),
-                "tools_used": len(metrics),
+                **summary,
+                "total_duration_ms": round(summary["total_duration_ms"], 2),
             },
         }
         _click.echo(_json.dumps(output, indent=2))
     else:
+        header = (
+            f"{'Tool':<15} {'Calls':<8} {'Success':<8} {'Fail':<6} {'Rate':<8} {'Avg ms':<10}"
+            f"{'p50':>9} {'p90':>9} {'p99':>9} {'Max':>9}"
+        )
         _click.echo("Tool Usage Statistics")
-        _click.echo("=" * 60)
+        _click.echo("=" * len(header))
         _click.echo()
-        _click.echo(f"{'Tool':<15} {'Calls':<8} {'Success':<8} {'Fail':<6} {'Rate':<8} {'Avg ms':<10}")
-        _click.echo("-" * 60)
-
-        total_calls = 0
-        total_success = 0
-        total_duration = 0.0
-
-        # Sort by call count
-        sorted_metrics = sorted(metrics.items(), key=lambda x: x[1].get("call_count", 0), reverse=True)
-
-        for tool_name, m in sorted_metrics:
-            calls = m.get("call_count", 0)
-            success = m.get("success_count", 0)
-            failures = m.get("failure_count", 0)
-            rate = m.get("success_rate", 0.0)
-            avg_ms = m.get("average_duration_ms", 0.0)
+        _click.echo(header)
+        _click.echo("-" * len(header))
 
-            total_calls += calls
-            total_success += success
-            total_duration += m.get("total_duration_ms", 0.0)
-
-            _click.echo(f"{tool_name:<15} {calls:<8} {success:<8} {failures:<6} {rate:>6.1f}% {avg_ms:>8.1f}")
+        # Sorted by call count
+        for m in collector.all():
+            latency = m.latency
+            _click.echo(
+                f"{m.tool_name:<15} {m.call_count:<8} {m.success_count:<8} {m.failure_count:<6} "
+                f"{m.success_rate:>6.1f}% {m.average_duration_ms:>8.1f}  "
+                f"{latency.percentile(50):>9.1f} {latency.percentile(90):>9.1f} "
+                f"{latency.percentile(99):>9.1f} {latency.max_ms:>9.1f}"
+            )
 
-        _click.echo("-" * 60)
-        total_rate = (total_success / total_calls * 100.0) if total_calls else 0.0
-        total_avg = (total_duration / total_calls) if total_calls else 0.0
-        _click.echo(f"{'TOTAL':<15} {total_calls:<8} {total_success:<8} {total_calls - total_success:<6} {total_rate:>6.1f}% {total_avg:>8.1f}")
+        _click.echo("-" * len(header))
+        total_calls = summary["total_calls"]
+        total_avg = (summary["total_duration_ms"] / total_calls) if total_calls else 0.0
+        _click.echo(
+            f"{'TOTAL':<15} {total_calls:<8} {summary['total_success']:<8} "
+            f"{summary['total_failures']:<6} {summary['success_rate']:>6.1f}% {total_avg:>8.1f}  "
+            f"{summary['p50_ms']:>9.1f} {summary['p90_ms']:>9.1f} "
+            f"{summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+        )
+        if prometheus_file:
+            _click.echo()
+            _click.echo(f"Wrote {prometheus_file}")
 
 
 # =============================================================================
@@ -2221,14 +2318,11 @@ def logs_list(ctx: _click.Context, limit: int, json_output: bool) -> None:
         return
 
     # Find all log files (exclude raw logs)
-    log_files = sorted(
-        [f for f in log_dir.glob("brynhild_*.jsonl") if not f.name.startswith("brynhild_raw_")],
-        reverse=True,
-    )[:limit]
+    log_paths = logging_files.list_logs(log_dir)[:limit]
 
     if json_output:
         logs_data = []
-        for f in log_files:
+        for f in log_paths:
             stat = f.stat()
             logs_data.append({
                 "path": str(f),
@@ -2238,16 +2332,16 @@ def logs_list(ctx: _click.Context, limit: int, json_output: bool) -> None:
             })
         _click.echo(_json.dumps({"logs": logs_data, "log_dir": str(log_dir)}, indent=2))
     else:
-        if not log_files:
+        if not log_paths:
             _click.echo(f"No logs found in {log_dir}")
             return
 
-        _click.echo(f"Conversation logs ({len(log_files)} shown):")
+        _click.echo(f"Conversation logs ({len(log_paths)} shown):")
         _click.echo(f"Directory: {log_dir}")
         _click.echo()
         _click.echo(f"{'Filename':<40} {'Size':>10} {'Modified'}")
         _click.echo("-" * 70)
-        for f in log_files:
+        for f in log_paths:
             stat = f.stat()
             size = f"{stat.st_size:,}"
             modified = _datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
@@ -2276,15 +2370,7 @@ def logs_view(
     log_path = _resolve_log_path(log_file, settings.logs_dir)
 
     # Read and display
-    events = []
-    with open(log_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(_json.loads(line))
-                except _json.JSONDecodeError:
-                    continue
+    events = _read_log_events(log_path)
 
     if json_output:
         for event in events:
@@ -2529,15 +2615,7 @@ def logs_export(
     log_path = _resolve_log_path(log_file, settings.logs_dir)
 
     # Read events
-    events: list[dict[str, _typing.Any]] = []
-    with open(log_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(_json.loads(line))
-                except _json.JSONDecodeError:
-                    continue
+    events = _read_log_events(log_path)
 
     if not events:
         _click.echo(f"No events found in {log_path}", err=True)
@@ -2589,6 +2667,8 @@ def logs_raw(
 
     Raw logs capture the exact JSON sent to and received from LLM providers.
     Use --raw-log flag when running brynhild to enable raw logging.
+    Requests are stored as deltas against the previous request and shown
+    here reconstructed in full.
 
     \b
     Examples:
@@ -2609,7 +2689,7 @@ def logs_raw(
             _click.echo(f"No raw logs found. Log directory: {log_dir}")
             return
 
-        raw_files = sorted(log_dir.glob("brynhild_raw_*.jsonl"), reverse=True)
+        raw_files = logging_files.list_logs(log_dir, raw=True)
         if not raw_files:
             _click.echo(f"No raw log files found in {log_dir}")
             _click.echo("Use --raw-log flag when running brynhild chat to enable raw logging.")
@@ -2630,20 +2710,21 @@ def logs_raw(
             request_count = 0
             response_count = 0
             try:
-                with open(f, encoding="utf-8") as log_f:
-                    for line in log_f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                record = _json.loads(line)
-                                record_count += 1
-                                direction = record.get("direction")
-                                if direction == "request":
-                                    request_count += 1
-                                elif direction in ("response", "stream_complete"):
-                                    response_count += 1
-                            except _json.JSONDecodeError:
-                                pass
+                for line in logging_files.read_lines(f):
+                    line = line.strip()
+                    if line:
+                        try:
+                            record = _json.loads(line)
+                            direction = record.get("direction")
+                            if direction == "blob":
+                                continue
+                            record_count += 1
+                            if direction == "request":
+                                request_count += 1
+                            elif direction in ("response", "stream_complete"):
+                                response_count += 1
+                        except _json.JSONDecodeError:
+                            pass
             except OSError:
                 pass
 
@@ -2655,21 +2736,17 @@ def logs_raw(
     log_path = _resolve_log_path(
         log_file,
         log_dir,
-        pattern="brynhild_raw_*.jsonl",
+        pattern="brynhild_raw_*.jsonl*",
         exclude_prefix=None,
         error_message="No raw log files found",
     )
 
-    # Read all records
-    records: list[dict[str, _typing.Any]] = []
-    with open(log_path, encoding="utf-8") as log_f:
-        for line in log_f:
-            line = line.strip()
-            if line:
-                try:
-                    records.append(_json.loads(line))
-                except _json.JSONDecodeError:
-                    continue
+    # Read all records (delta-encoded requests are expanded to full payloads)
+    try:
+        records = logging.RawLogReader(log_path).get_records()
+    except logging_files.CompressionUnavailableError as e:
+        _click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1) from None
 
     # Parse index filter
     indices_to_show: set[int] | None = None
@@ -2830,6 +2907,59 @@ def logs_raw(
         _click.echo()
 
 
+
+@logs_group.command(name="gc")
+@_click.option("--max-total-mb", type=_click.IntRange(min=1), default=None, help="Keep at most this many MB of logs")
+@_click.option("--max-age-days", type=_click.IntRange(min=1), default=None, help="Delete logs older than this")
+@_click.option("--max-files", type=_click.IntRange(min=1), default=None, help="Keep at most this many log files")
+@_click.option("--dry-run", is_flag=True, help="Show what would be deleted without deleting")
+@_click.pass_context
+def logs_gc(
+    ctx: _click.Context,
+    max_total_mb: int | None,
+    max_age_days: int | None,
+    max_files: int | None,
+    dry_run: bool,
+) -> None:
+    """Delete old conversation and raw logs.
+
+    Applies the retention limits from the logging config (max_total_mb,
+    max_age_days, max_files); options override them. The newest logs are
+    kept until a limit is reached.
+
+    \b
+    Examples:
+        brynhild logs gc                      # Apply the configured limits
+        brynhild logs gc --max-age-days 30    # Delete logs older than 30 days
+        brynhild logs gc --max-files 50 --dry-run
+    """
+    settings: config.Settings = ctx.obj["settings"]
+    log_dir = settings.logs_dir
+
+    if max_total_mb is not None:
+        settings.logging.max_total_mb = max_total_mb
+    if max_age_days is not None:
+        settings.logging.max_age_days = max_age_days
+    if max_files is not None:
+        settings.logging.max_files = max_files
+    policy = _log_retention(settings)
+
+    if not policy.enabled:
+        _click.echo("No retention limits set.", err=True)
+        _click.echo("Set logging.max_total_mb, max_age_days or max_files, or pass them as options.", err=True)
+        raise SystemExit(1)
+
+    removed = logging_files.enforce_retention(log_dir, policy, dry_run=dry_run)
+    if not removed:
+        _click.echo(f"Nothing to delete in {log_dir}")
+        return
+
+    verb = "Would delete" if dry_run else "Deleted"
+    for path, size in removed:
+        _click.echo(f"  {path.name:<50} {size:>12,}")
+    total = sum(size for _, size in removed)
+    _click.echo(f"{verb} {len(removed)} log files ({total:,} bytes) in {log_dir}")
+
 # =============================================================================
 # Hooks Commands
 # =============================================================================
@@ -3056,6 +3186,112 @@ def hooks_test(
             _click.echo(f"Modified input: {_json.dumps(result.modified_input)}")
 
 
+@hooks_group.command(name="stats")
+@_click.option("--json", "json_output", is_flag=True, help="JSON output")
+@_click.option(
+    "--log",
+    "log_files",
+    type=_click.Path(exists=True),
+    multiple=True,
+    help="Read stats from a log file (repeatable)",
+)
+@_click.option("--all-logs", is_flag=True, help="Aggregate stats from every log in the log directory")
+@_click.pass_context
+def hooks_stats(
+    ctx: _click.Context,
+    json_output: bool,
+    log_files: tuple[str, ...],
+    all_logs: bool,
+) -> None:
+    """Show hook latency statistics from conversation logs.
+
+    Hook metrics are written to the log at session end; sources are combined,
+    so latency percentiles cover every log given.
+    """
+    import brynhild.hooks.metrics as hooks_metrics
+
+    settings: config.Settings = ctx.obj["settings"]
+
+    if not (log_files or all_logs):
+        _click.echo("Specify --log or --all-logs to read hook statistics.", err=True)
+        _click.echo()
+        _click.echo("Examples:")
+        _click.echo("  brynhild hooks stats --log ~/.brynhild/logs/brynhild_20251202_143022.jsonl")
+        _click.echo("  brynhild hooks stats --all-logs --json")
+        raise SystemExit(1)
+
+    paths = [_pathlib.Path(f) for f in log_files]
+    if all_logs:
+        paths += logging_files.list_logs(settings.logs_dir)
+
+    collector = hooks_metrics.HookMetricsCollector()
+    for path in paths:
+        # Cheap filter before parsing: metrics are one event per session
+        try:
+            lines = [line for line in logging_files.read_lines(path) if '"hook_metrics"' in line]
+        except OSError as e:
+            _click.echo(f"Warning: skipping {path}: {e}", err=True)
+            continue
+        for line in lines:
+            try:
+                event = _json.loads(line)
+            except _json.JSONDecodeError:
+                continue
+            if event.get("event_type") == "hook_metrics":
+                collector.merge(hooks_metrics.HookMetricsCollector.from_dict(event.get("hooks", {})))
+
+    if not collector.all():
+        _click.echo("No hook executions found", err=True)
+        raise SystemExit(1)
+
+    summary = collector.summary()
+    if json_output:
+        output = {
+            "hooks": collector.to_dict(),
+            "summary": {
+                **summary,
+                "total_duration_ms": round(summary["total_duration_ms"], 2),
+            },
+        }
+        _click.echo(_json.dumps(output, indent=2))
+        return
+
+    header = (
+        f"{'Hook':<24} {'Event':<18} {'Calls':>6} {'Block':>6} {'Error':>6} {'T/O':>5} "
+        f"{'Cached':>7} {'Total ms':>10}{'p50':>9} {'p90':>9} {'p99':>9} {'Max':>9}"
+    )
+    _click.echo("Hook Latency Statistics")
+    _click.echo("=" * len(header))
+    _click.echo()
+    _click.echo(header)
+    _click.echo("-" * len(header))
+
+    # Sorted by total time spent
+    for m in collector.all():
+        latency = m.latency
+        cached = f"{m.cache_hits}/{m.cache_hits + m.cache_misses}" if m.cache_hits + m.cache_misses else "-"
+        _click.echo(
+            f"{m.hook_name:<24} {m.event:<18} {m.call_count:>6} {m.outcomes.get('block', 0):>6} "
+            f"{m.outcomes.get('error', 0):>6} {m.outcomes.get('timeout', 0):>5} {cached:>7} "
+            f"{m.total_duration_ms:>10.1f}{latency.percentile(50):>9.1f} {latency.percentile(90):>9.1f} "
+            f"{latency.percentile(99):>9.1f} {latency.max_ms:>9.1f}"
+        )
+
+    _click.echo("-" * len(header))
+    outcomes = summary["outcomes"]
+    cache_total = summary["cache_hits"] + summary["cache_misses"]
+    cached = f"{summary['cache_hits']}/{cache_total}" if cache_total else "-"
+    _click.echo(
+        f"{'TOTAL':<24} {'':<18} {summary['total_calls']:>6} {outcomes['block']:>6} "
+        f"{outcomes['error']:>6} {outcomes['timeout']:>5} {cached:>7} "
+        f"{summary['total_duration_ms']:>10.1f}{summary['p50_ms']:>9.1f} {summary['p90_ms']:>9.1f} "
+        f"{summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+    )
+    if summary["over_budget"]:
+        _click.echo()
+        _click.echo(f"{summary['over_budget']} execution(s) exceeded their hook's budget_ms")
+
+
 # =============================================================================
 # Plugin Commands
 # =============================================================================
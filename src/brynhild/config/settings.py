@@ -545,6 +545,11 @@ class Settings(_pydantic_settings.BaseSettings):
         """Directory for session storage."""
         return self.config_dir / "sessions"
 
+    @property
+    def cache_dir(self) -> _pathlib.Path:
+        """Directory for rebuildable caches (e.g. code search indexes)."""
+        return self.config_dir / "cache"
+
     @property
     def logs_dir(self) -> _pathlib.Path:
         """Directory for conversation log files.
@@ -6,8 +6,9 @@ the main Settings class.
 
 Phase 2 types (basic sections):
 - BehaviorConfig: max_tokens, verbose, show_thinking, etc.
-- SandboxConfig: enabled, allow_network, allowed_paths
-- LoggingConfig: enabled, dir, private, raw_payloads
+- SandboxConfig: enabled, allow_network, allowed_paths, limits
+- SandboxLimitsConfig: per-command resource limits
+- LoggingConfig: enabled, dir, private, raw_payloads, flush, compress, retention
 - SessionConfig: auto_save, history_limit
 - ProviderInstanceConfig: enabled, base_url, cache_ttl
 - ProvidersConfig: default, dynamic provider instances
@@ -210,6 +211,39 @@ def _parse_colon_or_json_list(v: _typing.Any) -> list[str]:
     raise ValueError(f"Expected string or list, got {type(v).__name__}")
 
 
+class SandboxLimitsConfig(ConfigBase):
+    """
+    Per-command resource limits.
+
+    YAML section: sandbox.limits.*
+
+    Each limit is null (inherit from the brynhild process) or a positive
+    number. Limits apply to the command and everything it spawns; a command
+    that hits one fails with a "Resource limit exceeded: ..." error.
+    """
+
+    memory_mb: int | None = _pydantic.Field(default=None, ge=1)
+    """Address space limit in MiB (RLIMIT_AS)."""
+
+    cpu_seconds: int | None = _pydantic.Field(default=None, ge=1)
+    """CPU time limit in seconds (RLIMIT_CPU)."""
+
+    max_processes: int | None = _pydantic.Field(default=None, ge=1)
+    """Process limit (RLIMIT_NPROC; counts all of the user's processes)."""
+
+    max_file_size_mb: int | None = _pydantic.Field(default=None, ge=1)
+    """Largest file a command may write, in MiB (RLIMIT_FSIZE)."""
+
+    max_open_files: int | None = _pydantic.Field(default=None, ge=1)
+    """Open file descriptor limit (RLIMIT_NOFILE)."""
+
+    cgroup: str | None = None
+    """
+    Delegated cgroup v2 directory. When set and writable, each command runs
+    in its own child cgroup with memory.max/pids.max from the limits above.
+    """
+
+
 class SandboxConfig(ConfigBase):
     """
     Sandbox/security settings.
@@ -239,6 +273,9 @@ class SandboxConfig(ConfigBase):
     ] = _pydantic.Field(default_factory=list)
     """Additional paths where writes are allowed."""
 
+    limits: SandboxLimitsConfig = _pydantic.Field(default_factory=SandboxLimitsConfig)
+    """Per-command resource limits for Bash commands."""
+
     # Note: dangerously_skip_* are NOT in config - CLI only
 
     @_pydantic.field_validator("allowed_paths", mode="before")
@@ -279,6 +316,33 @@ class LoggingConfig(ConfigBase):
     raw_payloads: bool = False
     """Log full request/response JSON."""
 
+    flush: _typing.Literal["event", "interval", "turn"] = "event"
+    """When log records are flushed to disk: every event, every flush_interval_ms, or at turn end."""
+
+    flush_interval_ms: int = _pydantic.Field(default=1000, gt=0)
+    """Longest time a record stays unflushed with flush: interval."""
+
+    fsync: bool = False
+    """fsync log files at the end of each turn and on close."""
+
+    queue_size: int = _pydantic.Field(default=10000, ge=1)
+    """Most log records waiting for the background writer."""
+
+    on_full: _typing.Literal["block", "drop"] = "block"
+    """When the writer queue is full: wait for room (block) or discard records (drop)."""
+
+    compress: _typing.Literal["none", "gzip", "zstd"] = "none"
+    """Compress log files (zstd needs the zstandard package; falls back to gzip)."""
+
+    max_total_mb: int | None = _pydantic.Field(default=None, gt=0)
+    """Retention: most megabytes of logs kept in the log directory. None = no limit."""
+
+    max_age_days: int | None = _pydantic.Field(default=None, gt=0)
+    """Retention: delete logs older than this. None = no limit."""
+
+    max_files: int | None = _pydantic.Field(default=None, gt=0)
+    """Retention: most log files kept in the log directory. None = no limit."""
+
 
 # =============================================================================
 # Session Settings
@@ -936,6 +1000,7 @@ class ToolConfig(ConfigBase):
         allowed_commands: Whitelist patterns (list[str])
         blocked_commands: Blacklist patterns (list[str])
         allowed_paths: Allowed file paths (list[str])
+        timeout_seconds: Deadline for one call (overrides tools.timeout_seconds)
     """
 
     require_approval: _typing.Literal["always", "once", "never"] = "once"
@@ -950,6 +1015,9 @@ class ToolConfig(ConfigBase):
     allowed_paths: list[str] = _pydantic.Field(default_factory=list)
     """Allowed paths (for file tools)."""
 
+    timeout_seconds: float | None = _pydantic.Field(default=None, gt=0)
+    """Deadline for one call of this tool (None: use tools.timeout_seconds)."""
+
 
 class ToolsConfig(ConfigBase):
     """
@@ -961,7 +1029,9 @@ class ToolsConfig(ConfigBase):
         tools:
           disabled:
             dangerous-tool: true
-          bash:
+          project_index: true
+          timeout_seconds: 300
+          Bash:
             require_approval: always
             blocked_commands: [rm -rf]
 
@@ -980,6 +1050,20 @@ class ToolsConfig(ConfigBase):
     Dict for DCM mergeability. Key is tool name, value is whether disabled.
     """
 
+    project_index: bool = True
+    """
+    Keep an in-memory index of the project tree for Glob and Inspect.
+    Disable on network filesystems where file watching is unreliable.
+    """
+
+    timeout_seconds: float | None = _pydantic.Field(default=300.0, gt=0)
+    """
+    Deadline for one tool call; the call is cancelled (and its subprocesses
+    killed) when it passes. None disables the deadline. Bash is exempt unless
+    tools.Bash.timeout_seconds is set, since it enforces its own per-command
+    timeout.
+    """
+
     instances: dict[str, ToolConfig] = _pydantic.Field(default_factory=dict)
     """Typed mapping of tool name -> config. Populated by pre-validator."""
 
@@ -993,7 +1077,7 @@ class ToolsConfig(ConfigBase):
         if not isinstance(values, dict):
             return values
 
-        reserved = {"disabled", "instances"}
+        reserved = {"disabled", "project_index", "timeout_seconds", "instances"}
         instances: dict[str, _typing.Any] = dict(values.pop("instances", {}) or {})
 
         # Move non-reserved keys to instances
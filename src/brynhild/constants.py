@@ -23,6 +23,26 @@ DEFAULT_MAX_TOOL_ROUNDS = 20
 DEFAULT_BASH_TIMEOUT_MS = 120_000
 """Default timeout for bash command execution (2 minutes)."""
 
+DEFAULT_GREP_TIMEOUT_MS = 30_000
+"""Default deadline for a single ripgrep search (30 seconds)."""
+
+DEFAULT_TOOL_TIMEOUT_SECONDS = 300.0
+"""Default deadline for one tool call (5 minutes); Bash uses its own timeout."""
+
+DEFAULT_READ_MANY_MAX_CHARS = 40_000
+"""Combined output budget for one ReadMany call.
+
+Kept below DEFAULT_TOOL_RESULT_MAX_CHARS so the per-file headers and
+truncation hints survive context truncation.
+"""
+
+DEFAULT_DEDUP_MIN_CHARS = 400
+"""Smallest tool output that is replaced by a reference when it recurs."""
+
+DEFAULT_DEDUP_MAX_DIFF_RATIO = 0.5
+"""A repeated call's output is sent as a diff only if the diff is at most this
+fraction of the full output."""
+
 # Truncation limits for display
 DEFAULT_OUTPUT_TRUNCATE_LENGTH = 2000
 """Default length to truncate tool output for display."""
@@ -14,7 +14,9 @@ import typing as _typing
 import brynhild.api.base as api_base
 import brynhild.api.types as api_types
 import brynhild.constants as _constants
+import brynhild.core.history_pruning as history_pruning
 import brynhild.core.message_validators as message_validators
+import brynhild.core.result_dedup as result_dedup
 import brynhild.core.token_tracker as token_tracker
 import brynhild.core.tool_recovery as tool_recovery
 import brynhild.core.types as core_types
@@ -307,6 +309,8 @@ class ConversationProcessor:
         recovery_config: RecoveryConfig | None = None,
         require_finish: bool = False,
         validate_messages: bool = False,
+        dedupe_tool_results: bool = True,
+        pruning_config: history_pruning.PruningConfig | None = None,
     ) -> None:
         """
         Initialize the conversation processor.
@@ -328,6 +332,10 @@ class ConversationProcessor:
             require_finish: Require agent to call Finish tool to complete.
             validate_messages: Validate message structure before API calls.
                 Enable this in tests to catch message construction bugs.
+            dedupe_tool_results: Replace repeated tool output in the history
+                with a reference to the earlier result (or a diff against it).
+            pruning_config: Policy for stubbing stale tool results before
+                each API call (default: no pruning).
         """
         self._provider = provider
         self._callbacks = callbacks
@@ -365,6 +373,13 @@ class ConversationProcessor:
         # Token estimation for fallback when provider doesn't report usage
         self._token_tracker = token_tracker.ConversationTokenTracker(provider.model)
 
+        # Repeated tool output is replaced by references/diffs in the history
+        self._deduplicator = (
+            result_dedup.ToolResultDeduplicator() if dedupe_tool_results else None
+        )
+        self._dedup_saved_tokens = 0  # Since the last usage event
+        self._pruning_config = pruning_config or history_pruning.PruningConfig()
+
         # Message validation
         self._validate_messages = validate_messages
 
@@ -443,15 +458,8 @@ class ConversationProcessor:
         if not self._provider.supports_tools():
             return None
 
-        tools: list[api_types.Tool] = []
-        for tool in self._tool_registry.list_tools():
-            tools.append(
-                api_types.Tool(
-                    name=tool.name,
-                    description=tool.description,
-                    input_schema=tool.input_schema,
-                )
-            )
+        # Cached by the registry until its tool set changes
+        tools = self._tool_registry.api_tools()
         return tools if tools else None
 
     async def _execute_tool(
@@ -575,11 +583,14 @@ class ConversationProcessor:
 
         start_time = _time.perf_counter()
         try:
-            result = await tool.execute(tool_input)
+            # Run under the tool's deadline; Ctrl-C cancels the running tool
+            result, outcome = await self._tool_registry.run_tool(
+                tool, tool_input, self._callbacks.is_cancelled
+            )
             duration_ms = (_time.perf_counter() - start_time) * 1000
 
             # Record metrics
-            self._metrics.record(tool_use.name, result.success, duration_ms)
+            self._metrics.record(tool_use.name, result.success, duration_ms, outcome=outcome)
 
             self._log_result(tool_use, result)
 
@@ -639,6 +650,33 @@ class ConversationProcessor:
             self._metrics.record(tool_use.name, False, duration_ms)
             return self._make_error_result(tool_use, str(e))
 
+    def _format_tool_result(
+        self,
+        tool_use: api_types.ToolUse,
+        result: tools_base.ToolResult,
+    ) -> dict[str, _typing.Any]:
+        """Format a tool result for the history, deduplicating repeated output."""
+        message = core_types.format_tool_result_message(tool_use.id, result)
+        if self._deduplicator is not None:
+            replacement = self._deduplicator.apply(tool_use, message)
+            if replacement is not None:
+                saved = self._token_tracker.count(replacement.original)
+                saved -= self._token_tracker.count(replacement.replacement)
+                self._dedup_saved_tokens += max(saved, 0)
+        return message
+
+    def _take_dedup_saved_tokens(self) -> int | None:
+        """Tokens saved by deduplication since the last usage event (None if none)."""
+        saved, self._dedup_saved_tokens = self._dedup_saved_tokens, 0
+        return saved or None
+
+    def _prune_history(self, working_messages: list[dict[str, _typing.Any]]) -> None:
+        """Stub stale tool results before an API call (per the profile's policy)."""
+        pruned = history_pruning.prune_tool_results(working_messages, self._pruning_config)
+        if self._deduplicator is not None:
+            for tool_use_id in pruned:
+                self._deduplicator.forget(tool_use_id)
+
     def _make_error_result(
         self,
         tool_use: api_types.ToolUse,
@@ -929,6 +967,8 @@ class ConversationProcessor:
 
         # Working copy of messages for tool rounds
         working_messages = list(messages)
+        if self._deduplicator is not None:
+            self._deduplicator.seed(working_messages)
 
         while tool_round < self._max_tool_rounds:
             tool_round += 1
@@ -955,6 +995,7 @@ class ConversationProcessor:
             # Apply any pending injections before LLM call
             self._apply_pending_injections(working_messages)
             self._apply_recovery_feedback(working_messages)
+            self._prune_history(working_messages)
 
             # Validate messages before API call
             self._check_message_invariants(
@@ -1055,6 +1096,7 @@ class ConversationProcessor:
                         reasoning_tokens=usage.reasoning_tokens,
                         provider=usage.details.provider if usage.details else None,
                         generation_id=usage.details.generation_id if usage.details else None,
+                        deduplicated_tokens=self._take_dedup_saved_tokens(),
                     )
                 if self._markdown_logger:
                     self._markdown_logger.log_usage(
@@ -1078,6 +1120,7 @@ class ConversationProcessor:
                         provider=None,
                         generation_id=None,
                         estimated=True,
+                        deduplicated_tokens=self._take_dedup_saved_tokens(),
                     )
                 if self._markdown_logger:
                     self._markdown_logger.log_usage(
@@ -1246,9 +1289,7 @@ class ConversationProcessor:
                     all_tool_results.append(tool_result)
 
                     # Add tool result as individual message for next round
-                    working_messages.append(
-                        core_types.format_tool_result_message(tool_use.id, tool_result)
-                    )
+                    working_messages.append(self._format_tool_result(tool_use, tool_result))
 
                     # If Finish was called, break out of tool loop
                     if finish_detected:
@@ -1353,6 +1394,8 @@ class ConversationProcessor:
 
         # Working copy of messages for tool rounds
         working_messages = list(messages)
+        if self._deduplicator is not None:
+            self._deduplicator.seed(working_messages)
 
         while tool_round < self._max_tool_rounds:
             tool_round += 1
@@ -1379,6 +1422,7 @@ class ConversationProcessor:
             # Apply any pending injections before LLM call
             self._apply_pending_injections(working_messages)
             self._apply_recovery_feedback(working_messages)
+            self._prune_history(working_messages)
 
             # Validate messages before API call
             self._check_message_invariants(
@@ -1418,6 +1462,7 @@ class ConversationProcessor:
                         reasoning_tokens=usage.reasoning_tokens,
                         provider=usage.details.provider if usage.details else None,
                         generation_id=usage.details.generation_id if usage.details else None,
+                        deduplicated_tokens=self._take_dedup_saved_tokens(),
                     )
                 if self._markdown_logger:
                     usage = response.usage
@@ -1446,6 +1491,7 @@ class ConversationProcessor:
                         provider=None,
                         generation_id=None,
                         estimated=True,
+                        deduplicated_tokens=self._take_dedup_saved_tokens(),
                     )
                 if self._markdown_logger:
                     self._markdown_logger.log_usage(
@@ -1623,9 +1669,7 @@ class ConversationProcessor:
                     all_tool_results.append(tool_result)
 
                     # Add tool result as individual message for next round
-                    working_messages.append(
-                        core_types.format_tool_result_message(tool_use.id, tool_result)
-                    )
+                    working_messages.append(self._format_tool_result(tool_use, tool_result))
 
                     # If Finish was called, break out of tool loop
                     if finish_detected:
@@ -0,0 +1,170 @@
+"""
+Pruning of stale tool results from the conversation history.
+
+Every past tool result is otherwise resent verbatim on every request. Before
+each API call, prune_tool_results() replaces results that are no longer
+worth their tokens with a one-line stub:
+- results from more than N tool rounds ago (keep_rounds)
+- file reads superseded by a later successful write/edit of the same file
+
+Only the content of the tool_result message changes, so every tool call
+keeps its result and the history stays valid for every provider. Results
+that a later deduplication reference points to are kept in full.
+"""
+
+import dataclasses as _dataclasses
+import json as _json
+import os as _os
+import typing as _typing
+
+import brynhild.core.result_dedup as result_dedup
+
+if _typing.TYPE_CHECKING:
+    import brynhild.profiles.types as profiles_types
+
+PRUNED_PREFIX = "[Pruned: "
+
+_READ_TOOLS = frozenset({"Read", "ReadMany"})
+_WRITE_TOOLS = frozenset({"Write", "Edit", "MultiEdit"})
+
+
+@_dataclasses.dataclass
+class PruningConfig:
+    """Policy for pruning stale tool results (see ModelProfile)."""
+
+    keep_rounds: int | None = None
+    """Keep results of the last N tool rounds in full (None: never prune by age).
+
+    At least 1: the current round's results must reach the model.
+    """
+
+    prune_superseded_reads: bool = False
+    """Stub file reads made stale by a later write/edit of the same file."""
+
+    def __post_init__(self) -> None:
+        if self.keep_rounds is not None and self.keep_rounds < 1:
+            raise ValueError(f"keep_rounds must be at least 1 (got {self.keep_rounds})")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any pruning is configured."""
+        return self.keep_rounds is not None or self.prune_superseded_reads
+
+    @classmethod
+    def from_profile(cls, profile: "profiles_types.ModelProfile") -> "PruningConfig":
+        """Create PruningConfig from a model profile.
+
+        Args:
+            profile: Model profile with history pruning settings.
+
+        Returns:
+            PruningConfig populated from profile fields.
+        """
+        return cls(
+            keep_rounds=profile.prune_tool_results_after_rounds,
+            prune_superseded_reads=profile.prune_superseded_reads,
+        )
+
+
+def _paths(name: str, tool_input: dict[str, _typing.Any]) -> set[str]:
+    """Files a Read/ReadMany/Write/Edit/MultiEdit call touches."""
+    if name in ("Read", "Write", "Edit"):
+        items = [tool_input]
+    elif name == "ReadMany":
+        items = tool_input.get("files") or []
+    elif name == "MultiEdit":
+        items = tool_input.get("edits") or []
+    else:
+        return set()
+    return {
+        _os.path.normpath(item["file_path"])
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("file_path"), str)
+    }
+
+
+def prune_tool_results(
+    messages: list[dict[str, _typing.Any]],
+    config: PruningConfig,
+) -> list[str]:
+    """
+    Replace stale tool results in a message history with stubs, in place.
+
+    Pruned messages are replaced by new dicts (never mutated), so histories
+    sharing message objects with this one are unaffected.
+
+    Args:
+        messages: History in the internal format
+        config: Pruning policy
+
+    Returns:
+        IDs of the tool calls whose results were pruned by this call
+    """
+    if not config.enabled:
+        return []
+
+    # Tool calls by ID, with the tool round each belongs to
+    calls: dict[str, tuple[str, dict[str, _typing.Any], int]] = {}
+    rounds = 0
+    for message in messages:
+        if message.get("role") == "assistant" and message.get("tool_calls"):
+            rounds += 1
+            for call in message["tool_calls"]:
+                function = call.get("function", {})
+                try:
+                    arguments = _json.loads(function.get("arguments") or "{}")
+                except ValueError:
+                    arguments = {}
+                if not isinstance(arguments, dict):
+                    arguments = {}
+                calls[call.get("id", "")] = (function.get("name", ""), arguments, rounds)
+
+    # Latest round in which each file was successfully written
+    written: dict[str, tuple[int, str]] = {}
+    for message in messages:
+        if message.get("role") != "tool_result" or message.get("is_error"):
+            continue
+        call_info = calls.get(message.get("tool_use_id", ""))
+        if call_info is not None and call_info[0] in _WRITE_TOOLS:
+            name, arguments, call_round = call_info
+            for path in _paths(name, arguments):
+                written[path] = (call_round, message["tool_use_id"])
+
+    referenced = result_dedup.referenced_ids(messages)
+    pruned: list[str] = []
+    for i, message in enumerate(messages):
+        if message.get("role") != "tool_result":
+            continue
+        tool_use_id = message.get("tool_use_id", "")
+        content = message.get("content")
+        call_info = calls.get(tool_use_id)
+        if (
+            call_info is None
+            or not isinstance(content, str)
+            or content.startswith(PRUNED_PREFIX)
+            or tool_use_id in referenced
+        ):
+            continue
+        name, arguments, call_round = call_info
+
+        stub: str | None = None
+        if config.prune_superseded_reads and name in _READ_TOOLS:
+            paths = _paths(name, arguments)
+            later = [written[p] for p in paths if p in written and written[p][0] > call_round]
+            if paths and len(later) == len(paths):
+                writer = max(later)[1]
+                stub = (
+                    f"{PRUNED_PREFIX}{name} output removed; the file was modified "
+                    f"afterwards by tool call {writer}. Read it again if needed.]"
+                )
+        if stub is None and config.keep_rounds is not None:
+            age = rounds - call_round
+            if age >= config.keep_rounds:
+                stub = (
+                    f"{PRUNED_PREFIX}{name} output from {age} tool rounds ago removed "
+                    "to save context. Call the tool again if needed.]"
+                )
+        if stub is not None and len(stub) < len(content):
+            messages[i] = {**message, "content": stub}
+            pruned.append(tool_use_id)
+    return pruned
@@ -0,0 +1,237 @@
+"""
+Deduplication of repeated tool output in the conversation history.
+
+Agents often Read the same file several times in one session, and every copy
+stays in the message history, inflating input tokens on every later request.
+ToolResultDeduplicator tracks content hashes of tool results and, when output
+recurs, replaces the new copy with:
+- a short reference, if the output is identical to an earlier result still
+  in the history ("unchanged since tool call X")
+- a unified diff, if the same call (same tool and input) returned output
+  that differs only slightly from its earlier result
+"""
+
+import dataclasses as _dataclasses
+import difflib as _difflib
+import hashlib as _hashlib
+import json as _json
+import re as _re
+import typing as _typing
+
+import brynhild.api.types as api_types
+import brynhild.constants as _constants
+
+_UNCHANGED_PREFIX = "[Unchanged: "
+_DIFF_PREFIX = "[Changed since "
+_REFERENCE_RE = _re.compile(r"tool call (\S+) \(")
+
+
+def _digest(content: str) -> str:
+    return _hashlib.sha256(content.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def _call_key(name: str, tool_input: dict[str, _typing.Any]) -> str:
+    """Identity of a call: the same tool with the same input."""
+    return name + "\0" + _json.dumps(tool_input, sort_keys=True, default=str)
+
+
+def referenced_ids(messages: list[dict[str, _typing.Any]]) -> set[str]:
+    """IDs of tool calls that a reference or diff in the history points to."""
+    found: set[str] = set()
+    for message in messages:
+        content = message.get("content")
+        if (
+            message.get("role") == "tool_result"
+            and isinstance(content, str)
+            and content.startswith((_UNCHANGED_PREFIX, _DIFF_PREFIX))
+        ):
+            match = _REFERENCE_RE.search(content.partition("\n")[0])
+            if match:
+                found.add(match.group(1))
+    return found
+
+
+@_dataclasses.dataclass
+class _Seen:
+    """An earlier full result still present in the history."""
+
+    tool_use_id: str
+    tool_name: str
+    content: str
+
+
+@_dataclasses.dataclass
+class Replacement:
+    """A tool result whose content was replaced by a reference or diff."""
+
+    tool_use_id: str
+    """The call whose output was replaced."""
+
+    reference_id: str
+    """The earlier call it refers to."""
+
+    kind: _typing.Literal["unchanged", "diff"]
+    """Whether the output was identical or sent as a diff."""
+
+    original: str
+    """The output that would have been sent."""
+
+    replacement: str
+    """What was sent instead."""
+
+
+class ToolResultDeduplicator:
+    """
+    Replace repeated tool output with references to earlier results.
+
+    Only successful results of at least min_chars are considered. A reference
+    is only ever made to a result that is present in full in the history
+    (seeded from it, or added since); call forget() when an earlier result
+    is removed from the history.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_chars: int = _constants.DEFAULT_DEDUP_MIN_CHARS,
+        max_diff_ratio: float = _constants.DEFAULT_DEDUP_MAX_DIFF_RATIO,
+    ) -> None:
+        """
+        Initialize the deduplicator.
+
+        Args:
+            min_chars: Smallest output worth replacing
+            max_diff_ratio: Send a diff only if it is at most this fraction
+                of the full output's size
+        """
+        self._min_chars = min_chars
+        self._max_diff_ratio = max_diff_ratio
+        self._by_hash: dict[str, _Seen] = {}
+        self._by_call: dict[str, _Seen] = {}
+        self._replacements: list[Replacement] = []
+
+    @property
+    def replacements(self) -> list[Replacement]:
+        """Replacements made so far (oldest first)."""
+        return list(self._replacements)
+
+    def seed(self, messages: list[dict[str, _typing.Any]]) -> None:
+        """
+        Index the full tool results in the history a turn starts from.
+
+        Results remembered from earlier turns are dropped first: a runner may
+        keep only part of each turn (e.g. no tool results), so only results
+        in this history may be referenced.
+
+        Args:
+            messages: History in the internal format (assistant messages with
+                tool_calls, followed by tool_result messages)
+        """
+        self._by_hash.clear()
+        self._by_call.clear()
+        calls: dict[str, tuple[str, dict[str, _typing.Any]]] = {}
+        for message in messages:
+            role = message.get("role")
+            if role == "assistant":
+                for call in message.get("tool_calls") or []:
+                    function = call.get("function", {})
+                    try:
+                        arguments = _json.loads(function.get("arguments") or "{}")
+                    except ValueError:
+                        continue
+                    if isinstance(arguments, dict):
+                        calls[call.get("id", "")] = (function.get("name", ""), arguments)
+            elif role == "tool_result" and not message.get("is_error"):
+                tool_use_id = message.get("tool_use_id", "")
+                content = message.get("content")
+                if (
+                    tool_use_id in calls
+                    and isinstance(content, str)
+                    and len(content) >= self._min_chars
+                ):
+                    name, arguments = calls[tool_use_id]
+                    if not content.startswith((_UNCHANGED_PREFIX, _DIFF_PREFIX)):
+                        self._remember(tool_use_id, name, arguments, content)
+
+    def apply(
+        self,
+        tool_use: api_types.ToolUse,
+        message: dict[str, _typing.Any],
+    ) -> Replacement | None:
+        """
+        Deduplicate a tool_result message in place before it enters the history.
+
+        Args:
+            tool_use: The call that produced the result
+            message: Message from format_tool_result_message()
+
+        Returns:
+            The replacement made, or None if the full output is kept
+        """
+        content = message.get("content")
+        if message.get("is_error") or not isinstance(content, str):
+            return None
+        if len(content) < self._min_chars:
+            return None
+
+        replacement: Replacement | None = None
+        same = self._by_hash.get(_digest(content))
+        previous = self._by_call.get(_call_key(tool_use.name, tool_use.input))
+        if same is not None:
+            replacement = Replacement(
+                tool_use_id=tool_use.id,
+                reference_id=same.tool_use_id,
+                kind="unchanged",
+                original=content,
+                replacement=(
+                    f"{_UNCHANGED_PREFIX}this output is identical to the result of "
+                    f"tool call {same.tool_use_id} ({same.tool_name}) above; "
+                    "refer to that result.]"
+                ),
+            )
+        elif previous is not None:
+            diff = "".join(
+                _difflib.unified_diff(
+                    previous.content.splitlines(keepends=True),
+                    content.splitlines(keepends=True),
+                    fromfile=f"tool call {previous.tool_use_id}",
+                    tofile=f"tool call {tool_use.id}",
+                    n=2,
+                )
+            )
+            if len(diff) <= len(content) * self._max_diff_ratio:
+                replacement = Replacement(
+                    tool_use_id=tool_use.id,
+                    reference_id=previous.tool_use_id,
+                    kind="diff",
+                    original=content,
+                    replacement=(
+                        f"{_DIFF_PREFIX}tool call {previous.tool_use_id} "
+                        f"({previous.tool_name}) above; unified diff against that "
+                        f"result:]\n{diff}"
+                    ),
+                )
+
+        if replacement is None:
+            self._remember(tool_use.id, tool_use.name, tool_use.input, content)
+            return None
+        message["content"] = replacement.replacement
+        self._replacements.append(replacement)
+        return replacement
+
+    def forget(self, tool_use_id: str) -> None:
+        """Stop referring to a result that is no longer in the history."""
+        self._by_hash = {h: s for h, s in self._by_hash.items() if s.tool_use_id != tool_use_id}
+        self._by_call = {k: s for k, s in self._by_call.items() if s.tool_use_id != tool_use_id}
+
+    def _remember(
+        self,
+        tool_use_id: str,
+        name: str,
+        tool_input: dict[str, _typing.Any],
+        content: str,
+    ) -> None:
+        seen = _Seen(tool_use_id=tool_use_id, tool_name=name, content=content)
+        self._by_hash.setdefault(_digest(content), seen)
+        # Diffs are taken against the latest full result of the same call
+        self._by_call[_call_key(name, tool_input)] = seen
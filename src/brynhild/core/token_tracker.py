@@ -142,6 +142,10 @@ class ConversationTokenTracker:
         """
         return count_messages_tokens(self._encoder, messages, system_prompt)
 
+    def count(self, text: str) -> int:
+        """Count the tokens in a text string."""
+        return count_tokens(self._encoder, text)
+
     def reset_turn(self) -> None:
         """Reset output token counter for a new turn."""
         self._current_turn_output = 0
@@ -59,6 +59,14 @@ class ToolExecutionCallbacks(_abc.ABC):
         """
         ...
 
+    def is_cancelled(self) -> bool:
+        """Check if the user has requested cancellation.
+
+        Returns:
+            True if cancelled, False otherwise.
+        """
+        return False
+
 
 class ToolExecutor:
     """
@@ -179,9 +187,11 @@ class ToolExecutor:
         # Execute the tool with metrics
         start_time = _time.perf_counter()
         try:
-            result = await tool.execute(tool_use.input)
+            result, outcome = await self._registry.run_tool(
+                tool, tool_use.input, self._callbacks.is_cancelled
+            )
             duration_ms = (_time.perf_counter() - start_time) * 1000
-            self._metrics.record(tool_use.name, result.success, duration_ms)
+            self._metrics.record(tool_use.name, result.success, duration_ms, outcome=outcome)
 
             # Prepend warnings to output so LLM gets feedback about unknown params
             if validation.has_warnings:
@@ -18,6 +18,7 @@ import pydantic as _pydantic
 import yaml as _yaml
 
 import brynhild.hooks.events as events
+import brynhild.hooks.matching as matching
 
 
 class HookTimeoutConfig(_pydantic.BaseModel):
@@ -36,16 +37,17 @@ class HookDefinition(_pydantic.BaseModel):
 
     Hooks are defined in hooks.yaml and specify:
     - When to fire (event type and match conditions)
-    - What to execute (command, script, or prompt)
+    - What to execute (command, script, prompt, or Python function)
     - How to handle results
 
     Required fields:
     - name: Unique identifier for this hook
-    - type: One of "command", "script", or "prompt"
+    - type: One of "command", "script", "prompt", or "python"
 
     For type="command": provide `command` (shell command to run)
     For type="script": provide `script` (path to Python script)
     For type="prompt": provide `prompt` (LLM prompt template)
+    For type="python": provide `function` (Python function as module:function)
     """
 
     model_config = _pydantic.ConfigDict(extra="forbid")
@@ -53,14 +55,15 @@ class HookDefinition(_pydantic.BaseModel):
     name: str
     """Unique identifier for this hook."""
 
-    type: _typing.Literal["command", "script", "prompt"] = _pydantic.Field(
+    type: _typing.Literal["command", "script", "prompt", "python"] = _pydantic.Field(
         ...,
         description=(
             "Hook type. Must be one of: 'command' (run shell command), "
-            "'script' (run Python script file), or 'prompt' (LLM prompt)"
+            "'script' (run Python script file), 'prompt' (LLM prompt), "
+            "or 'python' (call Python function in-process)"
         ),
     )
-    """Hook type: command (shell), script (Python), or prompt (LLM)."""
+    """Hook type: command (shell), script (Python), prompt (LLM), or python (in-process)."""
 
     # Trigger conditions
     event: str | None = None
@@ -76,12 +79,25 @@ class HookDefinition(_pydantic.BaseModel):
     script: str | None = None
     """Path to Python script (for type=script)."""
 
+    persistent: bool = False
+    """Keep the script running between invocations (for type=script).
+
+    The script then speaks a JSON-lines protocol: one context per line on
+    stdin, one result per line on stdout.
+    """
+
     prompt: str | None = None
     """LLM prompt template (for type=prompt)."""
 
     model: str | None = None
     """Model to use for prompt hooks (optional, uses default)."""
 
+    function: str | None = None
+    """Python function as 'module:function' (for type=python).
+
+    The module is a dotted module name or a path to a .py file.
+    """
+
     # Result handling
     message: str | None = None
     """Message to show user if hook blocks (for type=command)."""
@@ -92,16 +108,62 @@ class HookDefinition(_pydantic.BaseModel):
     enabled: bool = True
     """Whether this hook is enabled."""
 
+    # Memoization
+    cacheable: bool = False
+    """Hook is a pure function of its context: reuse results for repeated contexts.
+
+    Results are cached per session by hook name plus a hash of the context
+    the hook receives (see hooks.result_cache). Results of runs that hit
+    the timeout or failed are not cached.
+    """
+
+    cache_ttl: int = _pydantic.Field(default=300, gt=0)
+    """Seconds a cached result stays valid (for cacheable hooks and prompt hook verdicts)."""
+
+    # Instrumentation
+    budget_ms: int | None = _pydantic.Field(default=None, gt=0)
+    """Latency budget in milliseconds.
+
+    Executions that take longer are logged as warnings and counted in the
+    hook metrics (`brynhild hooks stats`). None: no budget.
+    """
+
+    # Concurrency
+    observe_only: bool | None = None
+    """Hook only observes: its result never blocks or modifies anything.
+
+    Observe-only hooks of an event run concurrently with each other and with
+    the event's other hooks. None infers it from the event: hooks of events
+    that can neither block nor modify are observe-only.
+    """
+
+    background: bool = False
+    """Fire and forget: don't wait for this (observe-only) hook at all.
+
+    Pending runs are awaited by HookManager.aclose() at session end.
+    """
+
+    _matcher: matching.PatternMatcher = _pydantic.PrivateAttr()
+
+    def model_post_init(self, __context: _typing.Any) -> None:
+        """Compile the match conditions once, when the hook is loaded."""
+        self._matcher = matching.PatternMatcher(self.match)
+
+    @property
+    def matcher(self) -> matching.PatternMatcher:
+        """Compiled matcher for the match conditions."""
+        return self._matcher
+
     @_pydantic.model_validator(mode="before")
     @classmethod
     def _validate_type_present(cls, data: _typing.Any) -> _typing.Any:
         """Provide helpful error message when 'type' field is missing."""
         if isinstance(data, dict) and "type" not in data:
-            valid_types = ("command", "script", "prompt")
+            valid_types = ("command", "script", "prompt", "python")
             raise ValueError(
                 f"'type' field is required. Must be one of: {', '.join(repr(t) for t in valid_types)}. "
                 "Use 'command' for shell commands, 'script' for Python scripts, "
-                "'prompt' for LLM prompts."
+                "'prompt' for LLM prompts, 'python' for in-process Python functions."
             )
         return data
 
@@ -109,12 +171,12 @@ class HookDefinition(_pydantic.BaseModel):
     @classmethod
     def _validate_type_value(cls, v: _typing.Any) -> str:
         """Provide helpful error message for invalid type values."""
-        valid_types = ("command", "script", "prompt")
+        valid_types = ("command", "script", "prompt", "python")
         if v not in valid_types:
             raise ValueError(
                 f"Invalid hook type '{v}'. Must be one of: {', '.join(repr(t) for t in valid_types)}. "
                 "Use 'command' for shell commands, 'script' for Python scripts, "
-                "'prompt' for LLM prompts."
+                "'prompt' for LLM prompts, 'python' for in-process Python functions."
             )
         return str(v)
 
@@ -136,8 +198,29 @@ class HookDefinition(_pydantic.BaseModel):
                 "Hook type 'prompt' requires the 'prompt' field with the LLM prompt template. "
                 "Example: prompt: \"Analyze this: {{context}}\""
             )
+        if self.type == "python" and (not self.function or ":" not in self.function):
+            raise ValueError(
+                "Hook type 'python' requires the 'function' field with a Python function "
+                "as 'module:function'. "
+                'Example: function: "my_plugin.hooks:guard"'
+            )
+        if self.persistent and self.type != "script":
+            raise ValueError(
+                f"'persistent: true' is only supported for script hooks, not '{self.type}'"
+            )
+        if self.background and self.observe_only is False:
+            raise ValueError(
+                "Hook with 'background: true' cannot set 'observe_only: false'; "
+                "background hooks are always observe-only"
+            )
         return self
 
+    def is_observe_only(self, event: events.HookEvent) -> bool:
+        """Whether this hook's result is ignored for an event (see observe_only)."""
+        if self.observe_only is not None:
+            return self.observe_only
+        return self.background or not (event.can_block or event.can_modify)
+
 
 class HooksConfig(_pydantic.BaseModel):
     """
@@ -166,11 +249,65 @@ class HooksConfig(_pydantic.BaseModel):
     hooks: dict[str, list[HookDefinition]] = _pydantic.Field(default_factory=dict)
     """Hooks organized by event name."""
 
+    _index: dict[str, _EventHooks] = _pydantic.PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: _typing.Any) -> None:
+        """Index the enabled hooks by event and exact tool name."""
+        self._index = {
+            event_name: _EventHooks([h for h in hook_list if h.enabled])
+            for event_name, hook_list in self.hooks.items()
+        }
+
     def get_hooks_for_event(self, event: events.HookEvent) -> list[HookDefinition]:
         """Get all enabled hooks for a given event."""
         hook_list = self.hooks.get(event.value, [])
         return [h for h in hook_list if h.enabled]
 
+    def get_candidate_hooks(
+        self,
+        event: events.HookEvent,
+        tool: str | None,
+    ) -> list[HookDefinition]:
+        """
+        Get the enabled hooks for an event that could match a tool.
+
+        Hooks whose `tool` condition is an exact name other than `tool` are
+        left out; the rest (in definition order) still need their match
+        conditions checked.
+
+        Args:
+            event: The event being dispatched.
+            tool: Tool name in the context (None for non-tool events).
+
+        Returns:
+            Candidate hooks (shared list; do not modify).
+        """
+        index = self._index.get(event.value)
+        if index is None:
+            return []
+        return index.candidates(tool)
+
+
+class _EventHooks:
+    """Enabled hooks of one event, indexed by their exact `tool` condition."""
+
+    def __init__(self, hooks: list[HookDefinition]) -> None:
+        self._hooks = hooks
+        self._exact_tools = [h.matcher.exact_value("tool") for h in hooks]
+        self._by_tool: dict[str | None, list[HookDefinition]] = {}
+
+    def candidates(self, tool: str | None) -> list[HookDefinition]:
+        """Hooks whose exact tool condition (if any) is this tool."""
+        found = self._by_tool.get(tool)
+        if found is None:
+            found = [
+                hook
+                for hook, exact in zip(self._hooks, self._exact_tools, strict=True)
+                if exact is None or exact == tool
+            ]
+            self._by_tool[tool] = found
+        return found
+
 
 def load_hooks_yaml(path: _pathlib.Path) -> HooksConfig:
     """
@@ -211,6 +211,31 @@ class HookContext:
 
         return result
 
+    def get_field(self, name: str) -> _typing.Any:
+        """
+        Get one top-level entry of to_dict() without serializing the rest.
+
+        Used for matching hook conditions against the context cheaply.
+
+        Args:
+            name: Key in to_dict()
+
+        Returns:
+            The value as to_dict() would give it, or None if absent.
+        """
+        if name == "event":
+            return self.event.value
+        if name == "logger" or name not in _CONTEXT_FIELDS:
+            return None
+        value = getattr(self, name)
+        if value is None:
+            return None
+        if name in ("cwd", "plugin_path"):
+            return str(value)
+        if name in ("tool_result", "tool_metrics"):
+            return value.to_dict()
+        return value
+
     def to_json(self) -> str:
         """Serialize to JSON string."""
         return _json.dumps(self.to_dict())
@@ -250,6 +275,10 @@ class HookContext:
         return env
 
 
+_CONTEXT_FIELDS = frozenset(f.name for f in _dataclasses.fields(HookContext))
+"""Field names of HookContext (keys get_field() can return)."""
+
+
 @_dataclasses.dataclass
 class HookResult:
     """
@@ -265,6 +294,8 @@ class HookResult:
         inject_system_message: System message to inject into conversation
         context_injection: Text to inject during context_build
         context_location: Where to inject (prepend or append)
+        timed_out: Set by the executor when the hook hit its timeout and this
+            is its on_timeout result (not serialized)
     """
 
     action: HookAction = HookAction.CONTINUE
@@ -283,6 +314,8 @@ class HookResult:
     context_injection: str | None = None
     context_location: _typing.Literal["prepend", "append"] | None = None
 
+    timed_out: bool = False
+
     @classmethod
     def construct_continue(cls) -> HookResult:
         """Create a continue result (proceed normally)."""
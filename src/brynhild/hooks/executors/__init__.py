@@ -5,6 +5,7 @@ Each executor handles a specific hook type:
 - CommandHookExecutor: Runs shell commands
 - ScriptHookExecutor: Runs Python scripts with JSON I/O
 - PromptHookExecutor: Calls LLM for decisions
+- PythonHookExecutor: Calls Python functions in-process
 """
 
 from __future__ import annotations
@@ -14,20 +15,26 @@ import typing as _typing
 
 from brynhild.hooks.executors.base import HookExecutor
 from brynhild.hooks.executors.command import CommandHookExecutor
+from brynhild.hooks.executors.python import PythonHookExecutor
 from brynhild.hooks.executors.script import ScriptHookExecutor
 
+if _typing.TYPE_CHECKING:
+    import brynhild.api.base as api_base
+
 __all__ = [
     "CommandHookExecutor",
     "HookExecutor",
+    "PythonHookExecutor",
     "ScriptHookExecutor",
     "create_executor",
 ]
 
 
 def create_executor(
-    hook_type: _typing.Literal["command", "script", "prompt"],
+    hook_type: _typing.Literal["command", "script", "prompt", "python"],
     *,
     project_root: _pathlib.Path | None = None,
+    provider: api_base.LLMProvider | None = None,
 ) -> HookExecutor:
     """
     Create an executor for the given hook type.
@@ -35,6 +42,7 @@ def create_executor(
     Args:
         hook_type: Type of hook to execute.
         project_root: Project root directory.
+        provider: LLM provider for prompt hooks (default: created on first use).
 
     Returns:
         Appropriate executor instance.
@@ -46,11 +54,13 @@ def create_executor(
         return CommandHookExecutor(project_root=project_root)
     elif hook_type == "script":
         return ScriptHookExecutor(project_root=project_root)
+    elif hook_type == "python":
+        return PythonHookExecutor(project_root=project_root)
     elif hook_type == "prompt":
         # Import here to avoid circular imports and heavy deps
         from brynhild.hooks.executors.prompt import PromptHookExecutor
 
-        return PromptHookExecutor(project_root=project_root)
+        return PromptHookExecutor(project_root=project_root, provider=provider)
     else:
         raise ValueError(f"Unknown hook type: {hook_type}")
 
@@ -62,6 +62,13 @@ class HookExecutor(_abc.ABC):
         """
         ...
 
+    async def aclose(self) -> None:  # noqa: B027
+        """
+        Release resources held across executions (e.g. worker processes).
+
+        The default implementation holds none.
+        """
+
     async def execute(
         self,
         hook_def: config.HookDefinition,
@@ -81,7 +88,6 @@ class HookExecutor(_abc.ABC):
             Hook execution result.
         """
         timeout_seconds = hook_def.timeout.seconds
-        on_timeout = hook_def.timeout.on_timeout
 
         try:
             return await _asyncio.wait_for(
@@ -89,13 +95,7 @@ class HookExecutor(_abc.ABC):
                 timeout=timeout_seconds,
             )
         except TimeoutError:
-            if on_timeout == "block":
-                return events.HookResult.construct_block(
-                    f"Hook '{hook_def.name}' timed out after {timeout_seconds}s"
-                )
-            else:
-                # on_timeout == "continue"
-                return events.HookResult.construct_continue()
+            return self._timeout_result(hook_def)
         except Exception as e:
             # Execution errors result in continue (don't block on hook failures)
             # The manager will log the error
@@ -103,6 +103,37 @@ class HookExecutor(_abc.ABC):
                 f"Hook '{hook_def.name}' failed: {e}"
             ) from e
 
+    async def execute_batch(
+        self,
+        hook_defs: list[config.HookDefinition],
+        context: events.HookContext,
+    ) -> list[events.HookResult]:
+        """
+        Execute several hooks for the same context.
+
+        Executors that can combine hooks into one request override this;
+        by default the hooks run one after another.
+
+        Args:
+            hook_defs: The hook definitions.
+            context: The hook context.
+
+        Returns:
+            One result per hook, in order.
+        """
+        return [await self.execute(hook_def, context) for hook_def in hook_defs]
+
+    def _timeout_result(self, hook_def: config.HookDefinition) -> events.HookResult:
+        """Result of a hook that exceeded its timeout (per its on_timeout action)."""
+        if hook_def.timeout.on_timeout == "block":
+            result = events.HookResult.construct_block(
+                f"Hook '{hook_def.name}' timed out after {hook_def.timeout.seconds}s"
+            )
+        else:
+            result = events.HookResult.construct_continue()
+        result.timed_out = True
+        return result
+
 
 class HookExecutionError(Exception):
     """Raised when a hook fails to execute."""
@@ -10,20 +10,37 @@ Example prompt:
     Command: {{tool_input.command}}
 
     Respond with JSON: {"safe": true/false, "reason": "..."}
+
+Several prompt hooks on the same event are combined into one request that
+asks for one verdict per hook (see execute_batch()). Verdicts are cached by
+a hash of the rendered prompt, so a check the LLM already answered in this
+session is not asked again. Only verdicts that were actually parsed are
+cached: a missing or garbled answer counts as continue for that call only.
 """
 
 from __future__ import annotations
 
+import asyncio as _asyncio
+import hashlib as _hashlib
 import json as _json
 import re as _re
 import typing as _typing
 
+import brynhild.api.base as api_base
 import brynhild.hooks.config as config
 import brynhild.hooks.events as events
 import brynhild.hooks.executors.base as base
+import brynhild.hooks.result_cache as result_cache
+
+_MAX_TOKENS_PER_VERDICT = 500
+"""Response token limit per hook (keep responses short)."""
 
-if _typing.TYPE_CHECKING:
-    import brynhild.api.base as api_base
+_BATCH_INSTRUCTIONS = """\
+Answer each of the {count} independent checks below on its own, following \
+its instructions. Respond with only one JSON object that maps each check \
+number to the JSON verdict that check asks for, e.g. {example}.
+"""
+"""Preamble of a combined request; the checks follow as numbered sections."""
 
 
 class PromptHookExecutor(base.HookExecutor):
@@ -46,9 +63,15 @@ class PromptHookExecutor(base.HookExecutor):
         Args:
             project_root: Project root directory.
             provider: LLM provider to use. If None, creates default provider.
+                A session's provider is forked (see LLMProvider.fork()), so
+                hook requests don't disturb its conversation caches.
         """
         super().__init__(project_root=project_root)
+        # Duck-typed providers don't implement fork()
+        if isinstance(provider, api_base.LLMProvider):
+            provider = provider.fork()
         self._provider = provider
+        self._verdicts = result_cache.HookResultCache()
 
     @property
     def hook_type(self) -> str:
@@ -99,28 +122,128 @@ class PromptHookExecutor(base.HookExecutor):
         Renders the prompt template, calls the LLM, and parses the
         JSON response.
         """
-        prompt_template = hook_def.prompt
-        if not prompt_template:
-            raise base.HookExecutionError("Prompt hook has no prompt")
+        (result,) = await self._execute_batch_impl([hook_def], context)
+        return result
+
+    async def execute_batch(
+        self,
+        hook_defs: list[config.HookDefinition],
+        context: events.HookContext,
+    ) -> list[events.HookResult]:
+        """
+        Execute several prompt hooks in a single LLM request.
+
+        The batch runs under the longest timeout of its hooks; if it is
+        exceeded, each hook's on_timeout action applies.
+
+        Args:
+            hook_defs: The prompt hook definitions.
+            context: The hook context.
+
+        Returns:
+            One result per hook, in order.
+        """
+        timeout_seconds = max(hook_def.timeout.seconds for hook_def in hook_defs)
+        try:
+            return await _asyncio.wait_for(
+                self._execute_batch_impl(hook_defs, context),
+                timeout=timeout_seconds,
+            )
+        except TimeoutError:
+            return [self._timeout_result(hook_def) for hook_def in hook_defs]
+        except Exception as e:
+            names = ", ".join(f"'{hook_def.name}'" for hook_def in hook_defs)
+            raise base.HookExecutionError(f"Hooks {names} failed: {e}") from e
+
+    async def _execute_batch_impl(
+        self,
+        hook_defs: list[config.HookDefinition],
+        context: events.HookContext,
+    ) -> list[events.HookResult]:
+        """Render the prompts, ask the LLM for uncached verdicts, and cache them."""
+        prompts: list[str] = []
+        for hook_def in hook_defs:
+            if not hook_def.prompt:
+                raise base.HookExecutionError(f"Prompt hook '{hook_def.name}' has no prompt")
+            prompts.append(self._render_prompt(hook_def.prompt, context))
+        digests = [_hashlib.sha256(prompt.encode("utf-8")).hexdigest() for prompt in prompts]
+
+        results: list[events.HookResult | None] = [
+            self._verdicts.get(hook_def.name, digest)
+            for hook_def, digest in zip(hook_defs, digests, strict=True)
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        verdicts: list[events.HookResult | None] = []
+        if len(pending) == 1:
+            (i,) = pending
+            response = await self._complete(prompts[i], 1)
+            verdicts = [self._parse_response(response, hook_defs[i].name)]
+        elif pending:
+            batch_prompt = self._batch_prompt([prompts[i] for i in pending])
+            response = await self._complete(batch_prompt, len(pending))
+            verdicts = self._parse_batch_response(response, [hook_defs[i].name for i in pending])
 
-        # Render the prompt
-        rendered_prompt = self._render_prompt(prompt_template, context)
+        for i, verdict in zip(pending, verdicts, strict=True):
+            if verdict is None:
+                # No usable answer: continue, but ask again next time
+                results[i] = events.HookResult.construct_continue()
+                continue
+            results[i] = verdict
+            hook_def = hook_defs[i]
+            self._verdicts.put(hook_def.name, digests[i], verdict, hook_def.cache_ttl)
+        return [result for result in results if result is not None]
 
-        # Call the LLM
+    async def _complete(self, prompt: str, verdicts: int) -> str:
+        """Send one prompt to the LLM and return its answer."""
         provider = self._get_provider()
         response = await provider.complete(
-            messages=[{"role": "user", "content": rendered_prompt}],
-            max_tokens=500,  # Keep response short
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=_MAX_TOKENS_PER_VERDICT * verdicts,
         )
+        return response.content
+
+    def _batch_prompt(self, prompts: list[str]) -> str:
+        """Combine rendered prompts into one request for numbered verdicts."""
+        example = _json.dumps({str(n): {"...": "..."} for n in range(1, len(prompts) + 1)})
+        sections = [_BATCH_INSTRUCTIONS.format(count=len(prompts), example=example)]
+        sections += [f"## Check {n}\n\n{prompt}" for n, prompt in enumerate(prompts, start=1)]
+        return "\n\n".join(sections)
+
+    def _parse_batch_response(
+        self,
+        response: str,
+        hook_names: list[str],
+    ) -> list[events.HookResult | None]:
+        """
+        Parse the answer to a combined request into one result per hook.
 
-        # Parse the response
-        return self._parse_response(response.content, hook_def.name)
+        Verdicts that are missing or malformed are None (continue, as for a
+        single prompt hook).
+        """
+        data: _typing.Any = None
+        start = response.find("{")
+        if start >= 0:
+            try:
+                data, _ = _json.JSONDecoder().raw_decode(response, start)
+            except _json.JSONDecodeError:
+                data = None
+        if not isinstance(data, dict):
+            return [None for _ in hook_names]
+
+        results: list[events.HookResult | None] = []
+        for n, hook_name in enumerate(hook_names, start=1):
+            verdict = data.get(str(n))
+            if isinstance(verdict, dict):
+                results.append(self._parse_verdict(verdict, hook_name))
+            else:
+                results.append(None)
+        return results
 
     def _parse_response(
         self,
         response: str,
         hook_name: str,
-    ) -> events.HookResult:
+    ) -> events.HookResult | None:
         """
         Parse LLM response to determine hook result.
 
@@ -128,18 +251,28 @@ class PromptHookExecutor(base.HookExecutor):
         {"safe": true/false, "reason": "..."}
         or
         {"action": "continue|block|skip", "message": "..."}
+
+        Returns None if the response holds no verdict (treated as continue).
         """
         # Try to extract JSON from response
         json_match = _re.search(r"\{[^{}]*\}", response)
         if not json_match:
-            # No JSON found, assume continue
-            return events.HookResult.construct_continue()
+            # No JSON found
+            return None
 
         try:
             data = _json.loads(json_match.group())
         except _json.JSONDecodeError:
-            return events.HookResult.construct_continue()
+            return None
 
+        return self._parse_verdict(data, hook_name)
+
+    def _parse_verdict(
+        self,
+        data: dict[str, _typing.Any],
+        hook_name: str,
+    ) -> events.HookResult | None:
+        """Turn a parsed verdict object into a hook result (None: no verdict)."""
         # Check for action-based response
         if "action" in data:
             return events.HookResult.from_dict(data)
@@ -154,6 +287,6 @@ class PromptHookExecutor(base.HookExecutor):
                 message = reason or f"Hook '{hook_name}' determined operation is unsafe"
                 return events.HookResult.construct_block(message)
 
-        # Unknown format, continue
-        return events.HookResult.construct_continue()
+        # Unknown format
+        return None
 
@@ -0,0 +1,143 @@
+"""
+Python hook executor - calls a Python function in-process.
+
+Python hooks reference a function as "module:function", where module is
+either an importable dotted module name or a path to a .py file (relative
+to the project root). The function receives the HookContext object itself,
+with no serialization, and returns a HookResult.
+
+Example hook module:
+    import brynhild.hooks.events as events
+
+    def guard(context: events.HookContext) -> events.HookResult | None:
+        if context.tool == "Bash" and "rm -rf /" in context.tool_input["command"]:
+            return events.HookResult.construct_block("Refusing to delete /")
+        return None  # continue
+
+The function may also be async. Synchronous functions run on the event
+loop, so the timeout only interrupts async functions; keep sync hooks quick.
+"""
+
+from __future__ import annotations
+
+import hashlib as _hashlib
+import importlib as _importlib
+import importlib.util as _importlib_util
+import inspect as _inspect
+import pathlib as _pathlib
+import sys as _sys
+import typing as _typing
+
+import brynhild.hooks.config as config
+import brynhild.hooks.events as events
+import brynhild.hooks.executors.base as base
+
+HookFunction = _typing.Callable[[events.HookContext], _typing.Any]
+"""A python hook: returns a HookResult (or awaitable of one); None means continue."""
+
+
+class PythonHookExecutor(base.HookExecutor):
+    """
+    Executor for python hooks.
+
+    Resolves each "module:function" reference once and calls the function
+    directly with the hook context.
+    """
+
+    def __init__(
+        self,
+        *,
+        project_root: _pathlib.Path | None = None,
+    ) -> None:
+        super().__init__(project_root=project_root)
+        self._functions: dict[str, HookFunction] = {}
+
+    @property
+    def hook_type(self) -> str:
+        return "python"
+
+    async def _execute_impl(
+        self,
+        hook_def: config.HookDefinition,
+        context: events.HookContext,
+    ) -> events.HookResult:
+        """
+        Execute a python hook.
+
+        Calls the function with the context (awaiting it if it is async)
+        and validates the result.
+        """
+        reference = hook_def.function
+        if not reference:
+            raise base.HookExecutionError("Python hook has no function reference")
+
+        result = self._resolve(reference)(context)
+        if _inspect.isawaitable(result):
+            result = await result
+
+        if result is None:
+            return events.HookResult.construct_continue()
+        if isinstance(result, events.HookResult):
+            return result
+        if isinstance(result, dict):
+            return events.HookResult.from_dict(result)
+        raise base.HookExecutionError(
+            f"Python hook '{reference}' returned {type(result).__name__}, expected HookResult"
+        )
+
+    def _resolve(self, reference: str) -> HookFunction:
+        """Import the function for a "module:function" reference (cached)."""
+        function = self._functions.get(reference)
+        if function is not None:
+            return function
+
+        module_ref, _, attr_path = reference.rpartition(":")
+        module = self._import(module_ref)
+
+        target: _typing.Any = module
+        try:
+            for attr in attr_path.split("."):
+                target = getattr(target, attr)
+        except AttributeError as e:
+            raise base.HookExecutionError(
+                f"Python hook function not found: '{attr_path}' in '{module_ref}'"
+            ) from e
+        if not callable(target):
+            raise base.HookExecutionError(f"Python hook '{reference}' is not callable")
+
+        self._functions[reference] = target
+        return target  # type: ignore[no-any-return]
+
+    def _import(self, module_ref: str) -> _typing.Any:
+        """Import a dotted module name or a .py file relative to the project root."""
+        if not module_ref.endswith(".py"):
+            try:
+                return _importlib.import_module(module_ref)
+            except ImportError as e:
+                raise base.HookExecutionError(
+                    f"Cannot import python hook module '{module_ref}': {e}"
+                ) from e
+
+        module_path = _pathlib.Path(module_ref)
+        if not module_path.is_absolute():
+            module_path = self._project_root / module_path
+        if not module_path.exists():
+            raise base.HookExecutionError(f"Python hook module not found: {module_path}")
+
+        # Unique per file, so same-named hook modules of different plugins don't clash
+        digest = _hashlib.sha256(str(module_path.resolve()).encode()).hexdigest()[:12]
+        module_name = f"brynhild_hooks.{module_path.stem}_{digest}"
+        if module_name in _sys.modules:
+            return _sys.modules[module_name]
+
+        spec = _importlib_util.spec_from_file_location(module_name, module_path)
+        if spec is None or spec.loader is None:
+            raise base.HookExecutionError(f"Cannot load module spec for: {module_path}")
+        module = _importlib_util.module_from_spec(spec)
+        _sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del _sys.modules[module_name]
+            raise
+        return module
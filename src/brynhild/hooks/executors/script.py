@@ -12,11 +12,26 @@ Example script:
     context = json.load(sys.stdin)
     # ... process context ...
     json.dump({"action": "continue"}, sys.stdout)
+
+Persistent script hooks (persistent: true) keep one worker process per
+script running instead, so only the first invocation pays for interpreter
+startup. The worker reads one context JSON object per line on stdin and
+writes one result JSON object per line on stdout (an empty line means
+continue):
+
+    import json
+    import sys
+
+    for line in sys.stdin:
+        context = json.loads(line)
+        # ... process context ...
+        print(json.dumps({"action": "continue"}), flush=True)
 """
 
 from __future__ import annotations
 
 import asyncio as _asyncio
+import collections as _collections
 import json as _json
 import pathlib as _pathlib
 
@@ -24,15 +39,144 @@ import brynhild.hooks.config as config
 import brynhild.hooks.events as events
 import brynhild.hooks.executors.base as base
 
+_WORKER_LINE_LIMIT = 16 * 1024 * 1024
+"""Longest result line (bytes) a persistent worker may write."""
+
+_WORKER_STDERR_LINES = 20
+"""Trailing stderr lines of a persistent worker kept for error messages."""
+
+_WORKER_SHUTDOWN_TIMEOUT = 2.0
+"""Seconds a persistent worker gets to exit after stdin is closed."""
+
+
+class _ScriptWorker:
+    """
+    Long-lived process for a persistent script hook.
+
+    Requests are answered one at a time, in order. A worker that has exited
+    is started again on the next request; one whose request was interrupted
+    (timeout, cancellation) is killed, since its late answer would otherwise
+    be taken as the answer to the next request.
+    """
+
+    def __init__(self, script_path: _pathlib.Path, cwd: _pathlib.Path) -> None:
+        self._script_path = script_path
+        self._cwd = cwd
+        self._process: _asyncio.subprocess.Process | None = None
+        self._stderr_tail: _collections.deque[str] = _collections.deque(maxlen=_WORKER_STDERR_LINES)
+        self._stderr_task: _asyncio.Task[None] | None = None
+        self._killed: list[_asyncio.subprocess.Process] = []
+        self._lock = _asyncio.Lock()
+        self.starts = 0
+        """Number of times the process was started."""
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self._process is not None and self._process.returncode is None
+
+    async def request(self, context_json: str) -> str:
+        """
+        Send one context to the worker and return its result line.
+
+        Raises:
+            HookExecutionError: If the worker exits before answering.
+        """
+        async with self._lock:
+            if not self.alive:
+                await self._start()
+            process = self._process
+            assert process is not None
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(context_json.encode("utf-8") + b"\n")
+                await process.stdin.drain()
+                line = await process.stdout.readline()
+            except (BrokenPipeError, ConnectionResetError):
+                line = b""
+            except BaseException:
+                self._kill()
+                raise
+
+            if not line:
+                returncode = await process.wait()
+                if self._stderr_task is not None:
+                    await self._stderr_task
+                error_msg = "\n".join(self._stderr_tail)
+                self._process = None
+                raise base.HookExecutionError(
+                    f"Persistent script '{self._script_path}' exited "
+                    f"(exit {returncode}): {error_msg}"
+                )
+            return line.decode("utf-8", errors="replace").strip()
+
+    async def close(self) -> None:
+        """Stop the worker: close its stdin, then kill it if it doesn't exit."""
+        for killed in self._killed:
+            await killed.wait()
+        self._killed.clear()
+        process = self._process
+        if process is None:
+            return
+        if process.returncode is None:
+            assert process.stdin is not None
+            process.stdin.close()
+            try:
+                await _asyncio.wait_for(process.wait(), timeout=_WORKER_SHUTDOWN_TIMEOUT)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+        if self._stderr_task is not None:
+            await self._stderr_task
+        self._process = None
+
+    async def _start(self) -> None:
+        """Start (or restart) the worker process."""
+        self._process = await _asyncio.create_subprocess_exec(
+            "python3",
+            str(self._script_path),
+            stdin=_asyncio.subprocess.PIPE,
+            stdout=_asyncio.subprocess.PIPE,
+            stderr=_asyncio.subprocess.PIPE,
+            cwd=str(self._cwd),
+            limit=_WORKER_LINE_LIMIT,
+        )
+        self._stderr_tail.clear()
+        self._stderr_task = _asyncio.ensure_future(self._drain_stderr(self._process))
+        self.starts += 1
+
+    async def _drain_stderr(self, process: _asyncio.subprocess.Process) -> None:
+        """Keep the stderr pipe from filling up, remembering its last lines."""
+        assert process.stderr is not None
+        async for line in process.stderr:
+            self._stderr_tail.append(line.decode("utf-8", errors="replace").rstrip())
+
+    def _kill(self) -> None:
+        """Kill the worker process (it is started again on the next request)."""
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+            self._killed.append(self._process)
+        self._process = None
+
 
 class ScriptHookExecutor(base.HookExecutor):
     """
     Executor for script hooks.
 
     Runs Python scripts, passing context as JSON on stdin and
-    parsing the result from JSON on stdout.
+    parsing the result from JSON on stdout. Persistent hooks are served
+    by one worker process per script (and working directory) until
+    aclose().
     """
 
+    def __init__(
+        self,
+        *,
+        project_root: _pathlib.Path | None = None,
+    ) -> None:
+        super().__init__(project_root=project_root)
+        self._workers: dict[tuple[_pathlib.Path, _pathlib.Path], _ScriptWorker] = {}
+
     @property
     def hook_type(self) -> str:
         return "script"
@@ -63,6 +207,10 @@ class ScriptHookExecutor(base.HookExecutor):
         # Prepare context JSON
         context_json = context.to_json()
 
+        if hook_def.persistent:
+            worker = self._get_worker(script_path, context.cwd)
+            return self._parse_output(script_path, await worker.request(context_json))
+
         # Run script with Python interpreter
         # Use sys.executable equivalent - but we'll use python3 for simplicity
         # In production, could detect the venv Python
@@ -85,6 +233,14 @@ class ScriptHookExecutor(base.HookExecutor):
 
         # Parse result from stdout
         stdout_str = stdout.decode("utf-8", errors="replace").strip()
+        return self._parse_output(script_path, stdout_str)
+
+    def _parse_output(
+        self,
+        script_path: _pathlib.Path,
+        stdout_str: str,
+    ) -> events.HookResult:
+        """Parse a script's (stripped) output into a HookResult."""
         if not stdout_str:
             # Empty output = continue
             return events.HookResult.construct_continue()
@@ -97,3 +253,20 @@ class ScriptHookExecutor(base.HookExecutor):
                 f"Script '{script_path}' returned invalid JSON: {e}"
             ) from e
 
+    def _get_worker(
+        self,
+        script_path: _pathlib.Path,
+        cwd: _pathlib.Path,
+    ) -> _ScriptWorker:
+        """Get or create the persistent worker for a script."""
+        key = (script_path, cwd)
+        if key not in self._workers:
+            self._workers[key] = _ScriptWorker(script_path, cwd)
+        return self._workers[key]
+
+    async def aclose(self) -> None:
+        """Shut down all persistent workers."""
+        workers = list(self._workers.values())
+        self._workers.clear()
+        for worker in workers:
+            await worker.close()
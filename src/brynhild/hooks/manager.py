@@ -7,16 +7,21 @@ in the correct order, handling results and modifications.
 
 from __future__ import annotations
 
+import asyncio as _asyncio
 import logging as _logging
 import pathlib as _pathlib
+import time as _time
 import typing as _typing
 
 import brynhild.hooks.config as config
 import brynhild.hooks.events as events
-import brynhild.hooks.matching as matching
+import brynhild.hooks.metrics as hooks_metrics
+import brynhild.hooks.result_cache as result_cache
 
 if _typing.TYPE_CHECKING:
+    import brynhild.api.base as api_base
     import brynhild.hooks.executors.base as executors_base
+    import brynhild.logging as brynhild_logging
 
 _logger = _logging.getLogger(__name__)
 
@@ -31,6 +36,15 @@ class HookManager:
     Hooks are executed sequentially in definition order. If any hook
     returns BLOCK, execution stops and the block result is returned.
     Modifications from earlier hooks are visible to later hooks.
+
+    Observe-only hooks (see HookDefinition.observe_only) are the exception:
+    their results are ignored, so they start together when the event is
+    dispatched and run concurrently, each under its own timeout. Background
+    hooks are not waited for at all until aclose().
+
+    Results of cacheable hooks (see HookDefinition.cacheable) are memoized
+    for the lifetime of the manager. Every execution is timed into
+    `metrics`; executions over a hook's budget_ms are logged as warnings.
     """
 
     def __init__(
@@ -38,6 +52,7 @@ class HookManager:
         hooks_config: config.HooksConfig,
         *,
         project_root: _pathlib.Path | None = None,
+        provider: api_base.LLMProvider | None = None,
     ) -> None:
         """
         Initialize the hook manager.
@@ -45,15 +60,24 @@ class HookManager:
         Args:
             hooks_config: Loaded hooks configuration.
             project_root: Project root directory (for resolving script paths).
+            provider: LLM provider for prompt hooks; pass the session's
+                provider to reuse its HTTP connection pool (default: one
+                is created from settings on first use).
         """
         self._config = hooks_config
         self._project_root = project_root or _pathlib.Path.cwd()
+        self._provider = provider
         self._executors: dict[str, executors_base.HookExecutor] = {}
+        self._background: set[_asyncio.Task[None]] = set()
+        self._result_cache = result_cache.HookResultCache()
+        self._metrics = hooks_metrics.HookMetricsCollector()
 
     @classmethod
     def from_config(
         cls,
         project_root: _pathlib.Path | None = None,
+        *,
+        provider: api_base.LLMProvider | None = None,
     ) -> HookManager:
         """
         Create a HookManager by loading configuration files.
@@ -63,12 +87,13 @@ class HookManager:
 
         Args:
             project_root: Project root directory.
+            provider: LLM provider for prompt hooks (see __init__).
 
         Returns:
             Configured HookManager.
         """
         hooks_config = config.load_merged_config(project_root)
-        return cls(hooks_config, project_root=project_root)
+        return cls(hooks_config, project_root=project_root, provider=provider)
 
     @classmethod
     def construct_empty(cls) -> HookManager:
@@ -85,6 +110,8 @@ class HookManager:
 
         Hooks are executed sequentially. If any hook returns BLOCK,
         execution stops immediately. Modifications accumulate.
+        Observe-only hooks run concurrently and are awaited before
+        returning (background hooks are not).
 
         Args:
             event: The event being dispatched.
@@ -95,29 +122,91 @@ class HookManager:
             returns that block result. Otherwise returns CONTINUE
             with any accumulated modifications.
         """
-        hooks = self._config.get_hooks_for_event(event)
+        # Hooks are indexed by exact tool name: for a tool no hook targets
+        # this is a dict lookup, with no context serialization
+        hooks = self._config.get_candidate_hooks(event, context.tool)
         if not hooks:
             return events.HookResult.construct_continue()
 
-        context_dict = context.to_dict()
-        accumulated_result = events.HookResult.construct_continue()
+        # Context fields are serialized on demand, only for the fields that
+        # match conditions refer to; modifications from earlier hooks override
+        fields: dict[str, _typing.Any] = {}
 
+        def lookup(name: str) -> _typing.Any:
+            if name not in fields:
+                fields[name] = context.get_field(name)
+            return fields[name]
+
+        # Observe-only hooks are matched against the context as dispatched
+        # and started right away; the others run in order below
+        observers: list[_asyncio.Task[None]] = []
+        chain: list[config.HookDefinition] = []
         for hook_def in hooks:
-            # Check if hook matches
-            if not self._matches_hook(hook_def, context_dict):
-                continue
-
-            # Execute the hook
-            try:
-                result = await self._execute_hook(hook_def, context)
-            except Exception as e:
-                _logger.warning(
-                    "Hook %s failed with error: %s",
-                    hook_def.name,
-                    e,
-                )
-                # Hook errors don't block by default - continue
-                continue
+            if not hook_def.is_observe_only(event):
+                chain.append(hook_def)
+            elif self._matches_hook(hook_def, lookup):
+                task = _asyncio.ensure_future(self._observe(hook_def, context))
+                if hook_def.background:
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                else:
+                    observers.append(task)
+
+        try:
+            result = await self._run_chain(event, context, chain, lookup, fields)
+        except BaseException:
+            for task in observers:
+                task.cancel()
+            raise
+        if observers:
+            await _asyncio.gather(*observers)
+        return result
+
+    async def _run_chain(
+        self,
+        event: events.HookEvent,
+        context: events.HookContext,
+        hooks: list[config.HookDefinition],
+        lookup: _typing.Callable[[str], _typing.Any],
+        fields: dict[str, _typing.Any],
+    ) -> events.HookResult:
+        """Run hooks whose results count, sequentially (see dispatch())."""
+        accumulated_result = events.HookResult.construct_continue()
+
+        # Results of prompt hooks evaluated ahead in a batch (None: failed)
+        batched: dict[int, events.HookResult | None] = {}
+
+        for index, hook_def in enumerate(hooks):
+            if index in batched:
+                batched_result = batched.pop(index)
+                if batched_result is None:
+                    continue
+                result = batched_result
+            else:
+                # Check if hook matches
+                if not self._matches_hook(hook_def, lookup):
+                    continue
+
+                batch = [index] if batched else self._prompt_batch(hooks, index, lookup)
+                if len(batch) > 1:
+                    # Consecutive prompt hooks share one LLM request
+                    batched = await self._execute_prompt_batch(hooks, batch, context)
+                    batched_result = batched.pop(index)
+                    if batched_result is None:
+                        continue
+                    result = batched_result
+                else:
+                    # Execute the hook
+                    try:
+                        result = await self._execute_hook(hook_def, context)
+                    except Exception as e:
+                        _logger.warning(
+                            "Hook %s failed with error: %s",
+                            hook_def.name,
+                            e,
+                        )
+                        # Hook errors don't block by default - continue
+                        continue
 
             # Handle the result
             if result.action == events.HookAction.BLOCK:
@@ -142,30 +231,139 @@ class HookManager:
                     result,
                 )
 
-                # Update context_dict with modifications for subsequent hooks
+                # Update matched fields with modifications for subsequent hooks
                 if result.modified_input is not None:
-                    context_dict["tool_input"] = result.modified_input
+                    fields["tool_input"] = result.modified_input
                 if result.modified_output is not None:
-                    context_dict["tool_result"] = {
-                        **context_dict.get("tool_result", {}),
+                    fields["tool_result"] = {
+                        **(lookup("tool_result") or {}),
                         "output": result.modified_output,
                     }
                 if result.modified_message is not None:
-                    context_dict["message"] = result.modified_message
+                    fields["message"] = result.modified_message
                 if result.modified_response is not None:
-                    context_dict["response"] = result.modified_response
+                    fields["response"] = result.modified_response
 
         return accumulated_result
 
+    def _prompt_batch(
+        self,
+        hooks: list[config.HookDefinition],
+        start: int,
+        lookup: _typing.Callable[[str], _typing.Any],
+    ) -> list[int]:
+        """
+        Indexes of the matching prompt hooks in the run starting at start.
+
+        The run is the consecutive prompt hooks from hooks[start] (which
+        matches); cacheable ones are left out, since they are memoized
+        individually. Later hooks of the run are matched against the
+        context as it is before the run.
+        """
+        if hooks[start].type != "prompt" or hooks[start].cacheable:
+            return [start]
+        batch = [start]
+        for index in range(start + 1, len(hooks)):
+            hook_def = hooks[index]
+            if hook_def.type != "prompt":
+                break
+            if not hook_def.cacheable and self._matches_hook(hook_def, lookup):
+                batch.append(index)
+        return batch
+
+    async def _execute_prompt_batch(
+        self,
+        hooks: list[config.HookDefinition],
+        batch: list[int],
+        context: events.HookContext,
+    ) -> dict[int, events.HookResult | None]:
+        """Execute a batch of prompt hooks, recording each in the metrics."""
+        hook_defs = [hooks[index] for index in batch]
+        executor = self._get_executor(hook_defs[0])
+        start = _time.perf_counter()
+        try:
+            results = await executor.execute_batch(hook_defs, context)
+        except Exception as e:
+            _logger.warning("Hooks %s failed with error: %s", [h.name for h in hook_defs], e)
+            for hook_def in hook_defs:
+                self._record(hook_def, context, "error", start, cached=None)
+            return dict.fromkeys(batch)
+
+        for hook_def, result in zip(hook_defs, results, strict=True):
+            outcome: hooks_metrics.HookOutcome = (
+                "timeout" if result.timed_out else result.action.value
+            )
+            self._record(hook_def, context, outcome, start, cached=None)
+        return dict(zip(batch, results, strict=True))
+
     def _matches_hook(
         self,
         hook_def: config.HookDefinition,
-        context_dict: dict[str, _typing.Any],
+        lookup: _typing.Callable[[str], _typing.Any],
     ) -> bool:
         """Check if a hook's match conditions are satisfied."""
         if not hook_def.match:
             return True
-        return matching.match_patterns(hook_def.match, context_dict)
+        return hook_def.matcher.matches_lookup(lookup)
+
+    async def _observe(
+        self,
+        hook_def: config.HookDefinition,
+        context: events.HookContext,
+    ) -> None:
+        """Run an observe-only hook, ignoring its result."""
+        try:
+            result = await self._execute_hook(hook_def, context)
+        except Exception as e:
+            _logger.warning(
+                "Hook %s failed with error: %s",
+                hook_def.name,
+                e,
+            )
+            return
+        if result.action != events.HookAction.CONTINUE:
+            _logger.debug(
+                "Ignoring %s from observe-only hook %s",
+                result.action.value,
+                hook_def.name,
+            )
+
+    @property
+    def metrics(self) -> hooks_metrics.HookMetricsCollector:
+        """Latency and outcome metrics of the hooks run so far."""
+        return self._metrics
+
+    @property
+    def cache_stats(self) -> dict[str, result_cache.CacheCounts]:
+        """Result cache hit/miss counts per cacheable hook name."""
+        return self._result_cache.stats()
+
+    @property
+    def pending_background(self) -> int:
+        """Number of background hook runs still in progress."""
+        return len(self._background)
+
+    async def aclose(
+        self,
+        *,
+        logger: brynhild_logging.ConversationLogger | None = None,
+    ) -> None:
+        """
+        Wait for background hooks to finish, then shut down executors.
+
+        Call at session end; each run is bounded by its hook's timeout.
+        Persistent script workers are stopped (and started again if the
+        manager is used afterwards).
+
+        Args:
+            logger: Conversation log to write the session's hook metrics to.
+        """
+        while self._background:
+            await _asyncio.gather(*self._background)
+        for executor in self._executors.values():
+            await executor.aclose()
+        if logger is not None and self._metrics.all():
+            logger.log_hook_metrics(self._metrics.to_dict())
 
     async def _execute_hook(
         self,
@@ -175,10 +373,65 @@ class HookManager:
         """
         Execute a single hook.
 
-        Gets or creates the appropriate executor and runs the hook.
+        Gets or creates the appropriate executor and runs the hook,
+        or reuses its result if the hook is cacheable. The execution is
+        recorded in the hook metrics.
         """
         executor = self._get_executor(hook_def)
-        return await executor.execute(hook_def, context)
+        start = _time.perf_counter()
+        digest: str | None = None
+        cached: events.HookResult | None = None
+        if hook_def.cacheable:
+            digest = result_cache.context_digest(context)
+            cached = self._result_cache.get(hook_def.name, digest)
+            if cached is not None:
+                self._record(hook_def, context, cached.action.value, start, cached=True)
+                return cached
+
+        # Cacheable hooks count a miss when they run
+        miss = False if hook_def.cacheable else None
+        try:
+            result = await executor.execute(hook_def, context)
+        except Exception:
+            self._record(hook_def, context, "error", start, cached=miss)
+            raise
+
+        # The executor turns timeouts into the hook's on_timeout result
+        outcome: hooks_metrics.HookOutcome = "timeout" if result.timed_out else result.action.value
+        self._record(hook_def, context, outcome, start, cached=miss)
+        # A run that hit the timeout says nothing about the context
+        if digest is not None and not result.timed_out:
+            self._result_cache.put(hook_def.name, digest, result, hook_def.cache_ttl)
+        return result
+
+    def _record(
+        self,
+        hook_def: config.HookDefinition,
+        context: events.HookContext,
+        outcome: hooks_metrics.HookOutcome,
+        start: float,
+        *,
+        cached: bool | None,
+    ) -> None:
+        """Record a hook execution that started at start (perf_counter)."""
+        duration_ms = (_time.perf_counter() - start) * 1000
+        over_budget = hook_def.budget_ms is not None and duration_ms > hook_def.budget_ms
+        if over_budget:
+            _logger.warning(
+                "Hook %s took %.0f ms on %s, over its %d ms budget",
+                hook_def.name,
+                duration_ms,
+                context.event.value,
+                hook_def.budget_ms,
+            )
+        self._metrics.record(
+            hook_def.name,
+            context.event.value,
+            outcome,
+            duration_ms,
+            cached=cached,
+            over_budget=over_budget,
+        )
 
     def _get_executor(
         self,
@@ -193,6 +446,7 @@ class HookManager:
             self._executors[hook_type] = executors.create_executor(
                 hook_type,
                 project_root=self._project_root,
+                provider=self._provider,
             )
         return self._executors[hook_type]
 
@@ -18,6 +18,22 @@ import re as _re
 import typing as _typing
 
 
+class _Condition(_typing.NamedTuple):
+    """One compiled field condition."""
+
+    path: tuple[str, ...]
+    """Dotted field path, pre-split."""
+
+    pattern: _typing.Any
+    """The pattern as configured."""
+
+    compiled: _re.Pattern[str] | None
+    """Compiled regex, or compiled glob (anchored) for glob patterns."""
+
+    is_glob: bool
+    """Whether compiled is a glob translation (match) rather than a regex (search)."""
+
+
 class PatternMatcher:
     """
     Matches patterns against context values.
@@ -27,6 +43,9 @@ class PatternMatcher:
     - Regex: "^sudo.*" matches "sudo rm -rf"
     - Glob: "*.py" matches "test.py"
     - Boolean: true/false matches boolean values
+
+    Patterns are compiled once (regex and glob compiled, dotted paths split),
+    so a matcher should be built once per hook and reused.
     """
 
     def __init__(self, patterns: dict[str, _typing.Any]) -> None:
@@ -39,13 +58,19 @@ class PatternMatcher:
                       e.g., {"tool": "Bash", "tool_input.command": "^rm.*"}
         """
         self._patterns = patterns
-        self._compiled: dict[str, _re.Pattern[str]] = {}
+        self._conditions: list[_Condition] = []
 
-        # Pre-compile regex patterns
         for key, value in patterns.items():
-            if isinstance(value, str) and self._looks_like_regex(value):
-                with _contextlib.suppress(_re.error):
-                    self._compiled[key] = _re.compile(value)
+            compiled: _re.Pattern[str] | None = None
+            is_glob = False
+            if isinstance(value, str):
+                if self._looks_like_regex(value):
+                    with _contextlib.suppress(_re.error):
+                        compiled = _re.compile(value)
+                if compiled is None and ("*" in value or "?" in value):
+                    compiled = _re.compile(_fnmatch.translate(value))
+                    is_glob = True
+            self._conditions.append(_Condition(tuple(key.split(".")), value, compiled, is_glob))
 
     @staticmethod
     def _looks_like_regex(value: str) -> bool:
@@ -63,6 +88,25 @@ class PatternMatcher:
         regex_only_chars = {"^", "$", "+", "(", ")", "|", "\\", "[", "]"}
         return any(c in value for c in regex_only_chars)
 
+    def exact_value(self, field_path: str) -> str | None:
+        """
+        The literal string a field must equal, if its pattern is exact.
+
+        Args:
+            field_path: Field path as given in the patterns
+
+        Returns:
+            The pattern, or None if the field has no pattern or it is a
+            regex, glob or non-string pattern.
+        """
+        path = tuple(field_path.split("."))
+        for condition in self._conditions:
+            if condition.path == path:
+                if isinstance(condition.pattern, str) and condition.compiled is None:
+                    return condition.pattern
+                return None
+        return None
+
     def matches(self, context: dict[str, _typing.Any]) -> bool:
         """
         Check if all patterns match the given context.
@@ -77,54 +121,40 @@ class PatternMatcher:
         Returns:
             True if all patterns match, False otherwise.
         """
-        if not self._patterns:
-            return True
+        return self.matches_lookup(context.get)
 
-        for field_path, pattern in self._patterns.items():
-            value = self._get_nested_value(context, field_path)
-            if not self._match_value(field_path, pattern, value):
-                return False
-
-        return True
-
-    def _get_nested_value(
-        self,
-        data: dict[str, _typing.Any],
-        path: str,
-    ) -> _typing.Any:
+    def matches_lookup(self, lookup: _typing.Callable[[str], _typing.Any]) -> bool:
         """
-        Get a nested value from a dict using dot notation.
+        Check if all patterns match, fetching top-level fields on demand.
+
+        Only the top-level fields the patterns refer to are looked up, so
+        the caller need not build the whole context dict.
 
         Args:
-            data: Dict to traverse
-            path: Dot-separated path (e.g., "tool_input.command")
+            lookup: Returns the value of a top-level context field (None if
+                    absent), in HookContext.to_dict() form.
 
         Returns:
-            The value at the path, or None if not found.
+            True if all patterns match, False otherwise.
         """
-        parts = path.split(".")
-        current: _typing.Any = data
-
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                return None
+        for condition in self._conditions:
+            value = lookup(condition.path[0])
+            for part in condition.path[1:]:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(part)
+            if not self._match_value(condition, value):
+                return False
 
-        return current
+        return True
 
-    def _match_value(
-        self,
-        field_path: str,
-        pattern: _typing.Any,
-        value: _typing.Any,
-    ) -> bool:
+    def _match_value(self, condition: _Condition, value: _typing.Any) -> bool:
         """
         Match a single pattern against a value.
 
         Args:
-            field_path: The field path (for looking up compiled regex)
-            pattern: The pattern to match
+            condition: The compiled condition
             value: The value to match against
 
         Returns:
@@ -133,22 +163,20 @@ class PatternMatcher:
         if value is None:
             return False
 
+        pattern = condition.pattern
+
         # Boolean match
         if isinstance(pattern, bool):
             return bool(value == pattern)
 
         # String pattern against string value
         if isinstance(pattern, str) and isinstance(value, str):
-            # Try compiled regex first
-            if field_path in self._compiled:
-                return bool(self._compiled[field_path].search(value))
-
-            # Try glob pattern
-            if "*" in pattern or "?" in pattern:
-                return _fnmatch.fnmatch(value, pattern)
-
-            # Exact match
-            return pattern == value
+            if condition.compiled is None:
+                # Exact match
+                return pattern == value
+            if condition.is_glob:
+                return condition.compiled.match(value) is not None
+            return condition.compiled.search(value) is not None
 
         # Number match
         if isinstance(pattern, (int, float)) and isinstance(value, (int, float)):
@@ -165,6 +193,9 @@ def match_patterns(
     """
     Convenience function to match patterns against context.
 
+    Compiles the patterns on every call; reuse a PatternMatcher instead
+    when matching the same patterns repeatedly.
+
     Args:
         patterns: Dict of field paths to pattern values.
         context: Dict of context values.
@@ -173,4 +204,3 @@ def match_patterns(
         True if all patterns match.
     """
     return PatternMatcher(patterns).matches(context)
-
@@ -0,0 +1,230 @@
+"""
+Hook latency metrics.
+
+Every hook execution is timed and recorded by HookManager into a
+HookMetricsCollector, per hook and event: how it ended (see HookOutcome),
+how long it took, whether its result came from the result cache, and
+whether it went over its latency budget. The totals are written to the
+conversation log at session end and aggregated by `brynhild hooks stats`.
+"""
+
+from __future__ import annotations
+
+import dataclasses as _dataclasses
+import typing as _typing
+
+import brynhild.tools.base as tools_base
+
+HookOutcome = _typing.Literal["continue", "block", "skip", "timeout", "error"]
+"""How a hook execution ended.
+
+- continue / block / skip: The hook returned that action
+- timeout: The hook exceeded its timeout (its on_timeout action was used)
+- error: The hook failed to execute
+"""
+
+HOOK_OUTCOMES: tuple[HookOutcome, ...] = _typing.get_args(HookOutcome)
+"""All outcomes, in display order."""
+
+
+@_dataclasses.dataclass
+class HookMetrics:
+    """
+    Metrics for one hook on one event.
+
+    Accumulated during a session; sessions merge by adding counts.
+    """
+
+    hook_name: str
+    event: str
+    call_count: int = 0
+    outcomes: dict[str, int] = _dataclasses.field(default_factory=dict)
+    """Outcome -> count."""
+    cache_hits: int = 0
+    cache_misses: int = 0
+    over_budget_count: int = 0
+    total_duration_ms: float = 0.0
+    latency: tools_base.LatencyHistogram = _dataclasses.field(
+        default_factory=tools_base.LatencyHistogram
+    )
+
+    @property
+    def key(self) -> str:
+        """Identifier of the hook/event pair."""
+        return f"{self.event}:{self.hook_name}"
+
+    @property
+    def average_duration_ms(self) -> float:
+        """Average duration per execution in milliseconds."""
+        if self.call_count == 0:
+            return 0.0
+        return self.total_duration_ms / self.call_count
+
+    def record_call(
+        self,
+        outcome: HookOutcome,
+        duration_ms: float,
+        *,
+        cached: bool | None = None,
+        over_budget: bool = False,
+    ) -> None:
+        """
+        Record a hook execution.
+
+        Args:
+            outcome: How the execution ended
+            duration_ms: How long it took in milliseconds
+            cached: For cacheable hooks, whether the result came from the
+                cache (None: hook is not cacheable)
+            over_budget: Whether it took longer than the hook's budget
+        """
+        self.call_count += 1
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if cached is True:
+            self.cache_hits += 1
+        elif cached is False:
+            self.cache_misses += 1
+        if over_budget:
+            self.over_budget_count += 1
+        self.total_duration_ms += duration_ms
+        self.latency.record(duration_ms)
+
+    def merge(self, other: HookMetrics) -> None:
+        """Add another set of metrics for the same hook and event."""
+        self.call_count += other.call_count
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.over_budget_count += other.over_budget_count
+        self.total_duration_ms += other.total_duration_ms
+        self.latency.merge(other.latency)
+
+    def to_dict(self) -> dict[str, _typing.Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "hook_name": self.hook_name,
+            "event": self.event,
+            "call_count": self.call_count,
+            "outcomes": dict(self.outcomes),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "over_budget_count": self.over_budget_count,
+            "total_duration_ms": self.total_duration_ms,
+            "average_duration_ms": self.average_duration_ms,
+            "p50_ms": self.latency.percentile(50),
+            "p90_ms": self.latency.percentile(90),
+            "p99_ms": self.latency.percentile(99),
+            "max_ms": self.latency.max_ms,
+            "latency": self.latency.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, _typing.Any]) -> HookMetrics:
+        """Create from dictionary."""
+        return cls(
+            hook_name=data["hook_name"],
+            event=data["event"],
+            call_count=data.get("call_count", 0),
+            outcomes=dict(data.get("outcomes", {})),
+            cache_hits=data.get("cache_hits", 0),
+            cache_misses=data.get("cache_misses", 0),
+            over_budget_count=data.get("over_budget_count", 0),
+            total_duration_ms=data.get("total_duration_ms", 0.0),
+            latency=tools_base.LatencyHistogram.from_dict(data.get("latency", {})),
+        )
+
+
+class HookMetricsCollector:
+    """
+    Collects hook metrics across a session.
+
+    Like tools.base.MetricsCollector, but keyed by hook and event.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty metrics collector."""
+        self._metrics: dict[str, HookMetrics] = {}
+
+    def record(
+        self,
+        hook_name: str,
+        event: str,
+        outcome: HookOutcome,
+        duration_ms: float,
+        *,
+        cached: bool | None = None,
+        over_budget: bool = False,
+    ) -> None:
+        """
+        Record a hook execution.
+
+        Args:
+            hook_name: Name of the hook
+            event: Event value the hook ran for
+            outcome: How the execution ended
+            duration_ms: How long it took in milliseconds
+            cached: Whether a cacheable hook's result came from the cache
+            over_budget: Whether it took longer than the hook's budget
+        """
+        metrics = self._get_or_create(hook_name, event)
+        metrics.record_call(outcome, duration_ms, cached=cached, over_budget=over_budget)
+
+    def _get_or_create(self, hook_name: str, event: str) -> HookMetrics:
+        key = f"{event}:{hook_name}"
+        if key not in self._metrics:
+            self._metrics[key] = HookMetrics(hook_name=hook_name, event=event)
+        return self._metrics[key]
+
+    def get(self, hook_name: str, event: str) -> HookMetrics | None:
+        """Get metrics for a hook on an event."""
+        return self._metrics.get(f"{event}:{hook_name}")
+
+    def all(self) -> list[HookMetrics]:
+        """Get all hook metrics, sorted by total time (descending)."""
+        return sorted(
+            self._metrics.values(),
+            key=lambda m: m.total_duration_ms,
+            reverse=True,
+        )
+
+    def to_dict(self) -> dict[str, dict[str, _typing.Any]]:
+        """Convert all metrics to JSON-serializable dict."""
+        return {key: m.to_dict() for key, m in self._metrics.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[str, _typing.Any]]) -> HookMetricsCollector:
+        """Create from dictionary."""
+        collector = cls()
+        for metrics_data in data.values():
+            metrics = HookMetrics.from_dict(metrics_data)
+            collector._metrics[metrics.key] = metrics
+        return collector
+
+    def merge(self, other: HookMetricsCollector) -> None:
+        """Add another collector's metrics (e.g. to aggregate sessions)."""
+        for metrics in other._metrics.values():
+            self._get_or_create(metrics.hook_name, metrics.event).merge(metrics)
+
+    def summary(self) -> dict[str, _typing.Any]:
+        """Get a summary of all metrics."""
+        latency = tools_base.LatencyHistogram()
+        outcomes: dict[str, int] = dict.fromkeys(HOOK_OUTCOMES, 0)
+        for m in self._metrics.values():
+            latency.merge(m.latency)
+            for outcome, count in m.outcomes.items():
+                outcomes[outcome] = outcomes.get(outcome, 0) + count
+
+        return {
+            "total_calls": sum(m.call_count for m in self._metrics.values()),
+            "outcomes": outcomes,
+            "cache_hits": sum(m.cache_hits for m in self._metrics.values()),
+            "cache_misses": sum(m.cache_misses for m in self._metrics.values()),
+            "over_budget": sum(m.over_budget_count for m in self._metrics.values()),
+            "total_duration_ms": sum(m.total_duration_ms for m in self._metrics.values()),
+            "p50_ms": latency.percentile(50),
+            "p90_ms": latency.percentile(90),
+            "p99_ms": latency.percentile(99),
+            "max_ms": latency.max_ms,
+            "hooks_run": len(self._metrics),
+        }
@@ -0,0 +1,134 @@
+"""
+Result memoization for cacheable hooks.
+
+Hooks marked ``cacheable: true`` are pure functions of their context (an
+allowlist check, a path policy), so their result for a context seen before
+is reused instead of running the hook again. Results are keyed by hook name
+plus a stable hash of the context, kept in an LRU, and expire after the
+hook's cache_ttl.
+"""
+
+from __future__ import annotations
+
+import collections as _collections
+import dataclasses as _dataclasses
+import hashlib as _hashlib
+import json as _json
+import time as _time
+import typing as _typing
+
+import brynhild.hooks.events as events
+
+DEFAULT_MAX_ENTRIES = 1024
+"""Default number of results kept (least recently used are evicted)."""
+
+
+def context_digest(context: events.HookContext) -> str:
+    """
+    Stable hash of everything a hook can see of a context.
+
+    Args:
+        context: The hook context
+
+    Returns:
+        Hex digest of the canonical JSON of context.to_dict()
+    """
+    canonical = _json.dumps(context.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+    return _hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@_dataclasses.dataclass
+class CacheCounts:
+    """Cache lookups for one hook."""
+
+    hits: int = 0
+    """Lookups answered from the cache."""
+
+    misses: int = 0
+    """Lookups that had to run the hook."""
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to a JSON-serializable dict."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class HookResultCache:
+    """LRU of hook results with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        clock: _typing.Callable[[], float] = _time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Most results to keep
+            clock: Time source in seconds (for tests)
+        """
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: _collections.OrderedDict[
+            tuple[str, str], tuple[float, events.HookResult]
+        ] = _collections.OrderedDict()
+        self._counts: dict[str, CacheCounts] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, hook_name: str, digest: str) -> events.HookResult | None:
+        """
+        Look up a hook's result for a context, counting the hit or miss.
+
+        Args:
+            hook_name: Name of the hook
+            digest: context_digest() of the context
+
+        Returns:
+            A copy of the cached result, or None if absent or expired.
+        """
+        counts = self._counts.setdefault(hook_name, CacheCounts())
+        key = (hook_name, digest)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            counts.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        counts.hits += 1
+        # Callers get their own copy, as if the hook had run
+        return _dataclasses.replace(entry[1])
+
+    def put(
+        self,
+        hook_name: str,
+        digest: str,
+        result: events.HookResult,
+        ttl: float,
+    ) -> None:
+        """
+        Store a hook's result for a context.
+
+        Args:
+            hook_name: Name of the hook
+            digest: context_digest() of the context
+            result: The hook's result
+            ttl: Seconds until the result expires
+        """
+        key = (hook_name, digest)
+        self._entries[key] = (self._clock() + ttl, _dataclasses.replace(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, CacheCounts]:
+        """Hit/miss counts per hook name."""
+        return dict(self._counts)
+
+    def clear(self) -> None:
+        """Drop every cached result (counts are kept)."""
+        self._entries.clear()
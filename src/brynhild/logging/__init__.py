@@ -6,20 +6,31 @@ plus presentation-grade markdown output for sharing.
 """
 
 from brynhild.logging.conversation_logger import ConversationLogger, RawPayloadLogger
+from brynhild.logging.files import RetentionPolicy
 from brynhild.logging.markdown_logger import (
     MarkdownLogger,
     export_log_to_markdown,
     format_markdown_table,
 )
-from brynhild.logging.reader import LogInjection, LogReader, ReconstructedContext
+from brynhild.logging.reader import (
+    LogInjection,
+    LogReader,
+    RawLogReader,
+    ReconstructedContext,
+)
+from brynhild.logging.writer import BufferedLogWriter, WriterConfig
 
 __all__ = [
+    "BufferedLogWriter",
     "ConversationLogger",
     "LogInjection",
     "LogReader",
     "MarkdownLogger",
+    "RawLogReader",
     "RawPayloadLogger",
     "ReconstructedContext",
+    "RetentionPolicy",
+    "WriterConfig",
     "export_log_to_markdown",
     "format_markdown_table",
 ]
@@ -10,6 +10,15 @@ import json as _json
 import pathlib as _pathlib
 import typing as _typing
 
+import brynhild.logging.files as log_files
+import brynhild.logging.writer as log_writer
+
+BLOB_REF_KEY = "$blob"
+"""Key of a reference to a stored blob in delta-encoded raw requests: {"$blob": hash}."""
+
+_BLOB_MIN_CHARS = 1024
+"""Values at least this long (as JSON) are stored once as blobs and referenced by hash."""
+
 
 class ConversationLogger:
     """
@@ -23,6 +32,7 @@ class ConversationLogger:
     - tool_call: Tool invocation request
     - tool_result: Result of tool execution
     - error: Error events
+    - hook_metrics: Hook latency totals (at session end)
     - session_end: Session completion
 
     Usage:
@@ -42,6 +52,9 @@ class ConversationLogger:
         provider: str = "unknown",
         model: str = "unknown",
         enabled: bool = True,
+        writer_config: log_writer.WriterConfig | None = None,
+        compress: log_files.Compression = "none",
+        retention: log_files.RetentionPolicy | None = None,
     ) -> None:
         """
         Initialize the conversation logger.
@@ -53,11 +66,14 @@ class ConversationLogger:
             provider: LLM provider name.
             model: Model name.
             enabled: Whether logging is enabled.
+            writer_config: Flush and backpressure settings for the background writer.
+            compress: Compress the log file (adds .gz or .zst to its name).
+            retention: Old logs in log_dir to delete when the log is opened.
         """
         self._enabled = enabled
         self._provider = provider
         self._model = model
-        self._file: _typing.TextIO | None = None
+        self._writer: log_writer.BufferedLogWriter | None = None
         self._file_path: _pathlib.Path | None = None
         self._session_id = _datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self._event_count = 0
@@ -67,8 +83,9 @@ class ConversationLogger:
             return
 
         # Determine log file path
+        base_dir: _pathlib.Path | None = None
         if log_file:
-            self._file_path = _pathlib.Path(log_file)
+            self._file_path = log_files.compressed_path(_pathlib.Path(log_file), compress)
         else:
             # Use log_dir with auto-generated filename
             base_dir = _pathlib.Path(log_dir) if log_dir else _pathlib.Path("/tmp/brynhild-logs")
@@ -83,10 +100,16 @@ class ConversationLogger:
 
             # Generate filename with timestamp
             filename = f"brynhild_{self._session_id}.jsonl"
-            self._file_path = base_dir / filename
+            self._file_path = log_files.compressed_path(base_dir / filename, compress)
 
-        # Open the file (noqa: held as instance state, closed in close())
-        self._file = open(self._file_path, "w", encoding="utf-8")  # noqa: SIM115
+        # Open the file (written from a background thread, closed in close())
+        self._writer = log_writer.BufferedLogWriter(
+            self._file_path, writer_config, default=str
+        )
+
+        # Drop old logs past the retention limits
+        if retention and base_dir:
+            log_files.enforce_retention(base_dir, retention, keep={self._file_path})
 
         # Log session start
         self._write_event(
@@ -103,8 +126,8 @@ class ConversationLogger:
         event_type: str,
         data: dict[str, _typing.Any],
     ) -> None:
-        """Write an event to the log file."""
-        if not self._enabled or not self._file:
+        """Queue an event for the background writer."""
+        if not self._enabled or not self._writer:
             return
 
         self._event_count += 1
@@ -115,12 +138,8 @@ class ConversationLogger:
             **data,
         }
 
-        try:
-            self._file.write(_json.dumps(event, default=str) + "\n")
-            self._file.flush()  # Ensure immediate write for crash safety
-        except OSError:
-            # Silently ignore write errors - logging shouldn't break the app
-            pass
+        # Write errors are ignored by the writer - logging shouldn't break the app
+        self._writer.write(event)
 
     def log_system_prompt(self, prompt: str) -> None:
         """Log the system prompt (legacy method).
@@ -255,6 +274,7 @@ class ConversationLogger:
         provider: str | None = None,
         generation_id: str | None = None,
         estimated: bool = False,
+        deduplicated_tokens: int | None = None,
     ) -> None:
         """Log token usage with optional extended details.
 
@@ -267,6 +287,9 @@ class ConversationLogger:
             provider: Provider that served the request.
             generation_id: Unique ID for this generation.
             estimated: True if values are tiktoken estimates (provider didn't report usage).
+            deduplicated_tokens: Estimated tokens of repeated tool output replaced
+                with references/diffs since the previous usage event (already
+                excluded from input_tokens); events add up to the session total.
         """
         data: dict[str, _typing.Any] = {
             "input_tokens": input_tokens,
@@ -286,6 +309,8 @@ class ConversationLogger:
             data["generation_id"] = generation_id
         if estimated:
             data["estimated"] = True
+        if deduplicated_tokens:
+            data["deduplicated_tokens"] = deduplicated_tokens
 
         self._write_event("usage", data)
 
@@ -321,6 +346,35 @@ class ConversationLogger:
             },
         )
 
+    def log_hook_metrics(
+        self,
+        metrics: dict[str, dict[str, _typing.Any]],
+    ) -> None:
+        """
+        Log hook metrics summary.
+
+        Called at end of session to record cumulative hook latencies.
+
+        Args:
+            metrics: Dictionary of hook key -> metrics dict from HookMetricsCollector.to_dict()
+        """
+        total_calls = sum(m.get("call_count", 0) for m in metrics.values())
+        total_duration = sum(m.get("total_duration_ms", 0) for m in metrics.values())
+
+        self._write_event(
+            "hook_metrics",
+            {
+                "hooks": metrics,
+                "summary": {
+                    "total_calls": total_calls,
+                    "total_duration_ms": round(total_duration, 2),
+                    "cache_hits": sum(m.get("cache_hits", 0) for m in metrics.values()),
+                    "over_budget": sum(m.get("over_budget_count", 0) for m in metrics.values()),
+                    "hooks_run": len(metrics),
+                },
+            },
+        )
+
     def log_raw_request(self, data: dict[str, _typing.Any]) -> None:
         """Log raw API request (for debugging)."""
         self._write_event("raw_request", {"data": data})
@@ -600,9 +654,19 @@ class ConversationLogger:
         """Check if logging is enabled."""
         return self._enabled
 
+    def flush(self) -> None:
+        """
+        Wait until all logged events are on disk.
+
+        Called at the end of each turn, so a crash loses at most the
+        current turn whatever the flush policy.
+        """
+        if self._writer:
+            self._writer.flush()
+
     def close(self) -> None:
         """Close the log file."""
-        if not self._enabled or not self._file:
+        if not self._enabled or not self._writer:
             return
 
         self._write_event(
@@ -612,12 +676,8 @@ class ConversationLogger:
             },
         )
 
-        try:
-            self._file.close()
-        except OSError:
-            pass
-        finally:
-            self._file = None
+        self._writer.close()
+        self._writer = None
 
     def __enter__(self) -> "ConversationLogger":
         """Context manager entry."""
@@ -654,7 +714,25 @@ class RawPayloadLogger:
     - endpoint: API endpoint (e.g., "/chat/completions")
     - payload: The actual JSON payload
 
-    Files are named: brynhild_raw_{session_id}.jsonl
+    Requests resend the whole conversation every round, so they are
+    delta-encoded (envelope "encoding": "delta") against the previous
+    request. The payload then holds:
+    - request: Request number (0-based)
+    - messages_kept: Leading messages shared with the previous request
+    - messages: Messages after those
+    - set: Top-level fields that are new or changed
+    - unset: Top-level fields that were removed
+
+    Large values (tool lists, the system prompt) are written once as "blob"
+    records ({"hash", "value"}) and referenced as {"$blob": hash}.
+    RawLogReader reconstructs the full requests.
+
+    Request and blob records are never dropped when the writer's queue is
+    full. If the writer skipped any record it could not write, the next
+    request is logged in full (no "encoding") and later deltas build on it.
+
+    Files are named: brynhild_raw_{session_id}.jsonl (plus .gz or .zst
+    when compressed)
     """
 
     def __init__(
@@ -666,6 +744,10 @@ class RawPayloadLogger:
         provider: str = "unknown",
         model: str = "unknown",
         enabled: bool = False,  # Off by default
+        writer_config: log_writer.WriterConfig | None = None,
+        delta: bool = True,
+        compress: log_files.Compression = "none",
+        retention: log_files.RetentionPolicy | None = None,
     ) -> None:
         """
         Initialize the raw payload logger.
@@ -677,14 +759,25 @@ class RawPayloadLogger:
             provider: LLM provider name.
             model: Model name.
             enabled: Whether logging is enabled (default: False).
+            writer_config: Flush and backpressure settings for the background writer.
+            delta: Delta-encode requests against the previous one (False: log
+                every request in full).
+            compress: Compress the log file (adds .gz or .zst to its name).
+            retention: Old logs in log_dir to delete when the log is opened.
         """
         self._enabled = enabled
         self._provider = provider
         self._model = model
-        self._file: _typing.TextIO | None = None
+        self._writer: log_writer.BufferedLogWriter | None = None
         self._file_path: _pathlib.Path | None = None
         self._session_id = session_id or _datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self._event_count = 0
+        self._delta = delta
+        self._request_count = 0
+        self._last_fields: dict[str, _typing.Any] = {}
+        self._last_messages: list[_typing.Any] = []
+        self._blobs: set[str] = set()
+        self._writer_failures = 0
 
         if not enabled:
             return
@@ -702,10 +795,14 @@ class RawPayloadLogger:
 
         # Generate filename with "raw" in the name
         filename = f"brynhild_raw_{self._session_id}.jsonl"
-        self._file_path = base_dir / filename
+        self._file_path = log_files.compressed_path(base_dir / filename, compress)
+
+        # Open the file (written from a background thread, closed in close())
+        self._writer = log_writer.BufferedLogWriter(self._file_path, writer_config)
 
-        # Open the file
-        self._file = open(self._file_path, "w", encoding="utf-8")  # noqa: SIM115
+        # Drop old logs past the retention limits
+        if retention:
+            log_files.enforce_retention(base_dir, retention, keep={self._file_path})
 
         # Log session start
         self._write_envelope(
@@ -726,9 +823,11 @@ class RawPayloadLogger:
         *,
         duration_ms: float | None = None,
         error: str | None = None,
+        encoding: str | None = None,
+        required: bool = False,
     ) -> None:
-        """Write an envelope to the log file."""
-        if not self._enabled or not self._file:
+        """Queue an envelope for the background writer (required: never dropped)."""
+        if not self._enabled or not self._writer:
             return
 
         envelope: dict[str, _typing.Any] = {
@@ -744,9 +843,10 @@ class RawPayloadLogger:
             envelope["duration_ms"] = duration_ms
         if error is not None:
             envelope["error"] = error
+        if encoding is not None:
+            envelope["encoding"] = encoding
 
-        self._file.write(_json.dumps(envelope) + "\n")
-        self._file.flush()
+        self._writer.write(envelope, required=required)
         self._event_count += 1
 
     def log_request(
@@ -759,14 +859,93 @@ class RawPayloadLogger:
 
         Args:
             endpoint: API endpoint (e.g., "/chat/completions").
-            payload: The JSON payload being sent.
+            payload: The JSON payload being sent (must not be mutated afterwards).
         """
+        if not self._enabled or not self._writer:
+            return
+        if not self._delta:
+            self._write_envelope(
+                direction="request", endpoint=endpoint, payload=payload, required=True
+            )
+            return
+
+        if self._writer.failed != self._writer_failures:
+            # A lost record may be a blob or request later deltas depend on;
+            # log this request in full so the chain starts over from it
+            self._writer_failures = self._writer.failed
+            self._start_chain(payload)
+            self._write_envelope(
+                direction="request", endpoint=endpoint, payload=payload, required=True
+            )
+            return
+
         self._write_envelope(
             direction="request",
             endpoint=endpoint,
-            payload=payload,
+            payload=self._encode_request(payload),
+            encoding="delta",
+            required=True,
         )
 
+    def _start_chain(self, payload: dict[str, _typing.Any]) -> None:
+        """Make a request logged in full the base of the following deltas."""
+        messages = payload.get("messages")
+        self._request_count += 1
+        self._last_fields = {key: value for key, value in payload.items() if key != "messages"}
+        self._last_messages = list(messages) if isinstance(messages, list) else []
+        self._blobs = set()
+
+    def _encode_request(self, payload: dict[str, _typing.Any]) -> dict[str, _typing.Any]:
+        """Delta-encode a request against the previous one (see class docstring)."""
+        messages = payload.get("messages")
+        if not isinstance(messages, list):
+            messages = []
+        fields = {key: value for key, value in payload.items() if key != "messages"}
+
+        # Messages are usually the previous request's plus a few new ones;
+        # unchanged ones are often the very same objects (provider cache)
+        kept = 0
+        for old, new in zip(self._last_messages, messages, strict=False):
+            if old is not new and old != new:
+                break
+            kept += 1
+
+        changed = {
+            key: self._blob_ref(value)
+            for key, value in fields.items()
+            if key not in self._last_fields or self._last_fields[key] != value
+        }
+        encoded: dict[str, _typing.Any] = {
+            "request": self._request_count,
+            "messages_kept": kept,
+            "messages": [self._blob_ref(message) for message in messages[kept:]],
+            "set": changed,
+            "unset": [key for key in self._last_fields if key not in fields],
+        }
+
+        self._request_count += 1
+        self._last_fields = fields
+        self._last_messages = list(messages)
+        return encoded
+
+    def _blob_ref(self, value: _typing.Any) -> _typing.Any:
+        """Replace a large value by a blob reference, writing the blob once."""
+        if not isinstance(value, dict | list):
+            return value
+        encoded = _json.dumps(value, sort_keys=True, default=str)
+        if len(encoded) < _BLOB_MIN_CHARS:
+            return value
+        digest = _hashlib.sha256(encoded.encode()).hexdigest()[:16]
+        if digest not in self._blobs:
+            self._blobs.add(digest)
+            self._write_envelope(
+                direction="blob",
+                endpoint="",
+                payload={"hash": digest, "value": value},
+                required=True,
+            )
+        return {BLOB_REF_KEY: digest}
+
     def log_response(
         self,
         endpoint: str,
@@ -861,9 +1040,19 @@ class RawPayloadLogger:
         """Check if logging is enabled."""
         return self._enabled
 
+    def flush(self) -> None:
+        """
+        Wait until all logged events are on disk.
+
+        Called at the end of each turn, so a crash loses at most the
+        current turn whatever the flush policy.
+        """
+        if self._writer:
+            self._writer.flush()
+
     def close(self) -> None:
         """Close the log file."""
-        if not self._enabled or not self._file:
+        if not self._enabled or not self._writer:
             return
 
         self._write_envelope(
@@ -872,12 +1061,8 @@ class RawPayloadLogger:
             payload={"total_events": self._event_count},
         )
 
-        try:
-            self._file.close()
-        except OSError:
-            pass
-        finally:
-            self._file = None
+        self._writer.close()
+        self._writer = None
 
     def __enter__(self) -> "RawPayloadLogger":
         """Context manager entry."""
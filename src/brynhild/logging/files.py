@@ -0,0 +1,259 @@
+"""
+Log file helpers: compression, listing and retention.
+
+Conversation and raw logs can be written compressed. The compression
+follows the file suffix (.jsonl, .jsonl.gz, .jsonl.zst), so readers handle
+every kind of log the same way. zstd needs the optional zstandard package;
+without it, gzip is used for new logs and existing .zst logs cannot be read
+(CompressionUnavailableError).
+
+A retention policy (total size, age, number of files) keeps the log
+directory from growing forever. It is enforced when a logger opens its file
+and by `brynhild logs gc`.
+"""
+
+from __future__ import annotations
+
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import gzip as _gzip
+import io as _io
+import os as _os
+import pathlib as _pathlib
+import time as _time
+import typing as _typing
+
+Compression = _typing.Literal["none", "gzip", "zstd"]
+"""How log files are compressed."""
+
+LOG_PREFIX = "brynhild_"
+"""Prefix of every log file name (raw logs are brynhild_raw_*)."""
+
+LOG_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+"""Suffixes of log files: plain, gzip and zstd."""
+
+_COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+"""Suffix appended to the .jsonl name for each compression."""
+
+
+class CompressionUnavailableError(OSError):
+    """A log is compressed with zstd but the zstandard package is not installed."""
+
+
+def _import_zstd() -> _typing.Any:
+    """The optional zstandard module, or None if it is not installed."""
+    try:
+        import zstandard as _zstd  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return None
+    return _zstd
+
+
+def _require_zstd(path: _pathlib.Path) -> _typing.Any:
+    """The zstandard module, needed to open path."""
+    zstd = _import_zstd()
+    if zstd is None:
+        raise CompressionUnavailableError(
+            f"{path} is zstd-compressed; install brynhild[zstd] to read and write it"
+        )
+    return zstd
+
+
+def zstd_available() -> bool:
+    """Whether zstd compression can be used."""
+    return _import_zstd() is not None
+
+
+def compressed_path(path: _pathlib.Path, compress: Compression) -> _pathlib.Path:
+    """
+    Path of a log file written with a compression.
+
+    Args:
+        path: The plain log path (e.g. brynhild_20250101_120000.jsonl)
+        compress: Requested compression (zstd falls back to gzip if
+            zstandard is not installed)
+
+    Returns:
+        The path with the compression's suffix appended (if not already there).
+    """
+    if compress == "zstd" and not zstd_available():
+        compress = "gzip"
+    suffix = _COMPRESSION_SUFFIXES.get(compress)
+    if suffix is None or path.name.endswith(suffix):
+        return path
+    return path.with_name(path.name + suffix)
+
+
+def open_for_writing(path: _pathlib.Path) -> _typing.TextIO:
+    """
+    Open a log file for writing (truncating it), compressed as its suffix says.
+
+    flush() on the returned file makes everything written so far readable
+    from the file, also when compressed.
+    """
+    if path.name.endswith(".gz"):
+        return _gzip.open(path, "wt", encoding="utf-8")
+    if path.name.endswith(".zst"):
+        zstd = _require_zstd(path)
+        raw = open(path, "wb")  # noqa: SIM115 - closed with the returned wrapper
+        writer = zstd.ZstdCompressor().stream_writer(raw)
+        return _io.TextIOWrapper(writer, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")  # noqa: SIM115
+
+
+def open_for_reading(path: _pathlib.Path) -> _typing.TextIO:
+    """
+    Open a log file for reading, decompressing as its suffix says.
+
+    Raises:
+        CompressionUnavailableError: The log is zstd-compressed and zstandard
+            is not installed.
+    """
+    if path.name.endswith(".gz"):
+        return _gzip.open(path, "rt", encoding="utf-8")
+    if path.name.endswith(".zst"):
+        zstd = _require_zstd(path)
+        raw = open(path, "rb")  # noqa: SIM115 - closed with the returned wrapper
+        reader = zstd.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return _io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")  # noqa: SIM115
+
+
+def read_lines(path: _pathlib.Path) -> _typing.Iterator[str]:
+    """
+    Yield the lines of a log file, plain or compressed.
+
+    A compressed log still being written (or cut short by a crash) ends
+    without an end-of-stream marker; its lines are yielded up to there.
+
+    Raises:
+        CompressionUnavailableError: The log is zstd-compressed and zstandard
+            is not installed.
+    """
+    truncated: tuple[type[Exception], ...] = (EOFError,)
+    if path.name.endswith(".zst"):
+        truncated = (EOFError, _require_zstd(path).ZstdError)
+    with open_for_reading(path) as f, _contextlib.suppress(*truncated):
+        yield from f
+
+
+def is_log_file(name: str) -> bool:
+    """Whether a file name is a brynhild log (conversation or raw)."""
+    return name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIXES)
+
+
+def list_logs(log_dir: _pathlib.Path, *, raw: bool | None = False) -> list[_pathlib.Path]:
+    """
+    List log files, newest first.
+
+    Args:
+        log_dir: Log directory
+        raw: False for conversation logs, True for raw logs, None for both
+
+    Returns:
+        Log file paths, sorted by name (the session timestamp), newest first.
+    """
+    if not log_dir.is_dir():
+        return []
+    raw_prefix = f"{LOG_PREFIX}raw_"
+    paths = [
+        log_dir / name
+        for name in _os.listdir(log_dir)
+        if is_log_file(name) and (raw is None or name.startswith(raw_prefix) == raw)
+    ]
+    return sorted(paths, reverse=True)
+
+
+@_dataclasses.dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits on the log files kept in a log directory (None: no limit)."""
+
+    max_total_bytes: int | None = None
+    """Most bytes of logs kept; the oldest are deleted first."""
+
+    max_age_days: float | None = None
+    """Logs last modified longer ago than this are deleted."""
+
+    max_files: int | None = None
+    """Most log files kept; the oldest are deleted first."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is set."""
+        return (
+            self.max_total_bytes is not None
+            or self.max_age_days is not None
+            or self.max_files is not None
+        )
+
+
+def enforce_retention(
+    log_dir: _pathlib.Path,
+    policy: RetentionPolicy,
+    *,
+    keep: _typing.Collection[_pathlib.Path] = (),
+    dry_run: bool = False,
+    now: float | None = None,
+) -> list[tuple[_pathlib.Path, int]]:
+    """
+    Delete the log files a retention policy doesn't allow.
+
+    Logs are kept newest first (by modification time) until a limit is
+    reached; everything older is deleted. One directory scan, so it is
+    cheap enough to run whenever a logger opens.
+
+    Args:
+        log_dir: Log directory
+        policy: Limits to enforce
+        keep: Logs never deleted (e.g. the ones just opened); they count
+            towards max_files
+        dry_run: Only report what would be deleted
+        now: Current time as a Unix timestamp (for tests)
+
+    Returns:
+        (path, size in bytes) of each deleted log, newest first.
+    """
+    if not policy.enabled:
+        return []
+
+    logs: list[tuple[float, int, _pathlib.Path]] = []
+    try:
+        with _os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not is_log_file(entry.name) or not entry.is_file(follow_symlinks=False):
+                    continue
+                path = _pathlib.Path(entry.path)
+                if path in keep:
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                logs.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return []
+    logs.sort(key=lambda log: log[0], reverse=True)
+
+    cutoff = None
+    if policy.max_age_days is not None:
+        cutoff = (now if now is not None else _time.time()) - policy.max_age_days * 86400
+
+    removed: list[tuple[_pathlib.Path, int]] = []
+    total_bytes = 0
+    file_count = len(keep)
+    over_limit = False
+    for mtime, size, path in logs:
+        over_limit = (
+            over_limit
+            or (cutoff is not None and mtime < cutoff)
+            or (policy.max_files is not None and file_count >= policy.max_files)
+            or (policy.max_total_bytes is not None and total_bytes + size > policy.max_total_bytes)
+        )
+        if not over_limit:
+            total_bytes += size
+            file_count += 1
+            continue
+        if not dry_run:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        removed.append((path, size))
+    return removed
@@ -5,6 +5,7 @@ This module provides utilities for:
 - Reading and parsing conversation log files
 - Reconstructing context at any point in the conversation
 - Validating log integrity via content hashes
+- Expanding delta-encoded raw payload logs into full requests
 """
 
 import dataclasses as _dataclasses
@@ -13,6 +14,9 @@ import json as _json
 import pathlib as _pathlib
 import typing as _typing
 
+import brynhild.logging.conversation_logger as conversation_logger
+import brynhild.logging.files as log_files
+
 
 @_dataclasses.dataclass
 class LogInjection:
@@ -75,7 +79,7 @@ class LogReader:
         Initialize the log reader.
 
         Args:
-            log_path: Path to the JSONL log file.
+            log_path: Path to the JSONL log file (.jsonl.gz/.jsonl.zst: compressed).
         """
         self._log_path = _pathlib.Path(log_path)
         self._events: list[dict[str, _typing.Any]] | None = None
@@ -84,14 +88,13 @@ class LogReader:
         """Load events if not already loaded."""
         if self._events is None:
             self._events = []
-            with open(self._log_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            self._events.append(_json.loads(line))
-                        except _json.JSONDecodeError:
-                            continue
+            for line in log_files.read_lines(self._log_path):
+                line = line.strip()
+                if line:
+                    try:
+                        self._events.append(_json.loads(line))
+                    except _json.JSONDecodeError:
+                        continue
 
     def get_events(self) -> list[dict[str, _typing.Any]]:
         """Get all events from the log."""
@@ -353,3 +356,108 @@ class LogReader:
             "injected_messages": context.injected_messages,
         }
 
+
+
+class RawLogReader:
+    """
+    Reader for raw payload logs (see RawPayloadLogger).
+
+    Delta-encoded requests are expanded back into the full payloads that
+    were sent; blob records are consumed. Logs written without delta
+    encoding are read as-is.
+
+    Usage:
+        reader = RawLogReader("brynhild_raw_20250101_120000.jsonl")
+        request = reader.get_request(3)
+        print(len(request["messages"]))
+    """
+
+    def __init__(self, log_path: _pathlib.Path | str) -> None:
+        """
+        Initialize the raw log reader.
+
+        Args:
+            log_path: Path to the raw JSONL log file (.jsonl.gz/.jsonl.zst: compressed).
+        """
+        self._log_path = _pathlib.Path(log_path)
+
+    def iter_records(self) -> _typing.Iterator[dict[str, _typing.Any]]:
+        """
+        Yield the log's records with request payloads expanded.
+
+        Reconstruction is sequential, so a request is only available once
+        every record before it has been read.
+        """
+        blobs: dict[str, _typing.Any] = {}
+        fields: dict[str, _typing.Any] = {}
+        messages: list[_typing.Any] = []
+
+        def resolve(value: _typing.Any) -> _typing.Any:
+            """Replace a blob reference by the blob's value."""
+            if isinstance(value, dict) and list(value) == [conversation_logger.BLOB_REF_KEY]:
+                return blobs.get(value[conversation_logger.BLOB_REF_KEY])
+            return value
+
+        for line in log_files.read_lines(self._log_path):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _json.loads(line)
+            except _json.JSONDecodeError:
+                continue
+
+            if record.get("direction") == "blob":
+                blob = record.get("payload", {})
+                blobs[blob.get("hash")] = blob.get("value")
+                continue
+            if record.get("encoding") != "delta":
+                if record.get("direction") == "request":
+                    # A request logged in full: later deltas build on it
+                    payload = record.get("payload", {})
+                    fields = {k: v for k, v in payload.items() if k != "messages"}
+                    messages = list(payload.get("messages") or [])
+                yield record
+                continue
+
+            delta = record.get("payload", {})
+            messages = messages[: delta.get("messages_kept", 0)]
+            messages.extend(resolve(m) for m in delta.get("messages", []))
+            fields = {k: v for k, v in fields.items() if k not in delta.get("unset", [])}
+            fields.update({k: resolve(v) for k, v in delta.get("set", {}).items()})
+
+            expanded = {k: v for k, v in record.items() if k != "encoding"}
+            expanded["payload"] = {**fields, "messages": list(messages)}
+            yield expanded
+
+    def get_records(self) -> list[dict[str, _typing.Any]]:
+        """Get all records with request payloads expanded."""
+        return list(self.iter_records())
+
+    def get_requests(self) -> list[dict[str, _typing.Any]]:
+        """Get the full payload of every request, in order."""
+        return [
+            record.get("payload", {})
+            for record in self.iter_records()
+            if record.get("direction") == "request"
+        ]
+
+    def get_request(self, number: int) -> dict[str, _typing.Any] | None:
+        """
+        Reconstruct one request.
+
+        Args:
+            number: Request number (0-based, in order of the log).
+
+        Returns:
+            The full request payload, or None if there are fewer requests.
+        """
+        count = 0
+        for record in self.iter_records():
+            if record.get("direction") != "request":
+                continue
+            if count == number:
+                payload: dict[str, _typing.Any] = record.get("payload", {})
+                return payload
+            count += 1
+        return None
@@ -0,0 +1,254 @@
+"""
+Background writer for JSONL log files.
+
+ConversationLogger and RawPayloadLogger hand their records to a
+BufferedLogWriter instead of writing them directly. Serializing and writing
+happen on a writer thread fed by a bounded queue, so a slow disk (e.g. an
+NFS home directory) never stalls the event loop while a response streams.
+
+When records reach the disk is set by the flush policy:
+- event: Flush after every record (the default)
+- interval: Flush at most every flush_interval_ms
+- turn: Flush only when flush() is called (at the end of each turn)
+
+flush() always waits until everything written so far is on disk (and
+fsync'd if configured), which makes turn boundaries crash-safe whatever
+the policy.
+"""
+
+from __future__ import annotations
+
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import json as _json
+import os as _os
+import pathlib as _pathlib
+import queue as _queue
+import threading as _threading
+import time as _time
+import typing as _typing
+
+import brynhild.logging.files as log_files
+
+FlushPolicy = _typing.Literal["event", "interval", "turn"]
+"""When buffered records are flushed to the file."""
+
+OverflowPolicy = _typing.Literal["block", "drop"]
+"""What write() does when the queue is full."""
+
+
+@_dataclasses.dataclass(frozen=True)
+class WriterConfig:
+    """Settings for a BufferedLogWriter (see the logging.* config section)."""
+
+    flush: FlushPolicy = "event"
+    """When records are flushed to the file."""
+
+    flush_interval_ms: int = 1000
+    """Longest time a record stays unflushed with the interval policy."""
+
+    fsync: bool = False
+    """fsync the file on flush() (turn boundaries and close)."""
+
+    queue_size: int = 10_000
+    """Most records waiting to be written."""
+
+    on_full: OverflowPolicy = "block"
+    """When the queue is full, wait for room (block) or discard the record (drop)."""
+
+
+class _FlushRequest:
+    """Queue marker: flush everything before it, then signal done."""
+
+    def __init__(self) -> None:
+        self.done = _threading.Event()
+
+
+_STOP = object()
+"""Queue marker: flush and stop the writer thread."""
+
+_LIVENESS_CHECK_INTERVAL = 0.5
+"""Seconds between checks that the writer thread is alive while waiting on it."""
+
+
+class BufferedLogWriter:
+    """
+    Writes JSON records, one per line, from a background thread.
+
+    Records must not be modified after write(): they are serialized later,
+    on the writer thread. Write errors are ignored, as logging shouldn't
+    break the app.
+    """
+
+    def __init__(
+        self,
+        path: _pathlib.Path,
+        config: WriterConfig | None = None,
+        *,
+        default: _typing.Callable[[_typing.Any], _typing.Any] | None = None,
+    ) -> None:
+        """
+        Open the file (truncating it) and start the writer thread.
+
+        Args:
+            path: Log file path (.gz or .zst: written compressed)
+            config: Flush and backpressure settings (default: WriterConfig())
+            default: Fallback serializer for json.dumps
+        """
+        self._config = config or WriterConfig()
+        self._default = default
+        self._queue: _queue.Queue[_typing.Any] = _queue.Queue(maxsize=self._config.queue_size)
+        self._dropped = 0
+        self._failed = 0
+        self._closed = False
+        # Held as instance state, closed by the writer thread
+        self._file = log_files.open_for_writing(path)
+        self._thread = _threading.Thread(
+            target=self._run,
+            name=f"log-writer-{path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def config(self) -> WriterConfig:
+        """The writer's settings."""
+        return self._config
+
+    @property
+    def dropped(self) -> int:
+        """Records discarded because the queue was full (drop policy)."""
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        """Records skipped because they could not be serialized or written."""
+        return self._failed
+
+    def write(self, record: dict[str, _typing.Any], *, required: bool = False) -> None:
+        """
+        Queue a record to be written.
+
+        With the drop policy, the record is discarded if the queue is full;
+        otherwise this waits for room.
+
+        Args:
+            record: JSON record
+            required: Wait for room even with the drop policy (for records
+                that later records depend on)
+        """
+        if self._closed:
+            return
+        if required or self._config.on_full == "block":
+            if not self._put(record):
+                self._dropped += 1
+            return
+        try:
+            self._queue.put_nowait(record)
+        except _queue.Full:
+            self._dropped += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every record written so far is flushed (and fsync'd).
+
+        Args:
+            timeout: Longest time to wait in seconds (None: no limit)
+
+        Returns:
+            True if the flush completed in time (False if the writer thread
+            has stopped).
+        """
+        if self._closed:
+            return True
+        request = _FlushRequest()
+        if not self._put(request):
+            return False
+        deadline = None if timeout is None else _time.monotonic() + timeout
+        while True:
+            wait = _LIVENESS_CHECK_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - _time.monotonic()))
+            if request.done.wait(wait):
+                return True
+            if not self._thread.is_alive():
+                return False
+            if deadline is not None and _time.monotonic() >= deadline:
+                return False
+
+    def close(self) -> None:
+        """Write and flush everything queued, then close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._put(_STOP)
+        self._thread.join()
+
+    def _put(self, item: _typing.Any) -> bool:
+        """Queue an item, waiting for room while the writer thread is alive."""
+        while True:
+            if not self._thread.is_alive():
+                return False
+            try:
+                self._queue.put(item, timeout=_LIVENESS_CHECK_INTERVAL)
+            except _queue.Full:
+                continue
+            return True
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue until stopped."""
+        interval = self._config.flush_interval_ms / 1000
+        dirty = False
+        last_flush = _time.monotonic()
+        try:
+            while True:
+                timeout = None
+                if dirty and self._config.flush == "interval":
+                    timeout = max(0.0, last_flush + interval - _time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except _queue.Empty:
+                    item = None
+
+                if item is None:
+                    self._flush_file(sync=False)
+                elif item is _STOP:
+                    self._flush_file(sync=self._config.fsync)
+                    return
+                elif isinstance(item, _FlushRequest):
+                    self._flush_file(sync=self._config.fsync)
+                    item.done.set()
+                else:
+                    self._write_line(item)
+                    dirty = True
+                    if not self._flush_due(last_flush):
+                        continue
+                    self._flush_file(sync=False)
+
+                dirty = False
+                last_flush = _time.monotonic()
+        finally:
+            with _contextlib.suppress(Exception):
+                self._file.close()
+
+    def _flush_due(self, last_flush: float) -> bool:
+        """Whether the flush policy calls for a flush after a record."""
+        if self._config.flush == "event":
+            return True
+        if self._config.flush == "interval":
+            return _time.monotonic() - last_flush >= self._config.flush_interval_ms / 1000
+        return False
+
+    def _write_line(self, record: dict[str, _typing.Any]) -> None:
+        # Unwritable or unserializable records are skipped (including a failing
+        # default serializer, too deep nesting, or a record modified meanwhile)
+        try:
+            self._file.write(_json.dumps(record, default=self._default) + "\n")
+        except Exception:
+            self._failed += 1
+
+    def _flush_file(self, *, sync: bool) -> None:
+        with _contextlib.suppress(Exception):
+            self._file.flush()
+            if sync:
+                _os.fsync(self._file.fileno())
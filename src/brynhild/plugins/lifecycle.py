@@ -90,6 +90,7 @@ async def fire_plugin_init(
         _logger.debug("Firing plugin_init for %s", plugin.name)
         result = await manager.dispatch(events.HookEvent.PLUGIN_INIT, context)
         _logger.debug("Plugin %s init hook result: %s", plugin.name, result.action.value)
+        await manager.aclose()
     except Exception as e:
         _logger.warning("Plugin %s init hook failed: %s", plugin.name, e)
 
@@ -169,6 +170,7 @@ async def _fire_all_shutdown_hooks() -> None:
 
             _logger.debug("Firing plugin_shutdown for %s", plugin_name)
             await manager.dispatch(events.HookEvent.PLUGIN_SHUTDOWN, context)
+            await manager.aclose()
 
         except Exception as e:
             _logger.debug("Plugin %s shutdown hook skipped: %s", plugin_name, e)
@@ -175,6 +175,8 @@ class ToolMetrics:
     call_count: int = 0
     success_count: int = 0
     failure_count: int = 0
+    timeout_count: int = 0
+    cancelled_count: int = 0
     total_duration_ms: float = 0.0
     last_used: str | None = None
 
@@ -199,6 +201,8 @@ class ToolMetrics:
             "call_count": self.call_count,
             "success_count": self.success_count,
             "failure_count": self.failure_count,
+            "timeout_count": self.timeout_count,
+            "cancelled_count": self.cancelled_count,
             "total_duration_ms": self.total_duration_ms,
             "average_duration_ms": self.average_duration_ms,
             "success_rate": self.success_rate,
@@ -145,6 +145,22 @@ class ModelProfile:
     false positives but may miss some legitimate tool calls.
     """
 
+    # History pruning
+    prune_tool_results_after_rounds: int | None = None
+    """Replace tool results older than this many tool rounds with a short stub.
+
+    Applied before each API call; results of the most recent N rounds stay
+    intact (N must be at least 1, so the current round's results always reach
+    the model). None keeps every result. Small-context models benefit most.
+    """
+
+    prune_superseded_reads: bool = False
+    """Replace file reads with a stub once the file has been written or edited.
+
+    The stale content is removed before each API call; the stub tells the
+    model to read the file again if it still needs it.
+    """
+
     # Behavioral settings
     # NOTE: These behavioral fields are display-only; none currently affect behavior.
     eagerness: _typing.Literal["minimal", "low", "medium", "high"] = "medium"
@@ -186,6 +202,17 @@ class ModelProfile:
     Note: Aspirational; no current effect on system behavior.
     """
 
+    def __post_init__(self) -> None:
+        """Reject settings that can't work."""
+        if (
+            self.prune_tool_results_after_rounds is not None
+            and self.prune_tool_results_after_rounds < 1
+        ):
+            raise ValueError(
+                f"Profile {self.name!r}: prune_tool_results_after_rounds must be "
+                f"at least 1 (got {self.prune_tool_results_after_rounds})"
+            )
+
     def get_enabled_patterns_text(self) -> str:
         """Get concatenated text of all enabled prompt patterns."""
         parts = []
@@ -14,11 +14,19 @@ Usage:
 
 from brynhild.tools.base import SandboxMixin, Tool, ToolResult
 from brynhild.tools.bash import BashTool
-from brynhild.tools.file import FileEditTool, FileReadTool, FileWriteTool
+from brynhild.tools.code_search import CodeSearchTool
+from brynhild.tools.file import (
+    FileEditTool,
+    FileReadTool,
+    FileWriteTool,
+    MultiEditTool,
+    ReadManyTool,
+)
 from brynhild.tools.finish import FinishTool
 from brynhild.tools.glob import GlobTool
 from brynhild.tools.grep import GrepTool
 from brynhild.tools.inspect import InspectTool
+from brynhild.tools.project_index import ProjectIndex
 from brynhild.tools.registry import (
     BUILTIN_TOOL_NAMES,
     ToolRegistry,
@@ -36,6 +44,7 @@ from brynhild.tools.sandbox import (
     validate_path,
 )
 from brynhild.tools.skill import LearnSkillTool
+from brynhild.tools.symbols import SymbolsTool
 
 __all__ = [
     # Base classes
@@ -48,6 +57,7 @@ __all__ = [
     "build_registry_from_settings",
     "create_default_registry",
     "get_default_registry",
+    "ProjectIndex",
     # Sandbox
     "SandboxConfig",
     "SandboxUnavailableError",
@@ -58,12 +68,16 @@ __all__ = [
     "check_write_path",
     # Tool implementations
     "BashTool",
+    "CodeSearchTool",
     "FileReadTool",
     "FileWriteTool",
     "FileEditTool",
+    "MultiEditTool",
+    "ReadManyTool",
     "FinishTool",
     "GrepTool",
     "GlobTool",
     "InspectTool",
     "LearnSkillTool",
+    "SymbolsTool",
 ]
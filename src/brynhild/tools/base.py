@@ -8,7 +8,9 @@ Each tool has a name, description, input schema, and execute method.
 from __future__ import annotations
 
 import abc as _abc
+import asyncio as _asyncio
 import dataclasses as _dataclasses
+import math as _math
 import pathlib as _pathlib
 import typing as _typing
 
@@ -40,6 +42,20 @@ _DEFAULT_RECOVERY_POLICY: dict[RiskLevel, RecoveryPolicy] = {
     "high_impact": "deny",
 }
 
+ToolOutcome = _typing.Literal["success", "failure", "timeout", "cancelled"]
+"""How a tool call ended.
+
+- success / failure: The tool returned a result
+- timeout: The call exceeded its deadline and was cancelled
+- cancelled: The user cancelled the call while it was running
+"""
+
+_CANCEL_POLL_SECONDS = 0.1
+"""How often a running tool checks for user cancellation."""
+
+_CANCEL_GRACE_SECONDS = 5.0
+"""How long a cancelled tool gets to clean up (kill subprocesses) before it is abandoned."""
+
 
 @_dataclasses.dataclass
 class ToolResult:
@@ -88,6 +104,99 @@ class InputValidation:
         return len(self.warnings) > 0
 
 
+_HISTOGRAM_BUCKETS_PER_DOUBLING = 4
+"""Histogram resolution: bucket bounds grow by 2 ** (1/4), so buckets are ~19% wide."""
+
+_HISTOGRAM_BUCKETS = 100
+"""Number of histogram buckets; the last one also holds anything above ~6 hours."""
+
+
+@_dataclasses.dataclass
+class LatencyHistogram:
+    """
+    Fixed-bucket, log-scaled latency histogram.
+
+    Bucket i holds durations in (2**((i-1)/4), 2**(i/4)] ms, with bucket 0
+    holding everything up to 1 ms. The bounds are the same for every
+    histogram, so histograms from different sessions merge by adding counts.
+    Percentiles are accurate to one bucket width (~19%) and never exceed the
+    exact maximum.
+    """
+
+    counts: dict[int, int] = _dataclasses.field(default_factory=dict)
+    """Sparse bucket index -> sample count."""
+
+    max_ms: float = 0.0
+    """Largest recorded duration."""
+
+    @staticmethod
+    def bucket_for(duration_ms: float) -> int:
+        """Index of the bucket a duration falls into."""
+        if duration_ms <= 1.0:
+            return 0
+        index = _math.ceil(_math.log2(duration_ms) * _HISTOGRAM_BUCKETS_PER_DOUBLING - 1e-9)
+        return min(index, _HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def upper_bound(index: int) -> float:
+        """Upper bound of a bucket in ms."""
+        return float(2.0 ** (index / _HISTOGRAM_BUCKETS_PER_DOUBLING))
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        return sum(self.counts.values())
+
+    def record(self, duration_ms: float) -> None:
+        """Add one sample."""
+        index = self.bucket_for(duration_ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples to this one."""
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile in [0, 100]
+
+        Returns:
+            Upper bound of the bucket holding the percentile (capped at the
+            maximum), or 0.0 if the histogram is empty
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+        rank = max(1, _math.ceil(total * p / 100.0))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, _typing.Any]:
+        """Convert to JSON-serializable dict (bucket indexes become string keys)."""
+        return {
+            "buckets": {str(i): n for i, n in sorted(self.counts.items())},
+            "max_ms": self.max_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, _typing.Any]) -> LatencyHistogram:
+        """Create from dictionary."""
+        return cls(
+            counts={int(i): int(n) for i, n in data.get("buckets", {}).items()},
+            max_ms=data.get("max_ms", 0.0),
+        )
+
+
 @_dataclasses.dataclass
 class ToolMetrics:
     """
@@ -102,8 +211,11 @@ class ToolMetrics:
     call_count: int = 0
     success_count: int = 0
     failure_count: int = 0
+    timeout_count: int = 0  # Subset of failure_count
+    cancelled_count: int = 0  # Subset of failure_count
     total_duration_ms: float = 0.0
     last_used: str | None = None  # ISO timestamp
+    latency: LatencyHistogram = _dataclasses.field(default_factory=LatencyHistogram)
 
     @property
     def success_rate(self) -> float:
@@ -124,6 +236,7 @@ class ToolMetrics:
         success: bool,
         duration_ms: float,
         timestamp: str | None = None,
+        outcome: ToolOutcome | None = None,
     ) -> None:
         """
         Record a tool call.
@@ -132,6 +245,8 @@ class ToolMetrics:
             success: Whether the call succeeded
             duration_ms: How long the call took in milliseconds
             timestamp: ISO timestamp of the call (default: now)
+            outcome: How the call ended; "timeout" and "cancelled" are
+                counted as failures and tracked separately
         """
         import datetime as _dt
 
@@ -140,9 +255,31 @@ class ToolMetrics:
             self.success_count += 1
         else:
             self.failure_count += 1
+            if outcome == "timeout":
+                self.timeout_count += 1
+            elif outcome == "cancelled":
+                self.cancelled_count += 1
         self.total_duration_ms += duration_ms
+        self.latency.record(duration_ms)
         self.last_used = timestamp or _dt.datetime.now(_dt.UTC).isoformat()
 
+    def merge(self, other: ToolMetrics) -> None:
+        """
+        Add another set of metrics for the same tool (e.g. from another session).
+
+        Metrics saved before histograms existed merge their counts but
+        contribute no latency samples.
+        """
+        self.call_count += other.call_count
+        self.success_count += other.success_count
+        self.failure_count += other.failure_count
+        self.timeout_count += other.timeout_count
+        self.cancelled_count += other.cancelled_count
+        self.total_duration_ms += other.total_duration_ms
+        self.latency.merge(other.latency)
+        if other.last_used and (self.last_used is None or other.last_used > self.last_used):
+            self.last_used = other.last_used
+
     def to_dict(self) -> dict[str, _typing.Any]:
         """Convert to JSON-serializable dict."""
         return {
@@ -150,10 +287,17 @@ class ToolMetrics:
             "call_count": self.call_count,
             "success_count": self.success_count,
             "failure_count": self.failure_count,
+            "timeout_count": self.timeout_count,
+            "cancelled_count": self.cancelled_count,
             "total_duration_ms": self.total_duration_ms,
             "average_duration_ms": self.average_duration_ms,
             "success_rate": self.success_rate,
+            "p50_ms": self.latency.percentile(50),
+            "p90_ms": self.latency.percentile(90),
+            "p99_ms": self.latency.percentile(99),
+            "max_ms": self.latency.max_ms,
             "last_used": self.last_used,
+            "latency": self.latency.to_dict(),
         }
 
     @classmethod
@@ -164,8 +308,11 @@ class ToolMetrics:
             call_count=data.get("call_count", 0),
             success_count=data.get("success_count", 0),
             failure_count=data.get("failure_count", 0),
+            timeout_count=data.get("timeout_count", 0),
+            cancelled_count=data.get("cancelled_count", 0),
             total_duration_ms=data.get("total_duration_ms", 0.0),
             last_used=data.get("last_used"),
+            latency=LatencyHistogram.from_dict(data.get("latency", {})),
         )
 
 
@@ -187,6 +334,8 @@ class MetricsCollector:
         success: bool,
         duration_ms: float,
         timestamp: str | None = None,
+        *,
+        outcome: ToolOutcome | None = None,
     ) -> None:
         """
         Record a tool call.
@@ -196,10 +345,11 @@ class MetricsCollector:
             success: Whether the call succeeded
             duration_ms: How long the call took in milliseconds
             timestamp: ISO timestamp of the call (default: now)
+            outcome: How the call ended (see ToolOutcome)
         """
         if tool_name not in self._metrics:
             self._metrics[tool_name] = ToolMetrics(tool_name=tool_name)
-        self._metrics[tool_name].record_call(success, duration_ms, timestamp)
+        self._metrics[tool_name].record_call(success, duration_ms, timestamp, outcome)
 
     def get(self, tool_name: str) -> ToolMetrics | None:
         """Get metrics for a specific tool."""
@@ -225,18 +375,34 @@ class MetricsCollector:
             collector._metrics[name] = ToolMetrics.from_dict(metrics_data)
         return collector
 
+    def merge(self, other: MetricsCollector) -> None:
+        """Add another collector's metrics (e.g. to aggregate sessions)."""
+        for name, metrics in other._metrics.items():
+            if name not in self._metrics:
+                self._metrics[name] = ToolMetrics(tool_name=name)
+            self._metrics[name].merge(metrics)
+
     def summary(self) -> dict[str, _typing.Any]:
         """Get a summary of all metrics."""
         total_calls = sum(m.call_count for m in self._metrics.values())
         total_success = sum(m.success_count for m in self._metrics.values())
         total_duration = sum(m.total_duration_ms for m in self._metrics.values())
+        latency = LatencyHistogram()
+        for m in self._metrics.values():
+            latency.merge(m.latency)
 
         return {
             "total_calls": total_calls,
             "total_success": total_success,
             "total_failures": total_calls - total_success,
+            "total_timeouts": sum(m.timeout_count for m in self._metrics.values()),
+            "total_cancelled": sum(m.cancelled_count for m in self._metrics.values()),
             "success_rate": (total_success / total_calls * 100.0) if total_calls else 0.0,
             "total_duration_ms": total_duration,
+            "p50_ms": latency.percentile(50),
+            "p90_ms": latency.percentile(90),
+            "p99_ms": latency.percentile(99),
+            "max_ms": latency.max_ms,
             "tools_used": len(self._metrics),
         }
 
@@ -255,6 +421,7 @@ class Tool(_abc.ABC):
     - version (property): Tool version string (default: "0.0.0")
     - categories (property): List of category tags (default: [])
     - examples (property): Usage examples for the LLM (default: [])
+    - close(): Release resources held across calls (default: none held)
     """
 
     # Marker indicating this class uses proper inheritance, not duck typing.
@@ -458,6 +625,14 @@ class Tool(_abc.ABC):
             },
         }
 
+    def close(self) -> None:  # noqa: B027
+        """
+        Release resources held across calls (e.g. persisted indexes).
+
+        Called by ToolRegistry.close() at session end. The default
+        implementation holds none.
+        """
+
     def __repr__(self) -> str:
         return f"<Tool {self.name}>"
 
@@ -568,3 +743,68 @@ class SandboxMixin:
         except sandbox.PathValidationError as e:
             return ToolResult(success=False, output="", error=str(e))
 
+
+
+async def run_with_deadline(
+    tool: Tool,
+    input: dict[str, _typing.Any],
+    timeout: float | None = None,
+    is_cancelled: _typing.Callable[[], bool] | None = None,
+) -> tuple[ToolResult, ToolOutcome]:
+    """
+    Run a tool as a cancellable task bounded by a deadline.
+
+    The tool's task is cancelled when the deadline passes or when
+    is_cancelled() becomes true (polled while the tool runs), so a
+    long-running tool does not block Ctrl-C. Tools that spawn subprocesses
+    kill them when their task is cancelled.
+
+    Args:
+        tool: The tool to run
+        input: Tool input
+        timeout: Deadline in seconds (None: no deadline)
+        is_cancelled: Callback reporting user cancellation
+
+    Returns:
+        Tuple of (result, outcome). Exceptions raised by the tool propagate.
+    """
+    loop = _asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    task = _asyncio.ensure_future(tool.execute(input))
+    outcome: ToolOutcome | None = None
+    try:
+        while not task.done():
+            wait = None if deadline is None else max(deadline - loop.time(), 0.0)
+            if is_cancelled is not None:
+                wait = _CANCEL_POLL_SECONDS if wait is None else min(wait, _CANCEL_POLL_SECONDS)
+            await _asyncio.wait({task}, timeout=wait)
+            if task.done():
+                break
+            if is_cancelled is not None and is_cancelled():
+                outcome = "cancelled"
+                break
+            if deadline is not None and loop.time() >= deadline:
+                outcome = "timeout"
+                break
+    finally:
+        if not task.done():
+            task.cancel()
+            await _asyncio.wait({task}, timeout=_CANCEL_GRACE_SECONDS)
+            if not task.done():
+                # Still running: detach rather than block the session on it
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    if outcome == "timeout":
+        return ToolResult(
+            success=False,
+            output="",
+            error=f"Tool '{tool.name}' timed out after {timeout:g}s",
+        ), outcome
+    if outcome == "cancelled":
+        return ToolResult(success=False, output="", error="Cancelled by user"), outcome
+
+    if task.cancelled():
+        # The tool cancelled itself; report it like a user cancellation
+        return ToolResult(success=False, output="", error="Cancelled by user"), "cancelled"
+    result = task.result()
+    return result, "success" if result.success else "failure"
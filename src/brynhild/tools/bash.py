@@ -8,13 +8,16 @@ Supports timeouts, background execution, and sandboxing via macOS sandbox-exec.
 from __future__ import annotations
 
 import asyncio as _asyncio
+import contextlib as _contextlib
 import os as _os
 import pathlib as _pathlib
+import signal as _signal
 import typing as _typing
 
 import brynhild.constants as _constants
 import brynhild.tools.base as base
 import brynhild.tools.sandbox as sandbox
+import brynhild.tools.sandbox_limits as sandbox_limits
 
 
 class BashTool(base.Tool):
@@ -25,6 +28,7 @@ class BashTool(base.Tool):
     - Command execution with configurable timeout
     - Working directory management
     - Sandbox mode via macOS sandbox-exec
+    - Per-command resource limits (rlimits, optional cgroup v2)
     - Dry-run mode for testing
     """
 
@@ -105,6 +109,7 @@ class BashTool(base.Tool):
             self._sandbox_config = sandbox.SandboxConfig(
                 project_root=path,
                 dry_run=self._dry_run,
+                resource_limits=self._sandbox_config.resource_limits,
             )
 
     def configure_sandbox(
@@ -112,6 +117,7 @@ class BashTool(base.Tool):
         project_root: _pathlib.Path | None = None,
         allowed_paths: list[_pathlib.Path] | None = None,
         allow_network: bool = False,
+        resource_limits: sandbox_limits.ResourceLimits | None = None,
     ) -> None:
         """
         Configure sandbox settings.
@@ -120,12 +126,14 @@ class BashTool(base.Tool):
             project_root: Root directory for write access
             allowed_paths: Additional paths where writes are allowed
             allow_network: Whether to allow network access
+            resource_limits: Per-command resource limits
         """
         self._sandbox_config = sandbox.SandboxConfig(
             project_root=project_root or self._working_dir,
             allowed_paths=allowed_paths,
             allow_network=allow_network,
             dry_run=self._dry_run,
+            resource_limits=resource_limits,
         )
 
     def _get_sandbox_config(self) -> sandbox.SandboxConfig:
@@ -169,19 +177,29 @@ class BashTool(base.Tool):
         # Prepare command (with or without sandbox)
         profile_path: _pathlib.Path | None = None
         actual_command = command
+        config = self._get_sandbox_config()
+        limits = config.resource_limits
 
         if self._sandbox_enabled:
-            config = self._get_sandbox_config()
             actual_command, profile_path = sandbox.get_sandbox_command(command, config)
+        elif limits.has_rlimits:
+            # Resource limits apply even when the OS sandbox is off
+            actual_command = sandbox_limits.in_bash(limits.limit_command(command))
+
+        cgroup = sandbox_limits.CommandCgroup.create(limits)
+        if cgroup is not None:
+            actual_command = cgroup.wrap(actual_command)
 
         try:
-            # Create subprocess
+            # Create subprocess in its own process group so the whole tree
+            # can be killed on timeout or cancellation
             proc = await _asyncio.create_subprocess_shell(
                 actual_command,
                 stdout=_asyncio.subprocess.PIPE,
                 stderr=_asyncio.subprocess.PIPE,
                 cwd=str(self._working_dir),
                 env=self._get_env(),
+                start_new_session=True,
             )
 
             # Wait for completion with timeout
@@ -191,14 +209,19 @@ class BashTool(base.Tool):
                     timeout=timeout_sec,
                 )
             except TimeoutError:
-                # Kill the process on timeout
-                proc.kill()
+                _kill_process_tree(proc, cgroup)
                 await proc.wait()
                 return base.ToolResult(
                     success=False,
                     output="",
                     error=f"Command timed out after {timeout_ms}ms",
                 )
+            except _asyncio.CancelledError:
+                # Deadline or user cancel: don't leave the command running
+                _kill_process_tree(proc, cgroup)
+                with _contextlib.suppress(_asyncio.CancelledError):
+                    await _asyncio.shield(proc.wait())
+                raise
 
             # Decode output
             stdout_str = stdout.decode("utf-8", errors="replace")
@@ -211,9 +234,18 @@ class BashTool(base.Tool):
                     output += "\n--- stderr ---\n"
                 output += stderr_str
 
-            # Check for sandbox violations in stderr
+            # Check for resource limit and sandbox violations
             error_msg = None
-            if proc.returncode != 0:
+            returncode = proc.returncode or 0
+            violation = sandbox_limits.describe_violation(
+                limits,
+                returncode,
+                stderr_str,
+                cgroup.violations() if cgroup is not None else None,
+            )
+            if violation is not None:
+                error_msg = violation
+            elif returncode != 0:
                 if "deny" in stderr_str.lower() or "sandbox" in stderr_str.lower():
                     error_msg = f"Sandbox blocked operation: {stderr_str.rstrip()}"
                 elif stderr_str:
@@ -244,9 +276,11 @@ class BashTool(base.Tool):
                 error=f"Failed to execute command: {e}",
             )
         finally:
-            # Clean up sandbox profile
+            # Clean up sandbox profile and per-command cgroup
             if profile_path:
                 sandbox.cleanup_sandbox_profile(profile_path)
+            if cgroup is not None:
+                cgroup.remove()
 
     # Environment variables that are safe to pass to subprocesses
     _ENV_ALLOWLIST: set[str] = {
@@ -331,3 +365,18 @@ class BashTool(base.Tool):
                 env[key] = value
 
         return env
+
+
+def _kill_process_tree(
+    proc: _asyncio.subprocess.Process,
+    cgroup: sandbox_limits.CommandCgroup | None,
+) -> None:
+    """Kill a command and everything it spawned (its process group and cgroup)."""
+    if cgroup is not None:
+        cgroup.kill()
+    try:
+        _os.killpg(proc.pid, _signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        # Group already gone; make sure the shell itself is
+        with _contextlib.suppress(ProcessLookupError):
+            proc.kill()
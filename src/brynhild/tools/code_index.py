@@ -0,0 +1,617 @@
+"""
+On-disk BM25 index over project source files for the CodeSearch tool.
+
+Files are split into fixed-size line chunks and each chunk is indexed as one
+BM25 document. Identifiers are indexed whole and split into subwords
+(``parseConfigFile`` -> ``parseconfigfile``, ``parse``, ``config``, ``file``),
+so a query like "config parser" finds ``ConfigParser`` and ``parse_config``.
+
+Layout of the index directory::
+
+    meta.json             file table, lexicon (term -> offset, count), stats
+    postings-<gen>.bin    uint32 pairs (chunk id, term frequency), grouped by term
+    chunks-<gen>.bin      uint32 quads (file id, start line, end line, length)
+
+The two ``.bin`` files are memory-mapped read-only; a query only touches the
+postings of its own terms. Changes are applied incrementally by mtime: changed
+and deleted files are tombstoned in the mapped segment and re-indexed into an
+in-memory delta, which is merged into a new segment generation once it grows
+large (or on ``close()``). ``meta.json`` is replaced atomically last, so a
+crash mid-write leaves the previous generation intact.
+
+The index directory is shared by every session on the same project. Segment
+files are never rewritten in place: each generation gets a unique id, its
+files are written under temporary names and renamed into place, and
+unreferenced generations are only deleted once they are old enough that no
+other process can still be about to load them. (Deleting a file another
+process has mapped is safe on POSIX; the mapping stays valid.)
+"""
+
+from __future__ import annotations
+
+import array as _array
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import functools as _functools
+import heapq as _heapq
+import json as _json
+import logging as _logging
+import math as _math
+import mmap as _mmap
+import os as _os
+import pathlib as _pathlib
+import re as _re
+import sys as _sys
+import threading as _threading
+import time as _time
+import typing as _typing
+import uuid as _uuid
+
+_logger = _logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+"""Bumped whenever the on-disk layout or tokenization changes."""
+
+DEFAULT_CHUNK_LINES = 40
+"""Lines per indexed chunk."""
+
+DEFAULT_MAX_FILE_BYTES = 1024 * 1024
+"""Files larger than this are not indexed (generated code, data dumps)."""
+
+# BM25 parameters (standard Okapi defaults)
+_K1 = 1.2
+_B = 0.75
+
+_DEAD = 0xFFFFFFFF
+
+_STALE_GENERATION_SECONDS = 600
+"""Unreferenced generation files younger than this are not deleted."""
+
+_WORD_RE = _re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_SUBWORD_RE = _re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+# =============================================================================
+# Tokenization
+# =============================================================================
+
+
+@_functools.lru_cache(maxsize=65536)
+def _expand(word: str) -> tuple[str, ...]:
+    """Index terms for one identifier: the whole word plus its subwords."""
+    whole = word.lower()
+    parts = [p.lower() for p in _SUBWORD_RE.findall(word)]
+    if len(parts) <= 1:
+        return (whole,) if len(whole) > 1 else ()
+    return (whole, *(p for p in parts if len(p) > 1))
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into index terms.
+
+    Args:
+        text: Source text or query
+
+    Returns:
+        Lowercased terms; identifiers contribute themselves and their
+        camelCase/snake_case subwords
+    """
+    terms: list[str] = []
+    for word in _WORD_RE.findall(text):
+        terms.extend(_expand(word))
+    return terms
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+@_dataclasses.dataclass(slots=True)
+class SearchHit:
+    """One ranked chunk."""
+
+    path: str
+    """File path relative to the index root."""
+
+    start_line: int
+    """First line of the chunk (1-indexed)."""
+
+    end_line: int
+    """Last line of the chunk (inclusive)."""
+
+    score: float
+    """BM25 score."""
+
+
+@_dataclasses.dataclass(slots=True)
+class _FileRecord:
+    file_id: int
+    mtime: float
+    size: int
+    first_chunk: int
+    n_chunks: int
+    length: int
+
+
+class _Segment:
+    """A read-only, memory-mapped generation of the index."""
+
+    def __init__(
+        self,
+        lexicon: dict[str, list[int]],
+        postings: memoryview,
+        chunks: memoryview,
+        maps: list[_mmap.mmap],
+    ) -> None:
+        self.lexicon = lexicon
+        self.postings = postings
+        self.chunks = chunks
+        self.n_chunks = len(chunks) // 4
+        self._maps = maps
+
+    @classmethod
+    def empty(cls) -> _Segment:
+        return cls({}, memoryview(_array.array("I")), memoryview(_array.array("I")), [])
+
+    def close(self) -> None:
+        self.postings.release()
+        self.chunks.release()
+        for m in self._maps:
+            m.close()
+        self._maps = []
+
+
+def _map_uint32(path: _pathlib.Path, maps: list[_mmap.mmap]) -> memoryview:
+    """Memory-map a file of native uint32 values (empty files can't be mapped)."""
+    with open(path, "rb") as f:
+        if _os.fstat(f.fileno()).st_size == 0:
+            return memoryview(_array.array("I"))
+        m = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+    maps.append(m)
+    return memoryview(m).cast("I")
+
+
+class CodeIndex:
+    """
+    Incrementally maintained BM25 index over a set of project files.
+
+    Thread-safe. The caller supplies the file list (with mtimes) to
+    ``refresh()``; only files whose mtime or size changed are re-read.
+    """
+
+    def __init__(
+        self,
+        root: _pathlib.Path,
+        *,
+        index_dir: _pathlib.Path | None = None,
+        chunk_lines: int = DEFAULT_CHUNK_LINES,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    ) -> None:
+        """
+        Create an index. The persisted segment (if any) is loaded lazily.
+
+        Args:
+            root: Directory that indexed paths are relative to
+            index_dir: Where to persist the index (None keeps it in memory only)
+            chunk_lines: Lines per chunk
+            max_file_bytes: Skip files larger than this
+        """
+        self._root = root.resolve()
+        self._index_dir = index_dir
+        self._chunk_lines = chunk_lines
+        self._max_file_bytes = max_file_bytes
+
+        self._lock = _threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all in-memory state (the segment must already be closed)."""
+        self._loaded = False
+        self._segment = _Segment.empty()
+        self._files: dict[str, _FileRecord] = {}
+        self._file_paths: list[str | None] = []
+        self._dead_files: set[int] = set()
+        self._delta_chunks = _array.array("I")
+        self._delta_postings: dict[str, _array.array[int]] = {}
+        self._live_chunks = 0
+        self._live_length = 0
+        self._dirty = False
+
+    @property
+    def root(self) -> _pathlib.Path:
+        """Resolved root directory."""
+        return self._root
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self._files)
+
+    def close(self) -> None:
+        """Persist pending changes and unmap the segment."""
+        with self._lock:
+            if self._dirty:
+                self._compact()
+            self._segment.close()
+            self._reset()
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def refresh(self, files: _typing.Iterable[tuple[str, float, int]]) -> tuple[int, int]:
+        """
+        Bring the index up to date with the given file list.
+
+        Args:
+            files: (relative path, mtime, size) for every file that should be indexed
+
+        Returns:
+            Tuple of (files re-indexed, files removed)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            seen: set[str] = set()
+            changed: list[tuple[str, float, int]] = []
+            for rel, mtime, size in files:
+                seen.add(rel)
+                record = self._files.get(rel)
+                if record is None or record.mtime != mtime or record.size != size:
+                    changed.append((rel, mtime, size))
+            removed = [rel for rel in self._files if rel not in seen]
+
+            for rel in removed:
+                self._remove(rel)
+            for rel, mtime, size in changed:
+                if rel in self._files:
+                    self._remove(rel)
+                self._add(rel, mtime, size)
+
+            if changed or removed:
+                self._dirty = True
+                # Merge once the delta is a sizeable fraction of the segment
+                pending = len(self._delta_chunks) // 4 + (
+                    self._segment.n_chunks + len(self._delta_chunks) // 4 - self._live_chunks
+                )
+                if pending > max(256, self._segment.n_chunks // 8):
+                    self._compact()
+            return len(changed), len(removed)
+
+    def _add(self, rel: str, mtime: float, size: int) -> None:
+        """Read, chunk and index one file into the delta."""
+        file_id = len(self._file_paths)
+        first_chunk = self._segment.n_chunks + len(self._delta_chunks) // 4
+        record = _FileRecord(file_id, mtime, size, first_chunk, 0, 0)
+
+        text = self._read_text(rel, size)
+        if text is not None:
+            lines = text.splitlines()
+            for start in range(0, len(lines), self._chunk_lines):
+                chunk_id = first_chunk + record.n_chunks
+                terms = tokenize("\n".join(lines[start:start + self._chunk_lines]))
+                if not terms:
+                    continue
+                counts: dict[str, int] = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    postings = self._delta_postings.get(term)
+                    if postings is None:
+                        postings = self._delta_postings[term] = _array.array("I")
+                    postings.append(chunk_id)
+                    postings.append(tf)
+                end = min(start + self._chunk_lines, len(lines))
+                self._delta_chunks.extend((file_id, start + 1, end, len(terms)))
+                record.n_chunks += 1
+                record.length += len(terms)
+
+        self._files[rel] = record
+        self._file_paths.append(rel)
+        self._live_chunks += record.n_chunks
+        self._live_length += record.length
+
+    def _read_text(self, rel: str, size: int) -> str | None:
+        """File contents, or None for oversized, binary or unreadable files."""
+        if size > self._max_file_bytes:
+            return None
+        try:
+            data = (self._root / rel).read_bytes()
+        except OSError:
+            return None
+        if b"\0" in data[:8192]:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def _remove(self, rel: str) -> None:
+        """Tombstone a file; its postings are dropped at the next merge."""
+        record = self._files.pop(rel)
+        self._dead_files.add(record.file_id)
+        self._file_paths[record.file_id] = None
+        self._live_chunks -= record.n_chunks
+        self._live_length -= record.length
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        path_prefix: str = "",
+    ) -> list[SearchHit]:
+        """
+        Rank chunks against a query.
+
+        Args:
+            query: Free-text query (identifiers are split like indexed text)
+            limit: Maximum number of hits
+            path_prefix: Only return files under this relative directory
+
+        Returns:
+            Hits ordered by descending score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            self._ensure_loaded()
+            if not terms or not self._live_chunks:
+                return []
+
+            allowed: set[int] | None = None
+            if path_prefix:
+                prefix = path_prefix.rstrip("/") + "/"
+                allowed = {
+                    r.file_id for rel, r in self._files.items() if rel.startswith(prefix)
+                }
+
+            n = self._live_chunks
+            avg_length = self._live_length / n
+            # BM25 length normalization k1 * (1 - b + b * len / avg), split into terms
+            base_norm = _K1 * (1.0 - _B)
+            slope = _K1 * _B / avg_length
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._live_postings(term, allowed)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = _math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+                weight = idf * (_K1 + 1)
+                for chunk_id, tf, length in postings:
+                    norm = base_norm + slope * length
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + weight * tf / (tf + norm)
+
+            best = _heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            hits: list[SearchHit] = []
+            for chunk_id, score in best:
+                file_id, start, end, _length = self._chunk(chunk_id)
+                path = self._file_paths[file_id]
+                assert path is not None
+                hits.append(SearchHit(path, start, end, score))
+            return hits
+
+    def _chunk(self, chunk_id: int) -> tuple[int, int, int, int]:
+        """(file id, start line, end line, length) of a chunk."""
+        base = self._segment.n_chunks
+        if chunk_id < base:
+            row: _typing.Sequence[int] = self._segment.chunks[chunk_id * 4:chunk_id * 4 + 4]
+        else:
+            offset = (chunk_id - base) * 4
+            row = self._delta_chunks[offset:offset + 4]
+        return row[0], row[1], row[2], row[3]
+
+    def _live_postings(
+        self,
+        term: str,
+        allowed: set[int] | None,
+    ) -> list[tuple[int, int, int]]:
+        """(chunk id, tf, chunk length) for live chunks containing ``term``."""
+        result: list[tuple[int, int, int]] = []
+        dead = self._dead_files
+
+        entry = self._segment.lexicon.get(term)
+        if entry is not None:
+            offset, count = entry
+            flat = self._segment.postings[offset * 2:(offset + count) * 2]
+            chunk_ids, tfs = flat[0::2], flat[1::2]
+            file_ids, lengths = self._segment.chunks[0::4], self._segment.chunks[3::4]
+            if not dead and allowed is None:
+                # Common case: nothing to filter, stay in C-level iteration
+                result.extend(
+                    zip(chunk_ids, tfs, map(lengths.__getitem__, chunk_ids), strict=True)
+                )
+            else:
+                for chunk_id, tf in zip(chunk_ids, tfs, strict=True):
+                    file_id = file_ids[chunk_id]
+                    if file_id in dead or (allowed is not None and file_id not in allowed):
+                        continue
+                    result.append((chunk_id, tf, lengths[chunk_id]))
+
+        delta = self._delta_postings.get(term)
+        if delta is not None:
+            it = iter(delta)
+            for chunk_id, tf in zip(it, it, strict=True):
+                file_id, _start, _end, length = self._chunk(chunk_id)
+                if file_id in dead or (allowed is not None and file_id not in allowed):
+                    continue
+                result.append((chunk_id, tf, length))
+        return result
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        """Load the persisted segment once. Caller holds the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._index_dir is None:
+            return
+        meta_path = self._index_dir / "meta.json"
+        try:
+            meta = _json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.debug("Ignoring unreadable code index %s: %s", meta_path, e)
+            return
+
+        if (
+            meta.get("version") != INDEX_FORMAT_VERSION
+            or meta.get("byteorder") != _sys.byteorder
+            or meta.get("chunk_lines") != self._chunk_lines
+            or meta.get("max_file_bytes") != self._max_file_bytes
+        ):
+            _logger.debug("Code index at %s is stale; rebuilding", self._index_dir)
+            return
+
+        generation = meta["generation"]
+        maps: list[_mmap.mmap] = []
+        try:
+            postings = _map_uint32(self._index_dir / f"postings-{generation}.bin", maps)
+            chunks = _map_uint32(self._index_dir / f"chunks-{generation}.bin", maps)
+        except OSError as e:
+            for m in maps:
+                m.close()
+            _logger.debug("Code index segment missing: %s", e)
+            return
+
+        self._segment = _Segment(meta["lexicon"], postings, chunks, maps)
+        for rel, mtime, size, first_chunk, n_chunks, length in meta["files"]:
+            record = _FileRecord(len(self._file_paths), mtime, size, first_chunk, n_chunks, length)
+            self._files[rel] = record
+            self._file_paths.append(rel)
+            self._live_chunks += n_chunks
+            self._live_length += length
+
+    def _compact(self) -> None:
+        """
+        Merge the segment and delta into a new generation. Caller holds the lock.
+
+        Live files keep their order; chunk and file ids are renumbered densely.
+        """
+        old_chunk_count = self._segment.n_chunks + len(self._delta_chunks) // 4
+        remap = _array.array("I", [_DEAD]) * old_chunk_count
+        files: list[tuple[str, _FileRecord]] = sorted(
+            self._files.items(), key=lambda item: item[1].file_id
+        )
+        new_chunks = _array.array("I")
+        new_files: dict[str, _FileRecord] = {}
+        for new_id, (rel, record) in enumerate(files):
+            first = len(new_chunks) // 4
+            for i in range(record.n_chunks):
+                old = record.first_chunk + i
+                remap[old] = first + i
+                _file_id, start, end, length = self._chunk(old)
+                new_chunks.extend((new_id, start, end, length))
+            new_files[rel] = _FileRecord(
+                new_id, record.mtime, record.size, first, record.n_chunks, record.length
+            )
+
+        new_postings = _array.array("I")
+        lexicon: dict[str, list[int]] = {}
+        segment = self._segment
+        for term in segment.lexicon.keys() | self._delta_postings.keys():
+            start = len(new_postings) // 2
+            self._merge_postings(term, remap, new_postings)
+            count = len(new_postings) // 2 - start
+            if count:
+                lexicon[term] = [start, count]
+
+        self._dirty = False
+        if self._index_dir is not None:
+            try:
+                self._write_segment(new_files, lexicon, new_postings, new_chunks)
+            except OSError as e:
+                _logger.warning("Could not persist code index to %s: %s", self._index_dir, e)
+
+        segment.close()
+        self._segment = _Segment(
+            lexicon, memoryview(new_postings), memoryview(new_chunks), []
+        )
+        self._files = new_files
+        self._file_paths = list(new_files)
+        self._dead_files = set()
+        self._delta_chunks = _array.array("I")
+        self._delta_postings = {}
+
+    def _merge_postings(
+        self,
+        term: str,
+        remap: _array.array[int],
+        out: _array.array[int],
+    ) -> None:
+        """Append a term's live postings (renumbered through ``remap``) to ``out``."""
+        sources: list[_typing.Sequence[int]] = []
+        entry = self._segment.lexicon.get(term)
+        if entry is not None:
+            offset, count = entry
+            sources.append(self._segment.postings[offset * 2:(offset + count) * 2])
+        delta = self._delta_postings.get(term)
+        if delta is not None:
+            sources.append(delta)
+        for flat in sources:
+            it = iter(flat)
+            for chunk_id, tf in zip(it, it, strict=True):
+                new_id = remap[chunk_id]
+                if new_id != _DEAD:
+                    out.append(new_id)
+                    out.append(tf)
+
+    def _write_segment(
+        self,
+        files: dict[str, _FileRecord],
+        lexicon: dict[str, list[int]],
+        postings: _array.array[int],
+        chunks: _array.array[int],
+    ) -> None:
+        """Write a generation to disk and switch meta.json over to it."""
+        assert self._index_dir is not None
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        # Never reused, so no other process can have a file of this name open
+        generation = _uuid.uuid4().hex
+        for name, data in (("postings", postings), ("chunks", chunks)):
+            path = self._index_dir / f"{name}-{generation}.bin"
+            tmp = path.with_name(f"{path.name}.tmp")
+            with open(tmp, "wb") as f:
+                data.tofile(f)
+            _os.replace(tmp, path)
+
+        meta = {
+            "version": INDEX_FORMAT_VERSION,
+            "byteorder": _sys.byteorder,
+            "chunk_lines": self._chunk_lines,
+            "max_file_bytes": self._max_file_bytes,
+            "generation": generation,
+            "files": [
+                [rel, r.mtime, r.size, r.first_chunk, r.n_chunks, r.length]
+                for rel, r in files.items()
+            ],
+            "lexicon": lexicon,
+        }
+        tmp = self._index_dir / f"meta.json.{generation}.tmp"
+        tmp.write_text(_json.dumps(meta, separators=(",", ":")), encoding="utf-8")
+        _os.replace(tmp, self._index_dir / "meta.json")
+
+        self._remove_stale_generations(generation)
+
+    def _remove_stale_generations(self, current: str) -> None:
+        """
+        Delete old generations (and leftover temporary files).
+
+        Another session may have just read a meta.json pointing at an older
+        generation and not opened its files yet, so only files untouched for
+        _STALE_GENERATION_SECONDS are deleted.
+        """
+        assert self._index_dir is not None
+        cutoff = _time.time() - _STALE_GENERATION_SECONDS
+        for path in self._index_dir.iterdir():
+            name = path.name
+            if not name.endswith((".bin", ".tmp")) or current in name:
+                continue
+            with _contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
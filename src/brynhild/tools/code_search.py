@@ -0,0 +1,188 @@
+"""
+CodeSearch tool: ranked, offline search over project source files.
+
+Answers "where is the code that does X" in one call instead of several Grep
+rounds. Results come from a local BM25 index (see ``code_index``) that is
+persisted between sessions and refreshed by file mtime before every query.
+"""
+
+from __future__ import annotations
+
+import asyncio as _asyncio
+import pathlib as _pathlib
+import typing as _typing
+
+import brynhild.tools.base as base
+import brynhild.tools.code_index as code_index
+import brynhild.tools.project_index as project_index_module
+import brynhild.tools.sandbox as sandbox
+
+_DEFAULT_LIMIT = 10
+
+_SNIPPET_LINES = 4
+"""Best-matching lines shown per hit."""
+
+
+class CodeSearchTool(base.Tool, base.SandboxMixin):
+    """
+    Search project code by keywords and identifiers.
+
+    Features:
+    - BM25 ranking over fixed-size line chunks
+    - Identifier-aware matching (camelCase and snake_case subwords)
+    - Honors .gitignore (files come from the project index)
+    - Incremental updates by mtime; index persisted on disk
+    - Sandbox path validation (restricted to project directory)
+    """
+
+    def __init__(
+        self,
+        base_dir: _pathlib.Path | None = None,
+        sandbox_config: sandbox.SandboxConfig | None = None,
+        project_index: project_index_module.ProjectIndex | None = None,
+        index_dir: _pathlib.Path | None = None,
+    ) -> None:
+        """
+        Initialize the code search tool.
+
+        Args:
+            base_dir: Project directory to index (default: cwd)
+            sandbox_config: Sandbox configuration for path validation
+            project_index: Shared project index for file enumeration
+                (default: rescan the tree before each query)
+            index_dir: Directory to persist the search index (default: memory only)
+        """
+        self._base_dir = base_dir or _pathlib.Path.cwd()
+        self._sandbox_config = sandbox_config
+        self._project_index = project_index
+        self._index = code_index.CodeIndex(self._base_dir, index_dir=index_dir)
+
+    @property
+    def name(self) -> str:
+        return "CodeSearch"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Search project source files by keywords or identifiers and return the "
+            "best-matching code snippets, ranked by relevance. Identifiers match by "
+            "subword (e.g. 'config parser' finds parse_config and ConfigParser). "
+            "Use this to locate code before reading it; use Grep for exact regex matches."
+        )
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    @property
+    def categories(self) -> list[str]:
+        return ["search", "filesystem"]
+
+    @property
+    def requires_permission(self) -> bool:
+        return False  # Read-only search tool
+
+    @property
+    def input_schema(self) -> dict[str, _typing.Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Keywords and/or identifiers describing the code to find",
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Directory to restrict the search to (default: project root)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Maximum number of results (default: {_DEFAULT_LIMIT})",
+                },
+            },
+            "required": ["query"],
+        }
+
+    def close(self) -> None:
+        """Persist pending index changes."""
+        self._index.close()
+
+    async def execute(self, input: dict[str, _typing.Any]) -> base.ToolResult:
+        """Run a ranked search."""
+        query = input.get("query", "")
+        if not query or not code_index.tokenize(query):
+            return base.ToolResult(
+                success=False,
+                output="",
+                error="No searchable terms in query",
+            )
+
+        try:
+            search_path = self._resolve_and_validate(input.get("path", "."), "read")
+        except sandbox.PathValidationError as e:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=str(e),
+            )
+
+        try:
+            prefix = search_path.relative_to(self._index.root).as_posix()
+        except ValueError:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"Path is outside the indexed project: {input.get('path')}",
+            )
+        if prefix == ".":
+            prefix = ""
+
+        limit = input.get("limit") or _DEFAULT_LIMIT
+        try:
+            output = await _asyncio.to_thread(self._search, query, prefix, limit)
+        except Exception as e:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"Code search failed: {e}",
+            )
+        if output is None:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error="Project is too large to index; use Grep instead",
+            )
+
+        return base.ToolResult(
+            success=True,
+            output=output or "No matches found",
+            error=None,
+        )
+
+    def _search(self, query: str, prefix: str, limit: int) -> str | None:
+        """Refresh the index and format the top hits (None if files can't be listed)."""
+        files = project_index_module.snapshot_files(self._index.root, self._project_index)
+        if files is None:
+            return None
+        self._index.refresh(files)
+        hits = self._index.search(query, limit=limit, path_prefix=prefix)
+        terms = set(code_index.tokenize(query))
+        return "\n\n".join(self._format_hit(hit, terms) for hit in hits)
+
+    def _format_hit(self, hit: code_index.SearchHit, terms: set[str]) -> str:
+        """Header line plus the chunk lines that match the most query terms."""
+        header = f"{hit.path}:{hit.start_line}-{hit.end_line} (score {hit.score:.2f})"
+        try:
+            text = (self._index.root / hit.path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return header
+        lines = text.splitlines()[hit.start_line - 1:hit.end_line]
+
+        ranked = sorted(
+            range(len(lines)),
+            key=lambda i: len(terms.intersection(code_index.tokenize(lines[i]))),
+            reverse=True,
+        )
+        shown = sorted(i for i in ranked[:_SNIPPET_LINES] if lines[i].strip())
+        snippet = [f"{hit.start_line + i:6}|{lines[i]}" for i in shown]
+        return "\n".join([header, *snippet])
@@ -1,5 +1,5 @@
 """
-File operation tools: Read, Write, Edit.
+File operation tools: Read, ReadMany, Write, Edit, MultiEdit.
 
 These tools provide safe file system access with proper error handling
 and sandbox path validation to prevent writes outside the project directory.
@@ -7,12 +7,25 @@ and sandbox path validation to prevent writes outside the project directory.
 
 from __future__ import annotations
 
+import asyncio as _asyncio
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import os as _os
 import pathlib as _pathlib
+import stat as _stat
+import tempfile as _tempfile
 import typing as _typing
 
+import brynhild.constants as _constants
 import brynhild.tools.base as base
 import brynhild.tools.sandbox as sandbox
 
+if _typing.TYPE_CHECKING:
+    import brynhild.tools.project_index as project_index
+
+_READ_MANY_MAX_FILES = 50
+"""Maximum number of files a single ReadMany call may request."""
+
 
 class FileReadTool(base.Tool, base.SandboxMixin):
     """
@@ -107,66 +120,284 @@ class FileReadTool(base.Tool, base.SandboxMixin):
                 error=str(e),
             )
 
-        try:
-            if not path.exists():
-                return base.ToolResult(
-                    success=False,
-                    output="",
-                    error=f"File not found: {file_path}",
-                )
-
-            if not path.is_file():
-                return base.ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Not a file: {file_path}",
-                )
-
-            content = path.read_text(encoding="utf-8")
-            lines = content.splitlines(keepends=True)
-
-            # Apply offset and limit
-            if offset:
-                lines = lines[offset:]
-            if limit:
-                lines = lines[:limit]
+        return _read_numbered(path, file_path, offset, limit)
 
-            # Add line numbers (1-indexed, accounting for offset)
-            numbered_lines = []
-            for i, line in enumerate(lines):
-                line_num = i + offset + 1
-                # Right-align line numbers in 6-character field
-                numbered_lines.append(f"{line_num:6}|{line}")
 
-            output = "".join(numbered_lines)
-            if not output:
-                output = "(empty file)"
+def _read_numbered(
+    path: _pathlib.Path,
+    file_path: str,
+    offset: int,
+    limit: int | None,
+) -> base.ToolResult:
+    """
+    Read a validated path and format it with line numbers.
 
+    Args:
+        path: Resolved, sandbox-validated path
+        file_path: Path as given by the caller (used in error messages)
+        offset: Line number to start from (0-indexed)
+        limit: Maximum number of lines (None for all)
+    """
+    try:
+        if not path.exists():
             return base.ToolResult(
-                success=True,
-                output=output.rstrip(),
-                error=None,
+                success=False,
+                output="",
+                error=f"File not found: {file_path}",
             )
 
-        except PermissionError:
+        if not path.is_file():
             return base.ToolResult(
                 success=False,
                 output="",
-                error=f"Permission denied: {file_path}",
+                error=f"Not a file: {file_path}",
             )
-        except UnicodeDecodeError:
+
+        content = path.read_text(encoding="utf-8")
+        lines = content.splitlines(keepends=True)
+
+        # Apply offset and limit
+        if offset:
+            lines = lines[offset:]
+        if limit:
+            lines = lines[:limit]
+
+        # Add line numbers (1-indexed, accounting for offset)
+        numbered_lines = []
+        for i, line in enumerate(lines):
+            line_num = i + offset + 1
+            # Right-align line numbers in 6-character field
+            numbered_lines.append(f"{line_num:6}|{line}")
+
+        output = "".join(numbered_lines)
+        if not output:
+            output = "(empty file)"
+
+        return base.ToolResult(
+            success=True,
+            output=output.rstrip(),
+            error=None,
+        )
+
+    except PermissionError:
+        return base.ToolResult(
+            success=False,
+            output="",
+            error=f"Permission denied: {file_path}",
+        )
+    except UnicodeDecodeError:
+        return base.ToolResult(
+            success=False,
+            output="",
+            error=f"File is not valid UTF-8: {file_path}",
+        )
+    except Exception as e:
+        return base.ToolResult(
+            success=False,
+            output="",
+            error=f"Failed to read file: {e}",
+        )
+
+
+class ReadManyTool(base.Tool, base.SandboxMixin):
+    """
+    Read several files (or line ranges) in one call.
+
+    Each path is sandbox-validated exactly like Read. Files are read
+    concurrently on worker threads; the combined output is labelled per file
+    and capped by a shared character budget (later files are truncated or
+    skipped once it is spent, with a hint to read them separately).
+    """
+
+    def __init__(
+        self,
+        base_dir: _pathlib.Path | None = None,
+        sandbox_config: sandbox.SandboxConfig | None = None,
+        max_chars: int = _constants.DEFAULT_READ_MANY_MAX_CHARS,
+        max_files: int = _READ_MANY_MAX_FILES,
+    ) -> None:
+        """
+        Initialize the batch read tool.
+
+        Args:
+            base_dir: Base directory for relative paths (default: cwd)
+            sandbox_config: Sandbox configuration for path validation
+            max_chars: Combined output budget across all files
+            max_files: Maximum number of files per call
+        """
+        self._base_dir = base_dir or _pathlib.Path.cwd()
+        self._sandbox_config = sandbox_config
+        self._max_chars = max_chars
+        self._max_files = max_files
+
+    @property
+    def name(self) -> str:
+        return "ReadMany"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Read multiple files (or line ranges) in a single call. Returns each "
+            "file's content with line numbers under a '==> path <==' header. "
+            "Prefer this over several Read calls when you need related files. "
+            "Output shares one size budget; files past it are truncated or skipped."
+        )
+
+    @property
+    def input_schema(self) -> dict[str, _typing.Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "files": {
+                    "type": "array",
+                    "description": f"Files to read (at most {self._max_files})",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_path": {
+                                "type": "string",
+                                "description": "Path to the file (relative or absolute)",
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Line number to start reading from (0-indexed)",
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of lines to read",
+                            },
+                        },
+                        "required": ["file_path"],
+                    },
+                },
+            },
+            "required": ["files"],
+        }
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    @property
+    def categories(self) -> list[str]:
+        return ["filesystem", "read"]
+
+    @property
+    def requires_permission(self) -> bool:
+        return False  # Read-only tool
+
+    async def execute(self, input: dict[str, _typing.Any]) -> base.ToolResult:
+        """Read all requested files concurrently and combine the results."""
+        files = input.get("files") or []
+        if not isinstance(files, list) or not files:
             return base.ToolResult(
                 success=False,
                 output="",
-                error=f"File is not valid UTF-8: {file_path}",
+                error="No files provided",
             )
-        except Exception as e:
+        if len(files) > self._max_files:
             return base.ToolResult(
                 success=False,
                 output="",
-                error=f"Failed to read file: {e}",
+                error=f"Too many files ({len(files)}); at most {self._max_files} per call",
             )
 
+        # Accept bare path strings as well as {"file_path": ...} objects
+        requests: list[dict[str, _typing.Any]] = []
+        for n, f in enumerate(files, start=1):
+            request = {"file_path": f} if isinstance(f, str) else f
+            if not _valid_read_many_request(request):
+                return base.ToolResult(
+                    success=False,
+                    output="",
+                    error=(
+                        f"Invalid entry {n} in files: expected a path or an object with "
+                        "file_path (string) and optional offset and limit (integers)"
+                    ),
+                )
+            requests.append(dict(request))
+        results = await _asyncio.gather(*(
+            _asyncio.to_thread(self._read_one, request) for request in requests
+        ))
+
+        sections: list[str] = []
+        remaining = self._max_chars
+        failures = 0
+        for request, result in zip(requests, results, strict=True):
+            header = _read_many_header(request)
+            if not result.success:
+                failures += 1
+                sections.append(f"{header}\nError: {result.error}")
+                continue
+            if remaining <= 0:
+                sections.append(f"{header}\n(skipped: output budget exhausted; use Read)")
+                continue
+            text = result.output
+            if len(text) > remaining:
+                # Cut at a line boundary and say where to resume
+                kept: list[str] = []
+                used = 0
+                for line in text.split("\n"):
+                    if used + len(line) + 1 > remaining:
+                        break
+                    kept.append(line)
+                    used += len(line) + 1
+                resume = (request.get("offset") or 0) + len(kept)
+                kept.append(
+                    f"... (truncated: output budget reached; use Read with offset={resume})"
+                )
+                text = "\n".join(kept)
+            remaining -= len(text)
+            sections.append(f"{header}\n{text}")
+
+        if failures == len(requests):
+            return base.ToolResult(
+                success=False,
+                output="\n\n".join(sections),
+                error="None of the requested files could be read",
+            )
+        return base.ToolResult(
+            success=True,
+            output="\n\n".join(sections),
+            error=None,
+        )
+
+    def _read_one(self, request: dict[str, _typing.Any]) -> base.ToolResult:
+        """Validate and read one entry (runs in a worker thread)."""
+        file_path = request.get("file_path", "")
+        if not file_path:
+            return base.ToolResult(success=False, output="", error="No file_path provided")
+        try:
+            path = self._resolve_and_validate(file_path, "read")
+        except sandbox.PathValidationError as e:
+            return base.ToolResult(success=False, output="", error=str(e))
+        return _read_numbered(path, file_path, request.get("offset", 0), request.get("limit"))
+
+
+def _valid_read_many_request(request: _typing.Any) -> bool:
+    """Check the shape of one ReadMany entry (path checks happen when read)."""
+    if not isinstance(request, dict) or not isinstance(request.get("file_path"), str):
+        return False
+    for key in ("offset", "limit"):
+        value = request.get(key)
+        if value is not None and (
+            not isinstance(value, int) or isinstance(value, bool) or value < 0
+        ):
+            return False
+    return True
+
+
+def _read_many_header(request: dict[str, _typing.Any]) -> str:
+    """Section header for one ReadMany entry."""
+    file_path = request.get("file_path", "")
+    offset = request.get("offset") or 0
+    limit = request.get("limit")
+    if limit:
+        return f"==> {file_path} (lines {offset + 1}-{offset + limit}) <=="
+    if offset:
+        return f"==> {file_path} (from line {offset + 1}) <=="
+    return f"==> {file_path} <=="
+
 
 class FileWriteTool(base.Tool, base.SandboxMixin):
     """
@@ -182,6 +413,7 @@ class FileWriteTool(base.Tool, base.SandboxMixin):
         base_dir: _pathlib.Path | None = None,
         sandbox_config: sandbox.SandboxConfig | None = None,
         dry_run: bool = False,
+        project_index: project_index.ProjectIndex | None = None,
     ) -> None:
         """
         Initialize the file write tool.
@@ -190,10 +422,12 @@ class FileWriteTool(base.Tool, base.SandboxMixin):
             base_dir: Base directory for relative paths (default: cwd)
             sandbox_config: Sandbox configuration for path validation
             dry_run: If True, don't actually write files
+            project_index: Shared project index to notify after writes
         """
         self._base_dir = base_dir or _pathlib.Path.cwd()
         self._sandbox_config = sandbox_config
         self._dry_run = dry_run
+        self._project_index = project_index
 
     @property
     def name(self) -> str:
@@ -271,6 +505,8 @@ class FileWriteTool(base.Tool, base.SandboxMixin):
 
             # Write the file
             path.write_text(content, encoding="utf-8")
+            if self._project_index is not None:
+                self._project_index.notify_changed(path)
 
             return base.ToolResult(
                 success=True,
@@ -313,6 +549,7 @@ class FileEditTool(base.Tool, base.SandboxMixin):
         base_dir: _pathlib.Path | None = None,
         sandbox_config: sandbox.SandboxConfig | None = None,
         dry_run: bool = False,
+        project_index: project_index.ProjectIndex | None = None,
     ) -> None:
         """
         Initialize the file edit tool.
@@ -321,10 +558,12 @@ class FileEditTool(base.Tool, base.SandboxMixin):
             base_dir: Base directory for relative paths (default: cwd)
             sandbox_config: Sandbox configuration for path validation
             dry_run: If True, don't actually edit files
+            project_index: Shared project index to notify after writes
         """
         self._base_dir = base_dir or _pathlib.Path.cwd()
         self._sandbox_config = sandbox_config
         self._dry_run = dry_run
+        self._project_index = project_index
 
     @property
     def name(self) -> str:
@@ -455,6 +694,8 @@ class FileEditTool(base.Tool, base.SandboxMixin):
 
             # Write back
             path.write_text(new_content, encoding="utf-8")
+            if self._project_index is not None:
+                self._project_index.notify_changed(path)
 
             return base.ToolResult(
                 success=True,
@@ -474,3 +715,294 @@ class FileEditTool(base.Tool, base.SandboxMixin):
                 output="",
                 error=f"Failed to edit file: {e}",
             )
+
+
+@_dataclasses.dataclass
+class _PendingFile:
+    """One file touched by a MultiEdit call."""
+
+    path: _pathlib.Path
+    display: str
+    original: str
+    content: str
+    mtime_ns: int
+    edits: int = 0
+    replacements: int = 0
+    temp_path: _pathlib.Path | None = None
+
+
+class MultiEditTool(base.Tool, base.SandboxMixin):
+    """
+    Apply many search-and-replace edits across files in one call.
+
+    All edits are validated before anything is written: every path must pass
+    sandbox validation and every old_string must match (uniquely, unless
+    replace_all) against the file as modified by the earlier edits in the
+    same call. Files are then written to temp files and swapped in with
+    os.replace; if any step fails, already-replaced files are restored.
+    """
+
+    def __init__(
+        self,
+        base_dir: _pathlib.Path | None = None,
+        sandbox_config: sandbox.SandboxConfig | None = None,
+        dry_run: bool = False,
+        project_index: project_index.ProjectIndex | None = None,
+    ) -> None:
+        """
+        Initialize the multi-edit tool.
+
+        Args:
+            base_dir: Base directory for relative paths (default: cwd)
+            sandbox_config: Sandbox configuration for path validation
+            dry_run: If True, validate but don't write files
+            project_index: Shared project index to notify after writes
+        """
+        self._base_dir = base_dir or _pathlib.Path.cwd()
+        self._sandbox_config = sandbox_config
+        self._dry_run = dry_run
+        self._project_index = project_index
+
+    @property
+    def name(self) -> str:
+        return "MultiEdit"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Apply several text replacements, across one or more files, as a single "
+            "all-or-nothing change. Edits to the same file apply in order, each seeing "
+            "the result of the previous one. Each old_string must appear exactly once "
+            "unless replace_all is set. If any edit is invalid, no file is changed. "
+            "Prefer this over repeated Edit calls for renames and related changes."
+        )
+
+    @property
+    def input_schema(self) -> dict[str, _typing.Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "edits": {
+                    "type": "array",
+                    "description": "Edits to apply, in order",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file_path": {
+                                "type": "string",
+                                "description": "Path to the file to edit",
+                            },
+                            "old_string": {
+                                "type": "string",
+                                "description": "Text to search for and replace",
+                            },
+                            "new_string": {
+                                "type": "string",
+                                "description": "Text to replace with",
+                            },
+                            "replace_all": {
+                                "type": "boolean",
+                                "description": "Replace all occurrences (default: false)",
+                            },
+                        },
+                        "required": ["file_path", "old_string", "new_string"],
+                    },
+                },
+            },
+            "required": ["edits"],
+        }
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    @property
+    def categories(self) -> list[str]:
+        return ["filesystem", "write"]
+
+    @property
+    def risk_level(self) -> base.RiskLevel:
+        return "mutating"
+
+    async def execute(self, input: dict[str, _typing.Any]) -> base.ToolResult:
+        """Validate every edit, then apply them all or none."""
+        edits = input.get("edits") or []
+        if not isinstance(edits, list) or not edits:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error="No edits provided",
+            )
+
+        pending, error = self._prepare(edits)
+        if error is not None:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"{error} (no files were changed)",
+            )
+
+        files = list(pending.values())
+        summary = self._summary(files)
+
+        if self._dry_run:
+            return base.ToolResult(
+                success=True,
+                output=f"[DRY RUN] Would apply {summary}",
+                error=None,
+            )
+
+        error = self._commit(files)
+        if error is not None:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=error,
+            )
+
+        if self._project_index is not None:
+            for f in files:
+                self._project_index.notify_changed(f.path)
+
+        return base.ToolResult(
+            success=True,
+            output=f"Applied {summary}",
+            error=None,
+        )
+
+    def _prepare(
+        self,
+        edits: list[_typing.Any],
+    ) -> tuple[dict[_pathlib.Path, _PendingFile], str | None]:
+        """Read each target once and apply all edits in memory."""
+        pending: dict[_pathlib.Path, _PendingFile] = {}
+        for number, edit in enumerate(edits, start=1):
+            if not _valid_multi_edit(edit):
+                return pending, (
+                    f"Edit {number}: expected an object with file_path, old_string and "
+                    "new_string (strings) and optional replace_all (boolean)"
+                )
+            file_path = edit.get("file_path", "")
+            old_string = edit.get("old_string", "")
+            new_string = edit.get("new_string", "")
+            if not file_path:
+                return pending, f"Edit {number}: no file_path provided"
+            if not old_string:
+                return pending, f"Edit {number}: no old_string provided"
+            if old_string == new_string:
+                return pending, f"Edit {number}: old_string and new_string are identical"
+
+            try:
+                path = self._resolve_and_validate(file_path, "write")
+            except sandbox.PathValidationError as e:
+                return pending, f"Edit {number}: {e}"
+
+            target = pending.get(path)
+            if target is None:
+                try:
+                    if not path.is_file():
+                        kind = "Not a file" if path.exists() else "File not found"
+                        return pending, f"Edit {number}: {kind}: {file_path}"
+                    mtime_ns = path.stat().st_mtime_ns
+                    content = path.read_text(encoding="utf-8")
+                except PermissionError:
+                    return pending, f"Edit {number}: Permission denied: {file_path}"
+                except UnicodeDecodeError:
+                    return pending, f"Edit {number}: File is not valid UTF-8: {file_path}"
+                except OSError as e:
+                    return pending, f"Edit {number}: Failed to read {file_path}: {e}"
+                target = _PendingFile(path, file_path, content, content, mtime_ns)
+                pending[path] = target
+
+            # Matches are checked against the content left by earlier edits
+            count = target.content.count(old_string)
+            replace_all = edit.get("replace_all", False)
+            if count == 0:
+                return pending, f"Edit {number}: old_string not found in {file_path}"
+            if count > 1 and not replace_all:
+                return pending, (
+                    f"Edit {number}: old_string found {count} times in {file_path}, "
+                    "must be unique (or use replace_all)"
+                )
+            if not replace_all:
+                count = 1
+            target.content = target.content.replace(old_string, new_string, count)
+            target.edits += 1
+            target.replacements += count
+        return pending, None
+
+    def _commit(self, files: list[_PendingFile]) -> str | None:
+        """
+        Write temp files, then swap them in; roll back on any failure.
+
+        Returns:
+            Error message, or None on success
+        """
+        replaced: list[_PendingFile] = []
+        try:
+            # Stage: nothing visible changes until every temp file is written
+            for f in files:
+                if f.path.stat().st_mtime_ns != f.mtime_ns:
+                    raise _MultiEditError(f"{f.display} was modified during the edit")
+                f.temp_path = _write_temp(f.path, f.content)
+
+            for f in files:
+                assert f.temp_path is not None
+                _os.replace(f.temp_path, f.path)
+                f.temp_path = None
+                replaced.append(f)
+            return None
+        except (OSError, _MultiEditError) as e:
+            # Roll back files already swapped in from their in-memory originals
+            for f in replaced:
+                try:
+                    _os.replace(_write_temp(f.path, f.original), f.path)
+                except OSError:
+                    return (
+                        f"Failed to apply edits ({e}) and could not restore "
+                        f"{f.display}; check it manually"
+                    )
+            return f"Failed to apply edits: {e} (no files were changed)"
+        finally:
+            for f in files:
+                if f.temp_path is not None:
+                    with _contextlib.suppress(OSError):
+                        f.temp_path.unlink()
+                    f.temp_path = None
+
+    @staticmethod
+    def _summary(files: list[_PendingFile]) -> str:
+        total = sum(f.edits for f in files)
+        lines = [f"{total} edit(s) across {len(files)} file(s):"]
+        for f in files:
+            lines.append(f"  {f.display}: {f.edits} edit(s), {f.replacements} replacement(s)")
+        return "\n".join(lines)
+
+
+def _valid_multi_edit(edit: _typing.Any) -> bool:
+    """Check the shape of one MultiEdit entry (missing strings are reported later)."""
+    if not isinstance(edit, dict):
+        return False
+    strings = ("file_path", "old_string", "new_string")
+    if not all(isinstance(edit.get(key, ""), str) for key in strings):
+        return False
+    return isinstance(edit.get("replace_all", False), bool)
+
+
+class _MultiEditError(Exception):
+    """A precondition for applying MultiEdit changes no longer holds."""
+
+
+def _write_temp(path: _pathlib.Path, content: str) -> _pathlib.Path:
+    """Write content to a temp file beside ``path``, preserving its permissions."""
+    fd, temp_name = _tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temp_path = _pathlib.Path(temp_name)
+    try:
+        with _os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        _os.chmod(temp_path, _stat.S_IMODE(path.stat().st_mode))
+    except BaseException:
+        with _contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+    return temp_path
@@ -2,6 +2,8 @@
 Glob tool for file pattern matching.
 
 Finds files matching glob patterns with sandbox path validation.
+When a ProjectIndex is configured, matching and mtime sorting are answered
+from the in-memory index instead of walking the filesystem.
 """
 
 from __future__ import annotations
@@ -12,6 +14,9 @@ import typing as _typing
 import brynhild.tools.base as base
 import brynhild.tools.sandbox as sandbox
 
+if _typing.TYPE_CHECKING:
+    import brynhild.tools.project_index as project_index
+
 
 class GlobTool(base.Tool, base.SandboxMixin):
     """
@@ -25,6 +30,7 @@ class GlobTool(base.Tool, base.SandboxMixin):
         self,
         base_dir: _pathlib.Path | None = None,
         sandbox_config: sandbox.SandboxConfig | None = None,
+        project_index: project_index.ProjectIndex | None = None,
     ) -> None:
         """
         Initialize the glob tool.
@@ -32,9 +38,11 @@ class GlobTool(base.Tool, base.SandboxMixin):
         Args:
             base_dir: Base directory for searches (default: cwd)
             sandbox_config: Sandbox configuration for path validation
+            project_index: Shared project index (default: walk the filesystem)
         """
         self._base_dir = base_dir or _pathlib.Path.cwd()
         self._sandbox_config = sandbox_config
+        self._project_index = project_index
 
     @property
     def name(self) -> str:
@@ -124,14 +132,16 @@ class GlobTool(base.Tool, base.SandboxMixin):
             if not pattern.startswith("**/") and not pattern.startswith("/"):
                 pattern = "**/" + pattern
 
-            # Find matching files
-            matches = list(base_path.glob(pattern))
+            files = self._glob_indexed(pattern, base_path)
+            if files is None:
+                # Find matching files
+                matches = list(base_path.glob(pattern))
 
-            # Filter to files only (exclude directories)
-            files = [m for m in matches if m.is_file()]
+                # Filter to files only (exclude directories)
+                files = [m for m in matches if m.is_file()]
 
-            # Sort by modification time (newest first)
-            files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+                # Sort by modification time (newest first)
+                files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
 
             # Apply limit
             if limit:
@@ -171,3 +181,17 @@ class GlobTool(base.Tool, base.SandboxMixin):
                 output="",
                 error=f"Failed to search files: {e}",
             )
+
+    def _glob_indexed(
+        self,
+        pattern: str,
+        base_path: _pathlib.Path,
+    ) -> list[_pathlib.Path] | None:
+        """Match via the project index, newest first (None if not covered)."""
+        if self._project_index is None or pattern.startswith("/"):
+            return None
+        matches = self._project_index.glob(pattern, base_path)
+        if matches is None:
+            return None
+        matches.sort(key=lambda m: m[1].mtime, reverse=True)
+        return [path for path, _entry in matches]
@@ -2,6 +2,10 @@
 Grep tool using ripgrep for fast file searching.
 
 Provides powerful regex-based search across files with sandbox path validation.
+
+ripgrep output is consumed as a stream: once ``limit`` results have been
+collected the process is killed instead of being allowed to finish, and every
+search runs under a deadline so a pathological pattern cannot hang a round.
 """
 
 from __future__ import annotations
@@ -11,9 +15,20 @@ import pathlib as _pathlib
 import shutil as _shutil
 import typing as _typing
 
+import brynhild.constants as _constants
 import brynhild.tools.base as base
 import brynhild.tools.sandbox as sandbox
 
+# Guards passed to every ripgrep invocation
+_DEFAULT_MAX_COLUMNS = 500
+"""Lines longer than this are replaced by a preview (minified files, data blobs)."""
+
+_DEFAULT_MAX_FILESIZE = "10M"
+"""Files larger than this are skipped entirely."""
+
+# StreamReader buffer size; output lines longer than this are skipped
+_STREAM_LIMIT = 4 * 1024 * 1024
+
 
 class GrepTool(base.Tool, base.SandboxMixin):
     """
@@ -25,6 +40,8 @@ class GrepTool(base.Tool, base.SandboxMixin):
     - File type filtering
     - Glob patterns
     - Multiple output modes
+    - Early termination once ``limit`` results are collected
+    - Per-search deadline
     - Sandbox path validation (restricted to project directory)
     """
 
@@ -33,6 +50,9 @@ class GrepTool(base.Tool, base.SandboxMixin):
         base_dir: _pathlib.Path | None = None,
         ripgrep_path: str | None = None,
         sandbox_config: sandbox.SandboxConfig | None = None,
+        timeout_ms: int = _constants.DEFAULT_GREP_TIMEOUT_MS,
+        max_columns: int = _DEFAULT_MAX_COLUMNS,
+        max_filesize: str = _DEFAULT_MAX_FILESIZE,
     ) -> None:
         """
         Initialize the grep tool.
@@ -41,10 +61,16 @@ class GrepTool(base.Tool, base.SandboxMixin):
             base_dir: Base directory for searches (default: cwd)
             ripgrep_path: Path to ripgrep binary (default: find in PATH)
             sandbox_config: Sandbox configuration for path validation
+            timeout_ms: Deadline for a single search in milliseconds
+            max_columns: Maximum line length before ripgrep shows a preview
+            max_filesize: Skip files larger than this (ripgrep size syntax, e.g. "10M")
         """
         self._base_dir = base_dir or _pathlib.Path.cwd()
         self._ripgrep_path = ripgrep_path or _shutil.which("rg")
         self._sandbox_config = sandbox_config
+        self._timeout_ms = timeout_ms
+        self._max_columns = max_columns
+        self._max_filesize = max_filesize
 
     @property
     def name(self) -> str:
@@ -148,89 +174,196 @@ class GrepTool(base.Tool, base.SandboxMixin):
                 error=str(e),
             )
 
-        # Build command
-        args = [self._ripgrep_path]
-
-        # Output mode
         output_mode = input.get("output_mode", "content")
-        if output_mode == "files_with_matches":
-            args.append("-l")
-        elif output_mode == "count":
-            args.append("-c")
-
-        # Options
-        if input.get("-i"):
-            args.append("-i")
-        if input.get("-A"):
-            args.extend(["-A", str(input["-A"])])
-        if input.get("-B"):
-            args.extend(["-B", str(input["-B"])])
-        if input.get("-C"):
-            args.extend(["-C", str(input["-C"])])
-        if input.get("glob"):
-            args.extend(["--glob", input["glob"]])
-        if input.get("type"):
-            args.extend(["--type", input["type"]])
-
-        # Add line numbers for content mode
-        if output_mode == "content":
-            args.append("-n")
+        limit = input.get("limit")
+        args = self._build_args(input, output_mode, limit)
 
         # Pattern and validated path
-        args.append(pattern)
-        args.append(str(validated_path))
+        args.extend(["--", pattern, str(validated_path)])
 
         try:
-            proc = await _asyncio.create_subprocess_exec(
-                *args,
-                stdout=_asyncio.subprocess.PIPE,
-                stderr=_asyncio.subprocess.PIPE,
-                cwd=str(self._base_dir),
+            entries, truncated, timed_out, returncode, error = await self._run(args, limit)
+        except FileNotFoundError:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"ripgrep not found at: {self._ripgrep_path}",
+            )
+        except Exception as e:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"Failed to execute ripgrep: {e}",
             )
 
-            stdout, stderr = await proc.communicate()
-            output = stdout.decode("utf-8", errors="replace")
-            error = stderr.decode("utf-8", errors="replace")
-
-            # Apply limit
-            limit = input.get("limit")
-            if limit and output:
-                lines = output.splitlines()
-                if len(lines) > limit:
-                    lines = lines[:limit]
-                    lines.append(f"... (truncated, showing first {limit} lines)")
-                output = "\n".join(lines)
-
-            # ripgrep returns 1 for no matches (not an error)
-            if proc.returncode == 1 and not error:
-                return base.ToolResult(
-                    success=True,
-                    output="No matches found",
-                    error=None,
-                )
-
-            if proc.returncode != 0 and proc.returncode != 1:
-                return base.ToolResult(
-                    success=False,
-                    output="",
-                    error=error or f"ripgrep exited with code {proc.returncode}",
-                )
+        if timed_out:
+            partial = "\n".join(entries)
+            return base.ToolResult(
+                success=False,
+                output=partial,
+                error=(
+                    f"Search timed out after {self._timeout_ms}ms "
+                    f"({len(entries)} result(s) collected before the deadline). "
+                    "Narrow the path, add a glob/type filter, or simplify the pattern."
+                ),
+            )
 
+        if truncated:
+            entries.append(f"... (truncated, showing first {limit} lines)")
             return base.ToolResult(
                 success=True,
-                output=output.rstrip(),
+                output="\n".join(entries),
                 error=None,
             )
 
-        except FileNotFoundError:
+        # ripgrep returns 1 for no matches (not an error)
+        if returncode == 1 and not error:
             return base.ToolResult(
-                success=False,
-                output="",
-                error=f"ripgrep not found at: {self._ripgrep_path}",
+                success=True,
+                output="No matches found",
+                error=None,
             )
-        except Exception as e:
+
+        if returncode != 0 and returncode != 1:
             return base.ToolResult(
                 success=False,
                 output="",
-                error=f"Failed to execute ripgrep: {e}",
+                error=error or f"ripgrep exited with code {returncode}",
+            )
+
+        if not entries:
+            return base.ToolResult(
+                success=True,
+                output="No matches found",
+                error=None,
             )
+
+        return base.ToolResult(
+            success=True,
+            output="\n".join(entries).rstrip(),
+            error=None,
+        )
+
+    def _build_args(
+        self,
+        input: dict[str, _typing.Any],
+        output_mode: str,
+        limit: int | None,
+    ) -> list[str]:
+        """Build the ripgrep argument list (without pattern and path)."""
+        assert self._ripgrep_path is not None
+        args = [
+            self._ripgrep_path,
+            "--max-filesize", self._max_filesize,
+            "--max-columns", str(self._max_columns),
+            "--max-columns-preview",
+        ]
+
+        if output_mode == "content":
+            # Plain text is already in the final display format
+            args.append("-n")
+            if input.get("-A"):
+                args.extend(["-A", str(input["-A"])])
+            if input.get("-B"):
+                args.extend(["-B", str(input["-B"])])
+            if input.get("-C"):
+                args.extend(["-C", str(input["-C"])])
+            # No single file can contribute more than `limit` matches
+            if limit:
+                args.extend(["--max-count", str(limit)])
+        elif output_mode == "files_with_matches":
+            # rg stops reading each file at its first match
+            args.append("-l")
+        else:
+            # "path:count" per file ("count" alone when searching one file)
+            args.append("-c")
+
+        if input.get("-i"):
+            args.append("-i")
+        if input.get("glob"):
+            args.extend(["--glob", input["glob"]])
+        if input.get("type"):
+            args.extend(["--type", input["type"]])
+
+        return args
+
+    async def _run(
+        self,
+        args: list[str],
+        limit: int | None,
+    ) -> tuple[list[str], bool, bool, int | None, str]:
+        """
+        Run ripgrep, streaming stdout until done, ``limit`` is exceeded, or the deadline.
+
+        Returns:
+            Tuple of (entries, truncated, timed_out, returncode, stderr)
+        """
+        proc = await _asyncio.create_subprocess_exec(
+            *args,
+            stdout=_asyncio.subprocess.PIPE,
+            stderr=_asyncio.subprocess.PIPE,
+            cwd=str(self._base_dir),
+            limit=_STREAM_LIMIT,
+        )
+        assert proc.stdout is not None
+        assert proc.stderr is not None
+
+        # Drain stderr concurrently so a chatty rg can't block on a full pipe
+        stderr_task = _asyncio.ensure_future(proc.stderr.read())
+
+        entries: list[str] = []
+        truncated = False
+        timed_out = False
+        drained = False
+        try:
+            async with _asyncio.timeout(self._timeout_ms / 1000.0):
+                while True:
+                    raw = await _read_line(proc.stdout)
+                    if raw is None:
+                        continue
+                    if not raw:
+                        drained = True
+                        break
+                    if limit and len(entries) >= limit:
+                        truncated = True
+                        break
+                    entries.append(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+        except TimeoutError:
+            timed_out = True
+        except BaseException:
+            stderr_task.cancel()
+            raise
+        finally:
+            # Stop rg unless it ran to completion (limit, deadline, error or cancellation)
+            if proc.returncode is None and not drained:
+                proc.kill()
+            await proc.wait()
+
+        stderr = (await stderr_task).decode("utf-8", errors="replace")
+        return entries, truncated, timed_out, proc.returncode, stderr
+
+
+async def _read_line(stream: _asyncio.StreamReader) -> bytes | None:
+    """
+    Read one line of output.
+
+    Returns:
+        The line (b"" at end of output), or None for a line longer than
+        _STREAM_LIMIT, which is discarded.
+    """
+    try:
+        return await stream.readuntil(b"\n")
+    except _asyncio.IncompleteReadError as e:
+        return e.partial
+    except _asyncio.LimitOverrunError as e:
+        oversized = e
+    # Discard the buffered part of the line, then the rest of it
+    while True:
+        await stream.readexactly(oversized.consumed)
+        try:
+            await stream.readuntil(b"\n")
+            return None
+        except _asyncio.IncompleteReadError:
+            return None
+        except _asyncio.LimitOverrunError as e:
+            oversized = e
@@ -15,6 +15,9 @@ import typing as _typing
 import brynhild.tools.base as base
 import brynhild.tools.sandbox as sandbox
 
+if _typing.TYPE_CHECKING:
+    import brynhild.tools.project_index as project_index
+
 
 class InspectTool(base.Tool, base.SandboxMixin):
     """
@@ -36,6 +39,7 @@ class InspectTool(base.Tool, base.SandboxMixin):
         self,
         working_dir: _pathlib.Path | None = None,
         sandbox_config: sandbox.SandboxConfig | None = None,
+        project_index: project_index.ProjectIndex | None = None,
     ) -> None:
         """
         Initialize the Inspect tool.
@@ -43,11 +47,13 @@ class InspectTool(base.Tool, base.SandboxMixin):
         Args:
             working_dir: Working directory for relative paths
             sandbox_config: Sandbox configuration for path validation
+            project_index: Shared project index used for 'ls' (default: filesystem)
         """
         # SandboxMixin uses _base_dir, but we keep _working_dir for cwd operation
         self._working_dir = working_dir or _pathlib.Path.cwd()
         self._base_dir = self._working_dir
         self._sandbox_config = sandbox_config
+        self._project_index = project_index
 
     @property
     def name(self) -> str:
@@ -238,44 +244,9 @@ class InspectTool(base.Tool, base.SandboxMixin):
             )
 
         # Collect entries with metadata
-        entries: list[dict[str, _typing.Any]] = []
-        for entry in path.iterdir():
-            try:
-                stat = entry.stat()
-                is_dir = entry.is_dir()
-                is_symlink = entry.is_symlink()
-
-                # Apply filter
-                if filter_type == "files" and is_dir:
-                    continue
-                if filter_type == "dirs" and not is_dir:
-                    continue
-
-                entry_info = {
-                    "name": entry.name,
-                    "type": "symlink" if is_symlink else ("dir" if is_dir else "file"),
-                    "size": stat.st_size,
-                    "mtime": stat.st_mtime,
-                    "modified": _datetime.datetime.fromtimestamp(
-                        stat.st_mtime
-                    ).isoformat(),
-                }
-                if is_symlink:
-                    try:
-                        entry_info["target"] = str(entry.resolve())
-                    except OSError:
-                        entry_info["target"] = "(broken)"
-                entries.append(entry_info)
-            except (PermissionError, OSError):
-                # Skip entries we can't access
-                if filter_type == "all":
-                    entries.append({
-                        "name": entry.name,
-                        "type": "unknown",
-                        "size": 0,
-                        "mtime": 0,
-                        "error": "permission denied",
-                    })
+        entries = self._ls_indexed(path, filter_type)
+        if entries is None:
+            entries = self._ls_filesystem(path, filter_type)
 
         # Sort entries
         if sort_by == "mtime":
@@ -344,6 +315,85 @@ class InspectTool(base.Tool, base.SandboxMixin):
             output="\n".join(output_lines),
         )
 
+    def _ls_indexed(
+        self,
+        path: _pathlib.Path,
+        filter_type: str,
+    ) -> list[dict[str, _typing.Any]] | None:
+        """Collect 'ls' entries from the project index (None if not covered)."""
+        if self._project_index is None:
+            return None
+        listing = self._project_index.list_dir(path)
+        if listing is None:
+            return None
+
+        entries: list[dict[str, _typing.Any]] = []
+        for item in listing:
+            if filter_type == "files" and item.is_dir:
+                continue
+            if filter_type == "dirs" and not item.is_dir:
+                continue
+            entry_info: dict[str, _typing.Any] = {
+                "name": item.name,
+                "type": "symlink" if item.is_symlink else ("dir" if item.is_dir else "file"),
+                "size": item.size,
+                "mtime": item.mtime,
+                "modified": _datetime.datetime.fromtimestamp(item.mtime).isoformat(),
+            }
+            if item.is_symlink:
+                try:
+                    entry_info["target"] = str((path / item.name).resolve())
+                except OSError:
+                    entry_info["target"] = "(broken)"
+            entries.append(entry_info)
+        return entries
+
+    def _ls_filesystem(
+        self,
+        path: _pathlib.Path,
+        filter_type: str,
+    ) -> list[dict[str, _typing.Any]]:
+        """Collect 'ls' entries by reading the directory."""
+        entries: list[dict[str, _typing.Any]] = []
+        for entry in path.iterdir():
+            try:
+                stat = entry.stat()
+                is_dir = entry.is_dir()
+                is_symlink = entry.is_symlink()
+
+                # Apply filter
+                if filter_type == "files" and is_dir:
+                    continue
+                if filter_type == "dirs" and not is_dir:
+                    continue
+
+                entry_info = {
+                    "name": entry.name,
+                    "type": "symlink" if is_symlink else ("dir" if is_dir else "file"),
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "modified": _datetime.datetime.fromtimestamp(
+                        stat.st_mtime
+                    ).isoformat(),
+                }
+                if is_symlink:
+                    try:
+                        entry_info["target"] = str(entry.resolve())
+                    except OSError:
+                        entry_info["target"] = "(broken)"
+                entries.append(entry_info)
+            except (PermissionError, OSError):
+                # Skip entries we can't access
+                if filter_type == "all":
+                    entries.append({
+                        "name": entry.name,
+                        "type": "unknown",
+                        "size": 0,
+                        "mtime": 0,
+                        "error": "permission denied",
+                    })
+        return entries
+
     def _do_stat(self, path_str: str) -> base.ToolResult:
         """Get file/directory metadata."""
         path = self._resolve_path(path_str)
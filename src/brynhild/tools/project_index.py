@@ -0,0 +1,696 @@
+"""
+In-memory project file index shared by the built-in tools.
+
+The index keeps a trie of the project tree (one node per path component)
+with cached stat metadata, so listing, glob matching and mtime sorting do not
+walk the filesystem on every tool call. It is built lazily on first use and
+then kept current from filesystem events delivered by ``watchfiles`` (inotify
+on Linux, FSEvents on macOS), falling back to polling when native watching is
+unavailable.
+
+Ignore files (.gitignore, .ignore, .brynhildignore) are honored: ignored
+entries are still listed in their parent directory, but ignored directories
+are not descended into and ignored files never appear in glob results.
+
+Usage:
+    index = ProjectIndex(project_root)
+    matches = index.glob("**/*.py", project_root)   # None if not covered
+    entries = index.list_dir(project_root / "src")  # None if not covered
+    index.close()
+"""
+
+from __future__ import annotations
+
+import dataclasses as _dataclasses
+import logging as _logging
+import os as _os
+import pathlib as _pathlib
+import re as _re
+import stat as _stat
+import threading as _threading
+import typing as _typing
+
+_logger = _logging.getLogger(__name__)
+
+DEFAULT_IGNORE_FILES: tuple[str, ...] = (".gitignore", ".ignore", ".brynhildignore")
+"""Per-directory ignore files, applied in this order (later files win)."""
+
+ALWAYS_IGNORED: frozenset[str] = frozenset({".git"})
+"""Directory names that are never descended into."""
+
+DEFAULT_MAX_ENTRIES = 200_000
+"""Trees larger than this are not indexed; tools fall back to the filesystem."""
+
+# Event batching for the watcher (milliseconds). Kept short so files written
+# by Bash show up in the next tool call.
+_WATCH_DEBOUNCE_MS = 100
+_WATCH_STEP_MS = 20
+
+# The watcher yields an empty batch after this long without events. The first
+# such yield tells us watches are registered, so the initial scan can't miss
+# changes made while the watcher was starting up.
+_WATCH_TIMEOUT_MS = 250
+
+_POLL_INTERVAL_SEC = 2.0
+"""Full rescan interval when watchfiles cannot be imported."""
+
+
+# =============================================================================
+# Ignore rules
+# =============================================================================
+
+
+@_dataclasses.dataclass(frozen=True, slots=True)
+class IgnoreRule:
+    """A single compiled gitignore-style pattern."""
+
+    regex: _re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore/pathlib glob into a regex body (no anchors)."""
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                # "**/" matches zero or more directories; trailing "**" matches anything
+                if pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                else:
+                    out.append(".*")
+                    i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(_re.escape(c))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(_re.escape(pattern[i]))
+        else:
+            out.append(_re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def compile_ignore_pattern(line: str) -> IgnoreRule | None:
+    """
+    Compile one line of an ignore file.
+
+    Args:
+        line: Raw line from .gitignore (or similar)
+
+    Returns:
+        Compiled rule, or None for blank lines and comments
+    """
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negate = False
+    if line.startswith("!"):
+        negate = True
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    body = _translate_glob(line)
+    prefix = "^" if anchored else "^(?:.*/)?"
+    return IgnoreRule(regex=_re.compile(prefix + body + "$"), negate=negate, dir_only=dir_only)
+
+
+def load_ignore_rules(directory: _pathlib.Path, names: _typing.Iterable[str]) -> list[IgnoreRule]:
+    """Load and compile all ignore files present in a directory."""
+    rules: list[IgnoreRule] = []
+    for name in names:
+        try:
+            text = (directory / name).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        for line in text.splitlines():
+            rule = compile_ignore_pattern(line)
+            if rule is not None:
+                rules.append(rule)
+    return rules
+
+
+RuleChain = tuple[tuple[str, tuple[IgnoreRule, ...]], ...]
+"""Ignore rules in effect for a directory: (base relpath, rules) from root down."""
+
+
+def _is_ignored(rel_path: str, is_dir: bool, chain: RuleChain) -> bool:
+    """Evaluate gitignore semantics (last matching rule wins)."""
+    ignored = False
+    for base, rules in chain:
+        sub = rel_path[len(base) + 1 :] if base else rel_path
+        for rule in rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(sub):
+                ignored = not rule.negate
+    return ignored
+
+
+# =============================================================================
+# Trie
+# =============================================================================
+
+
+@_dataclasses.dataclass(slots=True)
+class IndexEntry:
+    """
+    One node of the project trie.
+
+    Directory nodes that were descended into have ``children`` set; files,
+    ignored directories and symlinked directories have ``children=None``.
+    """
+
+    name: str
+    is_dir: bool
+    is_symlink: bool
+    size: int
+    mtime: float
+    ignored: bool = False
+    children: dict[str, IndexEntry] | None = None
+    rules: RuleChain = ()
+
+
+def _entry_from_stat(name: str, st: _os.stat_result, is_symlink: bool) -> IndexEntry:
+    return IndexEntry(
+        name=name,
+        is_dir=_stat.S_ISDIR(st.st_mode),
+        is_symlink=is_symlink,
+        size=st.st_size,
+        mtime=st.st_mtime,
+    )
+
+
+class ProjectIndex:
+    """
+    Session-level index of files under the project root.
+
+    Thread-safe: the watcher thread applies updates under the same lock that
+    queries take. Every query returns ``None`` when the requested path is not
+    covered by the index (outside the root, inside an ignored directory, or the
+    tree was too large to index), in which case callers use the filesystem.
+    """
+
+    def __init__(
+        self,
+        root: _pathlib.Path,
+        *,
+        watch: bool = True,
+        ignore_files: tuple[str, ...] = DEFAULT_IGNORE_FILES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Create an index. Nothing is scanned until the first query.
+
+        Args:
+            root: Project root directory
+            watch: Keep the index current from filesystem events
+            ignore_files: Names of per-directory ignore files to honor
+            max_entries: Give up (and let tools use the filesystem) above this size
+        """
+        self._root = root.resolve()
+        self._watch = watch
+        self._ignore_files = ignore_files
+        self._max_entries = max_entries
+
+        self._lock = _threading.RLock()
+        self._tree: IndexEntry | None = None
+        self._entry_count = 0
+        self._available = True
+        self._stop = _threading.Event()
+        self._watch_ready = _threading.Event()
+        self._watcher: _threading.Thread | None = None
+        self._mode = "idle"
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    @property
+    def root(self) -> _pathlib.Path:
+        """Resolved project root."""
+        return self._root
+
+    @property
+    def mode(self) -> str:
+        """Update mode: idle, native, polling, rescan, static, or unavailable."""
+        return self._mode
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    def ensure_ready(self) -> bool:
+        """
+        Build the index (and start the watcher) if not done yet.
+
+        Returns:
+            True if the index can answer queries
+        """
+        with self._lock:
+            if self._tree is not None:
+                return True
+            if not self._available:
+                return False
+            if self._watch and self._watcher is None:
+                # Start watching before scanning so nothing changes unseen
+                self._watcher = _threading.Thread(
+                    target=self._watch_loop,
+                    name=f"brynhild-index-{self._root.name}",
+                    daemon=True,
+                )
+                self._watcher.start()
+                self._watch_ready.wait(timeout=2.0)
+            elif not self._watch:
+                self._mode = "static"
+            return self._build()
+
+    def close(self) -> None:
+        """Stop the watcher thread and drop the index."""
+        self._stop.set()
+        watcher = self._watcher
+        if watcher is not None and watcher is not _threading.current_thread():
+            watcher.join(timeout=2.0)
+        with self._lock:
+            self._tree = None
+            self._watcher = None
+
+    def _build(self) -> bool:
+        """Scan the whole tree. Caller holds the lock."""
+        root_rules = load_ignore_rules(self._root, self._ignore_files)
+        try:
+            st = _os.stat(self._root)
+        except OSError as e:
+            _logger.debug("Project index unavailable: %s", e)
+            self._available = False
+            self._mode = "unavailable"
+            return False
+
+        tree = _entry_from_stat(self._root.name, st, False)
+        tree.children = {}
+        tree.rules = (("", tuple(root_rules)),) if root_rules else ()
+
+        self._entry_count = 0
+        if not self._scan_into(tree, ""):
+            _logger.info(
+                "Project index disabled: more than %d entries under %s",
+                self._max_entries,
+                self._root,
+            )
+            self._available = False
+            self._mode = "unavailable"
+            self._stop.set()
+            return False
+
+        self._tree = tree
+        return True
+
+    def _scan_into(self, node: IndexEntry, rel: str) -> bool:
+        """
+        Populate ``node.children`` recursively. Caller holds the lock.
+
+        Returns:
+            False if the entry budget was exceeded
+        """
+        stack: list[tuple[IndexEntry, str]] = [(node, rel)]
+        while stack:
+            current, current_rel = stack.pop()
+            directory = self._root / current_rel if current_rel else self._root
+            children: dict[str, IndexEntry] = {}
+            try:
+                with _os.scandir(directory) as it:
+                    for dirent in it:
+                        child = self._entry_from_dirent(dirent)
+                        if child is None:
+                            continue
+                        children[child.name] = child
+            except OSError:
+                current.children = {}
+                continue
+
+            self._entry_count += len(children)
+            if self._entry_count > self._max_entries:
+                return False
+
+            current.children = children
+            for child in children.values():
+                child_rel = f"{current_rel}/{child.name}" if current_rel else child.name
+                child.ignored = child.name in ALWAYS_IGNORED or _is_ignored(
+                    child_rel, child.is_dir, current.rules
+                )
+                if child.is_dir and not child.is_symlink and not child.ignored:
+                    own = load_ignore_rules(self._root / child_rel, self._ignore_files)
+                    child.rules = current.rules + ((child_rel, tuple(own)),) if own else current.rules
+                    stack.append((child, child_rel))
+        return True
+
+    @staticmethod
+    def _entry_from_dirent(dirent: _os.DirEntry[str]) -> IndexEntry | None:
+        try:
+            is_symlink = dirent.is_symlink()
+            st = dirent.stat()
+        except OSError:
+            try:
+                # Broken symlink: keep it visible with its own metadata
+                st = dirent.stat(follow_symlinks=False)
+                is_symlink = True
+            except OSError:
+                return None
+        return _entry_from_stat(dirent.name, st, is_symlink)
+
+    # -------------------------------------------------------------------------
+    # Lookup helpers
+    # -------------------------------------------------------------------------
+
+    def _relative(self, path: _pathlib.Path) -> str | None:
+        """Project-relative posix path, or None if outside the root."""
+        try:
+            rel = path.relative_to(self._root)
+        except ValueError:
+            return None
+        return rel.as_posix() if rel.parts else ""
+
+    def _node(self, rel: str) -> IndexEntry | None:
+        """Find a node by relative path. Caller holds the lock."""
+        node = self._tree
+        if node is None:
+            return None
+        if not rel:
+            return node
+        for part in rel.split("/"):
+            if node.children is None:
+                return None
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def list_dir(self, path: _pathlib.Path) -> list[IndexEntry] | None:
+        """
+        List the direct children of an indexed directory.
+
+        Ignored entries are included (with ``ignored=True``).
+
+        Returns:
+            Snapshot of child entries, or None if the directory is not covered
+        """
+        rel = self._relative(path)
+        if rel is None or not self.ensure_ready():
+            return None
+        with self._lock:
+            node = self._node(rel)
+            if node is None or node.children is None:
+                return None
+            return list(node.children.values())
+
+    def iter_files(self, path: _pathlib.Path) -> list[tuple[str, IndexEntry]] | None:
+        """
+        All non-ignored files below an indexed directory.
+
+        Returns:
+            List of (path relative to ``path``, entry), or None if not covered
+        """
+        rel = self._relative(path)
+        if rel is None or not self.ensure_ready():
+            return None
+        with self._lock:
+            node = self._node(rel)
+            if node is None or node.children is None:
+                return None
+            result: list[tuple[str, IndexEntry]] = []
+            stack: list[tuple[IndexEntry, str]] = [(node, "")]
+            while stack:
+                current, prefix = stack.pop()
+                assert current.children is not None
+                for child in current.children.values():
+                    if child.ignored:
+                        continue
+                    child_rel = f"{prefix}{child.name}"
+                    if child.children is not None:
+                        stack.append((child, child_rel + "/"))
+                    elif not child.is_dir:
+                        result.append((child_rel, child))
+            return result
+
+    def glob(
+        self,
+        pattern: str,
+        base: _pathlib.Path,
+    ) -> list[tuple[_pathlib.Path, IndexEntry]] | None:
+        """
+        Match files below ``base`` against a pathlib-style glob pattern.
+
+        Args:
+            pattern: Relative glob (``**`` matches any number of directories)
+            base: Directory the pattern is relative to
+
+        Returns:
+            List of (absolute path, entry) for matching files, or None if not covered
+        """
+        files = self.iter_files(base)
+        if files is None:
+            return None
+        regex = _re.compile("^" + _translate_glob(pattern) + "$")
+        base = base.resolve()
+        return [(base / rel, entry) for rel, entry in files if regex.match(rel)]
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def notify_changed(self, path: _pathlib.Path) -> None:
+        """
+        Refresh a single path immediately.
+
+        Tools that write files call this so the next query sees the change
+        without waiting for the watcher's debounce.
+        """
+        with self._lock:
+            if self._tree is not None:
+                self._refresh(path)
+
+    def _refresh(self, path: _pathlib.Path) -> None:
+        """Re-stat one path and update the trie. Caller holds the lock."""
+        rel = self._relative(path)
+        if not rel:
+            return
+        parent_rel, _, name = rel.rpartition("/")
+        parts = rel.split("/")
+        parent = self._tree
+        assert parent is not None
+        for i, part in enumerate(parts[:-1]):
+            if parent.children is None:
+                # Inside an ignored or symlinked directory: not indexed
+                return
+            child = parent.children.get(part)
+            if child is None:
+                # An intermediate directory appeared; refreshing it scans its contents
+                self._refresh(self._root.joinpath(*parts[: i + 1]))
+                return
+            parent = child
+        if parent.children is None:
+            return
+
+        # The parent's own mtime changes whenever an entry is added or removed
+        parent_path = self._root / parent_rel if parent_rel else self._root
+        try:
+            parent_st = _os.stat(parent_path)
+            parent.mtime = parent_st.st_mtime
+            parent.size = parent_st.st_size
+        except OSError:
+            pass
+
+        try:
+            is_symlink = _os.path.islink(path)
+            st = _os.stat(path) if not is_symlink or _os.path.exists(path) else _os.lstat(path)
+        except OSError:
+            removed = parent.children.pop(name, None)
+            if removed is not None:
+                self._entry_count -= 1 + self._count(removed)
+            if name in self._ignore_files:
+                self._rescan_dir(parent, parent_rel)
+            return
+
+        fresh = _entry_from_stat(name, st, is_symlink)
+        existing = parent.children.get(name)
+        if existing is not None and existing.is_dir == fresh.is_dir:
+            existing.size = fresh.size
+            existing.mtime = fresh.mtime
+            existing.is_symlink = fresh.is_symlink
+        else:
+            if existing is not None:
+                self._entry_count -= 1 + self._count(existing)
+            self._entry_count += 1
+            parent.children[name] = fresh
+            fresh.ignored = name in ALWAYS_IGNORED or _is_ignored(rel, fresh.is_dir, parent.rules)
+            if fresh.is_dir and not fresh.is_symlink and not fresh.ignored:
+                own = load_ignore_rules(path, self._ignore_files)
+                fresh.rules = parent.rules + ((rel, tuple(own)),) if own else parent.rules
+                if not self._scan_into(fresh, rel):
+                    self._disable()
+                    return
+
+        if name in self._ignore_files:
+            # Ignore rules changed: recompute everything below the parent
+            self._rescan_dir(parent, parent_rel)
+
+    def _rescan_dir(self, node: IndexEntry, rel: str) -> None:
+        """Reload a directory's ignore rules and rescan its subtree. Caller holds the lock."""
+        if node.children is not None:
+            self._entry_count -= self._count(node)
+        if rel:
+            parent = self._node(rel.rpartition("/")[0])
+            inherited = parent.rules if parent is not None else ()
+        else:
+            inherited = ()
+        own = load_ignore_rules(self._root / rel if rel else self._root, self._ignore_files)
+        node.rules = inherited + ((rel, tuple(own)),) if own else inherited
+        if not self._scan_into(node, rel):
+            self._disable()
+
+    @staticmethod
+    def _count(node: IndexEntry) -> int:
+        """Number of descendants of a node."""
+        total = 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.children:
+                total += len(current.children)
+                stack.extend(current.children.values())
+        return total
+
+    def _disable(self) -> None:
+        """Stop serving queries after the tree outgrew the budget. Caller holds the lock."""
+        _logger.info("Project index disabled: tree under %s grew too large", self._root)
+        self._tree = None
+        self._available = False
+        self._mode = "unavailable"
+        self._stop.set()
+
+    # -------------------------------------------------------------------------
+    # Watcher
+    # -------------------------------------------------------------------------
+
+    def _apply_changes(self, changes: _typing.Iterable[tuple[_typing.Any, str]]) -> None:
+        with self._lock:
+            if self._tree is None:
+                return
+            # Parents first, so new directories exist before their contents
+            for path in sorted({p for _, p in changes}, key=len):
+                self._refresh(_pathlib.Path(path))
+                if self._tree is None:
+                    return
+
+    def _watch_loop(self) -> None:
+        """Background thread: apply filesystem events until closed."""
+        try:
+            import watchfiles as _watchfiles
+        except ImportError:
+            self._watch_ready.set()
+            self._poll_loop()
+            return
+
+        force_polling: bool | None = None
+        self._mode = "native"
+        if not self._root.is_dir():
+            self._watch_ready.set()
+        while not self._stop.is_set() and self._root.is_dir():
+            try:
+                for changes in _watchfiles.watch(
+                    self._root,
+                    watch_filter=None,
+                    debounce=_WATCH_DEBOUNCE_MS,
+                    step=_WATCH_STEP_MS,
+                    stop_event=self._stop,
+                    force_polling=force_polling,
+                    rust_timeout=_WATCH_TIMEOUT_MS,
+                    yield_on_timeout=True,
+                    raise_interrupt=False,
+                    ignore_permission_denied=True,
+                ):
+                    self._watch_ready.set()
+                    if changes:
+                        self._apply_changes(changes)
+                return
+            except Exception as e:
+                self._watch_ready.set()
+                if force_polling:
+                    _logger.warning("Project index watcher stopped: %s", e)
+                    self._mode = "static"
+                    return
+                # Typically the inotify watch limit; polling has no such limit
+                _logger.info("Native file watching unavailable (%s); polling instead", e)
+                force_polling = True
+                self._mode = "polling"
+                with self._lock:
+                    if self._tree is not None and not self._build():
+                        return
+
+    def _poll_loop(self) -> None:
+        """Fallback without watchfiles: rebuild the index periodically."""
+        self._mode = "rescan"
+        while not self._stop.wait(_POLL_INTERVAL_SEC):
+            with self._lock:
+                if self._tree is not None and not self._build():
+                    return
+
+
+def snapshot_files(
+    root: _pathlib.Path,
+    index: ProjectIndex | None = None,
+) -> list[tuple[str, float, int]] | None:
+    """
+    (relative path, mtime, size) of every non-ignored file under ``root``.
+
+    Uses the shared index when it covers ``root``; otherwise performs a
+    one-off scan with the same ignore rules.
+
+    Returns:
+        File list, or None if the tree is too large to index
+    """
+    root = root.resolve()
+    transient = index is None or index.root != root
+    if transient:
+        index = ProjectIndex(root, watch=False)
+    assert index is not None
+    try:
+        entries = index.iter_files(root)
+    finally:
+        if transient:
+            index.close()
+    if entries is None:
+        return None
+    return [(rel, entry.mtime, entry.size) for rel, entry in entries]
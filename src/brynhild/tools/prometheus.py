@@ -0,0 +1,106 @@
+"""
+Prometheus textfile export for tool metrics.
+
+Writes a MetricsCollector in the text exposition format, for the node
+exporter's textfile collector (``--collector.textfile.directory``):
+- brynhild_tool_calls_total{tool, outcome}: calls by outcome
+- brynhild_tool_duration_seconds{tool}: latency histogram, with bucket
+  bounds at powers of two milliseconds (every fourth LatencyHistogram bucket)
+"""
+
+from __future__ import annotations
+
+import os as _os
+import pathlib as _pathlib
+import tempfile as _tempfile
+
+import brynhild.tools.base as base
+
+_BUCKETS_PER_BOUND = 4
+"""Histogram buckets folded into one exported ``le`` bound (one per doubling)."""
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, metrics: base.ToolMetrics) -> list[str]:
+    """Cumulative _bucket/_sum/_count lines for one tool."""
+    latency = metrics.latency
+    lines: list[str] = []
+    if latency.counts:
+        highest = max(latency.counts)
+        top = -(-highest // _BUCKETS_PER_BOUND) * _BUCKETS_PER_BOUND
+        cumulative = 0
+        for bound in range(0, top + 1, _BUCKETS_PER_BOUND):
+            cumulative += sum(
+                latency.counts.get(i, 0) for i in range(bound - _BUCKETS_PER_BOUND + 1, bound + 1)
+            )
+            le = base.LatencyHistogram.upper_bound(bound) / 1000.0
+            lines.append(f'{name}_bucket{{{labels},le="{le:g}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {latency.count}')
+    lines.append(f"{name}_sum{{{labels}}} {metrics.total_duration_ms / 1000.0:g}")
+    lines.append(f"{name}_count{{{labels}}} {latency.count}")
+    return lines
+
+
+def format_textfile(collector: base.MetricsCollector) -> str:
+    """
+    Render tool metrics in the Prometheus text exposition format.
+
+    Args:
+        collector: Metrics to export
+
+    Returns:
+        Exposition text, ending in a newline
+    """
+    tools = sorted(collector.all(), key=lambda m: m.tool_name)
+    lines = [
+        "# HELP brynhild_tool_calls_total Tool calls by outcome.",
+        "# TYPE brynhild_tool_calls_total counter",
+    ]
+    for m in tools:
+        tool = _escape(m.tool_name)
+        other_failures = m.failure_count - m.timeout_count - m.cancelled_count
+        for outcome, count in (
+            ("success", m.success_count),
+            ("failure", other_failures),
+            ("timeout", m.timeout_count),
+            ("cancelled", m.cancelled_count),
+        ):
+            lines.append(
+                f'brynhild_tool_calls_total{{tool="{tool}",outcome="{outcome}"}} {count}'
+            )
+
+    lines += [
+        "# HELP brynhild_tool_duration_seconds Tool call latency.",
+        "# TYPE brynhild_tool_duration_seconds histogram",
+    ]
+    for m in tools:
+        labels = f'tool="{_escape(m.tool_name)}"'
+        lines += _histogram_lines("brynhild_tool_duration_seconds", labels, m)
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(collector: base.MetricsCollector, path: _pathlib.Path) -> None:
+    """
+    Atomically write tool metrics to a textfile-collector file.
+
+    The file is replaced in one rename so the exporter never reads a partial
+    file. The node exporter only picks up files ending in ``.prom``.
+
+    Args:
+        collector: Metrics to export
+        path: Destination file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with _os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(format_textfile(collector))
+        _os.chmod(tmp, 0o644)
+        _os.replace(tmp, path)
+    except BaseException:
+        _pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
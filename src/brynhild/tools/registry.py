@@ -6,11 +6,19 @@ The registry provides a central place to register, look up, and list tools.
 
 from __future__ import annotations
 
+import hashlib as _hashlib
 import logging as _logging
+import pathlib as _pathlib
 import typing as _typing
 
+import brynhild.api.types as api_types
 import brynhild.tools.base as base
 
+if _typing.TYPE_CHECKING:
+    import brynhild.config as config
+    import brynhild.tools.project_index as project_index
+    import brynhild.tools.sandbox_limits as sandbox_limits
+
 _logger = _logging.getLogger(__name__)
 
 
@@ -20,10 +28,78 @@ class ToolRegistry:
 
     Tools can be registered by name and looked up for execution.
     The registry also provides listing and schema introspection.
+
+    The tool set rarely changes during a session, so the listings and API
+    payloads are built once per registry version (bumped by register() and
+    unregister()) and shared; treat the returned definitions as read-only.
     """
 
     def __init__(self) -> None:
         self._tools: dict[str, base.Tool] = {}
+        self._project_index: project_index.ProjectIndex | None = None
+        self._default_timeout: float | None = None
+        self._timeouts: dict[str, float | None] = {}
+        self._version = 0
+        self._cache: dict[str, _typing.Any] = {}
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of registered tools changes."""
+        return self._version
+
+    @property
+    def project_index(self) -> project_index.ProjectIndex | None:
+        """Shared project file index used by the built-in tools (if any)."""
+        return self._project_index
+
+    @project_index.setter
+    def project_index(self, index: project_index.ProjectIndex | None) -> None:
+        self._project_index = index
+
+    def set_timeout(self, seconds: float | None, tool_name: str | None = None) -> None:
+        """
+        Set the deadline for tool calls.
+
+        Args:
+            seconds: Deadline in seconds (None: no deadline)
+            tool_name: Tool to set it for (default: all tools without their own)
+        """
+        if tool_name is None:
+            self._default_timeout = seconds
+        else:
+            self._timeouts[tool_name] = seconds
+
+    def timeout_for(self, name: str) -> float | None:
+        """Deadline in seconds for calls to a tool (None: no deadline)."""
+        return self._timeouts.get(name, self._default_timeout)
+
+    async def run_tool(
+        self,
+        tool: base.Tool,
+        tool_input: dict[str, _typing.Any],
+        is_cancelled: _typing.Callable[[], bool] | None = None,
+    ) -> tuple[base.ToolResult, base.ToolOutcome]:
+        """
+        Run a tool under its deadline, cancelling it on timeout or user cancel.
+
+        Args:
+            tool: The tool to run
+            tool_input: Tool input
+            is_cancelled: Callback reporting user cancellation
+
+        Returns:
+            Tuple of (result, outcome)
+        """
+        return await base.run_with_deadline(
+            tool, tool_input, self.timeout_for(tool.name), is_cancelled
+        )
+
+    def close(self) -> None:
+        """Release session-level resources (each tool's, then the project index watcher)."""
+        for tool in self._tools.values():
+            tool.close()
+        if self._project_index is not None:
+            self._project_index.close()
 
     def register(self, tool: base.Tool) -> None:
         """
@@ -38,6 +114,36 @@ class ToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         self._tools[tool.name] = tool
+        self._changed()
+
+    def unregister(self, name: str) -> base.Tool:
+        """
+        Remove a registered tool.
+
+        Args:
+            name: Tool name (case-sensitive)
+
+        Returns:
+            The removed tool instance
+
+        Raises:
+            KeyError: If tool is not found
+        """
+        tool = self.get_or_raise(name)
+        del self._tools[name]
+        self._changed()
+        return tool
+
+    def _changed(self) -> None:
+        """Invalidate the cached listings after the tool set changed."""
+        self._version += 1
+        self._cache.clear()
+
+    def _cached(self, key: str, build: _typing.Callable[[], _typing.Any]) -> _typing.Any:
+        """Value of a listing for the current version, building it on first use."""
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
 
     def get(self, name: str) -> base.Tool | None:
         """
@@ -77,7 +183,10 @@ class ToolRegistry:
         Returns:
             List of tool instances, sorted by name
         """
-        return sorted(self._tools.values(), key=lambda t: t.name)
+        tools: list[base.Tool] = self._cached(
+            "tools", lambda: sorted(self._tools.values(), key=lambda t: t.name)
+        )
+        return list(tools)
 
     def list_names(self) -> list[str]:
         """
@@ -86,7 +195,30 @@ class ToolRegistry:
         Returns:
             Sorted list of tool names
         """
-        return sorted(self._tools.keys())
+        return [tool.name for tool in self.list_tools()]
+
+    def api_tools(self) -> list[api_types.Tool]:
+        """
+        Get all tools as API tool definitions, for passing to a provider.
+
+        The same Tool objects are returned until the tool set changes, so
+        their provider formats and JSON are only built once.
+
+        Returns:
+            List of api_types.Tool, sorted by name
+        """
+        tools: list[api_types.Tool] = self._cached(
+            "api",
+            lambda: [
+                api_types.Tool(
+                    name=tool.name,
+                    description=tool.description,
+                    input_schema=tool.input_schema,
+                )
+                for tool in self.list_tools()
+            ],
+        )
+        return list(tools)
 
     def to_api_format(self) -> list[dict[str, _typing.Any]]:
         """
@@ -95,7 +227,10 @@ class ToolRegistry:
         Returns:
             List of tool definitions for the API
         """
-        return [tool.to_api_format() for tool in self.list_tools()]
+        formatted: list[dict[str, _typing.Any]] = self._cached(
+            "anthropic", lambda: [tool.to_api_format() for tool in self.list_tools()]
+        )
+        return list(formatted)
 
     def to_openai_format(self) -> list[dict[str, _typing.Any]]:
         """
@@ -104,7 +239,10 @@ class ToolRegistry:
         Returns:
             List of tool definitions for the API
         """
-        return [tool.to_openai_format() for tool in self.list_tools()]
+        formatted: list[dict[str, _typing.Any]] = self._cached(
+            "openai", lambda: [tool.to_openai_format() for tool in self.list_tools()]
+        )
+        return list(formatted)
 
     def __len__(self) -> int:
         return len(self._tools)
@@ -170,11 +308,14 @@ def build_registry_from_settings(
     """
     # Import tools here to avoid circular imports
     import brynhild.tools.bash as bash
+    import brynhild.tools.code_search as code_search
     import brynhild.tools.file as file
     import brynhild.tools.glob as glob_tool
     import brynhild.tools.grep as grep
     import brynhild.tools.inspect as inspect_tool
+    import brynhild.tools.project_index as project_index_module
     import brynhild.tools.sandbox as sandbox
+    import brynhild.tools.symbols as symbols_tool
 
     registry = ToolRegistry()
 
@@ -200,6 +341,13 @@ def build_registry_from_settings(
         skip_sandbox=skip_sandbox,
     )
 
+    # Shared project index (built lazily on first Glob/Inspect query)
+    index: project_index_module.ProjectIndex | None = None
+    tools_config = getattr(settings, "tools", None)
+    if getattr(tools_config, "project_index", False) is True:
+        index = project_index_module.ProjectIndex(project_root)
+        registry.project_index = index
+
     # Register Bash tool with sandbox settings
     if "Bash" not in disabled_tools:
         bash_tool = bash.BashTool(
@@ -210,6 +358,7 @@ def build_registry_from_settings(
             project_root=project_root,
             allowed_paths=allowed_paths,
             allow_network=settings.sandbox_allow_network,
+            resource_limits=_resource_limits(settings),
         )
         # Apply skip_sandbox to the bash tool's sandbox config
         if bash_tool._sandbox_config:
@@ -222,15 +371,28 @@ def build_registry_from_settings(
             base_dir=project_root,
             sandbox_config=sandbox_config,
         ))
+    if "ReadMany" not in disabled_tools:
+        registry.register(file.ReadManyTool(
+            base_dir=project_root,
+            sandbox_config=sandbox_config,
+        ))
     if "Write" not in disabled_tools:
         registry.register(file.FileWriteTool(
             base_dir=project_root,
             sandbox_config=sandbox_config,
+            project_index=index,
         ))
     if "Edit" not in disabled_tools:
         registry.register(file.FileEditTool(
             base_dir=project_root,
             sandbox_config=sandbox_config,
+            project_index=index,
+        ))
+    if "MultiEdit" not in disabled_tools:
+        registry.register(file.MultiEditTool(
+            base_dir=project_root,
+            sandbox_config=sandbox_config,
+            project_index=index,
         ))
 
     # Register search tools with sandbox config
@@ -243,6 +405,21 @@ def build_registry_from_settings(
         registry.register(glob_tool.GlobTool(
             base_dir=project_root,
             sandbox_config=sandbox_config,
+            project_index=index,
+        ))
+    if "CodeSearch" not in disabled_tools:
+        registry.register(code_search.CodeSearchTool(
+            base_dir=project_root,
+            sandbox_config=sandbox_config,
+            project_index=index,
+            index_dir=_project_cache_dir(settings, project_root, "code-search"),
+        ))
+    if "Symbols" not in disabled_tools:
+        registry.register(symbols_tool.SymbolsTool(
+            base_dir=project_root,
+            sandbox_config=sandbox_config,
+            project_index=index,
+            index_dir=_project_cache_dir(settings, project_root, "symbols"),
         ))
 
     # Register inspect tool (read-only, no permission required)
@@ -250,6 +427,7 @@ def build_registry_from_settings(
         registry.register(inspect_tool.InspectTool(
             working_dir=project_root,
             sandbox_config=sandbox_config,
+            project_index=index,
         ))
 
     # Discover plugins once (used for both tools and skills)
@@ -275,9 +453,56 @@ def build_registry_from_settings(
     # Load tools from enabled plugins
     _load_plugin_tools(registry, discovered_plugins)
 
+    _apply_timeouts(registry, tools_config)
     return registry
 
 
+def _apply_timeouts(registry: ToolRegistry, tools_config: _typing.Any) -> None:
+    """Set the registry's tool deadlines from ToolsConfig (tools.timeout_seconds)."""
+    import brynhild.constants as constants
+
+    registry.set_timeout(
+        getattr(tools_config, "timeout_seconds", constants.DEFAULT_TOOL_TIMEOUT_SECONDS)
+    )
+    # Bash enforces its own per-command timeout; no extra deadline unless configured
+    registry.set_timeout(None, "Bash")
+    instances = getattr(tools_config, "instances", None) or {}
+    for name in registry.list_names():
+        tool_config = instances.get(name)
+        if tool_config is not None and tool_config.timeout_seconds is not None:
+            registry.set_timeout(tool_config.timeout_seconds, name)
+
+
+def _project_cache_dir(
+    settings: _typing.Any,
+    project_root: _pathlib.Path,
+    kind: str,
+) -> _pathlib.Path | None:
+    """Per-project directory for a persisted tool index (None if no cache dir)."""
+    cache_dir = getattr(settings, "cache_dir", None)
+    if not isinstance(cache_dir, _pathlib.Path):
+        return None
+    digest = _hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / kind / f"{project_root.name}-{digest}"
+
+
+def _resource_limits(settings: config.Settings) -> sandbox_limits.ResourceLimits:
+    """Build sandbox ResourceLimits from the sandbox.limits config section."""
+    import brynhild.tools.sandbox_limits as sandbox_limits
+
+    limits = getattr(getattr(settings, "sandbox", None), "limits", None)
+    if limits is None:
+        return sandbox_limits.ResourceLimits()
+    return sandbox_limits.ResourceLimits(
+        memory_mb=limits.memory_mb,
+        cpu_seconds=limits.cpu_seconds,
+        max_processes=limits.max_processes,
+        max_file_size_mb=limits.max_file_size_mb,
+        max_open_files=limits.max_open_files,
+        cgroup_parent=_pathlib.Path(limits.cgroup) if limits.cgroup else None,
+    )
+
+
 def _discover_plugins(
     settings: _typing.Any,  # brynhild.config.Settings
 ) -> list[_typing.Any]:  # list[brynhild.plugins.manifest.Plugin]
@@ -514,6 +739,7 @@ def _load_entry_point_tools(registry: ToolRegistry) -> None:
 
 # Builtin tool names for reference
 BUILTIN_TOOL_NAMES = frozenset({
-    "Bash", "Read", "Write", "Edit", "Grep", "Glob", "Inspect", "LearnSkill", "Finish"
+    "Bash", "Read", "ReadMany", "Write", "Edit", "MultiEdit", "Grep", "Glob", "CodeSearch",
+    "Symbols", "Inspect", "LearnSkill", "Finish",
 })
 
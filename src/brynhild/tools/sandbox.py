@@ -3,9 +3,11 @@ Sandbox utilities for restricting tool execution.
 
 Provides:
 - Path validation to restrict file operations to project directory
+- Compiled path policy (component trie) for fast allow/deny checks
 - Sensitive path blocklist (platform-aware)
 - Seatbelt profile for macOS sandbox-exec
-- Sandbox wrapper for command execution (platform-aware)
+- Sandbox wrapper for command execution (platform-aware), including
+  per-command resource limits (see sandbox_limits)
 """
 
 from __future__ import annotations
@@ -13,9 +15,12 @@ from __future__ import annotations
 import os as _os
 import pathlib as _pathlib
 import platform as _platform
+import stat as _stat
 import tempfile as _tempfile
 import typing as _typing
 
+import brynhild.tools.sandbox_limits as sandbox_limits
+
 
 def _get_sensitive_paths() -> tuple[list[str], list[str]]:
     """Get platform-specific sensitive paths.
@@ -111,6 +116,159 @@ class SandboxUnavailableError(Exception):
     pass
 
 
+# =============================================================================
+# Compiled Path Policy
+# =============================================================================
+
+_ALLOW = 1
+_BLOCK_READ = 2
+_BLOCK_WRITE = 4
+
+PolicyDecision = _typing.Literal["allowed", "blocked", "unlisted"]
+
+
+class _PolicyNode:
+    """One path component in the policy trie."""
+
+    __slots__ = ("flags", "children")
+
+    def __init__(self) -> None:
+        self.flags = 0
+        self.children: dict[str, _PolicyNode] = {}
+
+
+def _policy_parts(path: _pathlib.PurePath) -> tuple[str, ...]:
+    """Trie keys for a path (case-folded where the filesystem is case-insensitive)."""
+    if _os.name == "nt":
+        return tuple(part.lower() for part in path.parts)
+    return path.parts
+
+
+class PathPolicy:
+    """
+    Allow/deny rules of a SandboxConfig compiled into a component trie.
+
+    Each allowed or blocked directory is a node keyed by its path parts, so
+    checking a resolved path is a single walk over its components (O(depth))
+    instead of a relative_to() scan over every rule. Allowed directories win
+    over blocked ones at any depth, which lets the project directory punch
+    through the home-directory block.
+
+    The policy also caches the resolved project root, so paths under it only
+    need their components below the root checked for symlinks.
+    """
+
+    def __init__(
+        self,
+        project_root: _pathlib.Path,
+        allowed: list[_pathlib.Path],
+        blocked_read: list[_pathlib.Path],
+        blocked_write: list[_pathlib.Path],
+    ) -> None:
+        """
+        Compile the policy.
+
+        Args:
+            project_root: Project root (as configured, may be unresolved)
+            allowed: Resolved directories where reads and writes are allowed
+            blocked_read: Directories where reads are blocked
+            blocked_write: Directories where writes are blocked
+        """
+        self._root = _PolicyNode()
+        for paths, flag in (
+            (allowed, _ALLOW),
+            (blocked_read, _BLOCK_READ),
+            (blocked_write, _BLOCK_WRITE),
+        ):
+            for path in paths:
+                self._insert(path, flag)
+
+        # Resolve cache: configured and resolved spellings of the project root
+        self._resolved_root = project_root.resolve()
+        self._root_prefixes = {
+            str(self._resolved_root): self._resolved_root,
+        }
+        if project_root.is_absolute():
+            self._root_prefixes[str(project_root)] = self._resolved_root
+
+    def _insert(self, path: _pathlib.Path, flag: int) -> None:
+        node = self._root
+        for part in _policy_parts(path):
+            node = node.children.setdefault(part, _PolicyNode())
+        node.flags |= flag
+
+    def check(
+        self,
+        resolved: _pathlib.Path,
+        operation: _typing.Literal["read", "write"],
+    ) -> PolicyDecision:
+        """
+        Classify a resolved path.
+
+        Args:
+            resolved: Absolute, resolved path
+            operation: The type of operation (read or write)
+
+        Returns:
+            "allowed" if under an allowed directory, "blocked" if under a
+            blocked directory for this operation, otherwise "unlisted"
+        """
+        block_flag = _BLOCK_WRITE if operation == "write" else _BLOCK_READ
+        blocked = False
+        node = self._root
+        for part in _policy_parts(resolved):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if node.flags & _ALLOW:
+                return "allowed"
+            if node.flags & block_flag:
+                blocked = True
+        return "blocked" if blocked else "unlisted"
+
+    def resolve(self, path: _pathlib.Path) -> _pathlib.Path:
+        """
+        Resolve a path, reusing the cached project root resolution.
+
+        Paths under the project root are resolved by checking only their
+        components below the root; anything else (or any symlink or ``..``
+        below the root) falls back to Path.resolve().
+
+        Raises:
+            OSError, RuntimeError: As raised by Path.resolve()
+        """
+        text = str(path)
+        for prefix, resolved_root in self._root_prefixes.items():
+            if text == prefix:
+                return resolved_root
+            if text.startswith(prefix) and text[len(prefix)] == _os.sep:
+                rest = text[len(prefix) + 1:]
+                break
+        else:
+            return path.resolve()
+
+        parts = rest.split(_os.sep)
+        if any(part in ("", ".", "..") for part in parts):
+            return path.resolve()
+        current = str(resolved_root)
+        for part in parts:
+            current = current + _os.sep + part
+            try:
+                mode = _os.lstat(current).st_mode
+            except OSError:
+                # Missing components are kept as-is, like Path.resolve()
+                return resolved_root.joinpath(*parts)
+            if _stat.S_ISLNK(mode):
+                return path.resolve()
+        return _pathlib.Path(current)
+
+
+# =============================================================================
+# Sandbox Configuration
+# =============================================================================
+
+
 class SandboxConfig:
     """Configuration for sandbox behavior."""
 
@@ -122,6 +280,7 @@ class SandboxConfig:
         allow_network: bool = False,
         dry_run: bool = False,
         skip_sandbox: bool = False,
+        resource_limits: sandbox_limits.ResourceLimits | None = None,
     ) -> None:
         """
         Initialize sandbox configuration.
@@ -133,6 +292,7 @@ class SandboxConfig:
             allow_network: Whether to allow network access
             dry_run: If True, don't actually execute commands
             skip_sandbox: If True, skip OS-level sandbox (DANGEROUS)
+            resource_limits: Per-command resource limits (default: none)
         """
         self.project_root = project_root or _pathlib.Path.cwd()
         self.allowed_paths = allowed_paths or []
@@ -140,6 +300,7 @@ class SandboxConfig:
         self.allow_network = allow_network
         self.dry_run = dry_run
         self.skip_sandbox = skip_sandbox
+        self.resource_limits = resource_limits or sandbox_limits.ResourceLimits()
 
         # Build allowed write paths
         # Include /tmp and system temp dir, handling macOS /tmp -> /private/tmp symlink
@@ -158,6 +319,13 @@ class SandboxConfig:
             SENSITIVE_WRITE_PATHS + self.blocked_paths
         )
 
+        self.policy = PathPolicy(
+            self.project_root,
+            self._allowed_write_paths,
+            self._blocked_read_paths,
+            self._blocked_write_paths,
+        )
+
     def _get_tmp_paths(self) -> list[_pathlib.Path]:
         """Get temp directory paths, handling symlinks."""
         paths: list[_pathlib.Path] = []
@@ -228,63 +396,35 @@ def validate_path(
 
     # Resolve the path (handles .., symlinks, etc.)
     try:
-        resolved = path.resolve()
+        resolved = config.policy.resolve(path)
     except (OSError, RuntimeError) as e:
         raise PathValidationError(f"Cannot resolve path: {path} ({e})") from e
 
-    # For WRITES: Check allowed paths FIRST (allows project to punch through ~ block)
-    if operation == "write":
-        is_allowed = False
-        for allowed in config._allowed_write_paths:
-            try:
-                resolved.relative_to(allowed)
-                is_allowed = True
-                break
-            except ValueError:
-                continue
+    # Allowed directories are checked first (allows project to punch through ~ block)
+    decision = config.policy.check(resolved, operation)
 
-        if is_allowed:
-            # Path is in an allowed directory - permit it
+    if operation == "write":
+        if decision == "allowed":
             return resolved
-
-        # Path is not in allowed directory - check if it's blocked
-        for blocked in config._blocked_write_paths:
-            try:
-                resolved.relative_to(blocked)
-                raise PathValidationError(
-                    f"Write access denied: {path} is in a protected location. "
-                    f"Writes are only allowed to: {config.project_root}, /tmp"
-                )
-            except ValueError:
-                pass
-
+        if decision == "blocked":
+            raise PathValidationError(
+                f"Write access denied: {path} is in a protected location. "
+                f"Writes are only allowed to: {config.project_root}, /tmp"
+            )
         # Not in allowed and not explicitly blocked - still deny writes
         raise PathValidationError(
             f"Write access denied: {path} is outside allowed directories. "
             f"Writes are only allowed to: {config.project_root}, /tmp"
         )
 
-    # For READS: Check allowed paths FIRST (allows project to punch through)
-    for allowed in config._allowed_write_paths:
-        try:
-            resolved.relative_to(allowed)
-            # Path is in an allowed directory - permit read
-            return resolved
-        except ValueError:
-            continue
-
-    # Not in allowed directory - check if blocked
-    for blocked in config._blocked_read_paths:
-        try:
-            resolved.relative_to(blocked)
-            raise PathValidationError(
-                f"Read access denied: {path} is in a protected location. "
-                f"Reads are only allowed from: project directory, /tmp, system paths"
-            )
-        except ValueError:
-            pass
+    if decision == "blocked":
+        raise PathValidationError(
+            f"Read access denied: {path} is in a protected location. "
+            f"Reads are only allowed from: project directory, /tmp, system paths"
+        )
 
-    # Not in allowed AND not in blocked - allow (needed for /usr, /bin, /System, etc.)
+    # Allowed, or not in allowed AND not in blocked - allow
+    # (needed for /usr, /bin, /System, etc.)
     return resolved
 
 
@@ -445,6 +585,9 @@ def get_sandbox_command(
     - macOS: sandbox-exec with Seatbelt profiles
     - Linux: bubblewrap (bwrap)
 
+    Configured rlimits are applied inside the sandbox's bash, so they cover
+    the command and all of its children (and still apply with skip_sandbox).
+
     Args:
         command: The command to execute
         config: Sandbox configuration
@@ -460,8 +603,13 @@ def get_sandbox_command(
     if config.dry_run:
         return f"echo '[DRY RUN] Would execute: {command}'", None
 
+    limits = config.resource_limits
+    command = limits.limit_command(command)
+
     # Skip sandbox if explicitly disabled (dangerous!)
     if config.skip_sandbox:
+        if limits.has_rlimits:
+            return sandbox_limits.in_bash(command), None
         return command, None
 
     system = _platform.system()
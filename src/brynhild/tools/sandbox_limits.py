@@ -0,0 +1,270 @@
+"""
+Resource limits for sandboxed commands.
+
+The filesystem/network sandbox does not bound how much a command may
+consume, so one runaway build or fork bomb can starve every other session on
+a shared host. This module provides:
+- ResourceLimits: per-command rlimits (address space, CPU time, processes,
+  file size, open files), applied with the bash ``ulimit`` builtin inside
+  the sandbox so they cover the command and everything it spawns
+- CommandCgroup: optional placement in a per-command cgroup v2 child of a
+  delegated parent, enforcing memory.max and pids.max for the whole tree
+- describe_violation(): turn an exit status into a distinct limit message
+"""
+
+from __future__ import annotations
+
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import itertools as _itertools
+import os as _os
+import pathlib as _pathlib
+import shlex as _shlex
+import signal as _signal
+
+LIMIT_SETUP_EXIT = 125
+"""Exit status used when the limits themselves could not be applied."""
+
+_cgroup_counter = _itertools.count()
+
+_MEMORY_ERRORS = (
+    "cannot allocate memory",
+    "memoryerror",
+    "out of memory",
+    "bad_alloc",
+)
+
+_PROCESS_ERRORS = (
+    "fork: resource temporarily unavailable",
+    "fork: retry",
+    "cannot fork",
+    "can't fork",
+)
+
+
+@_dataclasses.dataclass(frozen=True)
+class ResourceLimits:
+    """
+    Per-command resource limits. None leaves a limit as inherited.
+
+    Note that RLIMIT_NPROC counts every process of the user, not just the
+    command's descendants; use a cgroup for an exact per-command bound.
+    """
+
+    memory_mb: int | None = None
+    """Address space limit (RLIMIT_AS); also memory.max in a cgroup."""
+
+    cpu_seconds: int | None = None
+    """CPU time limit (RLIMIT_CPU). SIGXCPU at the limit, SIGKILL 1s later."""
+
+    max_processes: int | None = None
+    """Process limit (RLIMIT_NPROC); also pids.max in a cgroup."""
+
+    max_file_size_mb: int | None = None
+    """Largest file the command may write (RLIMIT_FSIZE)."""
+
+    max_open_files: int | None = None
+    """Open file descriptor limit (RLIMIT_NOFILE)."""
+
+    cgroup_parent: _pathlib.Path | None = None
+    """Delegated cgroup v2 directory for per-command child cgroups."""
+
+    @property
+    def has_rlimits(self) -> bool:
+        """Whether any rlimit is configured."""
+        return any(
+            value is not None
+            for value in (
+                self.memory_mb,
+                self.cpu_seconds,
+                self.max_processes,
+                self.max_file_size_mb,
+                self.max_open_files,
+            )
+        )
+
+    def ulimit_prefix(self) -> str:
+        """
+        Bash lines that apply the rlimits before the command runs.
+
+        Limits are set as hard limits, so the command cannot raise them. The
+        CPU soft limit sits one second below the hard limit so the command
+        receives SIGXCPU (reported distinctly) rather than a bare SIGKILL.
+
+        Returns:
+            Script prefix ending in a newline, or "" if no rlimits are set
+        """
+        if not self.has_rlimits:
+            return ""
+        # bash units: -v in KiB, -f in 1024-byte blocks
+        options: list[str] = []
+        if self.memory_mb is not None:
+            options += ["-v", str(self.memory_mb * 1024)]
+        if self.max_file_size_mb is not None:
+            options += ["-f", str(self.max_file_size_mb * 1024)]
+        if self.max_open_files is not None:
+            options += ["-n", str(self.max_open_files)]
+        if self.max_processes is not None:
+            options += ["-u", str(self.max_processes)]
+        if self.cpu_seconds is not None:
+            options += ["-t", str(self.cpu_seconds + 1)]
+        line = "ulimit " + " ".join(options)
+        if self.cpu_seconds is not None:
+            line += f" && ulimit -S -t {self.cpu_seconds}"
+        return f"{line} || exit {LIMIT_SETUP_EXIT}\n"
+
+    def limit_command(self, command: str) -> str:
+        """Prefix a bash script with the rlimit setup."""
+        return self.ulimit_prefix() + command
+
+
+def in_bash(script: str) -> str:
+    """Run a bash script from a POSIX shell command line (ulimit -u/-v are bash-only)."""
+    return f"/bin/bash -c {_shlex.quote(script)}"
+
+
+# =============================================================================
+# cgroup v2
+# =============================================================================
+
+
+class CommandCgroup:
+    """
+    A cgroup v2 child created for one command and removed afterwards.
+
+    The parent must be a delegated cgroup the user can write to, with the
+    memory and pids controllers enabled in its cgroup.subtree_control.
+    """
+
+    def __init__(self, path: _pathlib.Path) -> None:
+        self.path = path
+
+    @classmethod
+    def create(cls, limits: ResourceLimits) -> CommandCgroup | None:
+        """
+        Create a child cgroup configured from limits.
+
+        Returns:
+            The cgroup, or None if no parent is configured or it is not
+            usable (not delegated, controllers missing)
+        """
+        if limits.cgroup_parent is None:
+            return None
+        path = limits.cgroup_parent / f"brynhild-{_os.getpid()}-{next(_cgroup_counter)}"
+        try:
+            path.mkdir()
+        except OSError:
+            return None
+        cgroup = cls(path)
+        try:
+            if limits.memory_mb is not None:
+                (path / "memory.max").write_text(str(limits.memory_mb * 1024 * 1024))
+                with _contextlib.suppress(FileNotFoundError):
+                    (path / "memory.swap.max").write_text("0")
+            if limits.max_processes is not None:
+                (path / "pids.max").write_text(str(limits.max_processes))
+        except OSError:
+            cgroup.remove()
+            return None
+        return cgroup
+
+    def wrap(self, command: str) -> str:
+        """Make a shell command move itself into this cgroup before running."""
+        procs = _shlex.quote(str(self.path / "cgroup.procs"))
+        return f"echo $$ > {procs} || exit {LIMIT_SETUP_EXIT}\n{command}"
+
+    def violations(self) -> list[str]:
+        """Limits this cgroup hit (read from memory.events / pids.events)."""
+        found: list[str] = []
+        if _read_event(self.path / "memory.events", "oom_kill") > 0:
+            found.append("memory")
+        if _read_event(self.path / "pids.events", "max") > 0:
+            found.append("processes")
+        return found
+
+    def kill(self) -> None:
+        """Kill every process in the cgroup (cgroup.kill, Linux 5.14+; best effort)."""
+        with _contextlib.suppress(OSError):
+            (self.path / "cgroup.kill").write_text("1")
+
+    def remove(self) -> None:
+        """Remove the cgroup (best effort; fails while processes remain)."""
+        with _contextlib.suppress(OSError):
+            self.path.rmdir()
+
+
+def _read_event(path: _pathlib.Path, key: str) -> int:
+    """Read one counter from a cgroup *.events file (0 if unavailable)."""
+    try:
+        for line in path.read_text().splitlines():
+            name, _, value = line.partition(" ")
+            if name == key:
+                return int(value)
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+# =============================================================================
+# Violation reporting
+# =============================================================================
+
+
+def _signal_of(returncode: int) -> int | None:
+    """Signal that ended the command: negative Popen codes or shell 128+N."""
+    if returncode < 0:
+        return -returncode
+    if returncode > 128:
+        return returncode - 128
+    return None
+
+
+def describe_violation(
+    limits: ResourceLimits,
+    returncode: int,
+    stderr: str,
+    cgroup_violations: list[str] | None = None,
+) -> str | None:
+    """
+    Explain a command failure caused by a resource limit.
+
+    Args:
+        limits: The limits the command ran under
+        returncode: Exit status of the (wrapped) command
+        stderr: Captured standard error
+        cgroup_violations: Result of CommandCgroup.violations(), if any
+
+    Returns:
+        A "Resource limit exceeded: ..." message, or None if the failure
+        does not look limit-related
+    """
+    if returncode == 0:
+        return None
+    lowered = stderr.lower()
+    sig = _signal_of(returncode)
+    cgroup_violations = cgroup_violations or []
+
+    if returncode == LIMIT_SETUP_EXIT and (
+        "ulimit" in lowered or "cgroup.procs" in lowered
+    ):
+        return f"Could not apply resource limits: {stderr.strip()}"
+
+    reason: str | None = None
+    if limits.cpu_seconds is not None and sig == _signal.SIGXCPU:
+        reason = f"CPU time ({limits.cpu_seconds}s)"
+    elif limits.max_file_size_mb is not None and sig == _signal.SIGXFSZ:
+        reason = f"file size ({limits.max_file_size_mb} MB)"
+    elif "memory" in cgroup_violations or (
+        limits.memory_mb is not None and any(e in lowered for e in _MEMORY_ERRORS)
+    ):
+        reason = f"memory ({limits.memory_mb} MB)"
+    elif "processes" in cgroup_violations or (
+        limits.max_processes is not None and any(e in lowered for e in _PROCESS_ERRORS)
+    ):
+        reason = f"processes ({limits.max_processes})"
+    elif limits.max_open_files is not None and "too many open files" in lowered:
+        reason = f"open files ({limits.max_open_files})"
+
+    if reason is None:
+        return None
+    return f"Resource limit exceeded: {reason}"
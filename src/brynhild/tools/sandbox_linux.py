@@ -4,14 +4,25 @@ Linux sandbox implementation using bubblewrap.
 Provides OS-level process isolation on Linux systems using bubblewrap (bwrap).
 This is the primary sandbox mechanism for Linux, as Landlock requires kernel 5.13+
 and RHEL8/Rocky8 use kernel 4.18.
+
+Whether bwrap can actually create namespaces is probed once by running it,
+and the answer is persisted in the user cache directory (keyed by the bwrap
+binary and the kernel settings that govern user namespaces), so later process
+starts skip the probe. The CLI starts the probe in a background thread so it
+overlaps the rest of startup.
 """
 
 from __future__ import annotations
 
+import json as _json
+import os as _os
 import pathlib as _pathlib
 import shlex as _shlex
 import shutil as _shutil
 import subprocess as _subprocess
+import tempfile as _tempfile
+import threading as _threading
+import typing as _typing
 
 
 class BubblewrapNotFoundError(Exception):
@@ -29,50 +40,208 @@ class BubblewrapNotFunctionalError(Exception):
 # Cache the result of the functionality test
 _bwrap_functional: bool | None = None
 
+# Serializes probing so a background probe and a caller never both run bwrap
+_probe_lock = _threading.Lock()
+
+# Cache directory registered by start_bwrap_probe() for later callers
+_probe_cache_dir: _pathlib.Path | None = None
+
+_PROBE_CACHE_FILE = "bwrap-probe.json"
+"""Name of the persisted probe result inside the cache directory."""
+
+_PROBE_TIMEOUT = 5
+"""Seconds to wait for the probe sandbox to start and exit."""
+
+_USERNS_SYSCTLS = (
+    "/proc/sys/kernel/unprivileged_userns_clone",
+    "/proc/sys/user/max_user_namespaces",
+    "/proc/sys/kernel/apparmor_restrict_unprivileged_userns",
+    "/proc/sys/kernel/unprivileged_userns_apparmor_policy",
+)
+"""Kernel settings that decide whether unprivileged user namespaces work."""
+
 
 def is_bwrap_available() -> bool:
     """Check if bubblewrap is installed and in PATH."""
     return _shutil.which("bwrap") is not None
 
 
-def is_bwrap_functional() -> bool:
-    """Check if bubblewrap can actually create sandboxes.
+def probe_fingerprint(bwrap_path: str) -> dict[str, _typing.Any]:
+    """Describe everything the probe result depends on.
 
-    On some systems (e.g., Ubuntu 24.04 with AppArmor restrictions),
-    bwrap may be installed but unable to create user namespaces.
+    A persisted result is only reused while this fingerprint is unchanged:
+    same bwrap binary (path, mtime, mode), kernel release, user and
+    user-namespace sysctls.
+
+    Args:
+        bwrap_path: Absolute path of the bwrap binary
 
     Returns:
-        True if bwrap can create sandboxes, False otherwise.
+        JSON-serializable fingerprint
     """
-    global _bwrap_functional
+    try:
+        st = _os.stat(bwrap_path)
+        binary: list[int] | None = [st.st_mtime_ns, st.st_mode]
+    except OSError:
+        binary = None
+
+    sysctls: dict[str, str | None] = {}
+    for path in _USERNS_SYSCTLS:
+        try:
+            with open(path, encoding="utf-8") as f:
+                sysctls[path] = f.read().strip()
+        except OSError:
+            sysctls[path] = None
+
+    return {
+        "bwrap": bwrap_path,
+        "binary": binary,
+        "kernel": _os.uname().release,
+        "uid": _os.geteuid(),
+        "sysctls": sysctls,
+    }
+
+
+def _load_cached_probe(
+    cache_dir: _pathlib.Path,
+    fingerprint: dict[str, _typing.Any],
+) -> bool | None:
+    """Return True if a successful probe was persisted for this fingerprint.
+
+    Failures are never reused (see is_bwrap_functional), so this returns
+    None rather than False.
+    """
+    try:
+        data = _json.loads((cache_dir / _PROBE_CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    return True if data.get("functional") is True else None
+
+
+def _save_cached_probe(
+    cache_dir: _pathlib.Path,
+    fingerprint: dict[str, _typing.Any],
+    functional: bool,
+) -> None:
+    """Persist a probe result (best effort, atomic replace)."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = _tempfile.mkstemp(dir=cache_dir, prefix=".bwrap-probe.", suffix=".tmp")
+        with _os.fdopen(fd, "w", encoding="utf-8") as f:
+            _json.dump({"fingerprint": fingerprint, "functional": functional}, f)
+        _os.replace(temp_name, cache_dir / _PROBE_CACHE_FILE)
+    except OSError:
+        pass
 
-    if _bwrap_functional is not None:
-        return _bwrap_functional
 
-    if not is_bwrap_available():
-        _bwrap_functional = False
-        return False
+def _run_probe(bwrap_path: str) -> bool | None:
+    """Try a minimal bwrap invocation.
 
-    # Try a minimal bwrap invocation
+    Returns:
+        True/False for a definitive answer, None if the probe could not
+        complete (timeout or exec error), which is not worth persisting.
+    """
     try:
         result = _subprocess.run(
             [
-                "bwrap",
+                bwrap_path,
                 "--ro-bind", "/", "/",
                 "--dev", "/dev",
                 "--proc", "/proc",
                 "/bin/true",
             ],
             capture_output=True,
-            timeout=5,
+            timeout=_PROBE_TIMEOUT,
         )
-        _bwrap_functional = result.returncode == 0
     except (OSError, _subprocess.TimeoutExpired):
-        _bwrap_functional = False
+        return None
+    return result.returncode == 0
+
+
+def _known_result(cache_dir: _pathlib.Path | None) -> bool | None:
+    """Memoized or persisted probe result, without running bwrap.
+
+    Caller must hold _probe_lock.
+    """
+    global _bwrap_functional
 
+    if _bwrap_functional is None:
+        bwrap_path = _shutil.which("bwrap")
+        if bwrap_path is None:
+            _bwrap_functional = False
+        elif cache_dir is not None:
+            _bwrap_functional = _load_cached_probe(cache_dir, probe_fingerprint(bwrap_path))
     return _bwrap_functional
 
 
+def is_bwrap_functional(cache_dir: _pathlib.Path | None = None) -> bool:
+    """Check if bubblewrap can actually create sandboxes.
+
+    On some systems (e.g., Ubuntu 24.04 with AppArmor restrictions),
+    bwrap may be installed but unable to create user namespaces.
+
+    The result is memoized for the process. When a cache directory is given
+    (or was registered by start_bwrap_probe), a successful probe is also
+    persisted across runs; a failed one is retried at the next start.
+    If a background probe is in flight, this waits for it.
+
+    Args:
+        cache_dir: Directory for the persisted probe result
+
+    Returns:
+        True if bwrap can create sandboxes, False otherwise.
+    """
+    global _bwrap_functional
+
+    with _probe_lock:
+        cache_dir = cache_dir or _probe_cache_dir
+        known = _known_result(cache_dir)
+        if known is not None:
+            return known
+
+        bwrap_path = _shutil.which("bwrap")
+        assert bwrap_path is not None  # _known_result() handles a missing bwrap
+        fingerprint = probe_fingerprint(bwrap_path)
+        functional = _run_probe(bwrap_path)
+        # Only success is persisted: a failure may be transient (a namespace
+        # error under load) and must not block every later start
+        if functional and cache_dir is not None:
+            _save_cached_probe(cache_dir, fingerprint, functional)
+        _bwrap_functional = bool(functional)
+        return _bwrap_functional
+
+
+def start_bwrap_probe(cache_dir: _pathlib.Path | None = None) -> bool | None:
+    """Start the functionality probe without blocking startup.
+
+    If the answer is already known (memoized, persisted for this
+    fingerprint, or bwrap is missing) it is returned immediately. Otherwise
+    the probe runs in a background thread and None is returned; the first
+    is_bwrap_functional()/require_bwrap() call waits for it.
+
+    Args:
+        cache_dir: Directory for the persisted probe result
+
+    Returns:
+        The probe result if known without running bwrap, else None
+    """
+    global _probe_cache_dir
+
+    if cache_dir is not None:
+        _probe_cache_dir = cache_dir
+    with _probe_lock:
+        known = _known_result(_probe_cache_dir)
+    if known is None:
+        _threading.Thread(
+            target=is_bwrap_functional,
+            name="bwrap-probe",
+            daemon=True,
+        ).start()
+    return known
+
+
 def require_bwrap() -> None:
     """Raise if bubblewrap is not available or not functional.
 
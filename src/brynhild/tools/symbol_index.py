@@ -0,0 +1,476 @@
+"""
+Persistent Python symbol table for the Symbols tool.
+
+Each Python file is parsed with ``ast`` into definitions (classes, functions,
+methods, module/class-level assignments), imports and references (name loads
+and attribute accesses, flagged when they are call sites). Parsed results are
+stored keyed by the SHA-1 of the file contents, so unchanged files are never
+reparsed and a file that reverts to earlier contents reuses its old entry.
+
+Refreshes check mtime/size first and only hash files that changed; large
+batches (cold start, branch switch) are parsed in a process pool. The table
+is persisted as JSON under the user cache directory.
+"""
+
+from __future__ import annotations
+
+import ast as _ast
+import concurrent.futures as _futures
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import hashlib as _hashlib
+import json as _json
+import logging as _logging
+import multiprocessing as _multiprocessing
+import os as _os
+import pathlib as _pathlib
+import tempfile as _tempfile
+import threading as _threading
+import typing as _typing
+
+_logger = _logging.getLogger(__name__)
+
+SYMBOL_FORMAT_VERSION = 1
+"""Bumped whenever the extracted data changes shape."""
+
+PYTHON_SUFFIXES: frozenset[str] = frozenset({".py", ".pyi"})
+"""Files with these suffixes are indexed."""
+
+DEFAULT_MAX_FILE_BYTES = 2 * 1024 * 1024
+"""Larger Python files (usually generated) are skipped."""
+
+_POOL_THRESHOLD = 64
+"""Parse in a process pool only when at least this many files changed."""
+
+_MAX_WORKERS = 8
+
+# Parsed data per file, JSON-compatible:
+#   {"defs": [[qualname, kind, line, end_line, signature], ...],
+#    "imports": [[local_name, target, line], ...],
+#    "refs": [[name, line, is_call], ...],
+#    "error": str | None}
+FileData = dict[str, _typing.Any]
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+
+class _Extractor(_ast.NodeVisitor):
+    """Collect definitions, imports and references from one module."""
+
+    def __init__(self) -> None:
+        self.defs: list[list[_typing.Any]] = []
+        self.imports: list[list[_typing.Any]] = []
+        self.refs: list[list[_typing.Any]] = []
+        self._scope: list[tuple[str, str]] = []  # (name, kind)
+        self._call_funcs: set[int] = set()
+
+    def _qualname(self, name: str) -> str:
+        return ".".join([*(s for s, _ in self._scope), name])
+
+    def _in_class_or_module(self) -> bool:
+        return not self._scope or self._scope[-1][1] == "class"
+
+    def visit_ClassDef(self, node: _ast.ClassDef) -> None:
+        bases = ", ".join(_ast.unparse(b) for b in [*node.bases, *node.keywords])
+        self.defs.append([
+            self._qualname(node.name), "class", node.lineno, node.end_lineno,
+            f"({bases})" if bases else "",
+        ])
+        self._visit_scope(node, node.name, "class")
+
+    def visit_FunctionDef(self, node: _ast.FunctionDef) -> None:
+        self._visit_function(node, "def")
+
+    def visit_AsyncFunctionDef(self, node: _ast.AsyncFunctionDef) -> None:
+        self._visit_function(node, "async def")
+
+    def _visit_function(
+        self,
+        node: _ast.FunctionDef | _ast.AsyncFunctionDef,
+        kind: str,
+    ) -> None:
+        signature = f"({_ast.unparse(node.args)})"
+        if node.returns is not None:
+            signature += f" -> {_ast.unparse(node.returns)}"
+        self.defs.append([
+            self._qualname(node.name), kind, node.lineno, node.end_lineno, signature,
+        ])
+        self._visit_scope(node, node.name, "def")
+
+    def _visit_scope(self, node: _ast.AST, name: str, kind: str) -> None:
+        self._scope.append((name, kind))
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def visit_Assign(self, node: _ast.Assign) -> None:
+        if self._in_class_or_module():
+            for target in node.targets:
+                self._add_variables(target, node)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: _ast.AnnAssign) -> None:
+        if self._in_class_or_module():
+            self._add_variables(node.target, node)
+        self.generic_visit(node)
+
+    def _add_variables(self, target: _ast.AST, node: _ast.stmt) -> None:
+        if isinstance(target, _ast.Name):
+            self.defs.append([
+                self._qualname(target.id), "variable", node.lineno, node.end_lineno, "",
+            ])
+        elif isinstance(target, _ast.Tuple | _ast.List):
+            for element in target.elts:
+                self._add_variables(element, node)
+
+    def visit_Import(self, node: _ast.Import) -> None:
+        for alias in node.names:
+            local = alias.asname or alias.name.split(".")[0]
+            self.imports.append([local, alias.name, node.lineno])
+
+    def visit_ImportFrom(self, node: _ast.ImportFrom) -> None:
+        module = "." * node.level + (node.module or "")
+        for alias in node.names:
+            target = f"{module}.{alias.name}" if node.module else f"{module}{alias.name}"
+            self.imports.append([alias.asname or alias.name, target, node.lineno])
+
+    def visit_Call(self, node: _ast.Call) -> None:
+        self._call_funcs.add(id(node.func))
+        self.generic_visit(node)
+
+    def visit_Name(self, node: _ast.Name) -> None:
+        if isinstance(node.ctx, _ast.Load):
+            self.refs.append([node.id, node.lineno, id(node) in self._call_funcs])
+
+    def visit_Attribute(self, node: _ast.Attribute) -> None:
+        if isinstance(node.ctx, _ast.Load):
+            self.refs.append([node.attr, node.lineno, id(node) in self._call_funcs])
+        self.generic_visit(node)
+
+
+def extract_symbols(source: bytes | str) -> FileData:
+    """
+    Parse one Python module into its symbol data.
+
+    Args:
+        source: Module source
+
+    Returns:
+        JSON-compatible dict with defs, imports, refs and error (None if parsed)
+    """
+    extractor = _Extractor()
+    try:
+        extractor.visit(_ast.parse(source))
+    # Deeply nested (usually generated) code exhausts the parser or visitor stack
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+        return {"defs": [], "imports": [], "refs": [], "error": f"{type(e).__name__}: {e}"}
+    return {
+        "defs": extractor.defs,
+        "imports": extractor.imports,
+        "refs": extractor.refs,
+        "error": None,
+    }
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+@_dataclasses.dataclass(slots=True)
+class Definition:
+    """A class, function, method or variable definition."""
+
+    path: str
+    qualname: str
+    kind: str
+    """One of: class, def, async def, variable."""
+
+    line: int
+    end_line: int
+    signature: str
+    """Parameter list and return annotation (functions) or bases (classes)."""
+
+
+@_dataclasses.dataclass(slots=True)
+class Reference:
+    """A use of a name."""
+
+    path: str
+    name: str
+    line: int
+    kind: str
+    """One of: call, ref, import."""
+
+
+@_dataclasses.dataclass(slots=True)
+class _FileRecord:
+    mtime: float
+    size: int
+    digest: str
+
+
+class SymbolIndex:
+    """
+    Incrementally maintained symbol table for the Python files of a project.
+
+    Thread-safe. The caller supplies the file list (with mtimes) to
+    ``refresh()``; non-Python files are ignored.
+    """
+
+    def __init__(
+        self,
+        root: _pathlib.Path,
+        *,
+        index_dir: _pathlib.Path | None = None,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Create an index. The persisted table (if any) is loaded lazily.
+
+        Args:
+            root: Directory that indexed paths are relative to
+            index_dir: Where to persist the table (None keeps it in memory only)
+            max_file_bytes: Skip files larger than this
+            max_workers: Process pool size for large batches (default: CPU count, max 8)
+        """
+        self._root = root.resolve()
+        self._index_dir = index_dir
+        self._max_file_bytes = max_file_bytes
+        self._max_workers = max_workers or min(_os.cpu_count() or 1, _MAX_WORKERS)
+
+        self._lock = _threading.RLock()
+        self._loaded = False
+        self._files: dict[str, _FileRecord] = {}
+        self._data: dict[str, FileData] = {}
+        self._dirty = False
+        self._defs_by_name: dict[str, list[Definition]] | None = None
+        self._refs_by_name: dict[str, list[Reference]] | None = None
+
+    @property
+    def root(self) -> _pathlib.Path:
+        """Resolved root directory."""
+        return self._root
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self._files)
+
+    def close(self) -> None:
+        """Persist pending changes."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def refresh(self, files: _typing.Iterable[tuple[str, float, int]]) -> tuple[int, int]:
+        """
+        Bring the table up to date with the given file list.
+
+        Args:
+            files: (relative path, mtime, size) for every project file
+
+        Returns:
+            Tuple of (files re-indexed, files removed)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            seen: set[str] = set()
+            changed: list[tuple[str, float, int]] = []
+            for rel, mtime, size in files:
+                if _pathlib.PurePosixPath(rel).suffix not in PYTHON_SUFFIXES:
+                    continue
+                if size > self._max_file_bytes:
+                    continue
+                seen.add(rel)
+                record = self._files.get(rel)
+                if record is None or record.mtime != mtime or record.size != size:
+                    changed.append((rel, mtime, size))
+            removed = [rel for rel in self._files if rel not in seen]
+            for rel in removed:
+                del self._files[rel]
+
+            # Hash changed files; only contents never seen before are parsed
+            to_parse: dict[str, bytes] = {}
+            for rel, mtime, size in changed:
+                try:
+                    source = (self._root / rel).read_bytes()
+                except OSError:
+                    self._files.pop(rel, None)
+                    continue
+                digest = _hashlib.sha1(source).hexdigest()
+                self._files[rel] = _FileRecord(mtime, size, digest)
+                if digest not in self._data:
+                    to_parse[digest] = source
+            self._data.update(self._parse_all(to_parse))
+
+            if changed or removed:
+                self._dirty = True
+                self._defs_by_name = None
+                self._refs_by_name = None
+                # Persist expensive batches right away rather than at close
+                if len(to_parse) >= _POOL_THRESHOLD:
+                    self._save()
+            return len(changed), len(removed)
+
+    def _parse_all(self, sources: dict[str, bytes]) -> dict[str, FileData]:
+        """Parse sources (keyed by digest), in a process pool for large batches."""
+        if len(sources) < _POOL_THRESHOLD or self._max_workers < 2:
+            return {digest: extract_symbols(src) for digest, src in sources.items()}
+        digests = list(sources)
+        try:
+            # spawn: forking a process that runs watcher threads is unsafe
+            with _futures.ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=_multiprocessing.get_context("spawn"),
+            ) as pool:
+                results = pool.map(
+                    extract_symbols,
+                    (sources[d] for d in digests),
+                    chunksize=max(1, len(digests) // (self._max_workers * 4)),
+                )
+                return dict(zip(digests, results, strict=True))
+        except (OSError, _futures.BrokenExecutor) as e:
+            _logger.debug("Symbol parse pool unavailable (%s); parsing inline", e)
+            return {digest: extract_symbols(src) for digest, src in sources.items()}
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def definitions(self, name: str) -> list[Definition]:
+        """
+        Definitions matching ``name``.
+
+        Args:
+            name: Simple name (``register``) or dotted qualified suffix
+                (``ToolRegistry.register``)
+
+        Returns:
+            Matching definitions, ordered by path and line
+        """
+        with self._lock:
+            self._ensure_maps()
+            assert self._defs_by_name is not None
+            candidates = self._defs_by_name.get(name.rsplit(".", 1)[-1], [])
+            if "." in name:
+                candidates = [
+                    d for d in candidates
+                    if d.qualname == name or d.qualname.endswith("." + name)
+                ]
+            return sorted(candidates, key=lambda d: (d.path, d.line))
+
+    def references(self, name: str) -> list[Reference]:
+        """
+        References to the last component of ``name`` (loads, calls, imports).
+
+        Returns:
+            Matching references, ordered by path and line
+        """
+        with self._lock:
+            self._ensure_maps()
+            assert self._refs_by_name is not None
+            refs = self._refs_by_name.get(name.rsplit(".", 1)[-1], [])
+            return sorted(refs, key=lambda r: (r.path, r.line))
+
+    def outline(self, rel: str) -> FileData | None:
+        """Parsed data for one indexed file (None if not indexed)."""
+        with self._lock:
+            self._ensure_loaded()
+            record = self._files.get(rel)
+            if record is None:
+                return None
+            return self._data.get(record.digest)
+
+    def _ensure_maps(self) -> None:
+        """Build the name -> definitions/references maps. Caller holds the lock."""
+        self._ensure_loaded()
+        if self._defs_by_name is not None:
+            return
+        defs: dict[str, list[Definition]] = {}
+        refs: dict[str, list[Reference]] = {}
+        for rel, record in self._files.items():
+            data = self._data.get(record.digest)
+            if data is None:
+                continue
+            for qualname, kind, line, end_line, signature in data["defs"]:
+                short = qualname.rsplit(".", 1)[-1]
+                defs.setdefault(short, []).append(
+                    Definition(rel, qualname, kind, line, end_line, signature)
+                )
+            for local, target, line in data["imports"]:
+                for name in {local, target.rsplit(".", 1)[-1]}:
+                    refs.setdefault(name, []).append(Reference(rel, name, line, "import"))
+            for name, line, is_call in data["refs"]:
+                refs.setdefault(name, []).append(
+                    Reference(rel, name, line, "call" if is_call else "ref")
+                )
+        self._defs_by_name = defs
+        self._refs_by_name = refs
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _table_path(self) -> _pathlib.Path | None:
+        return self._index_dir / "symbols.json" if self._index_dir is not None else None
+
+    def _ensure_loaded(self) -> None:
+        """Load the persisted table once. Caller holds the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        path = self._table_path()
+        if path is None:
+            return
+        try:
+            table = _json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.debug("Ignoring unreadable symbol table %s: %s", path, e)
+            return
+        if table.get("version") != SYMBOL_FORMAT_VERSION:
+            return
+        self._data = table["data"]
+        self._files = {
+            rel: _FileRecord(mtime, size, digest)
+            for rel, (mtime, size, digest) in table["files"].items()
+        }
+
+    def _save(self) -> None:
+        """Write the table (dropping unreferenced entries). Caller holds the lock."""
+        live = {record.digest for record in self._files.values()}
+        self._data = {digest: d for digest, d in self._data.items() if digest in live}
+        self._dirty = False
+        path = self._table_path()
+        if path is None:
+            return
+        table = {
+            "version": SYMBOL_FORMAT_VERSION,
+            "files": {
+                rel: [r.mtime, r.size, r.digest] for rel, r in self._files.items()
+            },
+            "data": self._data,
+        }
+        temp_name: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A private temp file: other sessions may save the same table
+            fd, temp_name = _tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            with _os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_json.dumps(table, separators=(",", ":")))
+            _os.replace(temp_name, path)
+            temp_name = None
+        except OSError as e:
+            _logger.warning("Could not persist symbol table to %s: %s", path, e)
+        finally:
+            if temp_name is not None:
+                with _contextlib.suppress(OSError):
+                    _os.unlink(temp_name)
@@ -0,0 +1,238 @@
+"""
+Symbols tool: Python definitions, references and file outlines.
+
+Answers "where is X defined", "who uses X" and "what is in this file" from a
+persisted ``ast``-based symbol table (see ``symbol_index``), so navigation
+takes one call instead of several rounds of Grep guesses.
+"""
+
+from __future__ import annotations
+
+import asyncio as _asyncio
+import pathlib as _pathlib
+import typing as _typing
+
+import brynhild.tools.base as base
+import brynhild.tools.project_index as project_index_module
+import brynhild.tools.sandbox as sandbox
+import brynhild.tools.symbol_index as symbol_index
+
+_DEFAULT_LIMIT = 50
+
+_OPERATIONS = ("definition", "references", "outline")
+
+
+class SymbolsTool(base.Tool, base.SandboxMixin):
+    """
+    Navigate Python code by symbol (read-only, no permission required).
+
+    Operations:
+    - definition: Where a class/function/method/variable is defined
+    - references: Call sites, uses and imports of a name
+    - outline: Classes, functions and imports of one file
+    """
+
+    def __init__(
+        self,
+        base_dir: _pathlib.Path | None = None,
+        sandbox_config: sandbox.SandboxConfig | None = None,
+        project_index: project_index_module.ProjectIndex | None = None,
+        index_dir: _pathlib.Path | None = None,
+    ) -> None:
+        """
+        Initialize the symbols tool.
+
+        Args:
+            base_dir: Project directory to index (default: cwd)
+            sandbox_config: Sandbox configuration for path validation
+            project_index: Shared project index for file enumeration
+                (default: rescan the tree before each query)
+            index_dir: Directory to persist the symbol table (default: memory only)
+        """
+        self._base_dir = base_dir or _pathlib.Path.cwd()
+        self._sandbox_config = sandbox_config
+        self._project_index = project_index
+        self._index = symbol_index.SymbolIndex(self._base_dir, index_dir=index_dir)
+
+    @property
+    def name(self) -> str:
+        return "Symbols"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Navigate Python code by symbol. Operations:\n"
+            "- 'definition': where a class/function/method/variable is defined "
+            "(name may be qualified, e.g. 'ToolRegistry.register')\n"
+            "- 'references': call sites, uses and imports of a name\n"
+            "- 'outline': classes, functions and imports of a file (path required)\n"
+            "Faster and more precise than Grep for locating Python definitions."
+        )
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    @property
+    def categories(self) -> list[str]:
+        return ["search", "code"]
+
+    @property
+    def requires_permission(self) -> bool:
+        return False  # Read-only tool
+
+    @property
+    def input_schema(self) -> dict[str, _typing.Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": list(_OPERATIONS),
+                    "description": "The operation to perform",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Symbol name for definition/references",
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Python file for outline",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Maximum number of results (default: {_DEFAULT_LIMIT})",
+                },
+            },
+            "required": ["operation"],
+        }
+
+    def close(self) -> None:
+        """Persist pending symbol table changes."""
+        self._index.close()
+
+    async def execute(self, input: dict[str, _typing.Any]) -> base.ToolResult:
+        """Execute the symbol operation."""
+        operation = input.get("operation", "").lower()
+        if operation not in _OPERATIONS:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"Unknown operation: {operation}. "
+                f"Valid operations: {', '.join(_OPERATIONS)}",
+            )
+
+        name = input.get("name", "")
+        rel = ""
+        if operation == "outline":
+            if not input.get("path"):
+                return base.ToolResult(
+                    success=False,
+                    output="",
+                    error="outline requires a path",
+                )
+            try:
+                path = self._resolve_and_validate(input["path"], "read")
+                rel = path.relative_to(self._index.root).as_posix()
+            except sandbox.PathValidationError as e:
+                return base.ToolResult(success=False, output="", error=str(e))
+            except ValueError:
+                return base.ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Path is outside the indexed project: {input['path']}",
+                )
+        elif not name:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"{operation} requires a name",
+            )
+
+        limit = input.get("limit") or _DEFAULT_LIMIT
+        try:
+            return await _asyncio.to_thread(self._run, operation, name, rel, limit)
+        except Exception as e:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error=f"Symbol lookup failed: {e}",
+            )
+
+    def _run(self, operation: str, name: str, rel: str, limit: int) -> base.ToolResult:
+        """Refresh the table and answer one query (runs in a worker thread)."""
+        files = project_index_module.snapshot_files(self._index.root, self._project_index)
+        if files is None:
+            return base.ToolResult(
+                success=False,
+                output="",
+                error="Project is too large to index; use Grep instead",
+            )
+        self._index.refresh(files)
+
+        if operation == "definition":
+            output = self._format_definitions(name, limit)
+        elif operation == "references":
+            output = self._format_references(name, limit)
+        else:
+            outline = self._format_outline(rel)
+            if outline is None:
+                return base.ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Not an indexed Python file: {rel}",
+                )
+            output = outline
+        return base.ToolResult(success=True, output=output, error=None)
+
+    def _format_definitions(self, name: str, limit: int) -> str:
+        defs = self._index.definitions(name)
+        if not defs:
+            return f"No definition found for '{name}'"
+        lines = [
+            f"{d.path}:{d.line}: {d.kind} {d.qualname}{d.signature}" for d in defs[:limit]
+        ]
+        if len(defs) > limit:
+            lines.append(f"... ({len(defs) - limit} more)")
+        return "\n".join(lines)
+
+    def _format_references(self, name: str, limit: int) -> str:
+        refs = self._index.references(name)
+        if not refs:
+            return f"No references found for '{name}'"
+
+        # Show the source line of each reference, reading each file once
+        lines = [f"{len(refs)} reference(s) to '{name.rsplit('.', 1)[-1]}'"]
+        sources: dict[str, list[str]] = {}
+        for ref in refs[:limit]:
+            if ref.path not in sources:
+                try:
+                    text = (self._index.root / ref.path).read_text(
+                        encoding="utf-8", errors="replace"
+                    )
+                    sources[ref.path] = text.splitlines()
+                except OSError:
+                    sources[ref.path] = []
+            source = sources[ref.path]
+            code = source[ref.line - 1].strip() if ref.line <= len(source) else ""
+            lines.append(f"{ref.path}:{ref.line}: [{ref.kind}] {code}")
+        if len(refs) > limit:
+            lines.append(f"... ({len(refs) - limit} more)")
+        return "\n".join(lines)
+
+    def _format_outline(self, rel: str) -> str | None:
+        data = self._index.outline(rel)
+        if data is None:
+            return None
+        lines = [rel]
+        if data["error"]:
+            lines.append(f"(could not parse: {data['error']})")
+        if data["imports"]:
+            names = dict.fromkeys(local for local, _target, _line in data["imports"])
+            lines.append("imports: " + ", ".join(names))
+        for qualname, kind, line, _end_line, signature in data["defs"]:
+            depth = qualname.count(".")
+            short = qualname.rsplit(".", 1)[-1]
+            label = short if kind == "variable" else f"{kind} {short}{signature}"
+            lines.append(f"{line:6}| {'    ' * depth}{label}")
+        return "\n".join(lines)
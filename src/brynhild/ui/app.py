@@ -21,11 +21,14 @@ import textual.widgets as _widgets
 import brynhild.api.base as api_base
 import brynhild.constants as _constants
 import brynhild.core.conversation as core_conversation
+import brynhild.core.history_pruning as history_pruning
 import brynhild.core.prompts as core_prompts
 import brynhild.core.types as core_types
+import brynhild.hooks.manager as hooks_manager
 import brynhild.logging as brynhild_logging
 import brynhild.session as session
 import brynhild.skills as skills
+import brynhild.tools.base as tools_base
 import brynhild.tools.registry as tools_registry
 import brynhild.ui.base as ui_base
 import brynhild.ui.icons as icons
@@ -410,9 +413,12 @@ class BrynhildApp(_app.App[None]):
         conv_logger: brynhild_logging.ConversationLogger | None = None,
         system_prompt: str | None = None,
         initial_messages: list[dict[str, _typing.Any]] | None = None,
+        initial_tool_metrics: dict[str, dict[str, _typing.Any]] | None = None,
         session_id: str | None = None,
         sessions_dir: _typing.Any | None = None,  # pathlib.Path, avoid import
         recovery_config: core_conversation.RecoveryConfig | None = None,
+        pruning_config: history_pruning.PruningConfig | None = None,
+        hook_manager: hooks_manager.HookManager | None = None,
     ) -> None:
         """
         Initialize the Brynhild TUI.
@@ -427,9 +433,13 @@ class BrynhildApp(_app.App[None]):
             conv_logger: Conversation logger instance.
             system_prompt: System prompt (required).
             initial_messages: Messages to preload (for session resume).
+            initial_tool_metrics: Tool metrics saved with a resumed session;
+                this session's metrics are added to them.
             session_id: Session ID for saving.
             sessions_dir: Directory to save sessions to.
             recovery_config: Configuration for tool call recovery from thinking.
+            pruning_config: Policy for stubbing stale tool results in history.
+            hook_manager: Hook manager for tool hooks; closed when the app exits.
         """
         super().__init__()
         self._provider = provider
@@ -440,6 +450,8 @@ class BrynhildApp(_app.App[None]):
         self._dry_run = dry_run
         self._conv_logger = conv_logger
         self._recovery_config = recovery_config
+        self._pruning_config = pruning_config
+        self._hook_manager = hook_manager
         if system_prompt is None:
             raise ValueError("system_prompt is required")
         self._system_prompt = system_prompt
@@ -448,6 +460,8 @@ class BrynhildApp(_app.App[None]):
         self._session_id = session_id
         self._sessions_dir = sessions_dir
         self._initial_messages = initial_messages or []
+        # Accumulated across turns (and the sessions this one resumes)
+        self._tool_metrics = tools_base.MetricsCollector.from_dict(initial_tool_metrics or {})
 
         # Conversation state - start with initial messages if provided
         self._messages: list[dict[str, _typing.Any]] = list(self._initial_messages)
@@ -665,6 +679,13 @@ class BrynhildApp(_app.App[None]):
 
         return result
 
+    def _flush_logs(self) -> None:
+        """Flush the conversation and raw logs (blocking; run in a thread)."""
+        if self._conv_logger:
+            self._conv_logger.flush()
+        if self._provider.raw_logger:
+            self._provider.raw_logger.flush()
+
     @_textual.work(exclusive=True)
     async def _process_message(self, prompt: str) -> None:
         """Process a user message and get a response.
@@ -676,6 +697,7 @@ class BrynhildApp(_app.App[None]):
         using TUICallbacks to drive the UI.
         """
         self._is_processing = True
+        processor: core_conversation.ConversationProcessor | None = None
 
         try:
             # Preprocess for skill triggers (/skill command)
@@ -743,6 +765,9 @@ class BrynhildApp(_app.App[None]):
                 dry_run=self._dry_run,
                 logger=self._conv_logger,
                 recovery_config=self._recovery_config,
+                pruning_config=self._pruning_config,
+                hook_manager=self._hook_manager,
+                session_id=self._session_id or "",
             )
 
             # Process the conversation turn
@@ -765,6 +790,10 @@ class BrynhildApp(_app.App[None]):
                 self._conv_logger.log_error(str(e), context="streaming")
 
         finally:
+            if processor is not None:
+                self._tool_metrics.merge(processor.metrics)
+            # Turn boundary: get the turn's log records on disk
+            await _asyncio.to_thread(self._flush_logs)
             self._is_processing = False
             self._current_worker = None
 
@@ -861,8 +890,11 @@ class BrynhildApp(_app.App[None]):
 
     # === Session Management ===
 
-    def on_unmount(self) -> None:
-        """Save session on exit if there were any user messages."""
+    async def on_unmount(self) -> None:
+        """Log the hook metrics and save the session if there were any user messages."""
+        if self._hook_manager is not None:
+            await self._hook_manager.aclose(logger=self._conv_logger)
+
         # Count user messages (skip system messages)
         user_messages = [m for m in self._messages if m.get("role") == "user"]
         if not user_messages:
@@ -879,6 +911,7 @@ class BrynhildApp(_app.App[None]):
             )
             sess.id = self._session_id
             sess.messages = _working_messages_to_session(self._messages)
+            sess.tool_metrics = self._tool_metrics.to_dict() or None
 
             manager = session.SessionManager(self._sessions_dir)
             manager.save(sess)
@@ -930,9 +963,12 @@ def create_app(
     conv_logger: brynhild_logging.ConversationLogger | None = None,
     system_prompt: str | None = None,
     initial_messages: list[dict[str, _typing.Any]] | None = None,
+    initial_tool_metrics: dict[str, dict[str, _typing.Any]] | None = None,
     session_id: str | None = None,
     sessions_dir: _typing.Any | None = None,
     recovery_config: core_conversation.RecoveryConfig | None = None,
+    pruning_config: history_pruning.PruningConfig | None = None,
+    hook_manager: hooks_manager.HookManager | None = None,
 ) -> BrynhildApp:
     """
     Create a Brynhild TUI app instance.
@@ -950,8 +986,11 @@ def create_app(
         conv_logger=conv_logger,
         system_prompt=system_prompt,
         initial_messages=initial_messages,
+        initial_tool_metrics=initial_tool_metrics,
         session_id=session_id,
         sessions_dir=sessions_dir,
         recovery_config=recovery_config,
+        pruning_config=pruning_config,
+        hook_manager=hook_manager,
     )
 
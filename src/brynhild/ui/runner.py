@@ -5,6 +5,7 @@ This module provides a high-level interface for running conversations
 with an LLM, using the shared ConversationProcessor for the core logic.
 """
 
+import asyncio as _asyncio
 import typing as _typing
 
 import brynhild.api.base as api_base
@@ -12,7 +13,9 @@ import brynhild.constants as _constants
 
 # Import core modules directly to avoid circular imports
 import brynhild.core.conversation as core_conversation
+import brynhild.core.history_pruning as history_pruning
 import brynhild.core.prompts as core_prompts
+import brynhild.hooks.manager as hooks_manager
 import brynhild.logging as logging
 import brynhild.skills as skills
 import brynhild.tools.registry as tools_registry
@@ -47,8 +50,11 @@ class ConversationRunner:
         logger: logging.ConversationLogger | None = None,
         markdown_logger: logging.MarkdownLogger | None = None,
         recovery_config: core_conversation.RecoveryConfig | None = None,
+        pruning_config: history_pruning.PruningConfig | None = None,
         show_thinking: bool = False,
         require_finish: bool = False,
+        hook_manager: hooks_manager.HookManager | None = None,
+        session_id: str = "",
     ) -> None:
         """
         Initialize the conversation runner.
@@ -67,8 +73,11 @@ class ConversationRunner:
             logger: Conversation logger for JSONL output.
             markdown_logger: Markdown logger for presentation output.
             recovery_config: Configuration for tool call recovery from thinking.
+            pruning_config: Policy for stubbing stale tool results in history.
             show_thinking: If True, display full thinking/reasoning content.
             require_finish: Require agent to call Finish tool to complete.
+            hook_manager: Hook manager for tool hooks; closed by aclose().
+            session_id: Session ID for hook context.
         """
         self._provider = provider
         self._renderer = renderer
@@ -79,6 +88,7 @@ class ConversationRunner:
         self._verbose = verbose
         self._logger = logger
         self._markdown_logger = markdown_logger
+        self._hook_manager = hook_manager
 
         # Create callbacks for the renderer
         self._callbacks = ui_adapters.RendererCallbacks(
@@ -102,6 +112,9 @@ class ConversationRunner:
             markdown_logger=markdown_logger,
             recovery_config=recovery_config,
             require_finish=require_finish,
+            pruning_config=pruning_config,
+            hook_manager=hook_manager,
+            session_id=session_id,
         )
 
         # Conversation state
@@ -165,6 +178,26 @@ class ConversationRunner:
 
         return user_message, preprocess_result.skill_name
 
+    async def aclose(self) -> None:
+        """
+        End the session: finish background hooks and log the hook metrics.
+
+        Call before closing the conversation logger.
+        """
+        if self._hook_manager is not None:
+            await self._hook_manager.aclose(logger=self._logger)
+
+    def _flush_logs(self) -> None:
+        """
+        Get the turn's log records on disk before the next turn starts.
+
+        Blocks until the writer threads are done; run it with asyncio.to_thread.
+        """
+        if self._logger:
+            self._logger.flush()
+        if self._provider.raw_logger:
+            self._provider.raw_logger.flush()
+
     async def run_streaming(
         self,
         prompt: str,
@@ -189,10 +222,13 @@ class ConversationRunner:
             self._logger.log_user_message(user_message)
 
         # Process with streaming
-        result = await self._processor.process_streaming(
-            messages=self._messages,
-            system_prompt=self._system_prompt,
-        )
+        try:
+            result = await self._processor.process_streaming(
+                messages=self._messages,
+                system_prompt=self._system_prompt,
+            )
+        finally:
+            await _asyncio.to_thread(self._flush_logs)
 
         # Update message history with assistant response
         if result.response_text:
@@ -259,10 +295,13 @@ class ConversationRunner:
             self._logger.log_user_message(user_message)
 
         # Process without streaming
-        result = await self._processor.process_complete(
-            messages=self._messages,
-            system_prompt=self._system_prompt,
-        )
+        try:
+            result = await self._processor.process_complete(
+                messages=self._messages,
+                system_prompt=self._system_prompt,
+            )
+        finally:
+            await _asyncio.to_thread(self._flush_logs)
 
         # Update message history with assistant response
         if result.response_text:
@@ -0,0 +1,168 @@
+"""Tests for the incrementally maintained provider message list."""
+
+import json as _json
+import typing as _typing
+
+import pytest as _pytest
+
+import brynhild.api.message_cache as message_cache
+import brynhild.api.ollama_provider as ollama_provider
+import brynhild.api.openrouter_provider as openrouter_provider
+import brynhild.api.types as api_types
+
+
+def _history() -> list[dict[str, _typing.Any]]:
+    return [
+        {"role": "user", "content": "Fix the bug"},
+        {
+            "role": "assistant",
+            "content": "",
+            "reasoning": "Need to read the file first.",
+            "tool_calls": [
+                {
+                    "id": "call-1",
+                    "type": "function",
+                    "function": {"name": "Read", "arguments": '{"file_path": "a.py"}'},
+                }
+            ],
+        },
+        {"role": "tool_result", "tool_use_id": "call-1", "content": "print('héllo')"},
+    ]
+
+
+def _uncached(
+    provider: openrouter_provider.OpenRouterProvider,
+    messages: list[dict[str, _typing.Any]],
+    system: str | None = None,
+) -> list[dict[str, _typing.Any]]:
+    """What a fresh provider (empty cache) formats."""
+    fresh = openrouter_provider.OpenRouterProvider(model=provider.model, api_key="fake-key")
+    return fresh._format_messages(messages, system=system)
+
+
+@_pytest.fixture
+def provider(monkeypatch: _pytest.MonkeyPatch) -> openrouter_provider.OpenRouterProvider:
+    monkeypatch.setattr(
+        openrouter_provider.OpenRouterProvider,
+        "_get_reasoning_format",
+        lambda _self: "reasoning_field",
+    )
+    return openrouter_provider.OpenRouterProvider(model="test", api_key="fake-key")
+
+
+class TestFormattedMessageCache:
+    """Tests for FormattedMessageCache via the providers."""
+
+    def test_only_new_messages_formatted(
+        self, provider: openrouter_provider.OpenRouterProvider
+    ) -> None:
+        messages = _history()
+        provider._format_messages(messages, system="sys")
+        cache = provider._message_cache
+        assert (cache.hits, cache.misses) == (0, 3)
+
+        messages += [
+            {"role": "assistant", "content": "", "tool_calls": []},
+            {"role": "tool_result", "tool_use_id": "call-2", "content": "ok"},
+        ]
+        formatted = provider._format_messages(messages, system="sys")
+
+        assert (cache.hits, cache.misses) == (3, 5)
+        assert formatted == _uncached(provider, messages, "sys")
+
+    def test_rewritten_history_reformatted(
+        self, provider: openrouter_provider.OpenRouterProvider
+    ) -> None:
+        messages = _history()
+        provider._format_messages(messages, system=None)
+
+        # Replaced message object, and content replaced in place
+        messages[0] = {"role": "user", "content": "Something else"}
+        messages[2]["content"] = "[Pruned: Read output removed]"
+        formatted = provider._format_messages(messages, system=None)
+
+        assert formatted[0]["content"] == "Something else"
+        assert formatted[2]["content"] == "[Pruned: Read output removed]"
+        assert provider._message_cache.hits == 0
+
+    def test_reasoning_rule_flip(self, provider: openrouter_provider.OpenRouterProvider) -> None:
+        messages = _history()
+        in_loop = provider._format_messages(messages, system=None)
+        assert in_loop[1]["reasoning"] == "Need to read the file first."
+
+        messages.append({"role": "assistant", "content": "Fixed."})
+        after = provider._format_messages(messages, system=None)
+
+        assert "reasoning" not in after[1]
+        assert after == _uncached(provider, messages)
+        # The user message before the reasoning was still reused
+        assert provider._message_cache.hits == 1
+
+    def test_dropped_messages(self) -> None:
+        cache = message_cache.FormattedMessageCache()
+        messages = [{"role": "user", "content": "a"}, {"role": "other", "content": "b"}]
+
+        def format_message(
+            msg: dict[str, _typing.Any], _reasoning: _typing.Any
+        ) -> dict[str, _typing.Any] | None:
+            return dict(msg) if msg["role"] == "user" else None
+
+        assert cache.format(messages, None, format_message) == [messages[0]]
+        assert cache.format(messages, None, format_message) == [messages[0]]
+        assert cache.hits == 2
+
+    def test_fork_has_own_cache(self, provider: openrouter_provider.OpenRouterProvider) -> None:
+        """Side requests on a fork leave the conversation's cache intact."""
+        messages = _history()
+        provider._format_messages(messages, system="sys")
+        forked = provider.fork()
+
+        forked._format_messages([{"role": "user", "content": "Is this safe?"}], system=None)
+        provider._format_messages(messages, system="sys")
+
+        assert forked._client is provider._client
+        assert forked._message_cache is not provider._message_cache
+        assert (provider._message_cache.hits, provider._message_cache.misses) == (3, 3)
+
+
+class TestEncodePayload:
+    """Tests for serializing payloads with cached message JSON."""
+
+    def test_equivalent_to_json(self, provider: openrouter_provider.OpenRouterProvider) -> None:
+        messages = _history()
+        for _ in range(2):
+            payload = provider._build_payload(messages, "sys", None, 100, stream=True)
+
+            body = provider._message_cache.encode_payload(payload)
+
+            assert _json.loads(body) == payload
+            assert "héllo" in body.decode()
+
+    def test_payload_without_other_fields(self) -> None:
+        cache = message_cache.FormattedMessageCache()
+
+        assert _json.loads(cache.encode_payload({"messages": []})) == {"messages": []}
+
+    def test_ollama_uses_cache(self) -> None:
+        provider = ollama_provider.OllamaProvider(model="test")
+        messages = [{"role": "user", "content": "Hello"}]
+        provider._format_messages(messages, system=None)
+
+        payload = provider._build_payload(messages, None, None, 100, stream=False)
+
+        assert provider._message_cache.hits == 1
+        assert _json.loads(provider._message_cache.encode_payload(payload)) == payload
+
+    def test_tool_json_reused(self, provider: openrouter_provider.OpenRouterProvider) -> None:
+        tool = api_types.Tool(
+            name="Read",
+            description="Read a file",
+            input_schema={"type": "object", "properties": {"file_path": {"type": "string"}}},
+        )
+        payload = provider._build_payload(_history(), None, [tool], 100, stream=False)
+
+        body = provider._message_cache.encode_payload(payload, [tool])
+
+        assert _json.loads(body) == payload
+        assert tool.to_json("openai") in body.decode()
+        assert payload["tools"][0] is tool.to_openai_format()
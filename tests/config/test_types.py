@@ -266,6 +266,20 @@ class TestSandboxConfig:
         assert config.allow_network is True
         assert config.allowed_paths == ["/custom/path"]
 
+    def test_limits(self) -> None:
+        """Resource limits default to unset and reject non-positive values."""
+        assert types.SandboxConfig().limits.memory_mb is None
+
+        config = types.SandboxConfig.model_validate(
+            {"limits": {"memory_mb": 2048, "max_processes": 256}}
+        )
+        assert config.limits.memory_mb == 2048
+        assert config.limits.max_processes == 256
+        assert config.limits.cgroup is None
+
+        with _pytest.raises(_pydantic.ValidationError):
+            types.SandboxConfig.model_validate({"limits": {"cpu_seconds": 0}})
+
 
 class TestSandboxConfigPathParsing:
     """Tests for allowed_paths colon-delimited parsing (Unix convention)."""
@@ -737,6 +751,20 @@ class TestToolsConfig:
         assert tool_config.require_approval == "always"
         assert tool_config.blocked_commands == ["rm -rf /"]
 
+    def test_timeouts(self) -> None:
+        """timeout_seconds is a reserved key; per-tool values land in instances."""
+        config = types.ToolsConfig.model_validate(
+            {"timeout_seconds": 60, "Grep": {"timeout_seconds": 5}}
+        )
+
+        assert config.timeout_seconds == 60
+        assert "timeout_seconds" not in config.instances
+        assert config.get_tool_config("Grep").timeout_seconds == 5
+        assert types.ToolsConfig().timeout_seconds == 300
+        assert types.ToolsConfig(timeout_seconds=None).timeout_seconds is None
+        with _pytest.raises(_pydantic.ValidationError):
+            types.ToolsConfig(timeout_seconds=0)
+
 
 # =============================================================================
 # Dynamic Container Introspection Tests
@@ -474,6 +474,27 @@ class TestToolResultTruncation:
         assert "TRUNCATED" in message["content"]
 
 
+class TestDeduplicationSavings:
+    """Tests for the deduplicated_tokens reported with usage."""
+
+    def test_savings_reported_once(self) -> None:
+        """Each usage event reports only the savings since the previous one."""
+        processor = conversation.ConversationProcessor(
+            provider=MockProvider(),
+            callbacks=MockCallbacks(),
+        )
+        output = "".join(f"line number {i} of the file\n" for i in range(100))
+        result = tools_base.ToolResult(success=True, output=output, error=None)
+
+        for tool_id in ("call-1", "call-2"):
+            tool_use = api_types.ToolUse(id=tool_id, name="Read", input={"file_path": "a.py"})
+            processor._format_tool_result(tool_use, result)
+
+        saved = processor._take_dedup_saved_tokens()
+        assert saved is not None and saved > 0
+        assert processor._take_dedup_saved_tokens() is None
+
+
 # =============================================================================
 # Finish Tool Integration Tests
 # =============================================================================
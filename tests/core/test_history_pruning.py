@@ -0,0 +1,153 @@
+"""Tests for core/history_pruning.py."""
+
+import typing as _typing
+
+import pytest as _pytest
+
+import brynhild.api.types as api_types
+import brynhild.core.history_pruning as history_pruning
+import brynhild.core.types as core_types
+import brynhild.profiles.types as profiles_types
+import brynhild.tools.base as tools_base
+
+_FILE = "".join(f"{i:6}\tline number {i} of the file\n" for i in range(1, 51))
+
+
+def _round(
+    *calls: tuple[str, str, dict[str, _typing.Any], str],
+) -> list[dict[str, _typing.Any]]:
+    """An assistant tool call message followed by its results."""
+    uses = [api_types.ToolUse(id=i, name=n, input=inp) for i, n, inp, _ in calls]
+    messages = [core_types.format_assistant_tool_call(uses)]
+    for tool_id, _, _, output in calls:
+        result = tools_base.ToolResult(success=True, output=output, error=None)
+        messages.append(core_types.format_tool_result_message(tool_id, result))
+    return messages
+
+
+def _contents(messages: list[dict[str, _typing.Any]]) -> dict[str, str]:
+    return {m["tool_use_id"]: m["content"] for m in messages if m["role"] == "tool_result"}
+
+
+class TestPruneToolResults:
+    """Tests for prune_tool_results()."""
+
+    def test_disabled_by_default(self) -> None:
+        messages = _round(("r1", "Read", {"file_path": "a.py"}, _FILE))
+        config = history_pruning.PruningConfig()
+
+        assert not config.enabled
+        assert history_pruning.prune_tool_results(messages, config) == []
+
+    def test_old_rounds_become_stubs(self) -> None:
+        messages = [{"role": "user", "content": "go"}]
+        for i in range(4):
+            messages += _round((f"call-{i}", "Bash", {"command": f"cmd {i}"}, _FILE))
+        config = history_pruning.PruningConfig(keep_rounds=2)
+
+        pruned = history_pruning.prune_tool_results(messages, config)
+
+        assert pruned == ["call-0", "call-1"]
+        contents = _contents(messages)
+        assert contents["call-0"].startswith(history_pruning.PRUNED_PREFIX)
+        assert "3 tool rounds ago" in contents["call-0"]
+        assert contents["call-2"] == contents["call-3"] == _FILE
+        # Pruning again changes nothing
+        assert history_pruning.prune_tool_results(messages, config) == []
+
+    def test_superseded_read(self) -> None:
+        messages = _round(
+            ("read-a", "Read", {"file_path": "a.py"}, _FILE),
+            ("read-b", "Read", {"file_path": "b.py"}, _FILE),
+        )
+        messages += _round(("edit-a", "Edit", {"file_path": "./a.py"}, "Edited a.py"))
+        config = history_pruning.PruningConfig(prune_superseded_reads=True)
+
+        pruned = history_pruning.prune_tool_results(messages, config)
+
+        assert pruned == ["read-a"]
+        assert "modified afterwards by tool call edit-a" in _contents(messages)["read-a"]
+
+    def test_read_many_needs_every_file_written(self) -> None:
+        files = [{"file_path": "a.py"}, {"file_path": "b.py"}]
+        messages = _round(("many", "ReadMany", {"files": files}, _FILE))
+        messages += _round(("write-a", "Write", {"file_path": "a.py"}, "Wrote a.py"))
+        config = history_pruning.PruningConfig(prune_superseded_reads=True)
+
+        assert history_pruning.prune_tool_results(messages, config) == []
+
+        messages += _round(
+            ("edits", "MultiEdit", {"edits": [{"file_path": "b.py"}]}, "Edited b.py")
+        )
+        assert history_pruning.prune_tool_results(messages, config) == ["many"]
+
+    def test_failed_write_does_not_supersede(self) -> None:
+        messages = _round(("read", "Read", {"file_path": "a.py"}, _FILE))
+        messages += _round(("edit", "Edit", {"file_path": "a.py"}, ""))
+        messages[-1]["is_error"] = True
+        config = history_pruning.PruningConfig(prune_superseded_reads=True)
+
+        assert history_pruning.prune_tool_results(messages, config) == []
+
+    def test_referenced_results_kept(self) -> None:
+        """A result that a deduplication marker points to stays in full."""
+        messages = _round(("call-0", "Read", {"file_path": "a.py"}, _FILE))
+        messages += _round(
+            (
+                "call-1",
+                "Read",
+                {"file_path": "a.py"},
+                "[Unchanged: this output is identical to the result of "
+                "tool call call-0 (Read) above; refer to that result.]",
+            )
+        )
+        messages += _round(("call-2", "Bash", {"command": "ls"}, _FILE))
+        config = history_pruning.PruningConfig(keep_rounds=1)
+
+        pruned = history_pruning.prune_tool_results(messages, config)
+
+        assert "call-0" not in pruned
+        assert _contents(messages)["call-0"] == _FILE
+
+    def test_pairing_kept_and_originals_untouched(self) -> None:
+        messages = _round(("call-0", "Read", {"file_path": "a.py"}, _FILE))
+        messages += _round(("call-1", "Read", {"file_path": "b.py"}, _FILE))
+        original = list(messages)
+
+        history_pruning.prune_tool_results(messages, history_pruning.PruningConfig(keep_rounds=1))
+
+        assert [m["role"] for m in messages] == [m["role"] for m in original]
+        assert [m.get("tool_use_id") for m in messages] == [m.get("tool_use_id") for m in original]
+        assert original[1]["content"] == _FILE
+        assert messages[1] is not original[1]
+
+    def test_short_results_not_stubbed(self) -> None:
+        messages = _round(("call-0", "Bash", {"command": "true"}, "ok"))
+        messages += _round(("call-1", "Bash", {"command": "true"}, "ok"))
+
+        pruned = history_pruning.prune_tool_results(
+            messages, history_pruning.PruningConfig(keep_rounds=1)
+        )
+
+        assert pruned == []
+
+
+def test_config_from_profile() -> None:
+    profile = profiles_types.ModelProfile(
+        name="test",
+        prune_tool_results_after_rounds=5,
+        prune_superseded_reads=True,
+    )
+
+    config = history_pruning.PruningConfig.from_profile(profile)
+
+    assert (config.keep_rounds, config.prune_superseded_reads) == (5, True)
+
+
+@_pytest.mark.parametrize("rounds", [0, -1])
+def test_keep_rounds_below_one_rejected(rounds: int) -> None:
+    """Pruning the current round would stub results before the model sees them."""
+    with _pytest.raises(ValueError, match="at least 1"):
+        profiles_types.ModelProfile(name="test", prune_tool_results_after_rounds=rounds)
+    with _pytest.raises(ValueError, match="at least 1"):
+        history_pruning.PruningConfig(keep_rounds=rounds)
@@ -0,0 +1,173 @@
+"""Tests for core/result_dedup.py."""
+
+import typing as _typing
+
+import brynhild.api.types as api_types
+import brynhild.core.result_dedup as result_dedup
+import brynhild.core.types as core_types
+import brynhild.tools.base as tools_base
+
+_FILE = "".join(f"{i:6}\tline number {i} of the file\n" for i in range(1, 101))
+
+
+def _call(
+    tool_id: str,
+    name: str = "Read",
+    tool_input: dict[str, _typing.Any] | None = None,
+) -> api_types.ToolUse:
+    return api_types.ToolUse(
+        id=tool_id,
+        name=name,
+        input=tool_input if tool_input is not None else {"file_path": "a.py"},
+    )
+
+
+def _message(
+    tool_use: api_types.ToolUse, output: str, success: bool = True
+) -> dict[str, _typing.Any]:
+    result = tools_base.ToolResult(
+        success=success,
+        output=output if success else "",
+        error=None if success else output,
+    )
+    return core_types.format_tool_result_message(tool_use.id, result)
+
+
+class TestToolResultDeduplicator:
+    """Tests for ToolResultDeduplicator."""
+
+    def test_identical_output_becomes_reference(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        assert dedup.apply(first, _message(first, _FILE)) is None
+
+        second = _call("call-2")
+        message = _message(second, _FILE)
+        replacement = dedup.apply(second, message)
+
+        assert replacement is not None
+        assert (replacement.kind, replacement.reference_id) == ("unchanged", "call-1")
+        assert message["content"].startswith("[Unchanged: ")
+        assert "call-1" in message["content"]
+        assert replacement.original == _FILE
+
+    def test_identical_output_of_other_tool(self) -> None:
+        """Identical content is recognized whichever tool produced it."""
+        dedup = result_dedup.ToolResultDeduplicator()
+        read = _call("call-1")
+        dedup.apply(read, _message(read, _FILE))
+
+        bash = _call("call-2", "Bash", {"command": "cat a.py"})
+        replacement = dedup.apply(bash, _message(bash, _FILE))
+
+        assert replacement is not None
+        assert replacement.reference_id == "call-1"
+
+    def test_small_change_becomes_diff(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        dedup.apply(first, _message(first, _FILE))
+
+        edited = _FILE.replace("line number 50 of", "line fifty of")
+        second = _call("call-2")
+        message = _message(second, edited)
+        replacement = dedup.apply(second, message)
+
+        assert replacement is not None
+        assert replacement.kind == "diff"
+        content = message["content"]
+        assert content.startswith("[Changed since tool call call-1 (Read)")
+        assert "-    50\tline number 50 of the file" in content
+        assert "+    50\tline fifty of the file" in content
+        assert len(content) < len(edited) / 4
+
+    def test_large_change_sent_in_full(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        dedup.apply(first, _message(first, _FILE))
+
+        rewritten = _FILE.replace("line number", "row")
+        second = _call("call-2")
+        message = _message(second, rewritten)
+
+        assert dedup.apply(second, message) is None
+        assert message["content"] == rewritten
+
+    def test_diff_only_for_same_call(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        dedup.apply(first, _message(first, _FILE))
+
+        other = _call("call-2", tool_input={"file_path": "b.py"})
+        message = _message(other, _FILE.replace("number 50", "fifty"))
+
+        assert dedup.apply(other, message) is None
+
+    def test_small_and_error_results_untouched(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        for i in range(2):
+            call = _call(f"small-{i}")
+            assert dedup.apply(call, _message(call, "short output")) is None
+        for i in range(2):
+            call = _call(f"error-{i}")
+            assert dedup.apply(call, _message(call, _FILE, success=False)) is None
+
+    def test_seed_from_history(self) -> None:
+        """Results from earlier turns are referenced; markers are not."""
+        first = _call("call-1")
+        marker = _call("call-2")
+        history = [
+            core_types.format_assistant_tool_call([first, marker]),
+            _message(first, _FILE),
+            {
+                "role": "tool_result",
+                "tool_use_id": "call-2",
+                "content": "[Unchanged: see call-1]" + "x" * 500,
+                "is_error": False,
+            },
+        ]
+        dedup = result_dedup.ToolResultDeduplicator()
+        dedup.seed(history)
+
+        third = _call("call-3")
+        replacement = dedup.apply(third, _message(third, _FILE))
+
+        assert replacement is not None
+        assert replacement.reference_id == "call-1"
+
+    def test_seed_drops_results_of_earlier_turns(self) -> None:
+        """A result left out of the next turn's history is not referenced."""
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        dedup.seed([])
+        dedup.apply(first, _message(first, _FILE))
+
+        # The next turn's history keeps only the text of the first turn
+        dedup.seed(
+            [
+                {"role": "user", "content": "read a.py"},
+                {"role": "assistant", "content": "Done."},
+            ]
+        )
+        second = _call("call-2")
+        message = _message(second, _FILE)
+
+        assert dedup.apply(second, message) is None
+        assert message["content"] == _FILE
+
+        # The full result is in this turn's history, so a third read refers to it
+        third = _call("call-3")
+        replacement = dedup.apply(third, _message(third, _FILE))
+        assert replacement is not None
+        assert replacement.reference_id == "call-2"
+
+    def test_forget(self) -> None:
+        dedup = result_dedup.ToolResultDeduplicator()
+        first = _call("call-1")
+        dedup.apply(first, _message(first, _FILE))
+
+        dedup.forget("call-1")
+        second = _call("call-2")
+
+        assert dedup.apply(second, _message(second, _FILE)) is None
+        assert dedup.replacements == []
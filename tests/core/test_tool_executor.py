@@ -1,5 +1,6 @@
 """Tests for core/tool_executor.py."""
 
+import asyncio as _asyncio
 import typing as _typing
 
 import pytest as _pytest
@@ -20,6 +21,7 @@ class MockTool(tools_base.Tool):
         requires_permission: bool = True,
         execute_result: tools_base.ToolResult | None = None,
         execute_exception: Exception | None = None,
+        delay: float = 0.0,
     ) -> None:
         self._name = name
         self._requires_permission = requires_permission
@@ -27,6 +29,7 @@ class MockTool(tools_base.Tool):
             success=True, output="mock output", error=None
         )
         self._execute_exception = execute_exception
+        self._delay = delay
         self.execute_called = False
         self.execute_input: dict[str, _typing.Any] | None = None
 
@@ -49,6 +52,8 @@ class MockTool(tools_base.Tool):
     async def execute(self, input: dict[str, _typing.Any]) -> tools_base.ToolResult:
         self.execute_called = True
         self.execute_input = input
+        if self._delay:
+            await _asyncio.sleep(self._delay)
         if self._execute_exception:
             raise self._execute_exception
         return self._execute_result
@@ -238,3 +243,42 @@ class TestToolExecutor:
         assert len(callbacks.tool_calls) == 1
         assert len(callbacks.permission_requests) == 1
         assert callbacks.tool_calls[0].tool_name == "MockTool"
+
+    @_pytest.mark.asyncio
+    async def test_user_cancel_stops_tool(self) -> None:
+        """The callbacks' is_cancelled() cancels a running tool."""
+        tool = MockTool(requires_permission=False, delay=10.0)
+        registry = tools_registry.ToolRegistry()
+        registry.register(tool)
+        callbacks = MockCallbacks()
+        callbacks.is_cancelled = lambda: True  # type: ignore[method-assign]
+
+        executor = tool_executor.ToolExecutor(tool_registry=registry, callbacks=callbacks)
+        result = await _asyncio.wait_for(executor.execute(self._make_tool_use()), timeout=5)
+
+        assert result.success is False
+        assert result.error == "Cancelled by user"
+        metrics = executor.metrics.get("MockTool")
+        assert metrics is not None and metrics.failure_count == 1
+
+    @_pytest.mark.asyncio
+    async def test_deadline_recorded_as_timeout(self) -> None:
+        """A tool that overruns its deadline is cancelled and counted as a timeout."""
+        tool = MockTool(requires_permission=False, delay=10.0)
+        registry = tools_registry.ToolRegistry()
+        registry.register(tool)
+        registry.set_timeout(0.05)
+
+        executor = tool_executor.ToolExecutor(
+            tool_registry=registry,
+            callbacks=MockCallbacks(),
+        )
+
+        result = await executor.execute(self._make_tool_use())
+
+        assert result.success is False
+        assert result.error == "Tool 'MockTool' timed out after 0.05s"
+        metrics = executor.metrics.get("MockTool")
+        assert metrics is not None
+        assert (metrics.failure_count, metrics.timeout_count) == (1, 1)
+        assert executor.metrics.summary()["total_timeouts"] == 1
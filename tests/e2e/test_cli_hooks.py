@@ -4,12 +4,15 @@ End-to-end tests for CLI hooks commands.
 Tests the `brynhild hooks` subcommands.
 """
 
+import json as _json
 import pathlib as _pathlib
 
 import click.testing as _click_testing
 import pytest as _pytest
 
 import brynhild.cli as cli
+import brynhild.hooks.metrics as hooks_metrics
+import brynhild.logging.files as logging_files
 
 
 @_pytest.mark.e2e
@@ -88,3 +91,63 @@ hooks:
     # Should report an error (either non-zero exit or error message)
     # The exact behavior depends on implementation
     assert result.exit_code != 0 or "error" in result.output.lower()
+
+
+@_pytest.mark.e2e
+def test_hooks_stats_aggregates_logs(
+    cli_runner: _click_testing.CliRunner,
+    tmp_path: _pathlib.Path,
+) -> None:
+    """CLI hooks stats combines the hook metrics of several logs."""
+    logs = []
+    for i, durations in enumerate(([5.0, 12.0], [400.0])):
+        collector = hooks_metrics.HookMetricsCollector()
+        for ms in durations:
+            collector.record("guard", "pre_tool_use", "continue", ms)
+        log = tmp_path / f"log{i}.jsonl"
+        log.write_text(
+            _json.dumps({"event_type": "user_message", "content": "hi"})
+            + "\n"
+            + _json.dumps({"event_type": "hook_metrics", "hooks": collector.to_dict()})
+            + "\n"
+        )
+        logs += ["--log", str(log)]
+
+    result = cli_runner.invoke(cli.cli, ["hooks", "stats", "--json", *logs])
+
+    assert result.exit_code == 0
+    guard = _json.loads(result.output)["hooks"]["pre_tool_use:guard"]
+    assert guard["call_count"] == 3
+    assert guard["max_ms"] == 400.0
+
+    table = cli_runner.invoke(cli.cli, ["hooks", "stats", *logs])
+    assert table.exit_code == 0
+    assert "guard" in table.output
+    assert "p99" in table.output
+
+
+@_pytest.mark.e2e
+def test_hooks_stats_skips_unreadable_logs(
+    cli_runner: _click_testing.CliRunner,
+    tmp_path: _pathlib.Path,
+    monkeypatch: _pytest.MonkeyPatch,
+) -> None:
+    """CLI hooks stats warns about a zstd log it can't read and uses the others."""
+    monkeypatch.setattr(logging_files, "_import_zstd", lambda: None)
+    collector = hooks_metrics.HookMetricsCollector()
+    collector.record("guard", "pre_tool_use", "continue", 5.0)
+    readable = tmp_path / "brynhild_1.jsonl"
+    readable.write_text(
+        _json.dumps({"event_type": "hook_metrics", "hooks": collector.to_dict()}) + "\n"
+    )
+    compressed = tmp_path / "brynhild_2.jsonl.zst"
+    compressed.write_bytes(b"\x28\xb5\x2f\xfd")
+
+    result = cli_runner.invoke(
+        cli.cli, ["hooks", "stats", "--json", "--log", str(compressed), "--log", str(readable)]
+    )
+
+    assert result.exit_code == 0
+    assert _json.loads(result.stdout)["hooks"]["pre_tool_use:guard"]["call_count"] == 1
+    assert "skipping" in result.stderr
+    assert "brynhild[zstd]" in result.stderr
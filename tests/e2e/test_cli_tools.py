@@ -5,6 +5,7 @@ Tests the `brynhild tools` subcommands.
 """
 
 import json as _json
+import pathlib as _pathlib
 
 import click.testing as _click_testing
 import pytest as _pytest
@@ -65,3 +66,38 @@ def test_tools_schema_shows_json_schema(
     assert data["name"] == "Bash"
     assert "input_schema" in data
     assert "command" in data["input_schema"]["properties"]
+
+
+@_pytest.mark.e2e
+def test_tools_stats_aggregates_logs(
+    cli_runner: _click_testing.CliRunner,
+    tmp_path: _pathlib.Path,
+) -> None:
+    """CLI tools stats combines several logs and writes a Prometheus textfile."""
+    logs = []
+    for i, durations in enumerate(([5.0, 12.0], [400.0])):
+        log = tmp_path / f"log{i}.jsonl"
+        log.write_text(
+            "".join(
+                _json.dumps({
+                    "event_type": "tool_result",
+                    "tool_name": "Grep",
+                    "success": True,
+                    "duration_ms": ms,
+                })
+                + "\n"
+                for ms in durations
+            )
+        )
+        logs += ["--log", str(log)]
+    prom = tmp_path / "brynhild.prom"
+
+    result = cli_runner.invoke(
+        cli.cli, ["tools", "stats", "--json", "--prometheus", str(prom), *logs]
+    )
+
+    assert result.exit_code == 0
+    grep = _json.loads(result.output)["tools"]["Grep"]
+    assert grep["call_count"] == 3
+    assert grep["max_ms"] == 400.0
+    assert 'brynhild_tool_duration_seconds_count{tool="Grep"} 3' in prom.read_text()
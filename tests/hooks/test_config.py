@@ -96,6 +96,32 @@ class TestHookDefinition:
         )
         assert hook.match["tool"] == "Bash"
 
+    def test_observe_only_inferred_from_event(self) -> None:
+        """Hooks of notification-only events are observe-only by default."""
+        hook = config.HookDefinition(name="h", type="command", command="true")
+        assert hook.is_observe_only(events.HookEvent.SESSION_END) is True
+        assert hook.is_observe_only(events.HookEvent.PRE_TOOL_USE) is False
+
+        pinned = config.HookDefinition(name="h", type="command", command="true", observe_only=False)
+        assert pinned.is_observe_only(events.HookEvent.SESSION_END) is False
+
+        background = config.HookDefinition(
+            name="h", type="command", command="true", background=True
+        )
+        assert background.is_observe_only(events.HookEvent.PRE_TOOL_USE) is True
+
+    def test_persistent_requires_script_hook(self) -> None:
+        """persistent: true is rejected for non-script hooks."""
+        with _pytest.raises(ValueError, match="persistent"):
+            config.HookDefinition(name="h", type="command", command="true", persistent=True)
+
+    def test_background_cannot_disable_observe_only(self) -> None:
+        """background: true with observe_only: false is rejected."""
+        with _pytest.raises(ValueError, match="background"):
+            config.HookDefinition(
+                name="h", type="command", command="true", background=True, observe_only=False
+            )
+
     def test_enabled_default_true(self) -> None:
         """Hooks are enabled by default."""
         hook = config.HookDefinition(
@@ -152,6 +178,31 @@ class TestHooksConfig:
         assert len(hooks) == 1
         assert hooks[0].name == "enabled"
 
+    def test_get_candidate_hooks_indexed_by_tool(self) -> None:
+        """Hooks with an exact tool condition are only candidates for that tool."""
+        hooks = [
+            config.HookDefinition(
+                name=name, type="command", command="true", match=match, enabled=enabled
+            )
+            for name, match, enabled in [
+                ("bash", {"tool": "Bash"}, True),
+                ("any", {}, True),
+                ("files", {"tool": "^(Read|Write)$"}, True),
+                ("glob", {"tool": "Web*"}, True),
+                ("disabled", {"tool": "Bash"}, False),
+            ]
+        ]
+        cfg = config.HooksConfig(hooks={"pre_tool_use": hooks})
+        event = events.HookEvent.PRE_TOOL_USE
+
+        def names(tool: str | None) -> list[str]:
+            return [h.name for h in cfg.get_candidate_hooks(event, tool)]
+
+        assert names("Bash") == ["bash", "any", "files", "glob"]
+        assert names("Grep") == ["any", "files", "glob"]
+        assert names(None) == ["any", "files", "glob"]
+        assert cfg.get_candidate_hooks(events.HookEvent.SESSION_START, "Bash") == []
+
 
 class TestLoadHooksYaml:
     """Tests for YAML loading."""
@@ -1,12 +1,17 @@
 """Tests for HookManager."""
 
+import json as _json
 import pathlib as _pathlib
+import time as _time
+import unittest.mock as _mock
 
 import pytest as _pytest
 
+import brynhild.api.types as api_types
 import brynhild.hooks.config as config
 import brynhild.hooks.events as events
 import brynhild.hooks.manager as manager
+import brynhild.logging as brynhild_logging
 
 
 class TestHookManager:
@@ -360,3 +365,285 @@ class TestHookFailureSemantics:
         # First hook errored and continued, second hook should run and block
         assert result.action == events.HookAction.BLOCK
         assert result.message == "Second hook blocked"
+
+    @_pytest.mark.asyncio
+    async def test_unmatched_tool_skips_context_serialization(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """Dispatch for a tool no hook targets never serializes the context."""
+        hook = config.HookDefinition(
+            name="bash-only",
+            type="command",
+            command="exit 1",
+            match={"tool": "Bash", "tool_input.command": "^rm"},
+        )
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"pre_tool_use": [hook]}), project_root=tmp_path
+        )
+
+        def fail(*_args: object) -> None:
+            raise AssertionError("context serialized")
+
+        monkeypatch.setattr(events.HookContext, "to_dict", fail)
+        monkeypatch.setattr(events.HookContext, "get_field", fail)
+        context = events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test",
+            cwd=tmp_path,
+            tool="Read",
+            tool_input={"file_path": "a.py"},
+        )
+
+        result = await mgr.dispatch(events.HookEvent.PRE_TOOL_USE, context)
+
+        assert result.action == events.HookAction.CONTINUE
+
+    @_pytest.mark.asyncio
+    async def test_observe_only_hooks_run_concurrently(
+        self,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """Observe-only hooks overlap instead of running one after another."""
+        hooks = [
+            config.HookDefinition(
+                name=f"observer-{i}",
+                type="command",
+                command=f"sleep 0.4 && touch {tmp_path / f'ran-{i}'}",
+                observe_only=True,
+            )
+            for i in range(3)
+        ]
+        # A blocking result from an observer is ignored
+        hooks.append(
+            config.HookDefinition(
+                name="blocker", type="command", command="exit 1", observe_only=True
+            )
+        )
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"post_tool_use": hooks}), project_root=tmp_path
+        )
+        context = events.HookContext(
+            event=events.HookEvent.POST_TOOL_USE,
+            session_id="test",
+            cwd=tmp_path,
+            tool="Bash",
+        )
+
+        start = _time.perf_counter()
+        result = await mgr.dispatch(events.HookEvent.POST_TOOL_USE, context)
+        elapsed = _time.perf_counter() - start
+
+        assert result.action == events.HookAction.CONTINUE
+        assert all((tmp_path / f"ran-{i}").exists() for i in range(3))
+        assert elapsed < 1.0
+
+    @_pytest.mark.asyncio
+    async def test_background_hooks_drained_by_aclose(
+        self,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """Background hooks don't delay dispatch and finish by aclose()."""
+        marker = tmp_path / "done"
+        hook = config.HookDefinition(
+            name="audit",
+            type="command",
+            command=f"sleep 0.3 && touch {marker}",
+            background=True,
+        )
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"pre_tool_use": [hook]}), project_root=tmp_path
+        )
+        context = events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test",
+            cwd=tmp_path,
+            tool="Bash",
+        )
+
+        result = await mgr.dispatch(events.HookEvent.PRE_TOOL_USE, context)
+
+        assert result.action == events.HookAction.CONTINUE
+        assert mgr.pending_background == 1
+        assert not marker.exists()
+
+        await mgr.aclose()
+
+        assert marker.exists()
+        assert mgr.pending_background == 0
+
+    @_pytest.mark.asyncio
+    async def test_cacheable_hook_memoized(
+        self,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """A cacheable hook runs once per distinct context."""
+        runs = tmp_path / "runs"
+        hook = config.HookDefinition(
+            name="allowlist",
+            type="command",
+            command=f'echo run >> {runs}; [ "$BRYNHILD_TOOL_INPUT" != \'{{"command": "rm"}}\' ]',
+            cacheable=True,
+        )
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"pre_tool_use": [hook]}), project_root=tmp_path
+        )
+
+        def context(command: str) -> events.HookContext:
+            return events.HookContext(
+                event=events.HookEvent.PRE_TOOL_USE,
+                session_id="test",
+                cwd=tmp_path,
+                tool="Bash",
+                tool_input={"command": command},
+            )
+
+        results = [
+            await mgr.dispatch(events.HookEvent.PRE_TOOL_USE, context(command))
+            for command in ("ls", "rm", "ls", "rm", "pwd")
+        ]
+
+        assert [r.action for r in results] == [
+            events.HookAction.CONTINUE,
+            events.HookAction.BLOCK,
+            events.HookAction.CONTINUE,
+            events.HookAction.BLOCK,
+            events.HookAction.CONTINUE,
+        ]
+        assert len(runs.read_text().splitlines()) == 3
+        assert mgr.cache_stats["allowlist"].to_dict() == {"hits": 2, "misses": 3}
+        recorded = mgr.metrics.get("allowlist", "pre_tool_use")
+        assert recorded is not None
+        assert (recorded.cache_hits, recorded.cache_misses) == (2, 3)
+        assert recorded.outcomes == {"continue": 3, "block": 2}
+
+    @_pytest.mark.asyncio
+    async def test_executions_recorded_in_metrics(
+        self,
+        tmp_path: _pathlib.Path,
+        caplog: _pytest.LogCaptureFixture,
+    ) -> None:
+        """Each execution is timed; slow ones warn and count as over budget."""
+        hooks = [
+            config.HookDefinition(name="fast", type="command", command="exit 0"),
+            config.HookDefinition(name="slow", type="command", command="sleep 0.1", budget_ms=1),
+            config.HookDefinition(name="guard", type="command", command="exit 1"),
+        ]
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"pre_tool_use": hooks}), project_root=tmp_path
+        )
+        context = events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test",
+            cwd=tmp_path,
+            tool="Bash",
+        )
+
+        with caplog.at_level("WARNING"):
+            await mgr.dispatch(events.HookEvent.PRE_TOOL_USE, context)
+
+        slow = mgr.metrics.get("slow", "pre_tool_use")
+        guard = mgr.metrics.get("guard", "pre_tool_use")
+        assert slow is not None and guard is not None
+        assert slow.over_budget_count == 1
+        assert slow.latency.max_ms >= 100
+        assert guard.outcomes == {"block": 1}
+        assert "over its 1 ms budget" in caplog.text
+
+        log_file = tmp_path / "log.jsonl"
+        logger = brynhild_logging.ConversationLogger(log_file=log_file)
+        await mgr.aclose(logger=logger)
+        logger.close()
+
+        logged = [_json.loads(line) for line in log_file.read_text().splitlines()]
+        (event,) = [e for e in logged if e["event_type"] == "hook_metrics"]
+        assert set(event["hooks"]) == {
+            "pre_tool_use:fast",
+            "pre_tool_use:slow",
+            "pre_tool_use:guard",
+        }
+        assert event["summary"]["over_budget"] == 1
+
+    @_pytest.mark.asyncio
+    async def test_timeout_outcome_reported_by_executor(
+        self,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """Only hooks the executor timed out count as timeouts; late ones are cached."""
+        (tmp_path / "late.py").write_text(
+            "import asyncio, time\n\n"
+            "def blocking(context):\n    time.sleep(1.1)\n\n"
+            "async def slow(context):\n    await asyncio.sleep(30)\n"
+        )
+        timeout = config.HookTimeoutConfig(seconds=1, on_timeout="continue")
+        hooks = {
+            "pre_tool_use": [
+                config.HookDefinition(
+                    name="blocking",
+                    type="python",
+                    function="late.py:blocking",
+                    timeout=timeout,
+                    cacheable=True,
+                )
+            ],
+            "post_tool_use": [
+                config.HookDefinition(
+                    name="slow", type="python", function="late.py:slow", timeout=timeout
+                )
+            ],
+        }
+        mgr = manager.HookManager(config.HooksConfig(hooks=hooks), project_root=tmp_path)
+
+        def context(event: events.HookEvent) -> events.HookContext:
+            return events.HookContext(event=event, session_id="test", cwd=tmp_path, tool="Bash")
+
+        for _ in range(2):
+            await mgr.dispatch(
+                events.HookEvent.PRE_TOOL_USE, context(events.HookEvent.PRE_TOOL_USE)
+            )
+        await mgr.dispatch(events.HookEvent.POST_TOOL_USE, context(events.HookEvent.POST_TOOL_USE))
+
+        blocking = mgr.metrics.get("blocking", "pre_tool_use")
+        slow = mgr.metrics.get("slow", "post_tool_use")
+        assert blocking is not None and slow is not None
+        assert blocking.outcomes == {"continue": 2}
+        assert blocking.cache_hits == 1
+        assert slow.outcomes == {"timeout": 1}
+
+    @_pytest.mark.asyncio
+    async def test_prompt_hooks_batched(
+        self,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """Consecutive prompt hooks of an event share one LLM request."""
+        provider = _mock.AsyncMock()
+        provider.complete.return_value = api_types.CompletionResponse(
+            id="r",
+            content='{"1": {"safe": true}, "2": {"safe": false, "reason": "nope"}}',
+            stop_reason="stop",
+            usage=api_types.Usage(input_tokens=1, output_tokens=1),
+        )
+        hooks = [
+            config.HookDefinition(name="first", type="prompt", prompt="Check {{tool}}"),
+            config.HookDefinition(name="second", type="prompt", prompt="Also {{tool}}"),
+        ]
+        mgr = manager.HookManager(
+            config.HooksConfig(hooks={"pre_tool_use": hooks}),
+            project_root=tmp_path,
+            provider=provider,
+        )
+        context = events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test",
+            cwd=tmp_path,
+            tool="Bash",
+        )
+
+        result = await mgr.dispatch(events.HookEvent.PRE_TOOL_USE, context)
+
+        assert result.action == events.HookAction.BLOCK
+        assert result.message == "nope"
+        assert provider.complete.await_count == 1
+        second = mgr.metrics.get("second", "pre_tool_use")
+        assert second is not None and second.outcomes == {"block": 1}
@@ -131,6 +131,29 @@ class TestPatternMatcher:
         assert matcher.matches({"count": 6}) is False
         assert matcher.matches({"count": 5.0}) is True  # int/float equality
 
+    def test_lookup_fetches_only_referenced_fields(self) -> None:
+        """matches_lookup() only asks for the top-level fields it needs."""
+        matcher = matching.PatternMatcher({"tool": "Bash", "tool_input.command": "^git"})
+        requested: list[str] = []
+
+        def lookup(name: str) -> object:
+            requested.append(name)
+            return {"tool": "Bash", "tool_input": {"command": "git status"}}.get(name)
+
+        assert matcher.matches_lookup(lookup) is True
+        assert requested == ["tool", "tool_input"]
+
+    def test_exact_value(self) -> None:
+        """exact_value() reports literal string patterns only."""
+        matcher = matching.PatternMatcher(
+            {"tool": "Bash", "file": "*.py", "command": "^rm", "success": True}
+        )
+        assert matcher.exact_value("tool") == "Bash"
+        assert matcher.exact_value("file") is None
+        assert matcher.exact_value("command") is None
+        assert matcher.exact_value("success") is None
+        assert matcher.exact_value("missing") is None
+
 
 class TestMatchPatterns:
     """Tests for match_patterns convenience function."""
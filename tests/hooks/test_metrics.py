@@ -0,0 +1,44 @@
+"""Tests for hook latency metrics."""
+
+import brynhild.hooks.metrics as metrics
+
+
+class TestHookMetricsCollector:
+    """Tests for HookMetricsCollector."""
+
+    def test_record_per_hook_and_event(self) -> None:
+        collector = metrics.HookMetricsCollector()
+        collector.record("guard", "pre_tool_use", "continue", 10.0, cached=False)
+        collector.record("guard", "pre_tool_use", "block", 2.0, cached=True)
+        collector.record("guard", "post_tool_use", "timeout", 500.0, over_budget=True)
+
+        pre = collector.get("guard", "pre_tool_use")
+        post = collector.get("guard", "post_tool_use")
+
+        assert pre is not None and post is not None
+        assert pre.call_count == 2
+        assert pre.outcomes == {"continue": 1, "block": 1}
+        assert (pre.cache_hits, pre.cache_misses) == (1, 1)
+        assert post.over_budget_count == 1
+        # Sorted by total time
+        assert collector.all() == [post, pre]
+
+    def test_round_trip_and_merge(self) -> None:
+        first = metrics.HookMetricsCollector()
+        first.record("guard", "pre_tool_use", "continue", 10.0)
+        second = metrics.HookMetricsCollector()
+        second.record("guard", "pre_tool_use", "error", 400.0)
+        second.record("audit", "session_end", "continue", 1.0)
+
+        merged = metrics.HookMetricsCollector.from_dict(first.to_dict())
+        merged.merge(metrics.HookMetricsCollector.from_dict(second.to_dict()))
+
+        guard = merged.get("guard", "pre_tool_use")
+        assert guard is not None
+        assert guard.call_count == 2
+        assert guard.outcomes == {"continue": 1, "error": 1}
+        assert guard.latency.max_ms == 400.0
+        summary = merged.summary()
+        assert summary["total_calls"] == 3
+        assert summary["outcomes"]["error"] == 1
+        assert summary["hooks_run"] == 2
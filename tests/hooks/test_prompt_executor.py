@@ -190,3 +190,115 @@ class TestPromptHookExecutor:
         sent_prompt = mock_provider.last_messages[0]["content"]
         assert "Tool: Bash" in sent_prompt
         assert "Command: rm -rf /" in sent_prompt
+
+
+class CountingLLMProvider(MockLLMProvider):
+    """Mock provider that records every request."""
+
+    def __init__(self, response: str) -> None:
+        super().__init__(response)
+        self.requests: list[str] = []
+
+    async def complete(
+        self,
+        messages: list[dict[str, _typing.Any]],
+        **kwargs: _typing.Any,
+    ) -> api_types.CompletionResponse:
+        self.requests.append(messages[0]["content"])
+        return await super().complete(messages, **kwargs)
+
+
+class TestPromptHookBatching:
+    """Tests for combined requests and the verdict cache."""
+
+    @_pytest.fixture
+    def context(self, tmp_path: _pathlib.Path) -> events.HookContext:
+        return events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test-session",
+            cwd=tmp_path,
+            tool="Bash",
+            tool_input={"command": "rm -rf build"},
+        )
+
+    @staticmethod
+    def _hooks() -> list[config.HookDefinition]:
+        return [
+            config.HookDefinition(
+                name="safety", type="prompt", prompt="Is `{{tool_input.command}}` safe?"
+            ),
+            config.HookDefinition(
+                name="scope", type="prompt", prompt="Is `{{tool_input.command}}` in scope?"
+            ),
+            config.HookDefinition(name="style", type="prompt", prompt="Check {{tool}} style"),
+        ]
+
+    @_pytest.mark.asyncio
+    async def test_one_request_for_all_hooks(self, context: events.HookContext) -> None:
+        provider = CountingLLMProvider(
+            'Verdicts: {"1": {"safe": true}, "2": {"safe": false, "reason": "Out of scope"}}'
+        )
+        executor = prompt_executor.PromptHookExecutor(provider=provider)
+
+        results = await executor.execute_batch(self._hooks(), context)
+
+        assert len(provider.requests) == 1
+        request = provider.requests[0]
+        assert "3 independent checks" in request
+        assert "## Check 2\n\nIs `rm -rf build` in scope?" in request
+        assert [r.action for r in results] == [
+            events.HookAction.CONTINUE,
+            events.HookAction.BLOCK,
+            events.HookAction.CONTINUE,  # Missing verdict
+        ]
+        assert results[1].message == "Out of scope"
+
+    @_pytest.mark.asyncio
+    async def test_verdicts_cached_by_rendered_prompt(self, context: events.HookContext) -> None:
+        provider = CountingLLMProvider('{"1": {"safe": false}, "2": {"safe": true}}')
+        executor = prompt_executor.PromptHookExecutor(provider=provider)
+        hooks = self._hooks()[:2]
+
+        await executor.execute_batch(hooks, context)
+        again = await executor.execute_batch(hooks, context)
+        single = await executor.execute(hooks[0], context)
+
+        assert len(provider.requests) == 1
+        assert [r.action for r in again] == [events.HookAction.BLOCK, events.HookAction.CONTINUE]
+        assert single.action == events.HookAction.BLOCK
+
+        # A different rendered prompt is asked about again
+        context.tool_input = {"command": "ls"}
+        await executor.execute(hooks[0], context)
+        assert len(provider.requests) == 2
+        assert provider.requests[1] == "Is `ls` safe?"
+
+    @_pytest.mark.asyncio
+    async def test_unparseable_batch_answer_continues(self, context: events.HookContext) -> None:
+        provider = CountingLLMProvider("All good!")
+        executor = prompt_executor.PromptHookExecutor(provider=provider)
+
+        results = await executor.execute_batch(self._hooks(), context)
+
+        assert all(r.action == events.HookAction.CONTINUE for r in results)
+
+    @_pytest.mark.asyncio
+    async def test_unparsed_verdicts_not_cached(self, context: events.HookContext) -> None:
+        """A missing or garbled verdict is asked for again next time."""
+        provider = CountingLLMProvider('{"1": {"safe": false}}')
+        executor = prompt_executor.PromptHookExecutor(provider=provider)
+        hooks = self._hooks()[:2]
+
+        await executor.execute_batch(hooks, context)
+        provider._response = '{"safe": false, "reason": "Out of scope"}'
+        results = await executor.execute_batch(hooks, context)
+
+        # Only the unanswered check is asked again, and its verdict now holds
+        assert provider.requests[1] == "Is `rm -rf build` in scope?"
+        assert [r.action for r in results] == [events.HookAction.BLOCK, events.HookAction.BLOCK]
+
+        provider._response = "no idea"
+        context.tool_input = {"command": "ls"}
+        await executor.execute(hooks[0], context)
+        await executor.execute(hooks[0], context)
+        assert len(provider.requests) == 4
@@ -0,0 +1,173 @@
+"""Tests for python hook executor."""
+
+import pathlib as _pathlib
+import sys as _sys
+
+import pydantic as _pydantic
+import pytest as _pytest
+
+import brynhild.hooks.config as config
+import brynhild.hooks.events as events
+import brynhild.hooks.executors as executors
+import brynhild.hooks.executors.base as base
+import brynhild.hooks.executors.python as python_executor
+
+_HOOK_MODULE = """\
+import asyncio
+
+import brynhild.hooks.events as events
+
+calls = []
+
+
+def guard(context):
+    calls.append(context)
+    if "rm -rf /" in context.tool_input.get("command", ""):
+        return events.HookResult.construct_block("Dangerous command")
+    return None
+
+
+async def slow(context):
+    await asyncio.sleep(30)
+
+
+async def rewrite(context):
+    return {"action": "continue", "modified_input": {"command": "ls"}}
+
+
+def wrong(context):
+    return 42
+"""
+
+
+class TestPythonHookExecutor:
+    """Tests for PythonHookExecutor."""
+
+    @_pytest.fixture
+    def executor(self, tmp_path: _pathlib.Path) -> python_executor.PythonHookExecutor:
+        """Create executor with a hook module in the project root."""
+        (tmp_path / "guards.py").write_text(_HOOK_MODULE)
+        return python_executor.PythonHookExecutor(project_root=tmp_path)
+
+    @_pytest.fixture
+    def context(self, tmp_path: _pathlib.Path) -> events.HookContext:
+        """Create a basic hook context."""
+        return events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test-session",
+            cwd=tmp_path,
+            tool="Bash",
+            tool_input={"command": "ls -la"},
+        )
+
+    @staticmethod
+    def _hook(function: str, **kwargs: object) -> config.HookDefinition:
+        return config.HookDefinition(
+            name="py-hook",
+            type="python",
+            function=function,
+            **kwargs,  # type: ignore[arg-type]
+        )
+
+    def test_created_by_factory(self) -> None:
+        """create_executor knows the python hook type."""
+        executor = executors.create_executor("python")
+        assert isinstance(executor, python_executor.PythonHookExecutor)
+        assert executor.hook_type == "python"
+
+    def test_function_reference_required(self) -> None:
+        """Python hooks need a module:function reference."""
+        with _pytest.raises(_pydantic.ValidationError, match="module:function"):
+            config.HookDefinition(name="py-hook", type="python", function="guards")
+
+    @_pytest.mark.asyncio
+    async def test_receives_context_object(
+        self,
+        executor: python_executor.PythonHookExecutor,
+        context: events.HookContext,
+    ) -> None:
+        """The function gets the HookContext itself and None means continue."""
+        hook_def = self._hook("guards.py:guard")
+
+        result = await executor.execute(hook_def, context)
+        context.tool_input = {"command": "rm -rf /"}
+        blocked = await executor.execute(hook_def, context)
+
+        assert result.action == events.HookAction.CONTINUE
+        assert blocked.action == events.HookAction.BLOCK
+        assert blocked.message == "Dangerous command"
+        module = _sys.modules[executor._resolve("guards.py:guard").__module__]
+        assert module.calls == [context, context]
+
+    @_pytest.mark.asyncio
+    async def test_async_function_and_dict_result(
+        self,
+        executor: python_executor.PythonHookExecutor,
+        context: events.HookContext,
+    ) -> None:
+        """Async functions are awaited; dict results are parsed."""
+        result = await executor.execute(self._hook("guards.py:rewrite"), context)
+
+        assert result.modified_input == {"command": "ls"}
+
+    @_pytest.mark.asyncio
+    async def test_async_function_timeout(
+        self,
+        executor: python_executor.PythonHookExecutor,
+        context: events.HookContext,
+    ) -> None:
+        """The hook timeout applies to async functions."""
+        hook_def = self._hook(
+            "guards.py:slow",
+            timeout=config.HookTimeoutConfig(seconds=1, on_timeout="block"),
+        )
+
+        result = await executor.execute(hook_def, context)
+
+        assert result.action == events.HookAction.BLOCK
+        assert "timed out" in (result.message or "")
+
+    @_pytest.mark.asyncio
+    async def test_dotted_module(
+        self,
+        executor: python_executor.PythonHookExecutor,
+        context: events.HookContext,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """Importable modules are referenced by dotted name."""
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(_sys.modules, "guards", raising=False)
+        context.tool_input = {"command": "rm -rf /"}
+
+        result = await executor.execute(self._hook("guards:guard"), context)
+
+        assert result.action == events.HookAction.BLOCK
+
+    def test_resolved_once(
+        self,
+        executor: python_executor.PythonHookExecutor,
+    ) -> None:
+        """The module is imported once per reference."""
+        assert executor._resolve("guards.py:guard") is executor._resolve("guards.py:guard")
+
+    @_pytest.mark.asyncio
+    @_pytest.mark.parametrize(
+        ("function", "error"),
+        [
+            ("guards.py:missing", "not found"),
+            ("missing.py:guard", "not found"),
+            ("no_such_module_xyz:guard", "Cannot import"),
+            ("guards.py:wrong", "returned int"),
+        ],
+    )
+    async def test_errors(
+        self,
+        executor: python_executor.PythonHookExecutor,
+        context: events.HookContext,
+        function: str,
+        error: str,
+    ) -> None:
+        """Bad references and results raise HookExecutionError."""
+        with _pytest.raises(base.HookExecutionError, match=error):
+            await executor.execute(self._hook(function), context)
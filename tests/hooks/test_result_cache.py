@@ -0,0 +1,84 @@
+"""Tests for hook result memoization."""
+
+import pathlib as _pathlib
+
+import brynhild.hooks.events as events
+import brynhild.hooks.result_cache as result_cache
+
+
+def _context(**kwargs: object) -> events.HookContext:
+    return events.HookContext(
+        event=events.HookEvent.PRE_TOOL_USE,
+        session_id="test-session",
+        cwd=_pathlib.Path("/project"),
+        tool="Bash",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestContextDigest:
+    """Tests for context_digest()."""
+
+    def test_stable_across_key_order(self) -> None:
+        first = _context(tool_input={"command": "ls", "timeout": 5})
+        second = _context(tool_input={"timeout": 5, "command": "ls"})
+
+        assert result_cache.context_digest(first) == result_cache.context_digest(second)
+
+    def test_differs_with_input(self) -> None:
+        first = _context(tool_input={"command": "ls"})
+        second = _context(tool_input={"command": "rm"})
+
+        assert result_cache.context_digest(first) != result_cache.context_digest(second)
+
+
+class TestHookResultCache:
+    """Tests for HookResultCache."""
+
+    def test_hit_returns_copy(self) -> None:
+        cache = result_cache.HookResultCache()
+        cache.put("guard", "d1", events.HookResult.construct_block("no"), ttl=60)
+
+        first = cache.get("guard", "d1")
+        assert first is not None
+        first.message = "changed"
+        second = cache.get("guard", "d1")
+
+        assert second is not None
+        assert second.message == "no"
+        assert cache.get("guard", "d2") is None
+        assert cache.get("other", "d1") is None
+        assert cache.stats()["guard"].to_dict() == {"hits": 2, "misses": 1}
+        assert cache.stats()["other"].to_dict() == {"hits": 0, "misses": 1}
+
+    def test_expiry(self) -> None:
+        clock = _Clock()
+        cache = result_cache.HookResultCache(clock=clock)
+        cache.put("guard", "d1", events.HookResult.construct_continue(), ttl=10)
+
+        clock.now = 9.9
+        assert cache.get("guard", "d1") is not None
+        clock.now = 10.0
+        assert cache.get("guard", "d1") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self) -> None:
+        cache = result_cache.HookResultCache(max_entries=2)
+        result = events.HookResult.construct_continue()
+        cache.put("guard", "a", result, ttl=60)
+        cache.put("guard", "b", result, ttl=60)
+        cache.get("guard", "a")
+
+        cache.put("guard", "c", result, ttl=60)
+
+        assert cache.get("guard", "b") is None
+        assert cache.get("guard", "a") is not None
+        assert cache.get("guard", "c") is not None
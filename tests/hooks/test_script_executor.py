@@ -1,5 +1,6 @@
 """Tests for script hook executor."""
 
+import os as _os
 import pathlib as _pathlib
 
 import pydantic as _pydantic
@@ -64,3 +65,128 @@ class TestScriptHookExecutor:
 
         with _pytest.raises(base.HookExecutionError, match="not found"):
             await executor.execute(hook_def, context)
+
+
+_WORKER_SCRIPT = """\
+import json
+import os
+import sys
+import time
+
+for line in sys.stdin:
+    context = json.loads(line)
+    tool = context.get("tool")
+    if tool == "Crash":
+        print("worker crashed", file=sys.stderr)
+        sys.exit(3)
+    if tool == "Slow":
+        time.sleep(30)
+    result = {"action": "continue", "message": str(os.getpid())}
+    if tool == "Quiet":
+        print("", flush=True)
+        continue
+    print(json.dumps(result), flush=True)
+"""
+
+
+class TestPersistentScriptHooks:
+    """Tests for persistent (long-lived worker) script hooks."""
+
+    @_pytest.fixture
+    def executor(self, tmp_path: _pathlib.Path) -> script_executor.ScriptHookExecutor:
+        return script_executor.ScriptHookExecutor(project_root=tmp_path)
+
+    @_pytest.fixture
+    def hook_def(self, tmp_path: _pathlib.Path) -> config.HookDefinition:
+        (tmp_path / "worker.py").write_text(_WORKER_SCRIPT)
+        return config.HookDefinition(
+            name="worker",
+            type="script",
+            script="worker.py",
+            persistent=True,
+            timeout=config.HookTimeoutConfig(seconds=1, on_timeout="continue"),
+        )
+
+    @staticmethod
+    def _context(tmp_path: _pathlib.Path, tool: str) -> events.HookContext:
+        return events.HookContext(
+            event=events.HookEvent.PRE_TOOL_USE,
+            session_id="test-session",
+            cwd=tmp_path,
+            tool=tool,
+        )
+
+    @_pytest.mark.asyncio
+    async def test_worker_reused(
+        self,
+        executor: script_executor.ScriptHookExecutor,
+        hook_def: config.HookDefinition,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """Invocations are served by the same process."""
+        try:
+            first = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+            second = await executor.execute(hook_def, self._context(tmp_path, "Read"))
+            quiet = await executor.execute(hook_def, self._context(tmp_path, "Quiet"))
+        finally:
+            await executor.aclose()
+
+        assert first.message is not None
+        assert first.message == second.message
+        assert quiet.action == events.HookAction.CONTINUE
+        assert quiet.message is None
+
+    @_pytest.mark.asyncio
+    async def test_worker_restarted_after_crash(
+        self,
+        executor: script_executor.ScriptHookExecutor,
+        hook_def: config.HookDefinition,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """A crashed worker fails its request and is started again for the next."""
+        try:
+            before = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+            with _pytest.raises(base.HookExecutionError, match="exit 3.*worker crashed"):
+                await executor.execute(hook_def, self._context(tmp_path, "Crash"))
+            after = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+        finally:
+            await executor.aclose()
+
+        assert after.message is not None
+        assert after.message != before.message
+
+    @_pytest.mark.asyncio
+    async def test_timed_out_worker_replaced(
+        self,
+        executor: script_executor.ScriptHookExecutor,
+        hook_def: config.HookDefinition,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """A worker that timed out is not asked again (its answer would be stale)."""
+        try:
+            before = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+            timed_out = await executor.execute(hook_def, self._context(tmp_path, "Slow"))
+            after = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+        finally:
+            await executor.aclose()
+
+        assert timed_out.message is None
+        assert after.message is not None
+        assert after.message != before.message
+
+    @_pytest.mark.asyncio
+    async def test_aclose_stops_workers(
+        self,
+        executor: script_executor.ScriptHookExecutor,
+        hook_def: config.HookDefinition,
+        tmp_path: _pathlib.Path,
+    ) -> None:
+        """aclose() ends the worker processes."""
+        result = await executor.execute(hook_def, self._context(tmp_path, "Bash"))
+        assert result.message is not None
+        pid = int(result.message)
+
+        await executor.aclose()
+
+        with _pytest.raises(ProcessLookupError):
+            _os.kill(pid, 0)
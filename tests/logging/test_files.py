@@ -0,0 +1,149 @@
+"""Tests for brynhild.logging.files (compression, listing, retention)."""
+
+import gzip as _gzip
+import os as _os
+import pathlib as _pathlib
+
+import pytest as _pytest
+
+import brynhild.logging as logging
+import brynhild.logging.files as files
+
+_DAY = 86400.0
+_NOW = 1_800_000_000.0
+
+
+def _make_log(
+    log_dir: _pathlib.Path, name: str, *, size: int = 100, age_days: float = 0
+) -> _pathlib.Path:
+    path = log_dir / name
+    path.write_bytes(b"x" * size)
+    mtime = _NOW - age_days * _DAY
+    _os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestCompression:
+    """Tests for compressed log files."""
+
+    def test_compressed_path(self, monkeypatch: _pytest.MonkeyPatch) -> None:
+        """The suffix follows the compression; zstd falls back to gzip."""
+        monkeypatch.setattr(files, "_import_zstd", lambda: None)
+        path = _pathlib.Path("brynhild_1.jsonl")
+
+        assert files.compressed_path(path, "none") == path
+        assert files.compressed_path(path, "gzip").name == "brynhild_1.jsonl.gz"
+        assert files.compressed_path(path, "zstd").name == "brynhild_1.jsonl.gz"
+        assert files.compressed_path(_pathlib.Path("a.jsonl.gz"), "gzip").name == "a.jsonl.gz"
+
+    def test_gzip_conversation_log(self, tmp_path: _pathlib.Path) -> None:
+        """A gzip log is written compressed and read by LogReader."""
+        logger = logging.ConversationLogger(log_dir=tmp_path, compress="gzip")
+        logger.log_user_message("Hello")
+        logger.close()
+
+        assert logger.file_path is not None
+        assert logger.file_path.name.endswith(".jsonl.gz")
+        with _gzip.open(logger.file_path, "rt") as f:
+            assert '"user_message"' in f.read()
+        events = logging.LogReader(logger.file_path).get_events()
+        assert [e["event_type"] for e in events] == ["session_start", "user_message", "session_end"]
+
+    def test_read_log_still_being_written(self, tmp_path: _pathlib.Path) -> None:
+        """Flushed lines of an unfinished gzip log are readable."""
+        logger = logging.RawPayloadLogger(log_dir=tmp_path, enabled=True, compress="gzip")
+        logger.log_request("/chat/completions", {"messages": [{"role": "user", "content": "hi"}]})
+        logger.flush()
+
+        assert logger.file_path is not None
+        requests = logging.RawLogReader(logger.file_path).get_requests()
+        assert requests == [{"messages": [{"role": "user", "content": "hi"}]}]
+        logger.close()
+
+    def test_zstd_log_without_zstandard(
+        self, tmp_path: _pathlib.Path, monkeypatch: _pytest.MonkeyPatch
+    ) -> None:
+        """Reading a zstd log without zstandard says which extra to install."""
+        monkeypatch.setattr(files, "_import_zstd", lambda: None)
+        path = tmp_path / "brynhild_1.jsonl.zst"
+        path.write_bytes(b"")
+
+        with _pytest.raises(files.CompressionUnavailableError, match=r"brynhild\[zstd\]"):
+            logging.LogReader(path).get_events()
+
+
+class TestRetention:
+    """Tests for listing logs and enforcing retention."""
+
+    def test_list_logs(self, tmp_path: _pathlib.Path) -> None:
+        """Conversation and raw logs are listed separately, newest first."""
+        for name in (
+            "brynhild_20250101_000000.jsonl",
+            "brynhild_20250102_000000.jsonl.gz",
+            "brynhild_raw_20250101_000000.jsonl.zst",
+            "brynhild_notes.txt",
+            "other.jsonl",
+        ):
+            (tmp_path / name).touch()
+
+        assert [p.name for p in files.list_logs(tmp_path)] == [
+            "brynhild_20250102_000000.jsonl.gz",
+            "brynhild_20250101_000000.jsonl",
+        ]
+        assert [p.name for p in files.list_logs(tmp_path, raw=True)] == [
+            "brynhild_raw_20250101_000000.jsonl.zst",
+        ]
+        assert len(files.list_logs(tmp_path, raw=None)) == 3
+        assert files.list_logs(tmp_path / "missing") == []
+
+    @_pytest.mark.parametrize(
+        ("policy", "expected"),
+        [
+            (files.RetentionPolicy(max_age_days=10), ["c", "d"]),
+            (files.RetentionPolicy(max_files=2), ["c", "d"]),
+            (files.RetentionPolicy(max_total_bytes=250), ["c", "d"]),
+            (files.RetentionPolicy(max_total_bytes=150, max_files=3), ["b", "c", "d"]),
+            (files.RetentionPolicy(), []),
+        ],
+    )
+    def test_enforce_retention(
+        self,
+        tmp_path: _pathlib.Path,
+        policy: files.RetentionPolicy,
+        expected: list[str],
+    ) -> None:
+        """The newest logs are kept until a limit is reached."""
+        for age, name in enumerate("abcd"):
+            _make_log(tmp_path, f"brynhild_{name}.jsonl", age_days=age * 7)
+        _make_log(tmp_path, "unrelated.txt", age_days=100)
+
+        removed = files.enforce_retention(tmp_path, policy, now=_NOW)
+
+        assert sorted(p.name for p, _ in removed) == [f"brynhild_{n}.jsonl" for n in expected]
+        assert all(not p.exists() for p, _ in removed)
+        assert (tmp_path / "unrelated.txt").exists()
+
+    def test_dry_run_and_keep(self, tmp_path: _pathlib.Path) -> None:
+        """dry_run deletes nothing; kept logs are never deleted but count."""
+        old = _make_log(tmp_path, "brynhild_old.jsonl", age_days=30)
+        new = _make_log(tmp_path, "brynhild_new.jsonl")
+        current = _make_log(tmp_path, "brynhild_current.jsonl", age_days=60)
+        policy = files.RetentionPolicy(max_files=2)
+
+        removed = files.enforce_retention(tmp_path, policy, keep={current}, dry_run=True)
+
+        assert removed == [(old, 100)]
+        assert old.exists() and new.exists() and current.exists()
+
+    def test_enforced_when_logger_opens(self, tmp_path: _pathlib.Path) -> None:
+        """Opening a logger deletes logs past the retention limits."""
+        old = _make_log(tmp_path, "brynhild_20200101_000000.jsonl", age_days=365 * 5)
+
+        logger = logging.ConversationLogger(
+            log_dir=tmp_path,
+            retention=files.RetentionPolicy(max_age_days=30),
+        )
+        logger.close()
+
+        assert not old.exists()
+        assert logger.file_path is not None and logger.file_path.exists()
@@ -0,0 +1,168 @@
+"""Tests for delta-encoded raw payload logs and RawLogReader."""
+
+import json as _json
+import pathlib as _pathlib
+import threading as _threading
+
+import pytest as _pytest
+
+import brynhild.logging as logging
+import brynhild.logging.writer as writer
+
+_SYSTEM = {"role": "system", "content": "You are Brynhild. " * 100}
+_TOOLS = [
+    {"type": "function", "function": {"name": f"tool{n}", "description": "x" * 200}}
+    for n in range(5)
+]
+
+
+def _payload(messages: list[dict[str, str]], **fields: object) -> dict[str, object]:
+    return {"model": "test-model", "tools": _TOOLS, "messages": messages, **fields}
+
+
+def _log_requests(
+    tmp_path: _pathlib.Path,
+    payloads: list[dict[str, object]],
+    *,
+    delta: bool = True,
+) -> _pathlib.Path:
+    logger = logging.RawPayloadLogger(log_dir=tmp_path, enabled=True, delta=delta)
+    for payload in payloads:
+        logger.log_request("/chat/completions", payload)
+        logger.log_response("/chat/completions", {"id": "r"}, duration_ms=1.0)
+    logger.close()
+    assert logger.file_path is not None
+    return logger.file_path
+
+
+def _conversation() -> list[dict[str, object]]:
+    """Requests of a growing conversation, with a rewrite and field changes."""
+    history = [_SYSTEM, {"role": "user", "content": "hi"}]
+    payloads = [_payload(list(history), max_tokens=100)]
+    for n in range(3):
+        history = [
+            *history,
+            {"role": "assistant", "content": f"a{n}"},
+            {"role": "user", "content": f"u{n}"},
+        ]
+        payloads.append(_payload(list(history), max_tokens=100))
+    # Compaction rewrites the history and max_tokens changes; then max_tokens
+    # goes away and temperature is added
+    payloads.append(_payload([_SYSTEM, {"role": "user", "content": "summary"}], max_tokens=200))
+    payloads.append(_payload([_SYSTEM], temperature=0.5))
+    return payloads
+
+
+class TestRawPayloadDelta:
+    """Tests for delta encoding round trips."""
+
+    def test_requests_reconstructed(self, tmp_path: _pathlib.Path) -> None:
+        """Every request is reconstructed exactly as it was logged."""
+        payloads = _conversation()
+        path = _log_requests(tmp_path, payloads)
+
+        reader = logging.RawLogReader(path)
+
+        assert reader.get_requests() == payloads
+        assert reader.get_request(4) == payloads[4]
+        assert reader.get_request(len(payloads)) is None
+
+    def test_static_parts_stored_once(self, tmp_path: _pathlib.Path) -> None:
+        """Tools and system prompt are stored once; later requests are deltas."""
+        payloads = _conversation()
+        path = _log_requests(tmp_path, payloads)
+        stored = [_json.loads(line) for line in path.read_text().splitlines()]
+
+        blobs = [r for r in stored if r["direction"] == "blob"]
+        requests = [r for r in stored if r["direction"] == "request"]
+        assert len(blobs) == 2  # tools, system prompt
+        assert all(r["encoding"] == "delta" for r in requests)
+        assert requests[2]["payload"]["messages_kept"] == 4
+        assert requests[2]["payload"]["set"] == {}
+        assert len(requests[2]["payload"]["messages"]) == 2
+        assert requests[5]["payload"]["unset"] == ["max_tokens"]
+
+        full_size = _log_requests(tmp_path / "full", payloads, delta=False).stat().st_size
+        assert path.stat().st_size < full_size / 2
+
+    def test_records_keep_order_without_blobs(self, tmp_path: _pathlib.Path) -> None:
+        """get_records() yields requests and responses, not blob records."""
+        path = _log_requests(tmp_path, _conversation()[:2])
+
+        records = logging.RawLogReader(path).get_records()
+
+        directions = [r["direction"] for r in records]
+        assert directions == ["meta", "request", "response", "request", "response", "meta"]
+        assert "encoding" not in records[1]
+
+    def test_full_logs_read_as_is(self, tmp_path: _pathlib.Path) -> None:
+        """Logs written without delta encoding are read unchanged."""
+        payloads = _conversation()
+        path = _log_requests(tmp_path, payloads, delta=False)
+
+        assert logging.RawLogReader(path).get_requests() == payloads
+
+
+class TestRawPayloadDeltaLoss:
+    """Tests for delta chains when the writer loses records."""
+
+    def test_requests_never_dropped(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """With on_full: drop, only non-request records are discarded."""
+        release = _threading.Event()
+        original = writer.BufferedLogWriter._write_line
+
+        def stalled_write(self: writer.BufferedLogWriter, record: dict[str, object]) -> None:
+            release.wait(5)
+            original(self, record)
+
+        monkeypatch.setattr(writer.BufferedLogWriter, "_write_line", stalled_write)
+        logger = logging.RawPayloadLogger(
+            log_dir=tmp_path,
+            enabled=True,
+            writer_config=logging.WriterConfig(queue_size=2, on_full="drop"),
+        )
+        payloads = _conversation()
+        for payload in payloads:
+            logger.log_request("/chat/completions", payload)
+            for n in range(5):
+                logger.log_stream_chunk("/chat/completions", {"n": n})
+            release.set()
+        logger.close()
+
+        assert logger.file_path is not None
+        assert logging.RawLogReader(logger.file_path).get_requests() == payloads
+
+    def test_full_request_after_failed_record(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """After a record is lost, the next request is logged in full."""
+        original = writer.BufferedLogWriter._write_line
+        failures = []
+
+        def failing_write(self: writer.BufferedLogWriter, record: dict[str, object]) -> None:
+            if record["direction"] == "blob" and not failures:
+                failures.append(record)
+                record = {"bad": object()}
+            original(self, record)
+
+        monkeypatch.setattr(writer.BufferedLogWriter, "_write_line", failing_write)
+        logger = logging.RawPayloadLogger(log_dir=tmp_path, enabled=True)
+        payloads = _conversation()
+        for payload in payloads:
+            logger.log_request("/chat/completions", payload)
+            logger.flush()
+        logger.close()
+
+        assert logger.file_path is not None
+        stored = [_json.loads(line) for line in logger.file_path.read_text().splitlines()]
+        requests = [r for r in stored if r["direction"] == "request"]
+        assert "encoding" not in requests[1]
+        assert all(r["encoding"] == "delta" for r in requests[2:])
+        # Only the request whose blob was lost can't be reconstructed
+        assert logging.RawLogReader(logger.file_path).get_requests()[1:] == payloads[1:]
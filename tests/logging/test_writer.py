@@ -0,0 +1,173 @@
+"""Tests for brynhild.logging.writer (background log writer)."""
+
+import json as _json
+import pathlib as _pathlib
+import threading as _threading
+
+import pytest as _pytest
+
+import brynhild.logging as logging
+import brynhild.logging.writer as writer
+
+
+def _read(path: _pathlib.Path) -> list[dict[str, object]]:
+    return [_json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestBufferedLogWriter:
+    """Tests for BufferedLogWriter."""
+
+    def test_writes_records_in_order(self, tmp_path: _pathlib.Path) -> None:
+        """Records are written one JSON object per line, in order."""
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path)
+
+        for n in range(100):
+            log.write({"n": n})
+        log.close()
+
+        assert [r["n"] for r in _read(path)] == list(range(100))
+
+    def test_turn_policy_waits_for_flush(self, tmp_path: _pathlib.Path) -> None:
+        """With flush: turn, records reach the file on flush()."""
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path, writer.WriterConfig(flush="turn"))
+
+        log.write({"n": 1})
+        assert log.flush(timeout=5)
+        assert _read(path) == [{"n": 1}]
+        log.close()
+
+    def test_fsync_on_flush(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """fsync: true syncs the file on flush() and close()."""
+        synced: list[int] = []
+        monkeypatch.setattr(writer._os, "fsync", synced.append)
+        log = writer.BufferedLogWriter(
+            tmp_path / "log.jsonl", writer.WriterConfig(flush="interval", fsync=True)
+        )
+
+        log.write({"n": 1})
+        log.flush()
+        log.close()
+
+        assert len(synced) == 2
+
+    def test_drop_when_full(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """With on_full: drop, records that don't fit are discarded."""
+        release = _threading.Event()
+        original = writer.BufferedLogWriter._write_line
+
+        def stalled_write(self: writer.BufferedLogWriter, record: dict[str, object]) -> None:
+            release.wait(5)
+            original(self, record)
+
+        monkeypatch.setattr(writer.BufferedLogWriter, "_write_line", stalled_write)
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path, writer.WriterConfig(queue_size=2, on_full="drop"))
+
+        for n in range(10):
+            log.write({"n": n})
+        release.set()
+        log.close()
+
+        written = _read(path)
+        assert log.dropped > 0
+        assert len(written) + log.dropped == 10
+        assert written[0] == {"n": 0}
+
+    def test_unserializable_record_skipped(self, tmp_path: _pathlib.Path) -> None:
+        """A record json can't encode is skipped; the writer keeps going."""
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path)
+
+        log.write({"bad": object()})
+        log.write({"n": 2})
+        log.close()
+
+        assert _read(path) == [{"n": 2}]
+
+    def test_failing_serializer_skipped(self, tmp_path: _pathlib.Path) -> None:
+        """Any error serializing a record skips it; the thread keeps running."""
+
+        class Unprintable:
+            def __str__(self) -> str:
+                raise RuntimeError("no")
+
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path, default=str)
+
+        log.write({"bad": Unprintable()})
+        log.write({"n": 2})
+        assert log.flush(timeout=5)
+        log.close()
+
+        assert _read(path) == [{"n": 2}]
+
+    def test_stopped_thread_does_not_block(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+    ) -> None:
+        """write() and flush() return once the writer thread has stopped."""
+        monkeypatch.setattr(writer.BufferedLogWriter, "_run", lambda _self: None)
+        log = writer.BufferedLogWriter(tmp_path / "log.jsonl", writer.WriterConfig(queue_size=1))
+        log._thread.join()
+
+        for n in range(3):
+            log.write({"n": n})
+        assert log.flush() is False
+        log.close()
+
+    def test_write_after_close_ignored(self, tmp_path: _pathlib.Path) -> None:
+        """Writes and flushes after close() are no-ops."""
+        path = tmp_path / "log.jsonl"
+        log = writer.BufferedLogWriter(path)
+        log.close()
+
+        log.write({"n": 1})
+        assert log.flush()
+        log.close()
+
+        assert path.read_text() == ""
+
+
+class TestLoggerFlush:
+    """Tests for the loggers' use of the background writer."""
+
+    def test_conversation_logger_flush(self, tmp_path: _pathlib.Path) -> None:
+        """flush() makes every logged event readable."""
+        logger = logging.ConversationLogger(
+            log_dir=tmp_path,
+            writer_config=logging.WriterConfig(flush="turn"),
+        )
+        logger.log_user_message("Hello")
+        logger.flush()
+
+        assert logger.file_path is not None
+        events = _read(logger.file_path)
+        assert [e["event_type"] for e in events] == ["session_start", "user_message"]
+        logger.close()
+
+    def test_raw_logger_close_writes_all(self, tmp_path: _pathlib.Path) -> None:
+        """close() writes everything queued, ending with session_end."""
+        logger = logging.RawPayloadLogger(
+            log_dir=tmp_path,
+            enabled=True,
+            writer_config=logging.WriterConfig(flush="interval", flush_interval_ms=60_000),
+        )
+        for n in range(50):
+            logger.log_stream_chunk("/chat/completions", {"n": n})
+        logger.close()
+
+        assert logger.file_path is not None
+        envelopes = _read(logger.file_path)
+        assert len(envelopes) == 52
+        assert envelopes[-1]["endpoint"] == "session_end"
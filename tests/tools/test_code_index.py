@@ -0,0 +1,237 @@
+"""Tests for tools/code_index.py (BM25 index, incremental refresh, persistence)."""
+
+import json as _json
+import os as _os
+import pathlib as _pathlib
+import time as _time
+
+import brynhild.tools.code_index as code_index
+
+
+def _files(root: _pathlib.Path) -> list[tuple[str, float, int]]:
+    """File list in the form CodeIndex.refresh() expects."""
+    result = []
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and "index" not in path.relative_to(root).parts:
+            st = path.stat()
+            result.append((path.relative_to(root).as_posix(), st.st_mtime, st.st_size))
+    return result
+
+
+def _touch(path: _pathlib.Path, text: str) -> None:
+    """Rewrite a file and bump its mtime past filesystem granularity."""
+    path.write_text(text)
+    st = path.stat()
+    _os.utime(path, (st.st_atime, st.st_mtime + 10))
+
+
+class TestTokenize:
+    """Tests for identifier-aware tokenization."""
+
+    def test_camel_case_subwords(self) -> None:
+        assert code_index.tokenize("parseConfigFile") == [
+            "parseconfigfile", "parse", "config", "file",
+        ]
+
+    def test_snake_case_subwords(self) -> None:
+        assert code_index.tokenize("load_ignore_rules") == [
+            "load_ignore_rules", "load", "ignore", "rules",
+        ]
+
+    def test_acronyms_split(self) -> None:
+        assert code_index.tokenize("HTTPServer") == ["httpserver", "http", "server"]
+
+    def test_plain_words_and_noise(self) -> None:
+        """Single words are kept whole; one-letter words and numbers are dropped."""
+        assert code_index.tokenize("x = open(path) + 42") == ["open", "path"]
+
+
+class TestSearch:
+    """Tests for BM25 ranking."""
+
+    def test_ranks_relevant_chunk_first(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "config.py").write_text(
+            "def parse_config(path):\n    return ConfigParser().read(path)\n"
+        )
+        (tmp_path / "other.py").write_text("def unrelated():\n    return path\n")
+        index = code_index.CodeIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        hits = index.search("config parser")
+
+        assert [h.path for h in hits] == ["config.py"]
+        assert hits[0].start_line == 1
+        assert hits[0].score > 0
+
+    def test_chunk_level_hits(self, tmp_path: _pathlib.Path) -> None:
+        """Hits point at the chunk containing the match, not the whole file."""
+        lines = ["filler = 1"] * 25 + ["def needle_function(): pass"] + ["filler = 2"] * 5
+        (tmp_path / "big.py").write_text("\n".join(lines) + "\n")
+        index = code_index.CodeIndex(tmp_path, chunk_lines=10)
+        index.refresh(_files(tmp_path))
+
+        hits = index.search("needle")
+
+        assert len(hits) == 1
+        assert (hits[0].start_line, hits[0].end_line) == (21, 30)
+
+    def test_path_prefix_filter(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "src" / "a.py").write_text("token_value = 1\n")
+        (tmp_path / "tests" / "b.py").write_text("token_value = 2\n")
+        index = code_index.CodeIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        hits = index.search("token_value", path_prefix="src")
+
+        assert [h.path for h in hits] == ["src/a.py"]
+
+    def test_binary_and_oversized_files_skipped(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "blob.bin").write_bytes(b"secret_word\0\0\0")
+        (tmp_path / "huge.txt").write_text("secret_word " * 100)
+        index = code_index.CodeIndex(tmp_path, max_file_bytes=100)
+        index.refresh(_files(tmp_path))
+
+        assert index.search("secret_word") == []
+        assert len(index) == 2  # tracked, so they aren't re-read every refresh
+
+
+class TestIncremental:
+    """Tests for mtime-based incremental updates."""
+
+    def test_only_changed_files_reindexed(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "a.py").write_text("alpha = 1\n")
+        (tmp_path / "b.py").write_text("beta = 1\n")
+        index = code_index.CodeIndex(tmp_path)
+
+        assert index.refresh(_files(tmp_path)) == (2, 0)
+        assert index.refresh(_files(tmp_path)) == (0, 0)
+
+        _touch(tmp_path / "a.py", "gamma = 1\n")
+        assert index.refresh(_files(tmp_path)) == (1, 0)
+        assert index.search("alpha") == []
+        assert [h.path for h in index.search("gamma")] == ["a.py"]
+
+    def test_deleted_files_removed(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "a.py").write_text("alpha = 1\n")
+        index = code_index.CodeIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        (tmp_path / "a.py").unlink()
+
+        assert index.refresh(_files(tmp_path)) == (0, 1)
+        assert index.search("alpha") == []
+
+
+class TestPersistence:
+    """Tests for the on-disk segment."""
+
+    def test_reload_without_reindexing(self, tmp_path: _pathlib.Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("def load_settings(): pass\n")
+        index_dir = tmp_path / "index"
+        index = code_index.CodeIndex(src, index_dir=index_dir)
+        index.refresh(_files(src))
+        index.close()
+
+        assert (index_dir / "meta.json").exists()
+        reopened = code_index.CodeIndex(src, index_dir=index_dir)
+
+        assert reopened.refresh(_files(src)) == (0, 0)
+        assert [h.path for h in reopened.search("settings")] == ["a.py"]
+        reopened.close()
+
+    def test_changes_after_reload_tombstone_segment(self, tmp_path: _pathlib.Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("alpha_value = 1\n")
+        (src / "b.py").write_text("other = 1\n")
+        index_dir = tmp_path / "index"
+        index = code_index.CodeIndex(src, index_dir=index_dir)
+        index.refresh(_files(src))
+        index.close()
+
+        reopened = code_index.CodeIndex(src, index_dir=index_dir)
+        _touch(src / "a.py", "omega_result = 1\n")
+        assert reopened.refresh(_files(src)) == (1, 0)
+
+        assert reopened.search("alpha_value") == []
+        assert [h.path for h in reopened.search("omega_result")] == ["a.py"]
+        reopened.close()
+
+        # Pending changes were merged into a new generation on close
+        third = code_index.CodeIndex(src, index_dir=index_dir)
+        assert third.refresh(_files(src)) == (0, 0)
+        assert [h.path for h in third.search("omega_result")] == ["a.py"]
+        third.close()
+
+    def test_generations_never_rewritten(self, tmp_path: _pathlib.Path) -> None:
+        """Each merge writes new files; old ones are deleted only once stale."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("alpha_value = 1\n")
+        index_dir = tmp_path / "index"
+
+        def generation() -> str:
+            return _json.loads((index_dir / "meta.json").read_text())["generation"]
+
+        def merge(text: str) -> None:
+            _touch(src / "a.py", text)
+            index = code_index.CodeIndex(src, index_dir=index_dir)
+            index.refresh(_files(src))
+            index.close()
+
+        merge("alpha_value = 1\n")
+        first = generation()
+        # Another session still has the first generation mapped
+        reader = code_index.CodeIndex(src, index_dir=index_dir)
+        assert [h.path for h in reader.search("alpha_value")] == ["a.py"]
+
+        merge("omega_result = 1\n")
+        second = generation()
+        assert second != first
+        # Recent generations are kept, and the mapped one is untouched
+        assert (index_dir / f"postings-{first}.bin").exists()
+        assert [h.path for h in reader.search("alpha_value")] == ["a.py"]
+        reader.close()
+
+        stale = _time.time() - 2 * code_index._STALE_GENERATION_SECONDS
+        for path in index_dir.glob("*.bin"):
+            _os.utime(path, (stale, stale))
+        merge("gamma_total = 1\n")
+
+        assert sorted(p.name for p in index_dir.glob("*.bin")) == [
+            f"chunks-{generation()}.bin",
+            f"postings-{generation()}.bin",
+        ]
+        assert not list(index_dir.glob("*.tmp"))
+
+    def test_incompatible_index_rebuilt(self, tmp_path: _pathlib.Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("alpha = 1\n")
+        index_dir = tmp_path / "index"
+        index = code_index.CodeIndex(src, index_dir=index_dir, chunk_lines=10)
+        index.refresh(_files(src))
+        index.close()
+
+        other = code_index.CodeIndex(src, index_dir=index_dir, chunk_lines=20)
+
+        assert other.refresh(_files(src)) == (1, 0)
+        other.close()
+
+    def test_corrupt_meta_ignored(self, tmp_path: _pathlib.Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("alpha = 1\n")
+        index_dir = tmp_path / "index"
+        index_dir.mkdir()
+        (index_dir / "meta.json").write_text("{not json")
+
+        index = code_index.CodeIndex(src, index_dir=index_dir)
+
+        assert index.refresh(_files(src)) == (1, 0)
+        assert [h.path for h in index.search("alpha")] == ["a.py"]
+        index.close()
@@ -0,0 +1,108 @@
+"""Tests for the CodeSearch tool."""
+
+import pathlib as _pathlib
+
+import pytest as _pytest
+
+import brynhild.tools.code_search as code_search
+import brynhild.tools.project_index as project_index
+
+
+def _project(tmp_path: _pathlib.Path) -> _pathlib.Path:
+    root = tmp_path / "proj"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "loader.py").write_text(
+        "import json\n\n\ndef load_config(path):\n    return json.load(open(path))\n"
+    )
+    (root / "src" / "util.py").write_text("def helper():\n    return 1\n")
+    (root / "build").mkdir()
+    (root / "build" / "loader.py").write_text("def load_config(): pass\n")
+    (root / ".gitignore").write_text("build/\n")
+    return root
+
+
+class TestCodeSearchTool:
+    """Tests for CodeSearchTool."""
+
+    @_pytest.mark.asyncio
+    async def test_returns_ranked_snippets(self, tmp_path: _pathlib.Path) -> None:
+        root = _project(tmp_path)
+        tool = code_search.CodeSearchTool(base_dir=root)
+
+        result = await tool.execute({"query": "loadConfig"})
+
+        assert result.success is True
+        lines = result.output.splitlines()
+        assert lines[0].startswith("src/loader.py:1-5 (score ")
+        assert "     4|def load_config(path):" in lines
+
+    @_pytest.mark.asyncio
+    async def test_honors_gitignore(self, tmp_path: _pathlib.Path) -> None:
+        root = _project(tmp_path)
+        tool = code_search.CodeSearchTool(base_dir=root)
+
+        result = await tool.execute({"query": "load_config"})
+
+        assert "build/" not in result.output
+
+    @_pytest.mark.asyncio
+    async def test_uses_shared_project_index(self, tmp_path: _pathlib.Path) -> None:
+        root = _project(tmp_path)
+        index = project_index.ProjectIndex(root, watch=False)
+        tool = code_search.CodeSearchTool(base_dir=root, project_index=index)
+
+        (root / "src" / "late.py").write_text("late_symbol = 1\n")
+        index.notify_changed(root / "src" / "late.py")
+        result = await tool.execute({"query": "late_symbol"})
+
+        assert result.output.startswith("src/late.py:1-1")
+        index.close()
+
+    @_pytest.mark.asyncio
+    async def test_path_restricts_results(self, tmp_path: _pathlib.Path) -> None:
+        root = _project(tmp_path)
+        (root / "docs").mkdir()
+        (root / "docs" / "helper.md").write_text("The helper function.\n")
+        tool = code_search.CodeSearchTool(base_dir=root)
+
+        result = await tool.execute({"query": "helper", "path": "docs"})
+
+        assert result.output.startswith("docs/helper.md")
+        assert "src/util.py" not in result.output
+
+    @_pytest.mark.asyncio
+    async def test_no_matches(self, tmp_path: _pathlib.Path) -> None:
+        tool = code_search.CodeSearchTool(base_dir=_project(tmp_path))
+
+        result = await tool.execute({"query": "nonexistent_identifier"})
+
+        assert result.success is True
+        assert result.output == "No matches found"
+
+    @_pytest.mark.asyncio
+    async def test_query_without_terms_rejected(self, tmp_path: _pathlib.Path) -> None:
+        tool = code_search.CodeSearchTool(base_dir=_project(tmp_path))
+
+        result = await tool.execute({"query": "+ - 1"})
+
+        assert result.success is False
+        assert "No searchable terms" in (result.error or "")
+
+    @_pytest.mark.asyncio
+    async def test_path_outside_project_blocked(self, tmp_path: _pathlib.Path) -> None:
+        tool = code_search.CodeSearchTool(base_dir=_project(tmp_path))
+
+        result = await tool.execute({"query": "config", "path": "/etc"})
+
+        assert result.success is False
+
+    @_pytest.mark.asyncio
+    async def test_index_persisted_on_close(self, tmp_path: _pathlib.Path) -> None:
+        root = _project(tmp_path)
+        index_dir = tmp_path / "cache"
+        tool = code_search.CodeSearchTool(base_dir=root, index_dir=index_dir)
+
+        await tool.execute({"query": "config"})
+        tool.close()
+
+        assert (index_dir / "meta.json").exists()
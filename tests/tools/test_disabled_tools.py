@@ -171,10 +171,14 @@ class TestBuiltinToolNames:
         expected = {
             "Bash",
             "Read",
+            "ReadMany",
             "Write",
             "Edit",
+            "MultiEdit",
             "Grep",
             "Glob",
+            "CodeSearch",
+            "Symbols",
             "Inspect",
             "LearnSkill",
             "Finish",
@@ -0,0 +1,144 @@
+"""Tests for tools/grep.py streaming, early termination, and deadlines.
+
+These use small stand-in executables for ripgrep so the streaming logic can
+be exercised without depending on rg's output for a particular tree.
+"""
+
+import pathlib as _pathlib
+import sys as _sys
+import time as _time
+
+import pytest as _pytest
+
+import brynhild.tools.grep as grep
+
+
+def _fake_rg(tmp_path: _pathlib.Path, body: str) -> str:
+    """Write an executable Python script that stands in for rg."""
+    script = tmp_path / "fake-rg"
+    script.write_text(f"#!{_sys.executable}\nimport sys, json, time\n{body}\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def _args_file(tmp_path: _pathlib.Path) -> _pathlib.Path:
+    return tmp_path / "args.json"
+
+
+class TestGrepArgs:
+    """Tests for the ripgrep argument list."""
+
+    def _build(self, tmp_path: _pathlib.Path, input: dict, mode: str) -> list[str]:
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path="rg")
+        return tool._build_args(input, mode, input.get("limit"))
+
+    def test_guards_always_passed(self, tmp_path: _pathlib.Path) -> None:
+        """Filesize and column guards are passed in every mode."""
+        for mode in ("content", "files_with_matches", "count"):
+            args = self._build(tmp_path, {"pattern": "x"}, mode)
+            assert "--max-filesize" in args
+            assert "--max-columns" in args
+
+    def test_content_limit_sets_max_count(self, tmp_path: _pathlib.Path) -> None:
+        """Content mode caps per-file matches at limit."""
+        args = self._build(tmp_path, {"pattern": "x", "limit": 7}, "content")
+        assert args[args.index("--max-count") + 1] == "7"
+        assert "--json" not in args
+
+    def test_files_mode_uses_plain_list(self, tmp_path: _pathlib.Path) -> None:
+        """files_with_matches uses rg -l, whose lines stay short."""
+        args = self._build(tmp_path, {"pattern": "x"}, "files_with_matches")
+        assert "-l" in args
+        assert "--json" not in args
+
+    def test_count_mode_uses_plain_count_without_max_count(self, tmp_path: _pathlib.Path) -> None:
+        """Count mode uses rg -c and must not cap counts."""
+        args = self._build(tmp_path, {"pattern": "x"}, "count")
+        assert "-c" in args
+        assert "--json" not in args
+        assert "--max-count" not in args
+
+
+class TestGrepStreaming:
+    """Tests for streaming output handling."""
+
+    @_pytest.mark.asyncio
+    async def test_terminates_once_limit_reached(self, tmp_path: _pathlib.Path) -> None:
+        """An endless producer is killed as soon as limit is exceeded."""
+        rg = _fake_rg(
+            tmp_path,
+            "i = 0\nwhile True:\n    print(f'a.py:{i}:match', flush=True)\n    i += 1\n",
+        )
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg)
+
+        start = _time.monotonic()
+        result = await tool.execute({"pattern": "match", "limit": 5})
+
+        assert _time.monotonic() - start < 5
+        assert result.success is True
+        lines = result.output.splitlines()
+        assert lines[:5] == [f"a.py:{i}:match" for i in range(5)]
+        assert "truncated" in lines[-1]
+
+    @_pytest.mark.asyncio
+    async def test_deadline_kills_search(self, tmp_path: _pathlib.Path) -> None:
+        """A search that runs past the deadline fails with partial output."""
+        rg = _fake_rg(tmp_path, "print('a.py:1:early', flush=True)\ntime.sleep(60)\n")
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg, timeout_ms=300)
+
+        start = _time.monotonic()
+        result = await tool.execute({"pattern": "early"})
+
+        assert _time.monotonic() - start < 5
+        assert result.success is False
+        assert "timed out" in (result.error or "")
+        assert "a.py:1:early" in result.output
+
+    @_pytest.mark.asyncio
+    async def test_oversized_line_skipped(self, tmp_path: _pathlib.Path) -> None:
+        """A line longer than the stream limit is skipped, not a failure."""
+        rg = _fake_rg(
+            tmp_path,
+            "print('a.py')\n"
+            f"sys.stdout.write('x' * {grep._STREAM_LIMIT + 1024} + '\\n')\n"
+            "print('b.py')\n",
+        )
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg)
+
+        result = await tool.execute({"pattern": "x", "output_mode": "files_with_matches"})
+
+        assert result.success is True
+        assert result.output.splitlines() == ["a.py", "b.py"]
+
+    @_pytest.mark.asyncio
+    async def test_count_output(self, tmp_path: _pathlib.Path) -> None:
+        """rg -c lines are passed through, without a trailing newline."""
+        rg = _fake_rg(tmp_path, "print('a.py:3')\nprint('src/b.py:1')\n")
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg)
+
+        result = await tool.execute({"pattern": "x", "output_mode": "count"})
+
+        assert result.success is True
+        assert result.output == "a.py:3\nsrc/b.py:1"
+
+    @_pytest.mark.asyncio
+    async def test_no_matches_exit_code(self, tmp_path: _pathlib.Path) -> None:
+        """Exit code 1 without stderr means no matches."""
+        rg = _fake_rg(tmp_path, "sys.exit(1)")
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg)
+
+        result = await tool.execute({"pattern": "x"})
+
+        assert result.success is True
+        assert result.output == "No matches found"
+
+    @_pytest.mark.asyncio
+    async def test_error_exit_code(self, tmp_path: _pathlib.Path) -> None:
+        """Exit code 2 surfaces stderr as the error."""
+        rg = _fake_rg(tmp_path, "sys.stderr.write('regex parse error')\nsys.exit(2)")
+        tool = grep.GrepTool(base_dir=tmp_path, ripgrep_path=rg)
+
+        result = await tool.execute({"pattern": "("})
+
+        assert result.success is False
+        assert "regex parse error" in (result.error or "")
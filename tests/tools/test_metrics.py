@@ -0,0 +1,167 @@
+"""Tests for tool metrics: latency histograms, merging and Prometheus export."""
+
+import pathlib as _pathlib
+
+import pytest as _pytest
+
+import brynhild.tools.base as tools_base
+import brynhild.tools.prometheus as prometheus
+
+_BUCKET_WIDTH = 2 ** (1 / tools_base._HISTOGRAM_BUCKETS_PER_DOUBLING)
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_bucket_bounds(self) -> None:
+        hist = tools_base.LatencyHistogram
+
+        assert hist.bucket_for(0.2) == 0
+        assert hist.bucket_for(1.0) == 0
+        assert hist.bucket_for(2.0) == 4  # Upper bounds are inclusive
+        assert hist.bucket_for(2.01) == 5
+        assert hist.bucket_for(1e12) == tools_base._HISTOGRAM_BUCKETS - 1
+
+    def test_percentiles_within_one_bucket(self) -> None:
+        hist = tools_base.LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.record(float(ms))
+
+        for p in (50, 90, 99):
+            exact = 1000 * p / 100
+            assert exact <= hist.percentile(p) <= exact * _BUCKET_WIDTH
+        assert hist.percentile(100) == hist.max_ms == 1000.0
+
+    def test_percentile_capped_at_max(self) -> None:
+        hist = tools_base.LatencyHistogram()
+        hist.record(3.0)
+
+        assert hist.percentile(50) == 3.0
+
+    def test_empty(self) -> None:
+        assert tools_base.LatencyHistogram().percentile(99) == 0.0
+
+    def test_merge_matches_single_histogram(self) -> None:
+        combined = tools_base.LatencyHistogram()
+        a = tools_base.LatencyHistogram()
+        b = tools_base.LatencyHistogram()
+        for ms in (1.5, 20.0, 300.0):
+            a.record(ms)
+            combined.record(ms)
+        for ms in (5.0, 4000.0):
+            b.record(ms)
+            combined.record(ms)
+
+        a.merge(b)
+
+        assert a == combined
+
+    def test_round_trip(self) -> None:
+        hist = tools_base.LatencyHistogram()
+        hist.record(12.0)
+        hist.record(800.0)
+
+        data = hist.to_dict()
+
+        assert tools_base.LatencyHistogram.from_dict(data) == hist
+        assert all(isinstance(key, str) for key in data["buckets"])
+
+
+class TestMetricsMerge:
+    """Tests for aggregating ToolMetrics/MetricsCollector across sessions."""
+
+    def test_collectors_merge(self) -> None:
+        first = tools_base.MetricsCollector()
+        first.record("Grep", True, 10.0, "2026-01-01T00:00:00")
+        second = tools_base.MetricsCollector()
+        second.record("Grep", False, 900.0, "2026-01-02T00:00:00", outcome="timeout")
+        second.record("Read", True, 2.0)
+
+        # Round-trip through the session format first
+        aggregate = tools_base.MetricsCollector()
+        aggregate.merge(tools_base.MetricsCollector.from_dict(first.to_dict()))
+        aggregate.merge(tools_base.MetricsCollector.from_dict(second.to_dict()))
+
+        grep = aggregate.get("Grep")
+        assert grep is not None
+        assert (grep.call_count, grep.success_count, grep.timeout_count) == (2, 1, 1)
+        assert grep.latency.count == 2
+        assert grep.latency.max_ms == 900.0
+        assert grep.last_used == "2026-01-02T00:00:00"
+        assert aggregate.summary()["max_ms"] == 900.0
+
+    def test_legacy_metrics_without_histogram(self) -> None:
+        """Metrics saved before histograms existed still load and merge."""
+        legacy = {"Bash": {"tool_name": "Bash", "call_count": 3, "success_count": 3}}
+        collector = tools_base.MetricsCollector()
+        collector.record("Bash", True, 50.0)
+
+        collector.merge(tools_base.MetricsCollector.from_dict(legacy))
+
+        bash = collector.get("Bash")
+        assert bash is not None
+        assert bash.call_count == 4
+        assert bash.latency.count == 1
+
+    def test_to_dict_includes_percentiles(self) -> None:
+        collector = tools_base.MetricsCollector()
+        collector.record("Glob", True, 4.0)
+
+        data = collector.to_dict()["Glob"]
+
+        assert data["p50_ms"] == data["p99_ms"] == data["max_ms"] == 4.0
+        assert data["latency"]["buckets"] == {"8": 1}
+
+
+class TestPrometheusExport:
+    """Tests for the Prometheus textfile export."""
+
+    @_pytest.fixture
+    def collector(self) -> tools_base.MetricsCollector:
+        collector = tools_base.MetricsCollector()
+        collector.record("Grep", True, 0.5)
+        collector.record("Grep", True, 3.0)
+        collector.record("Grep", False, 30_000.0, outcome="timeout")
+        return collector
+
+    def test_format(self, collector: tools_base.MetricsCollector) -> None:
+        lines = prometheus.format_textfile(collector).splitlines()
+
+        assert "# TYPE brynhild_tool_calls_total counter" in lines
+        assert 'brynhild_tool_calls_total{tool="Grep",outcome="success"} 2' in lines
+        assert 'brynhild_tool_calls_total{tool="Grep",outcome="failure"} 0' in lines
+        assert 'brynhild_tool_calls_total{tool="Grep",outcome="timeout"} 1' in lines
+        assert "# TYPE brynhild_tool_duration_seconds histogram" in lines
+        assert 'brynhild_tool_duration_seconds_bucket{tool="Grep",le="0.001"} 1' in lines
+        assert 'brynhild_tool_duration_seconds_bucket{tool="Grep",le="0.004"} 2' in lines
+        assert 'brynhild_tool_duration_seconds_bucket{tool="Grep",le="+Inf"} 3' in lines
+        assert 'brynhild_tool_duration_seconds_count{tool="Grep"} 3' in lines
+        assert 'brynhild_tool_duration_seconds_sum{tool="Grep"} 30.0035' in lines
+
+    def test_buckets_are_cumulative(self, collector: tools_base.MetricsCollector) -> None:
+        counts = [
+            int(line.rsplit(" ", 1)[1])
+            for line in prometheus.format_textfile(collector).splitlines()
+            if line.startswith("brynhild_tool_duration_seconds_bucket")
+        ]
+
+        assert counts == sorted(counts)
+        assert counts[-1] == 3
+
+    def test_label_escaping(self) -> None:
+        collector = tools_base.MetricsCollector()
+        collector.record('odd"name\\', True, 1.0)
+
+        text = prometheus.format_textfile(collector)
+
+        assert 'tool="odd\\"name\\\\"' in text
+
+    def test_write_textfile(
+        self, collector: tools_base.MetricsCollector, tmp_path: _pathlib.Path
+    ) -> None:
+        path = tmp_path / "textfile" / "brynhild.prom"
+
+        prometheus.write_textfile(collector, path)
+
+        assert path.read_text() == prometheus.format_textfile(collector)
+        assert [p.name for p in path.parent.iterdir()] == ["brynhild.prom"]
@@ -0,0 +1,182 @@
+"""Tests for tools/project_index.py."""
+
+import os as _os
+import pathlib as _pathlib
+import time as _time
+
+import pytest as _pytest
+
+import brynhild.tools.glob as glob_tool
+import brynhild.tools.inspect as inspect_tool
+import brynhild.tools.project_index as project_index
+
+
+def _make_tree(root: _pathlib.Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "pkg" / "a.py").write_text("a")
+    (root / "src" / "b.py").write_text("b")
+    (root / "README.md").write_text("readme")
+    (root / "build").mkdir()
+    (root / "build" / "out.py").write_text("generated")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text("")
+    (root / ".gitignore").write_text("build/\n*.log\n!keep.log\n")
+    (root / "debug.log").write_text("")
+    (root / "keep.log").write_text("")
+
+
+@_pytest.fixture
+def tree(tmp_path: _pathlib.Path) -> _pathlib.Path:
+    _make_tree(tmp_path)
+    return tmp_path.resolve()
+
+
+class TestIgnorePatterns:
+    """Tests for gitignore pattern compilation."""
+
+    @_pytest.mark.parametrize(
+        ("pattern", "path", "is_dir", "expected"),
+        [
+            ("*.log", "debug.log", False, True),
+            ("*.log", "deep/dir/debug.log", False, True),
+            ("/top.txt", "top.txt", False, True),
+            ("/top.txt", "sub/top.txt", False, False),
+            ("build/", "build", True, True),
+            ("build/", "build", False, False),
+            ("docs/*.md", "docs/a.md", False, True),
+            ("docs/*.md", "docs/sub/a.md", False, False),
+            ("**/cache", "a/b/cache", True, True),
+            ("a/**/z", "a/z", False, True),
+            ("a/**/z", "a/b/c/z", False, True),
+        ],
+    )
+    def test_matching(self, pattern: str, path: str, is_dir: bool, expected: bool) -> None:
+        rule = project_index.compile_ignore_pattern(pattern)
+        assert rule is not None
+        matched = bool(rule.regex.match(path)) and (is_dir or not rule.dir_only)
+        assert matched is expected
+
+    def test_comments_and_blanks_skipped(self) -> None:
+        assert project_index.compile_ignore_pattern("# comment") is None
+        assert project_index.compile_ignore_pattern("   ") is None
+
+
+class TestProjectIndex:
+    """Tests for ProjectIndex queries."""
+
+    def test_list_dir_includes_ignored_entries(self, tree: _pathlib.Path) -> None:
+        """ls shows ignored entries, flagged, but doesn't descend into them."""
+        index = project_index.ProjectIndex(tree, watch=False)
+        entries = {e.name: e for e in index.list_dir(tree) or []}
+
+        assert {"src", "README.md", "build", ".git", "debug.log"} <= set(entries)
+        assert entries["build"].ignored is True
+        assert entries["src"].ignored is False
+        assert index.list_dir(tree / "build") is None
+        assert index.list_dir(tree / ".git") is None
+
+    def test_glob_skips_ignored(self, tree: _pathlib.Path) -> None:
+        """Ignored files never appear in glob results; negation re-includes."""
+        index = project_index.ProjectIndex(tree, watch=False)
+
+        py = sorted(str(p.relative_to(tree)) for p, _ in index.glob("**/*.py", tree) or [])
+        logs = sorted(p.name for p, _ in index.glob("**/*.log", tree) or [])
+
+        assert py == ["src/b.py", "src/pkg/a.py"]
+        assert logs == ["keep.log"]
+
+    def test_glob_relative_to_subdir(self, tree: _pathlib.Path) -> None:
+        index = project_index.ProjectIndex(tree, watch=False)
+        matches = index.glob("*.py", tree / "src")
+        assert [p.name for p, _ in matches or []] == ["b.py"]
+
+    def test_nested_ignore_file(self, tree: _pathlib.Path) -> None:
+        """Ignore files in subdirectories apply relative to their directory."""
+        (tree / "src" / ".gitignore").write_text("pkg/\n")
+        index = project_index.ProjectIndex(tree, watch=False)
+
+        names = [p.name for p, _ in index.glob("**/*.py", tree) or []]
+        assert names == ["b.py"]
+
+    def test_outside_root_not_covered(self, tree: _pathlib.Path, tmp_path_factory: _pytest.TempPathFactory) -> None:
+        other = tmp_path_factory.mktemp("other")
+        index = project_index.ProjectIndex(tree, watch=False)
+        assert index.list_dir(other) is None
+        assert index.glob("*", other) is None
+
+    def test_notify_changed_adds_and_removes(self, tree: _pathlib.Path) -> None:
+        """notify_changed reflects writes immediately, including new directories."""
+        index = project_index.ProjectIndex(tree, watch=False)
+        assert index.ensure_ready()
+
+        new_file = tree / "new" / "dir" / "c.py"
+        new_file.parent.mkdir(parents=True)
+        new_file.write_text("c")
+        index.notify_changed(new_file)
+        assert tree / "new" / "dir" / "c.py" in [p for p, _ in index.glob("**/c.py", tree) or []]
+
+        new_file.unlink()
+        index.notify_changed(new_file)
+        assert index.glob("**/c.py", tree) == []
+
+    def test_ignore_file_change_rescans(self, tree: _pathlib.Path) -> None:
+        index = project_index.ProjectIndex(tree, watch=False)
+        assert index.ensure_ready()
+
+        (tree / ".gitignore").write_text("*.log\n")
+        index.notify_changed(tree / ".gitignore")
+
+        assert [p.name for p, _ in index.glob("build/*.py", tree) or []] == ["out.py"]
+
+    def test_too_large_disables_index(self, tree: _pathlib.Path) -> None:
+        index = project_index.ProjectIndex(tree, watch=False, max_entries=3)
+        assert index.ensure_ready() is False
+        assert index.list_dir(tree) is None
+        assert index.mode == "unavailable"
+
+    def test_watcher_picks_up_changes(self, tree: _pathlib.Path) -> None:
+        """Files created behind the index's back appear via the watcher."""
+        index = project_index.ProjectIndex(tree)
+        try:
+            assert index.ensure_ready()
+            (tree / "src" / "late.py").write_text("x")
+
+            deadline = _time.monotonic() + 10
+            found = False
+            while _time.monotonic() < deadline and not found:
+                found = any(p.name == "late.py" for p, _ in index.glob("**/*.py", tree) or [])
+                _time.sleep(0.05)
+            assert found
+        finally:
+            index.close()
+
+
+class TestToolsWithIndex:
+    """Tests for Glob and Inspect backed by the index."""
+
+    @_pytest.mark.asyncio
+    async def test_glob_uses_index_mtime_order(self, tree: _pathlib.Path) -> None:
+        _os.utime(tree / "src" / "b.py", (1_000_000, 1_000_000))
+        index = project_index.ProjectIndex(tree, watch=False)
+        tool = glob_tool.GlobTool(base_dir=tree, project_index=index)
+
+        result = await tool.execute({"pattern": "*.py"})
+
+        assert result.success is True
+        assert result.output.splitlines() == ["src/pkg/a.py", "src/b.py"]
+
+    @_pytest.mark.asyncio
+    async def test_inspect_ls_matches_filesystem(self, tree: _pathlib.Path) -> None:
+        """ls output is identical with and without the index."""
+        index = project_index.ProjectIndex(tree, watch=False)
+        indexed = inspect_tool.InspectTool(working_dir=tree, project_index=index)
+        plain = inspect_tool.InspectTool(working_dir=tree)
+
+        for args in (
+            {"operation": "ls", "path": "."},
+            {"operation": "ls", "path": "src", "sort_by": "mtime"},
+            {"operation": "ls", "filter": "files", "sort_by": "size", "reverse": True},
+        ):
+            a = await indexed.execute(args)
+            b = await plain.execute(args)
+            assert a.output == b.output
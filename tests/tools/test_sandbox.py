@@ -11,6 +11,7 @@ import tempfile as _tempfile
 import pytest as _pytest
 
 import brynhild.tools.sandbox as sandbox
+import brynhild.tools.sandbox_linux as sandbox_linux
 
 
 class TestPathValidation:
@@ -194,6 +195,61 @@ class TestSymlinkHandling:
         with _pytest.raises(sandbox.PathValidationError):
             sandbox.validate_path(link, config, operation="read")
 
+    def test_blocks_symlinked_directory_escape(self, tmp_path: _pathlib.Path) -> None:
+        """A symlinked directory below the project root should be followed."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "docs").symlink_to(_pathlib.Path.home())
+
+        config = sandbox.SandboxConfig(project_root=project)
+
+        with _pytest.raises(sandbox.PathValidationError):
+            sandbox.validate_path(project / "docs" / ".bashrc", config, operation="read")
+
+
+class TestPathPolicy:
+    """Test the compiled path policy."""
+
+    def _policy(self, project: _pathlib.Path) -> sandbox.PathPolicy:
+        return sandbox.PathPolicy(
+            project,
+            allowed=[project],
+            blocked_read=[_pathlib.Path("/secrets")],
+            blocked_write=[_pathlib.Path("/secrets"), _pathlib.Path("/srv")],
+        )
+
+    def test_check_decisions(self) -> None:
+        """Allowed wins over blocked; other paths are unlisted."""
+        policy = self._policy(_pathlib.Path("/secrets/project"))
+
+        assert policy.check(_pathlib.Path("/secrets/project/a.py"), "write") == "allowed"
+        assert policy.check(_pathlib.Path("/secrets/other/a.py"), "read") == "blocked"
+        assert policy.check(_pathlib.Path("/srv/data"), "write") == "blocked"
+        assert policy.check(_pathlib.Path("/srv/data"), "read") == "unlisted"
+        assert policy.check(_pathlib.Path("/secretsx/a"), "read") == "unlisted"
+        assert policy.check(_pathlib.Path("/secrets"), "read") == "blocked"
+
+    def test_resolve_matches_path_resolve(self, tmp_path: _pathlib.Path) -> None:
+        """Cached-root resolution should agree with Path.resolve()."""
+        real = tmp_path / "real"
+        (real / "pkg").mkdir(parents=True)
+        (real / "pkg" / "mod.py").write_text("")
+        (real / "alias").symlink_to(real / "pkg")
+        link_root = tmp_path / "link"
+        link_root.symlink_to(real)
+        policy = self._policy(link_root)
+
+        for path in (
+            link_root,
+            link_root / "pkg" / "mod.py",
+            real / "pkg" / "mod.py",
+            link_root / "alias" / "mod.py",
+            link_root / "pkg" / ".." / "alias",
+            link_root / "missing" / "new.py",
+            tmp_path / "elsewhere.txt",
+        ):
+            assert policy.resolve(path) == path.resolve(), path
+
 
 class TestSeatbeltProfile:
     """Test Seatbelt profile generation."""
@@ -442,3 +498,116 @@ class TestSandboxUnavailableError:
         error_msg = str(exc_info.value)
         assert "--dangerously-skip-sandbox" in error_msg
         assert "BRYNHILD_DANGEROUSLY_SKIP_SANDBOX" in error_msg
+
+
+class TestBwrapProbeCache:
+    """Test the persisted bubblewrap functionality probe."""
+
+    @_pytest.fixture
+    def fake_bwrap(
+        self, tmp_path: _pathlib.Path, monkeypatch: _pytest.MonkeyPatch
+    ) -> tuple[_pathlib.Path, list[str]]:
+        """A fake bwrap binary whose probe result is recorded, not executed."""
+        bwrap = tmp_path / "bin" / "bwrap"
+        bwrap.parent.mkdir()
+        bwrap.write_text("")
+        calls: list[str] = []
+
+        def fake_probe(path: str) -> bool:
+            calls.append(path)
+            return True
+
+        monkeypatch.setattr(sandbox_linux._shutil, "which", lambda _: str(bwrap))
+        monkeypatch.setattr(sandbox_linux, "_run_probe", fake_probe)
+        monkeypatch.setattr(sandbox_linux, "_bwrap_functional", None)
+        monkeypatch.setattr(sandbox_linux, "_probe_cache_dir", None)
+        return bwrap, calls
+
+    def test_result_persisted_across_processes(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+        fake_bwrap: tuple[_pathlib.Path, list[str]],
+    ) -> None:
+        """A second process start should reuse the persisted result."""
+        _bwrap, calls = fake_bwrap
+        cache = tmp_path / "cache"
+
+        assert sandbox_linux.is_bwrap_functional(cache) is True
+        monkeypatch.setattr(sandbox_linux, "_bwrap_functional", None)
+        assert sandbox_linux.is_bwrap_functional(cache) is True
+
+        assert len(calls) == 1
+
+    def test_binary_change_invalidates(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+        fake_bwrap: tuple[_pathlib.Path, list[str]],
+    ) -> None:
+        """Replacing the bwrap binary should trigger a new probe."""
+        bwrap, calls = fake_bwrap
+        cache = tmp_path / "cache"
+        sandbox_linux.is_bwrap_functional(cache)
+
+        st = bwrap.stat()
+        _os.utime(bwrap, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        monkeypatch.setattr(sandbox_linux, "_bwrap_functional", None)
+        sandbox_linux.is_bwrap_functional(cache)
+
+        assert len(calls) == 2
+
+    def test_incomplete_probe_not_persisted(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+        fake_bwrap: tuple[_pathlib.Path, list[str]],
+    ) -> None:
+        """A timed-out probe counts as non-functional but is not cached."""
+        monkeypatch.setattr(sandbox_linux, "_run_probe", lambda _path: None)
+        cache = tmp_path / "cache"
+
+        assert sandbox_linux.is_bwrap_functional(cache) is False
+        assert not (cache / sandbox_linux._PROBE_CACHE_FILE).exists()
+
+    def test_failed_probe_not_persisted(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+        fake_bwrap: tuple[_pathlib.Path, list[str]],
+    ) -> None:
+        """A failure may be transient, so the next start probes again."""
+        bwrap, calls = fake_bwrap
+        cache = tmp_path / "cache"
+        fake_probe = sandbox_linux._run_probe
+        monkeypatch.setattr(sandbox_linux, "_run_probe", lambda _path: False)
+
+        assert sandbox_linux.is_bwrap_functional(cache) is False
+        assert not (cache / sandbox_linux._PROBE_CACHE_FILE).exists()
+
+        # A failure persisted by an older version is not reused either
+        fingerprint = sandbox_linux.probe_fingerprint(str(bwrap))
+        sandbox_linux._save_cached_probe(cache, fingerprint, False)
+        monkeypatch.setattr(sandbox_linux, "_run_probe", fake_probe)
+        monkeypatch.setattr(sandbox_linux, "_bwrap_functional", None)
+
+        assert sandbox_linux.is_bwrap_functional(cache) is True
+        assert len(calls) == 1
+
+    def test_start_probe_runs_in_background(
+        self,
+        tmp_path: _pathlib.Path,
+        monkeypatch: _pytest.MonkeyPatch,
+        fake_bwrap: tuple[_pathlib.Path, list[str]],
+    ) -> None:
+        """Cache misses probe in the background; hits answer immediately."""
+        _bwrap, calls = fake_bwrap
+        cache = tmp_path / "cache"
+
+        assert sandbox_linux.start_bwrap_probe(cache) is None
+        assert sandbox_linux.is_bwrap_functional() is True
+        assert (cache / sandbox_linux._PROBE_CACHE_FILE).exists()
+
+        monkeypatch.setattr(sandbox_linux, "_bwrap_functional", None)
+        assert sandbox_linux.start_bwrap_probe(cache) is True
+        assert len(calls) == 1
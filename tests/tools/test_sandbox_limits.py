@@ -0,0 +1,151 @@
+"""Tests for tools/sandbox_limits.py and resource limits in the Bash tool."""
+
+import pathlib as _pathlib
+import signal as _signal
+
+import pytest as _pytest
+
+import brynhild.tools.bash as bash
+import brynhild.tools.sandbox as sandbox
+import brynhild.tools.sandbox_limits as sandbox_limits
+
+
+class TestResourceLimits:
+    """Tests for rlimit script generation."""
+
+    def test_no_limits_no_prefix(self) -> None:
+        limits = sandbox_limits.ResourceLimits()
+
+        assert limits.has_rlimits is False
+        assert limits.limit_command("ls") == "ls"
+
+    def test_ulimit_prefix(self) -> None:
+        limits = sandbox_limits.ResourceLimits(
+            memory_mb=512,
+            cpu_seconds=30,
+            max_processes=64,
+            max_file_size_mb=10,
+            max_open_files=256,
+        )
+
+        assert limits.ulimit_prefix() == (
+            "ulimit -v 524288 -f 10240 -n 256 -u 64 -t 31 && ulimit -S -t 30 || exit 125\n"
+        )
+
+    def test_skip_sandbox_runs_limits_in_bash(self, tmp_path: _pathlib.Path) -> None:
+        """Limits still apply without the OS sandbox, via bash's ulimit."""
+        config = sandbox.SandboxConfig(
+            project_root=tmp_path,
+            skip_sandbox=True,
+            resource_limits=sandbox_limits.ResourceLimits(max_open_files=64),
+        )
+
+        wrapped, _profile = sandbox.get_sandbox_command("ls", config)
+
+        assert wrapped == "/bin/bash -c 'ulimit -n 64 || exit 125\nls'"
+
+
+class TestDescribeViolation:
+    """Tests for classifying limit failures."""
+
+    limits = sandbox_limits.ResourceLimits(
+        memory_mb=256, cpu_seconds=5, max_processes=32, max_file_size_mb=1, max_open_files=16
+    )
+
+    def test_signals(self) -> None:
+        cpu = sandbox_limits.describe_violation(self.limits, 128 + _signal.SIGXCPU, "")
+        fsize = sandbox_limits.describe_violation(self.limits, -_signal.SIGXFSZ, "")
+
+        assert cpu == "Resource limit exceeded: CPU time (5s)"
+        assert fsize == "Resource limit exceeded: file size (1 MB)"
+
+    def test_stderr_patterns(self) -> None:
+        memory = sandbox_limits.describe_violation(self.limits, 1, "MemoryError\n")
+        procs = sandbox_limits.describe_violation(
+            self.limits, 254, "bash: fork: retry: Resource temporarily unavailable"
+        )
+        files = sandbox_limits.describe_violation(self.limits, 1, "OSError: Too many open files")
+
+        assert memory == "Resource limit exceeded: memory (256 MB)"
+        assert procs == "Resource limit exceeded: processes (32)"
+        assert files == "Resource limit exceeded: open files (16)"
+
+    def test_cgroup_events(self) -> None:
+        result = sandbox_limits.describe_violation(self.limits, 137, "", ["memory"])
+
+        assert result == "Resource limit exceeded: memory (256 MB)"
+
+    def test_unconfigured_limits_not_reported(self) -> None:
+        """Ordinary failures are not misreported as limit violations."""
+        none = sandbox_limits.ResourceLimits()
+
+        assert sandbox_limits.describe_violation(none, 1, "MemoryError") is None
+        assert sandbox_limits.describe_violation(self.limits, 1, "No such file") is None
+        assert sandbox_limits.describe_violation(self.limits, 0, "MemoryError") is None
+
+
+class TestCommandCgroup:
+    """Tests for per-command cgroup handling (against a fake cgroupfs)."""
+
+    def test_create_writes_limits(self, tmp_path: _pathlib.Path) -> None:
+        limits = sandbox_limits.ResourceLimits(
+            memory_mb=64, max_processes=10, cgroup_parent=tmp_path
+        )
+
+        cgroup = sandbox_limits.CommandCgroup.create(limits)
+
+        assert cgroup is not None
+        assert (cgroup.path / "memory.max").read_text() == str(64 * 1024 * 1024)
+        assert (cgroup.path / "pids.max").read_text() == "10"
+        assert cgroup.wrap("ls").startswith(f"echo $$ > {cgroup.path / 'cgroup.procs'} ||")
+
+    def test_violations_from_events(self, tmp_path: _pathlib.Path) -> None:
+        cgroup = sandbox_limits.CommandCgroup(tmp_path)
+        (tmp_path / "memory.events").write_text("low 0\nhigh 0\nmax 3\noom 1\noom_kill 1\n")
+        (tmp_path / "pids.events").write_text("max 0\n")
+
+        assert cgroup.violations() == ["memory"]
+
+    def test_unusable_parent(self, tmp_path: _pathlib.Path) -> None:
+        limits = sandbox_limits.ResourceLimits(cgroup_parent=tmp_path / "missing")
+
+        assert sandbox_limits.CommandCgroup.create(limits) is None
+
+
+class TestBashToolLimits:
+    """Resource limits applied to real commands (OS sandbox off)."""
+
+    def _tool(self, tmp_path: _pathlib.Path, **limits: int) -> bash.BashTool:
+        tool = bash.BashTool(working_dir=tmp_path, sandbox_enabled=False)
+        tool.configure_sandbox(
+            project_root=tmp_path,
+            resource_limits=sandbox_limits.ResourceLimits(**limits),
+        )
+        return tool
+
+    @_pytest.mark.asyncio
+    async def test_file_size_limit(self, tmp_path: _pathlib.Path) -> None:
+        tool = self._tool(tmp_path, max_file_size_mb=1)
+
+        result = await tool.execute({"command": "head -c 2000000 /dev/zero > big.bin"})
+
+        assert result.success is False
+        assert result.error == "Resource limit exceeded: file size (1 MB)"
+
+    @_pytest.mark.asyncio
+    async def test_cpu_limit(self, tmp_path: _pathlib.Path) -> None:
+        tool = self._tool(tmp_path, cpu_seconds=1)
+
+        result = await tool.execute({"command": "while :; do :; done"})
+
+        assert result.success is False
+        assert result.error == "Resource limit exceeded: CPU time (1s)"
+
+    @_pytest.mark.asyncio
+    async def test_within_limits(self, tmp_path: _pathlib.Path) -> None:
+        tool = self._tool(tmp_path, max_open_files=64, max_file_size_mb=1)
+
+        result = await tool.execute({"command": "echo ok > f.txt && cat f.txt"})
+
+        assert result.success is True
+        assert result.output == "ok"
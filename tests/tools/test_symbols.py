@@ -0,0 +1,238 @@
+"""Tests for tools/symbol_index.py and the Symbols tool."""
+
+import os as _os
+import pathlib as _pathlib
+
+import pytest as _pytest
+
+import brynhild.tools.symbol_index as symbol_index
+import brynhild.tools.symbols as symbols
+
+_MODULE = '''\
+import os
+import pkg.helpers as h
+
+
+class Registry(Base):
+    """A registry."""
+
+    default_name = "x"
+
+    def register(self, tool: str) -> None:
+        h.validate(tool)
+
+    async def close(self):
+        pass
+
+
+def build() -> Registry:
+    registry = Registry()
+    registry.register("bash")
+    return registry
+'''
+
+
+def _files(root: _pathlib.Path) -> list[tuple[str, float, int]]:
+    result = []
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            st = path.stat()
+            result.append((path.relative_to(root).as_posix(), st.st_mtime, st.st_size))
+    return result
+
+
+class TestExtractSymbols:
+    """Tests for ast extraction."""
+
+    def test_definitions(self) -> None:
+        data = symbol_index.extract_symbols(_MODULE)
+        defs = {d[0]: d for d in data["defs"]}
+
+        assert defs["Registry"][1:3] == ["class", 5]
+        assert defs["Registry"][4] == "(Base)"
+        assert defs["Registry.default_name"][1] == "variable"
+        assert defs["Registry.register"][1] == "def"
+        assert defs["Registry.register"][4] == "(self, tool: str) -> None"
+        assert defs["Registry.close"][1] == "async def"
+        assert defs["build"][4] == "() -> Registry"
+        # Locals inside functions are not definitions
+        assert "build.registry" not in defs
+
+    def test_imports(self) -> None:
+        data = symbol_index.extract_symbols(_MODULE)
+
+        assert data["imports"] == [["os", "os", 1], ["h", "pkg.helpers", 2]]
+
+    def test_references_flag_calls(self) -> None:
+        data = symbol_index.extract_symbols(_MODULE)
+        refs = {(name, line): is_call for name, line, is_call in data["refs"]}
+
+        assert refs[("validate", 11)] is True
+        assert refs[("Registry", 18)] is True
+        assert refs[("Registry", 17)] is False  # return annotation
+        assert refs[("register", 19)] is True
+
+    def test_syntax_error_recorded(self) -> None:
+        data = symbol_index.extract_symbols("def broken(:\n")
+
+        assert data["defs"] == []
+        assert data["error"].startswith("SyntaxError")
+
+    @_pytest.mark.parametrize(
+        "source",
+        ["x = " + "+".join(["a"] * 100_000) + "\n", "x = " + "-" * 200_000 + "1\n"],
+    )
+    def test_deep_nesting_recorded(self, source: str) -> None:
+        """Code too deeply nested for the parser is recorded, not raised."""
+        data = symbol_index.extract_symbols(source)
+
+        assert data["defs"] == []
+        assert data["error"] is not None
+
+
+class TestSymbolIndex:
+    """Tests for incremental refresh and persistence."""
+
+    def test_definitions_and_references(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "mod.py").write_text(_MODULE)
+        (tmp_path / "notes.txt").write_text("def register(): pass\n")
+        index = symbol_index.SymbolIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        assert [(d.path, d.line) for d in index.definitions("register")] == [("mod.py", 10)]
+        assert [d.qualname for d in index.definitions("Registry.register")] == [
+            "Registry.register"
+        ]
+        assert index.definitions("Other.register") == []
+        assert [(r.line, r.kind) for r in index.references("register")] == [(19, "call")]
+
+    def test_only_changed_files_reparsed(self, tmp_path: _pathlib.Path) -> None:
+        (tmp_path / "a.py").write_text("def alpha(): pass\n")
+        (tmp_path / "b.py").write_text("def beta(): pass\n")
+        index = symbol_index.SymbolIndex(tmp_path)
+
+        assert index.refresh(_files(tmp_path)) == (2, 0)
+        assert index.refresh(_files(tmp_path)) == (0, 0)
+
+        (tmp_path / "a.py").write_text("def gamma(): pass\n")
+        st = (tmp_path / "a.py").stat()
+        _os.utime(tmp_path / "a.py", (st.st_atime, st.st_mtime + 10))
+        (tmp_path / "b.py").unlink()
+
+        assert index.refresh(_files(tmp_path)) == (1, 1)
+        assert index.definitions("alpha") == []
+        assert index.definitions("beta") == []
+        assert [d.path for d in index.definitions("gamma")] == ["a.py"]
+
+    def test_identical_content_parsed_once(
+        self, tmp_path: _pathlib.Path, monkeypatch: _pytest.MonkeyPatch
+    ) -> None:
+        """Entries are keyed by content hash, so copies share one parse."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("def same(): pass\n")
+        calls: list[object] = []
+        original = symbol_index.extract_symbols
+        monkeypatch.setattr(
+            symbol_index, "extract_symbols", lambda src: calls.append(src) or original(src)
+        )
+        index = symbol_index.SymbolIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        assert len(calls) == 1
+        assert len(index.definitions("same")) == 3
+
+    def test_persisted_table_reused(self, tmp_path: _pathlib.Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("class Alpha: pass\n")
+        cache = tmp_path / "cache"
+        index = symbol_index.SymbolIndex(src, index_dir=cache)
+        index.refresh(_files(src))
+        index.close()
+
+        reopened = symbol_index.SymbolIndex(src, index_dir=cache)
+
+        assert reopened.refresh(_files(src)) == (0, 0)
+        assert [d.kind for d in reopened.definitions("Alpha")] == ["class"]
+
+    def test_saved_through_private_temp_file(self, tmp_path: _pathlib.Path) -> None:
+        """Saving never touches a shared temp name and leaves no temp files."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("class Alpha: pass\n")
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        other = cache / "symbols.json.tmp"
+        other.write_text("another session's write in progress")
+        index = symbol_index.SymbolIndex(src, index_dir=cache)
+        index.refresh(_files(src))
+        index.close()
+
+        assert sorted(p.name for p in cache.iterdir()) == ["symbols.json", "symbols.json.tmp"]
+        assert other.read_text() == "another session's write in progress"
+        reopened = symbol_index.SymbolIndex(src, index_dir=cache)
+        assert reopened.refresh(_files(src)) == (0, 0)
+
+    def test_process_pool_batch(self, tmp_path: _pathlib.Path) -> None:
+        """Large batches go through the process pool and give the same results."""
+        for i in range(symbol_index._POOL_THRESHOLD + 1):
+            (tmp_path / f"m{i}.py").write_text(f"def func_{i}(): pass\n")
+        index = symbol_index.SymbolIndex(tmp_path, max_workers=2)
+
+        index.refresh(_files(tmp_path))
+
+        assert [d.path for d in index.definitions("func_7")] == ["m7.py"]
+        assert len(index) == symbol_index._POOL_THRESHOLD + 1
+
+
+class TestSymbolsTool:
+    """Tests for SymbolsTool."""
+
+    @_pytest.fixture
+    def tool(self, tmp_path: _pathlib.Path) -> symbols.SymbolsTool:
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text(_MODULE)
+        return symbols.SymbolsTool(base_dir=tmp_path)
+
+    @_pytest.mark.asyncio
+    async def test_definition(self, tool: symbols.SymbolsTool) -> None:
+        result = await tool.execute({"operation": "definition", "name": "Registry.register"})
+
+        assert result.success is True
+        assert result.output == (
+            "pkg/mod.py:10: def Registry.register(self, tool: str) -> None"
+        )
+
+    @_pytest.mark.asyncio
+    async def test_references_show_source(self, tool: symbols.SymbolsTool) -> None:
+        result = await tool.execute({"operation": "references", "name": "Registry"})
+
+        lines = result.output.splitlines()
+        assert lines[0] == "2 reference(s) to 'Registry'"
+        assert "pkg/mod.py:18: [call] registry = Registry()" in lines
+
+    @_pytest.mark.asyncio
+    async def test_outline(self, tool: symbols.SymbolsTool) -> None:
+        result = await tool.execute({"operation": "outline", "path": "pkg/mod.py"})
+
+        lines = result.output.splitlines()
+        assert lines[0] == "pkg/mod.py"
+        assert lines[1] == "imports: os, h"
+        assert "     5| class Registry(Base)" in lines
+        assert "    10|     def register(self, tool: str) -> None" in lines
+        assert "    13|     async def close(self)" in lines
+
+    @_pytest.mark.asyncio
+    async def test_not_found(self, tool: symbols.SymbolsTool) -> None:
+        result = await tool.execute({"operation": "definition", "name": "Missing"})
+
+        assert result.success is True
+        assert result.output == "No definition found for 'Missing'"
+
+    @_pytest.mark.asyncio
+    async def test_invalid_requests(self, tool: symbols.SymbolsTool) -> None:
+        assert (await tool.execute({"operation": "bogus"})).success is False
+        assert (await tool.execute({"operation": "definition"})).success is False
+        assert (await tool.execute({"operation": "outline"})).success is False
+        outside = await tool.execute({"operation": "outline", "path": "/etc/passwd"})
+        assert outside.success is False
@@ -4,12 +4,49 @@ Tests for the tool system.
 These tests verify that tools work correctly in isolation.
 """
 
+import asyncio as _asyncio
+import os as _os
 import pathlib as _pathlib
 import tempfile as _tempfile
+import typing as _typing
 
 import pytest as _pytest
 
 import brynhild.tools as tools
+import brynhild.tools.base as tools_base
+import brynhild.tools.file as file_module
+
+
+class _SleepTool(tools_base.Tool):
+    """Tool that sleeps for input['seconds'], recording whether it was cancelled."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.closed = False
+
+    @property
+    def name(self) -> str:
+        return "Sleep"
+
+    @property
+    def description(self) -> str:
+        return "Sleep for a while"
+
+    @property
+    def input_schema(self) -> dict[str, _typing.Any]:
+        return {"type": "object", "properties": {"seconds": {"type": "number"}}}
+
+    async def execute(self, input: dict[str, _typing.Any]) -> tools_base.ToolResult:
+        try:
+            await _asyncio.sleep(input["seconds"])
+        except _asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return tools_base.ToolResult(success=True, output="done")
+
+    def close(self) -> None:
+        self.closed = True
+
 
 # =============================================================================
 # Registry Tests
@@ -64,6 +101,97 @@ class TestToolRegistry:
         names = [t.name for t in registry.list_tools()]
         assert names == ["Bash", "Read", "Write"]
 
+    def test_api_payloads_cached_until_tool_set_changes(self) -> None:
+        """Tool payloads are reused until register()/unregister()."""
+        registry = tools.ToolRegistry()
+        registry.register(tools.BashTool())
+        version = registry.version
+
+        first = registry.api_tools()
+        openai = registry.to_openai_format()
+        assert registry.api_tools()[0] is first[0]
+        assert registry.to_openai_format()[0] is openai[0]
+
+        registry.register(tools.FileReadTool())
+        assert registry.version == version + 1
+        assert [t.name for t in registry.api_tools()] == ["Bash", "Read"]
+
+        removed = registry.unregister("Bash")
+        assert removed.name == "Bash"
+        assert registry.version == version + 2
+        assert [t["name"] for t in registry.to_api_format()] == ["Read"]
+
+    def test_unregister_unknown_raises(self) -> None:
+        """unregister() should raise KeyError for unknown tool."""
+        registry = tools.ToolRegistry()
+        with _pytest.raises(KeyError, match="not found"):
+            registry.unregister("NonExistent")
+        assert registry.version == 0
+
+    def test_timeout_overrides(self) -> None:
+        """Per-tool deadlines override the registry default."""
+        registry = tools.ToolRegistry()
+        assert registry.timeout_for("Grep") is None
+
+        registry.set_timeout(30)
+        registry.set_timeout(5, "Grep")
+        registry.set_timeout(None, "Bash")
+
+        assert registry.timeout_for("Glob") == 30
+        assert registry.timeout_for("Grep") == 5
+        assert registry.timeout_for("Bash") is None
+
+    @_pytest.mark.asyncio
+    async def test_run_tool_within_deadline(self) -> None:
+        """run_tool() returns the tool's result and outcome."""
+        registry = tools.ToolRegistry()
+        registry.set_timeout(5)
+        tool = _SleepTool()
+
+        result, outcome = await registry.run_tool(tool, {"seconds": 0})
+
+        assert (result.success, result.output, outcome) == (True, "done", "success")
+
+    @_pytest.mark.asyncio
+    async def test_run_tool_deadline_cancels_tool(self) -> None:
+        """A tool past its deadline is cancelled and reported as a timeout."""
+        registry = tools.ToolRegistry()
+        registry.set_timeout(0.05)
+        tool = _SleepTool()
+
+        result, outcome = await registry.run_tool(tool, {"seconds": 10})
+
+        assert outcome == "timeout"
+        assert result.success is False
+        assert "timed out after 0.05s" in (result.error or "")
+        assert tool.cancelled is True
+
+    @_pytest.mark.asyncio
+    async def test_run_tool_user_cancel(self) -> None:
+        """is_cancelled() is honoured while the tool is running."""
+        registry = tools.ToolRegistry()
+        tool = _SleepTool()
+        loop = _asyncio.get_running_loop()
+        cancel_at = loop.time() + 0.15
+
+        result, outcome = await registry.run_tool(
+            tool, {"seconds": 10}, lambda: loop.time() >= cancel_at
+        )
+
+        assert outcome == "cancelled"
+        assert result.error == "Cancelled by user"
+        assert tool.cancelled is True
+
+    def test_close_closes_every_tool(self) -> None:
+        """close() releases the resources of every registered tool."""
+        registry = tools.ToolRegistry()
+        tool = _SleepTool()
+        registry.register(tool)
+
+        registry.close()
+
+        assert tool.closed is True
+
     def test_default_registry_has_tools(self) -> None:
         """Default registry should have built-in tools."""
         registry = tools.get_default_registry()
@@ -112,6 +240,37 @@ class TestBashTool:
         assert result.error is not None
         assert "timed out" in result.error.lower()
 
+    @_pytest.mark.asyncio
+    async def test_cancel_kills_process_tree(self, tmp_path: _pathlib.Path) -> None:
+        """Cancelling a command kills the processes it spawned, not just the shell."""
+        pid_file = tmp_path / "child.pid"
+        tool = tools.BashTool(working_dir=tmp_path, sandbox_enabled=False)
+        task = _asyncio.ensure_future(
+            tool.execute({"command": f"sleep 30 & echo $! > {pid_file}; wait"})
+        )
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text().strip():
+                break
+            await _asyncio.sleep(0.02)
+        child = int(pid_file.read_text())
+
+        task.cancel()
+        with _pytest.raises(_asyncio.CancelledError):
+            await task
+
+        # The child has been killed and reaped by init (or is a zombie at worst)
+        for _ in range(100):
+            try:
+                _os.kill(child, 0)
+            except ProcessLookupError:
+                break
+            stat = _pathlib.Path(f"/proc/{child}/stat")
+            if stat.exists() and stat.read_text().split(") ")[1].startswith("Z"):
+                break
+            await _asyncio.sleep(0.02)
+        else:
+            _pytest.fail(f"child process {child} survived cancellation")
+
     @_pytest.mark.asyncio
     async def test_empty_command(self) -> None:
         """Should fail for empty command."""
@@ -202,6 +361,92 @@ class TestFileReadTool:
         assert "not found" in result.error.lower()
 
 
+class TestReadManyTool:
+    """Tests for ReadManyTool."""
+
+    @_pytest.mark.asyncio
+    async def test_reads_all_files_in_order(self, tmp_path: _pathlib.Path) -> None:
+        """Each file gets a labelled section, in request order."""
+        (tmp_path / "a.txt").write_text("alpha\n")
+        (tmp_path / "b.txt").write_text("one\ntwo\nthree\n")
+
+        tool = tools.ReadManyTool(base_dir=tmp_path)
+        result = await tool.execute({
+            "files": [
+                {"file_path": "b.txt", "offset": 1, "limit": 1},
+                "a.txt",
+            ],
+        })
+
+        assert result.success is True
+        assert result.output == (
+            "==> b.txt (lines 2-2) <==\n     2|two\n\n==> a.txt <==\n     1|alpha"
+        )
+
+    @_pytest.mark.asyncio
+    async def test_per_file_errors_inline(self, tmp_path: _pathlib.Path) -> None:
+        """A missing or blocked file doesn't fail the whole call."""
+        (tmp_path / "a.txt").write_text("alpha\n")
+        blocked = str(_pathlib.Path.home() / ".ssh" / "id_rsa")
+
+        tool = tools.ReadManyTool(base_dir=tmp_path)
+        result = await tool.execute({
+            "files": [{"file_path": "missing.txt"}, {"file_path": blocked}, "a.txt"],
+        })
+
+        assert result.success is True
+        assert "==> missing.txt <==\nError: File not found" in result.output
+        assert f"==> {blocked} <==\nError:" in result.output
+        assert "1|alpha" in result.output
+
+    @_pytest.mark.asyncio
+    async def test_all_failed(self, tmp_path: _pathlib.Path) -> None:
+        tool = tools.ReadManyTool(base_dir=tmp_path)
+        result = await tool.execute({"files": ["missing.txt"]})
+
+        assert result.success is False
+        assert result.error is not None
+
+    @_pytest.mark.asyncio
+    async def test_shared_budget(self, tmp_path: _pathlib.Path) -> None:
+        """Output past the budget is truncated with a resume offset, then skipped."""
+        (tmp_path / "big.txt").write_text("".join(f"line {i}\n" for i in range(100)))
+        (tmp_path / "small.txt").write_text("tail\n")
+
+        tool = tools.ReadManyTool(base_dir=tmp_path, max_chars=150)
+        result = await tool.execute({"files": ["big.txt", "small.txt"]})
+
+        assert result.success is True
+        big, small = result.output.split("\n\n")
+        big_lines = big.splitlines()
+        kept = len(big_lines) - 2  # minus header and truncation note
+        assert kept > 0
+        assert big_lines[-1].endswith(f"use Read with offset={kept})")
+        assert small == "==> small.txt <==\n(skipped: output budget exhausted; use Read)"
+
+    @_pytest.mark.asyncio
+    async def test_rejects_empty_and_oversized_requests(self, tmp_path: _pathlib.Path) -> None:
+        tool = tools.ReadManyTool(base_dir=tmp_path, max_files=2)
+
+        assert (await tool.execute({"files": []})).success is False
+        result = await tool.execute({"files": ["a", "b", "c"]})
+        assert result.success is False
+        assert "at most 2" in (result.error or "")
+
+    @_pytest.mark.asyncio
+    @_pytest.mark.parametrize(
+        "entry",
+        [1, ["a", "b", "c"], {"path": "a"}, {"file_path": 1}, {"file_path": "a", "offset": "2"}],
+    )
+    async def test_rejects_malformed_entries(self, tmp_path: _pathlib.Path, entry: object) -> None:
+        tool = tools.ReadManyTool(base_dir=tmp_path)
+
+        result = await tool.execute({"files": ["a.txt", entry]})
+
+        assert result.success is False
+        assert "Invalid entry 2" in (result.error or "")
+
+
 # =============================================================================
 # File Write Tool Tests
 # =============================================================================
@@ -340,6 +585,170 @@ class TestFileEditTool:
         assert test_file.read_text() == "baz bar baz"
 
 
+class TestMultiEditTool:
+    """Tests for MultiEditTool."""
+
+    @_pytest.mark.asyncio
+    async def test_edits_across_files(self, tmp_path: _pathlib.Path) -> None:
+        """Should apply every edit and summarize per file."""
+        (tmp_path / "a.py").write_text("old_name = 1\nprint(old_name)\n")
+        (tmp_path / "b.py").write_text("import a\na.old_name\n")
+
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        result = await tool.execute(
+            {
+                "edits": [
+                    {
+                        "file_path": "a.py",
+                        "old_string": "old_name",
+                        "new_string": "new_name",
+                        "replace_all": True,
+                    },
+                    {"file_path": "b.py", "old_string": "a.old_name", "new_string": "a.new_name"},
+                ]
+            }
+        )
+
+        assert result.success is True
+        assert (tmp_path / "a.py").read_text() == "new_name = 1\nprint(new_name)\n"
+        assert (tmp_path / "b.py").read_text() == "import a\na.new_name\n"
+        assert result.output.splitlines() == [
+            "Applied 2 edit(s) across 2 file(s):",
+            "  a.py: 1 edit(s), 2 replacement(s)",
+            "  b.py: 1 edit(s), 1 replacement(s)",
+        ]
+
+    @_pytest.mark.asyncio
+    async def test_edits_to_same_file_chain(self, tmp_path: _pathlib.Path) -> None:
+        """Later edits should see the result of earlier ones."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("alpha")
+
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        result = await tool.execute(
+            {
+                "edits": [
+                    {"file_path": "test.txt", "old_string": "alpha", "new_string": "beta"},
+                    {"file_path": "test.txt", "old_string": "beta", "new_string": "gamma"},
+                ]
+            }
+        )
+
+        assert result.success is True
+        assert test_file.read_text() == "gamma"
+
+    @_pytest.mark.asyncio
+    async def test_invalid_edit_changes_nothing(self, tmp_path: _pathlib.Path) -> None:
+        """Should validate every edit before writing any file."""
+        (tmp_path / "a.txt").write_text("foo")
+        (tmp_path / "b.txt").write_text("foo foo")
+
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        result = await tool.execute(
+            {
+                "edits": [
+                    {"file_path": "a.txt", "old_string": "foo", "new_string": "bar"},
+                    {"file_path": "b.txt", "old_string": "foo", "new_string": "bar"},
+                ]
+            }
+        )
+
+        assert result.success is False
+        assert result.error is not None
+        assert "Edit 2" in result.error
+        assert "2 times" in result.error
+        assert (tmp_path / "a.txt").read_text() == "foo"
+        assert (tmp_path / "b.txt").read_text() == "foo foo"
+
+    @_pytest.mark.asyncio
+    @_pytest.mark.parametrize(
+        "fields",
+        [
+            {"old_string": 1},
+            {"new_string": None},
+            {"file_path": ["a.txt"]},
+            {"replace_all": "false"},
+        ],
+    )
+    async def test_malformed_edit_rejected(
+        self, tmp_path: _pathlib.Path, fields: dict[str, object]
+    ) -> None:
+        """Should reject entries with wrongly typed fields and change nothing."""
+        (tmp_path / "a.txt").write_text("foo foo")
+
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        edit = {"file_path": "a.txt", "old_string": "foo", "new_string": "bar", **fields}
+        result = await tool.execute({"edits": [edit]})
+
+        assert result.success is False
+        assert (result.error or "").startswith("Edit 1: expected an object")
+        assert (tmp_path / "a.txt").read_text() == "foo foo"
+
+    @_pytest.mark.asyncio
+    async def test_failed_replace_rolls_back(
+        self, tmp_path: _pathlib.Path, monkeypatch: _pytest.MonkeyPatch
+    ) -> None:
+        """Should restore already-replaced files when a later replace fails."""
+        (tmp_path / "a.txt").write_text("one")
+        (tmp_path / "b.txt").write_text("two")
+        real_replace = file_module._os.replace
+        calls: list[object] = []
+
+        def flaky_replace(src: object, dst: object) -> None:
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(file_module._os, "replace", flaky_replace)
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        result = await tool.execute(
+            {
+                "edits": [
+                    {"file_path": "a.txt", "old_string": "one", "new_string": "1"},
+                    {"file_path": "b.txt", "old_string": "two", "new_string": "2"},
+                ]
+            }
+        )
+
+        assert result.success is False
+        assert result.error is not None
+        assert "disk full" in result.error
+        assert (tmp_path / "a.txt").read_text() == "one"
+        assert (tmp_path / "b.txt").read_text() == "two"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt", "b.txt"]
+
+    @_pytest.mark.asyncio
+    async def test_preserves_file_mode(self, tmp_path: _pathlib.Path) -> None:
+        """Should keep the original permissions of replaced files."""
+        script = tmp_path / "run.sh"
+        script.write_text("echo hi\n")
+        script.chmod(0o755)
+
+        tool = tools.MultiEditTool(base_dir=tmp_path)
+        result = await tool.execute(
+            {"edits": [{"file_path": "run.sh", "old_string": "hi", "new_string": "bye"}]}
+        )
+
+        assert result.success is True
+        assert script.stat().st_mode & 0o777 == 0o755
+
+    @_pytest.mark.asyncio
+    async def test_dry_run_writes_nothing(self, tmp_path: _pathlib.Path) -> None:
+        """Should only report what would change in dry-run mode."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("foo")
+
+        tool = tools.MultiEditTool(base_dir=tmp_path, dry_run=True)
+        result = await tool.execute(
+            {"edits": [{"file_path": "test.txt", "old_string": "foo", "new_string": "bar"}]}
+        )
+
+        assert result.success is True
+        assert result.output.startswith("[DRY RUN] Would apply 1 edit(s)")
+        assert test_file.read_text() == "foo"
+
+
 # =============================================================================
 # Grep Tool Tests
 # =============================================================================
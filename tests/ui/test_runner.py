@@ -9,12 +9,17 @@ allowed a token accounting bug to ship.
 """
 
 import io as _io
+import json as _json
+import pathlib as _pathlib
 import typing as _typing
 
 import pytest as _pytest
 
 import brynhild.api.base as api_base
 import brynhild.api.types as api_types
+import brynhild.hooks.config as hooks_config
+import brynhild.hooks.manager as hooks_manager
+import brynhild.logging as brynhild_logging
 import brynhild.tools.base as tools_base
 import brynhild.tools.registry as tools_registry
 import brynhild.ui.plain as plain
@@ -704,16 +709,60 @@ class MockConversationLogger:
         cached_tokens: int | None = None,  # noqa: ARG002
         provider: str | None = None,  # noqa: ARG002
         generation_id: str | None = None,  # noqa: ARG002
+        deduplicated_tokens: int | None = None,  # noqa: ARG002
     ) -> None:
         pass
 
     def log_thinking(self, content: str) -> None:  # noqa: ARG002
         pass
 
+    def flush(self) -> None:
+        pass
+
 
 class TestRunnerLogging:
     """Logger integration tests."""
 
+    @_pytest.mark.asyncio
+    async def test_hook_metrics_logged_on_close(self, tmp_path: _pathlib.Path) -> None:
+        """aclose() writes the session's hook metrics to the conversation log."""
+        provider = MockProviderForRunner(
+            responses=[
+                {
+                    "text": "Using tool...",
+                    "input_tokens": 100,
+                    "output_tokens": 10,
+                    "tool_calls": [{"name": "MockTool"}],
+                },
+                {"text": "Done", "input_tokens": 200, "output_tokens": 10},
+            ]
+        )
+        registry = tools_registry.ToolRegistry()
+        registry.register(MockToolForRunner())
+        hook = hooks_config.HookDefinition(name="audit", type="command", command="exit 0")
+        hook_manager = hooks_manager.HookManager(
+            hooks_config.HooksConfig(hooks={"pre_tool_use": [hook]}), project_root=tmp_path
+        )
+        log_file = tmp_path / "log.jsonl"
+        logger = brynhild_logging.ConversationLogger(log_file=log_file)
+
+        conv_runner = runner.ConversationRunner(
+            provider=provider,
+            renderer=plain.PlainTextRenderer(_io.StringIO()),
+            tool_registry=registry,
+            system_prompt="You are helpful.",
+            auto_approve_tools=True,
+            logger=logger,
+            hook_manager=hook_manager,
+        )
+        await conv_runner.run_streaming("test")
+        await conv_runner.aclose()
+        logger.close()
+
+        logged = [_json.loads(line) for line in log_file.read_text().splitlines()]
+        (event,) = [e for e in logged if e["event_type"] == "hook_metrics"]
+        assert set(event["hooks"]) == {"pre_tool_use:audit"}
+
     @_pytest.mark.asyncio
     async def test_system_prompt_logged_on_init(self) -> None:
         """System prompt is logged when runner is created with logger."""
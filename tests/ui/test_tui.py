@@ -1,9 +1,12 @@
 """Tests for the Textual TUI application."""
 
+import pathlib as _pathlib
+
 import pytest as _pytest
 
 import brynhild.api.base as api_base
 import brynhild.api.types as api_types
+import brynhild.session as session
 import brynhild.tools.base as tools_base
 import brynhild.ui as ui
 import brynhild.ui.widgets as widgets
@@ -181,6 +184,31 @@ class TestBrynhildApp:
         app = ui.create_app(provider, system_prompt=_TEST_SYSTEM_PROMPT)
         assert app.is_processing() is False
 
+    @_pytest.mark.asyncio
+    async def test_resumed_tool_metrics_kept_on_save(self, tmp_path: _pathlib.Path) -> None:
+        """Saving a resumed session adds to its tool metrics, not replaces them."""
+        saved = tools_base.MetricsCollector()
+        saved.record("Read", success=True, duration_ms=5.0)
+        current = tools_base.MetricsCollector()
+        current.record("Read", success=False, duration_ms=7.0)
+        app = ui.create_app(
+            MockProvider(),
+            system_prompt=_TEST_SYSTEM_PROMPT,
+            initial_messages=[{"role": "user", "content": "hi"}],
+            initial_tool_metrics=saved.to_dict(),
+            session_id="resumed",
+            sessions_dir=tmp_path,
+        )
+        app._tool_metrics.merge(current)
+
+        await app.on_unmount()
+
+        sess = session.SessionManager(tmp_path).load("resumed")
+        assert sess is not None and sess.tool_metrics is not None
+        read = tools_base.MetricsCollector.from_dict(sess.tool_metrics).get("Read")
+        assert read is not None
+        assert (read.call_count, read.success_count, read.failure_count) == (2, 1, 1)
+
 
 class TestBrynhildAppAsync:
     """Async tests for BrynhildApp using Textual pilot."""